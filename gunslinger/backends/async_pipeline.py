@@ -0,0 +1,319 @@
+import json
+import time
+import signal
+import asyncio
+import logging
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from backends.plugin_backend import accepts_kwarg
+from backends.checkpoint import FlushError
+
+logger = logging.getLogger(__name__)
+
+
+class Stage():
+    """A bounded pool of threads blocking work of one kind is run in. Calls
+    beyond `workers` wait on the event loop rather than piling up in the
+    pool, so a slow stage holds back the stages feeding it. The time calls
+    wait for a thread is recorded as `gunslinger_stage_wait_seconds`.
+
+    Arguments:
+        name (str): Name of the stage
+        workers (int): Calls running at once
+        metrics (Metrics): Metrics the waits are recorded in
+    """
+
+    def __init__(self, name, workers, metrics):
+        self.name = name
+        self.workers = workers
+        self.metrics = metrics
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix=name)
+        self._slots = asyncio.Semaphore(workers)
+
+
+    async def call(self, func, *args, **kwargs):
+        """Runs a blocking function in the stage.
+
+        Arguments:
+            func (callable): Function to run
+            *args: Arguments of the function
+            **kwargs: Keyword arguments of the function
+
+        Returns:
+            object: What the function returned
+        """
+        start = time.perf_counter()
+
+        async with self._slots:
+            self.metrics.observe('gunslinger_stage_wait_seconds',
+                                 time.perf_counter() - start, stage=self.name)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool,
+                                              partial(func, *args, **kwargs))
+
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+
+
+class AsyncPipeline():
+    """Runs a Gunslinger worker as an asyncio pipeline of bounded stages:
+    reading the queue, processing jobs, fetching, running the rules and
+    sending outputs. Each stage has its own concurrency limit and a full
+    stage makes the ones before it wait, so throughput is bound by the
+    slowest stage rather than the sum of them.
+
+    Processors with a `run_async` coroutine are awaited and given the
+    pipeline, whose `fetch`, `evaluate`, `run_rules` and `record` coroutines
+    run blocking work in the `fetch`, `rules` and `process` stages. Plain
+    `run` processors are run in the `process` stage as a whole, the message queue is only used from the
+    single thread of the `queue` stage. Reports are handed to the worker's
+    output dispatcher from the `output` stage, so outputs that fall behind
+    hold up the jobs instead of the event loop. Rules still hold the GIL
+    while they run, so CPU parallelism comes from the `rule_sandbox`
+    evaluators.
+
+    Arguments:
+        worker (Gunslinger): Worker owning the queue, plugins and
+            checkpoints
+        max_jobs (int, optional): Jobs processed at once
+        prefetch (int, optional): Messages read ahead of the jobs stage
+        fetch_workers (int, optional): HTTP requests sent at once
+        rule_workers (int, optional): Scripts the rules run on at once
+        output_workers (int, optional): Reports handed to the outputs at
+            once
+    """
+
+    def __init__(self, worker, **kwargs):
+        self.worker = worker
+        self.metrics = worker.metrics
+        self.max_jobs = kwargs.get('max_jobs', 4)
+        self.prefetch = kwargs.get('prefetch', self.max_jobs)
+        self.workers = {'queue': 1,
+                        'process': self.max_jobs,
+                        'fetch': kwargs.get('fetch_workers', 32),
+                        'rules': kwargs.get('rule_workers', 4),
+                        'output': kwargs.get('output_workers', 4)}
+        self.rate_limit = worker.config_info.get('queue_data', {}).get(
+            'rate_limit', 0)
+        self.stages = {}
+        self._jobs = None
+        self._settling = set()
+        self._stopping = None
+        self._loop = None
+
+
+    async def fetch(self, func, *args, **kwargs):
+        """Runs a blocking request in the `fetch` stage."""
+        return await self.stages['fetch'].call(func, *args, **kwargs)
+
+
+    async def evaluate(self, func, *args, **kwargs):
+        """Runs blocking rule work in the `rules` stage."""
+        return await self.stages['rules'].call(func, *args, **kwargs)
+
+
+    async def record(self, func, *args, **kwargs):
+        """Runs blocking reads and writes of the verdict cache and
+        checkpoints in the `process` stage."""
+        return await self.stages['process'].call(func, *args, **kwargs)
+
+
+    async def run_rules(self, rule_manager, **kwargs):
+        """Runs the rules on a script in the `rules` stage.
+
+        Arguments:
+            rule_manager (PluginManager): Manager of the rules
+            **kwargs: Arguments of `run_rules`
+
+        Returns:
+            list: Rules that fired
+        """
+        return await self.evaluate(rule_manager.run_rules, **kwargs)
+
+
+    async def report(self, report_data):
+        """Hands a report to the outputs in the `output` stage, waiting
+        while they are backed up.
+
+        Arguments:
+            report_data (dict): Report with a `results` list
+        """
+        await self.stages['output'].call(self.worker.report, report_data)
+
+
+    async def run_processor(self, processor_name, processor_data,
+                            config_info, job=None):
+        """Runs a processor, awaiting `run_async` if it has one and running
+        `run` in the `process` stage otherwise.
+
+        Returns:
+            dict: Report of the hits, if the processor returned them
+        """
+        proc_manager = self.worker.proc_manager
+        plugin = proc_manager.get_plugin(processor_name)
+
+        if not hasattr(plugin, 'run_async'):
+            return await self.stages['process'].call(
+                proc_manager.run_processor, processor_name, processor_data,
+                config_info, self.worker.rule_manager, job)
+        kwargs = {}
+        if job is not None and accepts_kwarg(plugin.run_async, 'checkpoint'):
+            kwargs['checkpoint'] = job
+        try:
+            return await plugin.run_async(data=processor_data,
+                                          config_info=config_info,
+                                          rule_manager=self.worker.rule_manager,
+                                          session=proc_manager.session,
+                                          pipeline=self, **kwargs)
+        except FlushError:
+            raise
+        except Exception as e:
+            logger.error(f'Cannot run processor {processor_name} '
+                         '(possible misconfigured)')
+            logger.error(e)
+            return {}
+
+
+    async def process(self, data, job=None):
+        """Processes the text of a queue message, the way
+        `Gunslinger.process` does.
+
+        Arguments:
+            data (str): JSON text of the message
+            job (Job, optional): Job the message belongs to, when resuming
+                an orphaned job
+        """
+        json_data = json.loads(data)
+        processor_name = json_data.get('processor', '')
+        checkpoints = self.worker.checkpoints
+        start = time.perf_counter()
+
+        if job is None and checkpoints:
+            job = await self.record(checkpoints.begin, data,
+                                    self.worker.report_checkpoint)
+            if job is None:
+                return
+        try:
+            with self.metrics.stage('message'):
+                returned_data = None
+                if processor_name:
+                    logger.info(f'Loading processor {processor_name}')
+                    config_info = self.worker.config_info.get(processor_name,
+                                                              {})
+                    with self.metrics.stage(processor_name):
+                        returned_data = await self.run_processor(
+                            processor_name, json_data.get('data', {}),
+                            config_info, job)
+                if returned_data:
+                    await self.report(returned_data)
+        except Exception:
+            self.worker.record_message(json_data, 'error')
+            if job:
+                await self.record(job.flush)
+            raise
+        if job:
+            await self.record(job.finish)
+        # May post the job's throughput to the feedback queue
+        await self.record(self.worker.record_message, json_data, 'ok',
+                          time.perf_counter() - start)
+
+
+    async def dequeue(self):
+        """Reads messages into the jobs queue until stopped, taking over
+        orphaned jobs when the queue is empty."""
+        worker = self.worker
+        message_queue = worker.message_queue
+        queue_stage = self.stages['queue']
+
+        def next_message():
+            data = worker.next_message()
+            return data, getattr(message_queue, 'last_receipt', None)
+
+        while not self._stopping.is_set():
+            data, receipt = await queue_stage.call(next_message)
+
+            if data:
+                await self._jobs.put((data, receipt, None))
+                continue
+            job = None
+            if worker.checkpoints:
+                job = await queue_stage.call(worker.checkpoints.claim_orphan,
+                                             worker.report_checkpoint)
+            if job is not None:
+                await self._jobs.put((job.body, None, job))
+                continue
+            try:
+                await asyncio.wait_for(self._stopping.wait(),
+                                       self.rate_limit or 1)
+            except asyncio.TimeoutError:
+                pass
+        for _ in range(self.max_jobs):
+            await self._jobs.put(None)
+
+
+    def settle(self, receipt, success):
+        """Acknowledges or releases a message in the background, so the job
+        slot is free while the queue thread may still be polling.
+
+        Arguments:
+            receipt (str): Receipt of the message
+            success (bool): Whether the message was processed
+        """
+        message_queue = self.worker.message_queue
+        method = message_queue.ack_message if success else \
+            message_queue.release_message
+        task = asyncio.ensure_future(self.stages['queue'].call(method,
+                                                               receipt))
+        self._settling.add(task)
+        task.add_done_callback(self._settling.discard)
+
+
+    async def run_jobs(self):
+        """Processes jobs from the jobs queue until told to stop."""
+        while True:
+            entry = await self._jobs.get()
+
+            if entry is None:
+                return
+            data, receipt, job = entry
+            if self._stopping.is_set() and job is None:
+                # Messages read ahead go back to the queue on shutdown
+                self.settle(receipt, False)
+                continue
+            try:
+                await self.process(data, job)
+                if job is None:
+                    self.settle(receipt, True)
+            except Exception as e:
+                logger.error(e)
+                if job is None:
+                    self.settle(receipt, False)
+
+
+    def stop(self):
+        logger.info('Stopping the pipeline')
+        self._stopping.set()
+
+
+    async def main(self):
+        self._loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        self._jobs = asyncio.Queue(self.prefetch)
+        self.stages = {name: Stage(name, workers, self.metrics)
+                       for name, workers in self.workers.items()}
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            self._loop.add_signal_handler(signum, self.stop)
+        try:
+            await asyncio.gather(self.dequeue(),
+                                 *[self.run_jobs()
+                                   for _ in range(self.max_jobs)])
+        finally:
+            await asyncio.gather(*self._settling, return_exceptions=True)
+            for stage in self.stages.values():
+                stage.close()
+
+
+    def run(self):
+        """Runs the pipeline until SIGTERM or SIGINT."""
+        asyncio.run(self.main())
@@ -0,0 +1,326 @@
+import os
+import time
+import hashlib
+import sqlite3
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class FlushError(Exception):
+    """The hits of a job could not be sent, so the job cannot finish and
+    has to run again."""
+
+
+def is_alive(pid):
+    """Checks whether a process on this host is still running.
+
+    Arguments:
+        pid (int): Process ID
+
+    Returns:
+        bool: True if the process exists
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class CheckpointStore():
+    """Local SQLite store of the progress of the jobs being processed.
+
+    A job is identified by the hash of its message. While it runs, the
+    processor marks the parts of it that are done (results, responses,
+    pages, ...) and their hits are sent to the outputs in batches, before
+    the marks are committed. A job that is delivered again after its worker
+    died resumes where the checkpoint stopped, a job that already finished
+    is skipped. Jobs whose owner died, or whose owner stopped saving
+    progress for `stale_after` seconds, can be taken over with
+    `claim_orphan`, so jobs whose message was already claimed or deleted
+    are not lost.
+
+    Arguments:
+        path (str, optional): Path of the SQLite database, shared by the
+            workers of a host
+        flush_items (int, optional): Finished parts saved per flush
+        flush_results (int, optional): Hits that trigger a flush
+        flush_interval (float, optional): Seconds between flushes
+        stale_after (int, optional): Seconds without progress after which a
+            job of a live process counts as orphaned
+        keep_done (int, optional): Seconds finished jobs are remembered
+    """
+
+    def __init__(self, **kwargs):
+        path = kwargs.get('path', 'state/checkpoints.db')
+        self.flush_items = kwargs.get('flush_items', 100)
+        self.flush_results = kwargs.get('flush_results', 50)
+        self.flush_interval = kwargs.get('flush_interval', 30)
+        self.stale_after = kwargs.get('stale_after', 3600)
+        self.keep_done = kwargs.get('keep_done', 900)
+        self.pid = os.getpid()
+        directory = os.path.dirname(path)
+
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS jobs ('
+                          'job_id TEXT PRIMARY KEY, '
+                          'body TEXT NOT NULL, '
+                          "state TEXT NOT NULL DEFAULT 'running', "
+                          'owner INTEGER NOT NULL, '
+                          'updated REAL NOT NULL)')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS jobs_state ON '
+                          'jobs (state, updated)')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS items ('
+                          'job_id TEXT NOT NULL, '
+                          'kind TEXT NOT NULL, '
+                          'key TEXT NOT NULL, '
+                          'PRIMARY KEY (job_id, kind, key))')
+        self._lock = threading.Lock()
+
+
+    def transaction(self, func, *args):
+        with self._lock:
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = func(*args)
+                self.conn.execute('COMMIT')
+                return result
+            except Exception:
+                self.conn.execute('ROLLBACK')
+                raise
+
+
+    def begin(self, body, report):
+        """Starts or resumes the job of a message.
+
+        Arguments:
+            body (str): Text of the message
+            report (callable): Called with report dicts of hits as they are
+                flushed, returns once they were sent and raises if they
+                could not be
+
+        Returns:
+            Job: The job, None if it is finished or another live process
+                is working on it
+        """
+        job_id = hashlib.sha256(body.encode('utf-8')).hexdigest()
+
+        def claim():
+            now = time.time()
+            self.evict(now)
+            row = self.conn.execute('SELECT state, owner, updated FROM jobs '
+                                    'WHERE job_id=?', (job_id,)).fetchone()
+            if row is None:
+                self.conn.execute('INSERT INTO jobs (job_id, body, owner, '
+                                  'updated) VALUES (?, ?, ?, ?)',
+                                  (job_id, body, self.pid, now))
+                return True
+            state, owner, updated = row
+            if state == 'done':
+                logger.info(f'Job {job_id[:12]} is already done')
+                return False
+            if owner != self.pid and is_alive(owner) and \
+               now - updated < self.stale_after:
+                logger.info(f'Job {job_id[:12]} is running in {owner}')
+                return False
+            self.conn.execute('UPDATE jobs SET owner=?, updated=? WHERE '
+                              'job_id=?', (self.pid, now, job_id))
+            return True
+
+        if not self.transaction(claim):
+            return None
+        return Job(self, job_id, body, report)
+
+
+    def claim_orphan(self, report):
+        """Takes over a job whose owner died or stopped making progress.
+
+        Arguments:
+            report (callable): Called with report dicts of hits as they are
+                flushed, returns once they were sent and raises if they
+                could not be
+
+        Returns:
+            Job: The job, None if there is no orphaned job
+        """
+        def claim():
+            now = time.time()
+            rows = self.conn.execute("SELECT job_id, body, owner, updated "
+                                     "FROM jobs WHERE state='running' AND "
+                                     'owner != ? ORDER BY updated',
+                                     (self.pid,)).fetchall()
+            for job_id, body, owner, updated in rows:
+                if is_alive(owner) and now - updated < self.stale_after:
+                    continue
+                self.conn.execute('UPDATE jobs SET owner=?, updated=? WHERE '
+                                  'job_id=?', (self.pid, now, job_id))
+                return job_id, body
+            return None
+
+        claimed = self.transaction(claim)
+
+        if claimed is None:
+            return None
+        logger.info(f'Resuming orphaned job {claimed[0][:12]}')
+        return Job(self, claimed[0], claimed[1], report)
+
+
+    def get_items(self, job_id):
+        with self._lock:
+            rows = self.conn.execute('SELECT kind, key FROM items WHERE '
+                                     'job_id=?', (job_id,)).fetchall()
+        items = {}
+        for kind, key in rows:
+            items.setdefault(kind, set()).add(key)
+        return items
+
+
+    def save(self, job_id, items, state='running'):
+        """Saves finished parts of a job.
+
+        Arguments:
+            job_id (str): ID of the job
+            items (list): (kind, key) tuples of the finished parts
+            state (str, optional): State of the job, `done` once it finished
+        """
+        def write():
+            self.conn.executemany('INSERT OR IGNORE INTO items (job_id, '
+                                  'kind, key) VALUES (?, ?, ?)',
+                                  [(job_id, kind, key)
+                                   for kind, key in items])
+            self.conn.execute('UPDATE jobs SET state=?, updated=? WHERE '
+                              'job_id=?', (state, time.time(), job_id))
+            if state == 'done':
+                self.conn.execute('DELETE FROM items WHERE job_id=?',
+                                  (job_id,))
+
+        self.transaction(write)
+
+
+    def evict(self, now):
+        self.conn.execute("DELETE FROM jobs WHERE state='done' AND "
+                          'updated < ?', (now - self.keep_done,))
+
+
+class Job():
+    """Progress of one job, kept in a CheckpointStore.
+
+    Arguments:
+        store (CheckpointStore): Store the job is saved in
+        job_id (str): ID of the job
+        body (str): Text of the message
+        report (callable): Called with report dicts of hits as they are
+            flushed, returns once they were sent and raises if they could
+            not be
+    """
+
+    def __init__(self, store, job_id, body, report):
+        self.store = store
+        self.job_id = job_id
+        self.body = body
+        self.report = report
+        self.done = store.get_items(job_id)
+        self._items = []
+        self._results = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+        # Set once a flush failed, the job can no longer be marked done
+        self.failed = False
+        if self.done:
+            count = sum(len(keys) for keys in self.done.values())
+            logger.info(f'Job {job_id[:12]} resumes after {count} '
+                        'finished part(s)')
+
+
+    def is_done(self, kind, key):
+        """Checks whether a part of the job was finished before.
+
+        Arguments:
+            kind (str): Kind of part, e.g. `result`
+            key (str): Key of the part, e.g. its URL
+
+        Returns:
+            bool: True if it is finished
+        """
+        with self._lock:
+            return key in self.done.get(kind, ())
+
+
+    def get_done(self, kind):
+        """Gets the finished parts of a kind.
+
+        Arguments:
+            kind (str): Kind of part
+
+        Returns:
+            set: Keys of the finished parts
+        """
+        with self._lock:
+            return set(self.done.get(kind, ()))
+
+
+    def complete(self, kind, key, results=()):
+        """Marks a part of the job as finished. Raises a FlushError if its
+        hits had to be sent and could not be.
+
+        Arguments:
+            kind (str): Kind of part
+            key (str): Key of the part
+            results (list, optional): Hits found in the part
+        """
+        with self._lock:
+            self.done.setdefault(kind, set()).add(key)
+            self._items.append((kind, key))
+            self._results += results
+            due = len(self._items) >= self.store.flush_items or \
+                len(self._results) >= self.store.flush_results or \
+                time.monotonic() - self._last_flush >= \
+                self.store.flush_interval
+        # Sending may take a while, other threads keep completing parts
+        if due:
+            self.flush()
+
+
+    def flush(self, state='running'):
+        """Sends the hits collected so far to the outputs, then saves the
+        parts they came from. If the hits cannot be sent, they and their
+        parts are kept for the next flush, the job is marked as failed and
+        a FlushError is raised.
+
+        Arguments:
+            state (str, optional): State of the job
+        """
+        with self._lock:
+            items, self._items = self._items, []
+            results, self._results = self._results, []
+            self._last_flush = time.monotonic()
+        try:
+            if results:
+                self.report({'results': results})
+            self.store.save(self.job_id, items, state)
+        except Exception as e:
+            with self._lock:
+                self._items = items + self._items
+                self._results = results + self._results
+                self.failed = True
+            raise FlushError(f'Cannot save job {self.job_id[:12]}: {e}') \
+                from e
+
+
+    def finish(self):
+        """Flushes what is left and marks the job as done. A job whose
+        flush failed only saves its progress and raises a FlushError, since
+        parts after the failure may have been left out."""
+        if self.failed:
+            self.flush()
+            raise FlushError(f'Job {self.job_id[:12]} did not finish')
+        self.flush('done')
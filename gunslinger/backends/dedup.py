@@ -0,0 +1,148 @@
+import os
+import time
+import sqlite3
+import logging
+from urllib.parse import urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+
+class DedupFilter():
+    """Drops scan results of pages that were already queued recently.
+
+    Each result is keyed on its page, either the URL (without fragment) or
+    only the domain, taken from the `page` fields of the search result and
+    falling back to `task`. A key is remembered for `cooldown` seconds,
+    which can be overridden per domain; an entry for a domain also applies
+    to its subdomains and a cooldown of 0 disables deduplication for it.
+    Keys are kept in SQLite so the filter survives restarts.
+
+    Arguments:
+        path (str, optional): Path of the SQLite database
+        key (str, optional): `url` or `domain`
+        cooldown (int, optional): Seconds a page is not queued again
+        domain_cooldowns (dict, optional): Cooldowns for specific domains
+        max_entries (int, optional): Maximum number of remembered keys
+        evict_every (int, optional): Checks between evictions of expired keys
+    """
+
+    def __init__(self, **kwargs):
+        path = kwargs.get('path', 'state/dedup.db')
+        self.key = kwargs.get('key', 'url')
+        self.cooldown = kwargs.get('cooldown', 3600)
+        self.domain_cooldowns = {domain.lower().strip('.'): seconds
+                                 for domain, seconds in
+                                 kwargs.get('domain_cooldowns', {}).items()}
+        self.max_entries = kwargs.get('max_entries', 1000000)
+        self.evict_every = kwargs.get('evict_every', 10000)
+        directory = os.path.dirname(path)
+
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS seen ('
+                           'key TEXT PRIMARY KEY, '
+                           'expires REAL NOT NULL)')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS seen_expires ON '
+                           'seen (expires)')
+        self._conn.commit()
+        self._checks = 0
+        self.duplicates = 0
+
+
+    def get_cooldown(self, domain):
+        """Gets the cooldown of a domain, using the closest configured
+        parent domain.
+
+        Arguments:
+            domain (str): Domain of the page
+
+        Returns:
+            int: Cooldown in seconds
+        """
+        parts = domain.split('.')
+
+        for i in range(len(parts)):
+            parent = '.'.join(parts[i:])
+            if parent in self.domain_cooldowns:
+                return self.domain_cooldowns[parent]
+        return self.cooldown
+
+
+    def get_key(self, result):
+        """Gets the dedup key and domain of a search result.
+
+        Arguments:
+            result (dict): URLScan search result
+
+        Returns:
+            str: Key of the page, None if the result has no URL
+            str: Domain of the page
+        """
+        page = result.get('page', {})
+        task = result.get('task', {})
+        url = page.get('url') or task.get('url') or ''
+        domain = (page.get('domain') or task.get('domain') or
+                  urlsplit(url).hostname or '').lower()
+
+        if self.key == 'domain':
+            return (f'domain:{domain}' if domain else None), domain
+        if not url:
+            return None, domain
+        parts = urlsplit(url)
+        url = urlunsplit((parts.scheme.lower(), parts.netloc.lower(),
+                          parts.path or '/', parts.query, ''))
+        return f'url:{url}', domain
+
+
+    def filter(self, results):
+        """Removes the results whose page is still in its cooldown, and
+        starts the cooldown of the others.
+
+        Arguments:
+            results (list): URLScan search results
+
+        Returns:
+            list: Results that should be queued
+        """
+        now = time.time()
+        new_results = []
+
+        with self._conn:
+            for result in results:
+                key, domain = self.get_key(result)
+                cooldown = self.get_cooldown(domain)
+
+                if key is None or cooldown <= 0:
+                    new_results.append(result)
+                    continue
+                row = self._conn.execute('SELECT expires FROM seen WHERE '
+                                         'key=?', (key,)).fetchone()
+                if row is not None and row[0] > now:
+                    self.duplicates += 1
+                    continue
+                self._conn.execute('INSERT OR REPLACE INTO seen VALUES '
+                                   '(?, ?)', (key, now + cooldown))
+                new_results.append(result)
+        dropped = len(results) - len(new_results)
+
+        if dropped:
+            logger.info(f'Dropped {dropped} duplicate result(s)')
+        self._checks += len(results)
+        if self._checks >= self.evict_every:
+            self._checks = 0
+            self._evict(now)
+        return new_results
+
+
+    def _evict(self, now):
+        with self._conn:
+            self._conn.execute('DELETE FROM seen WHERE expires <= ?', (now,))
+            count = self._conn.execute('SELECT COUNT(*) FROM '
+                                       'seen').fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute('DELETE FROM seen WHERE key IN (SELECT '
+                                   'key FROM seen ORDER BY expires LIMIT ?)',
+                                   (count - self.max_entries,))
@@ -0,0 +1,92 @@
+import re
+import logging
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+logger = logging.getLogger(__name__)
+
+# Inline scripts with any other type (JSON, templates, ...) are not code
+SCRIPT_TYPES = ('', 'text/javascript', 'application/javascript', 'module',
+                'text/ecmascript', 'application/ecmascript',
+                'application/x-javascript')
+
+SCRIPT_OPEN = re.compile(rb'<script\b([^>]*)>', re.IGNORECASE)
+SCRIPT_CLOSE = re.compile(rb'</script\s*>', re.IGNORECASE)
+SCRIPT_SRC = re.compile(rb'\bsrc\s*=', re.IGNORECASE)
+SCRIPT_TYPE = re.compile(rb'''\btype\s*=\s*["']?([^"'\s>]*)''',
+                         re.IGNORECASE)
+NOT_SPACE = re.compile(rb'\S')
+
+
+def split_inline_scripts(buffer):
+    """Finds the inline scripts of an HTML document without copying it.
+
+    Scripts with a `src` or a type that is not JavaScript are skipped, as
+    are empty ones.
+
+    Arguments:
+        buffer (bytes-like): Raw bytes of the document
+
+    Returns:
+        list: memoryview slices of `buffer`, one per inline script
+    """
+    buffer = memoryview(buffer)
+    segments = []
+    position = 0
+
+    while True:
+        start = SCRIPT_OPEN.search(buffer, position)
+        if start is None:
+            break
+        end = SCRIPT_CLOSE.search(buffer, start.end())
+        if end is None:
+            break
+        position = end.end()
+        attributes = start.group(1)
+        if SCRIPT_SRC.search(attributes):
+            continue
+        script_type = SCRIPT_TYPE.search(attributes)
+        if script_type and script_type.group(1).decode(
+                'ISO-8859-1').strip().lower() not in SCRIPT_TYPES:
+            continue
+        if NOT_SPACE.search(buffer, start.end(), end.start()):
+            segments.append(buffer[start.end():end.start()])
+    return segments
+
+
+class ScriptExtractor(HTMLParser):
+    """Collects the scripts of an HTML page while it is fed in chunks.
+
+    Only `<script>` and `<base>` tags are looked at, no tree is built.
+    External script URLs are resolved against the page URL (or its
+    `<base href>`) with `urljoin`. Inline scripts are left to
+    `split_inline_scripts`, which slices them out of the raw bytes.
+
+    Arguments:
+        url (str): URL of the page
+    """
+
+    def __init__(self, url):
+        super().__init__(convert_charrefs=False)
+        self.base_url = url
+        self.script_urls = []
+        self._seen = set()
+        self._has_base = False
+
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'base' and not self._has_base:
+            href = dict(attrs).get('href')
+            if href:
+                self.base_url = urljoin(self.base_url, href.strip())
+                self._has_base = True
+        elif tag == 'script':
+            attrs = dict(attrs)
+            src = (attrs.get('src') or '').strip()
+
+            if src:
+                url = urljoin(self.base_url, src)
+                if url.startswith(('http://', 'https://')) and \
+                   url not in self._seen:
+                    self._seen.add(url)
+                    self.script_urls.append(url)
@@ -0,0 +1,186 @@
+import time
+import logging
+import threading
+from datetime import datetime as dt, timezone
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+_session = None
+
+
+def get_session(**kwargs):
+    """Gets the process wide HTTP session, creating it on first use.
+
+    Arguments:
+        **kwargs: Passed on to HTTPSession when the session is created
+
+    Returns:
+        HTTPSession: The shared session
+    """
+    global _session
+
+    if _session is None:
+        _session = HTTPSession(**kwargs)
+    return _session
+
+
+class HostRateLimiter():
+    """Tracks rate limits per host from the rate-limit headers of responses.
+
+    URLScan reports the remaining quota in `X-Rate-Limit-Remaining` and when
+    it resets in `X-Rate-Limit-Reset-After` (seconds) or `X-Rate-Limit-Reset`
+    (timestamp). Once a host's quota is used up, requests to it wait until
+    the reset. A fixed minimum interval between requests can also be set
+    per host.
+
+    Arguments:
+        min_intervals (dict, optional): Host to minimum seconds between
+            requests
+    """
+
+    def __init__(self, min_intervals=None):
+        self._min_intervals = min_intervals or {}
+        self._blocked_until = {}
+        self._last_request = {}
+        self._lock = threading.Lock()
+
+
+    def wait(self, host):
+        """Blocks until a request to the host is allowed.
+
+        Arguments:
+            host (str): Host the request goes to
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                ready_at = self._blocked_until.get(host, 0)
+                interval = self._min_intervals.get(host, 0)
+                if interval:
+                    ready_at = max(ready_at,
+                                   self._last_request.get(host, 0) + interval)
+                if ready_at <= now:
+                    self._last_request[host] = now
+                    return
+            delay = ready_at - now
+            logger.info(f'Rate limited by {host}, waiting {delay:.1f}s')
+            time.sleep(delay)
+
+
+    def update(self, host, response):
+        """Reads the rate-limit headers of a response.
+
+        Arguments:
+            host (str): Host the response came from
+            response (requests.Response): Response to read the headers of
+        """
+        headers = response.headers
+        remaining = headers.get('X-Rate-Limit-Remaining')
+        retry_after = headers.get('Retry-After')
+
+        if response.status_code == 429 and retry_after:
+            delay = self.parse_delay(retry_after)
+        elif remaining is not None and remaining.isdigit() and \
+             int(remaining) == 0:
+            delay = self.parse_delay(headers.get('X-Rate-Limit-Reset-After'),
+                                     headers.get('X-Rate-Limit-Reset'))
+        else:
+            return
+        with self._lock:
+            blocked_until = time.monotonic() + delay
+            self._blocked_until[host] = max(self._blocked_until.get(host, 0),
+                                            blocked_until)
+
+
+    @staticmethod
+    def parse_delay(reset_after, reset_at=None):
+        """Gets the seconds until a rate limit resets.
+
+        Arguments:
+            reset_after (str): Seconds until the reset
+            reset_at (str, optional): ISO timestamp of the reset
+
+        Returns:
+            float: Seconds to wait, one second if the headers are unusable
+        """
+        try:
+            return max(float(reset_after), 0)
+        except (TypeError, ValueError):
+            pass
+        try:
+            reset = dt.fromisoformat(reset_at.replace('Z', '+00:00'))
+            if reset.tzinfo is None:
+                reset = reset.replace(tzinfo=timezone.utc)
+            return max((reset - dt.now(timezone.utc)).total_seconds(), 0)
+        except (AttributeError, TypeError, ValueError):
+            return 1.0
+
+
+class HTTPSession():
+    """Shared HTTP session for processors and outputs.
+
+    Connections are pooled and kept alive between requests, failed requests
+    are retried with exponential backoff on 429 and 5xx responses and every
+    request waits for the per-host rate limits.
+
+    Arguments:
+        pool_connections (int, optional): Number of host pools to keep
+        pool_maxsize (int, optional): Connections kept alive per host
+        retries (int, optional): Retries on connection errors and 429/5xx
+        backoff_factor (float, optional): Backoff factor between retries
+        min_intervals (dict, optional): Host to minimum seconds between
+            requests
+        timeout (int, optional): Default timeout for requests
+    """
+
+    def __init__(self, **kwargs):
+        pool_connections = kwargs.get('pool_connections', 10)
+        pool_maxsize = kwargs.get('pool_maxsize', 32)
+        self.timeout = kwargs.get('timeout', 10)
+        retry = Retry(total=kwargs.get('retries', 3),
+                      backoff_factor=kwargs.get('backoff_factor', 0.5),
+                      status_forcelist=[429, 500, 502, 503, 504],
+                      respect_retry_after_header=True,
+                      raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize,
+                              max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.rate_limiter = HostRateLimiter(kwargs.get('min_intervals'))
+
+
+    def request(self, method, url, **kwargs):
+        """Sends a request through the pooled session.
+
+        Arguments:
+            method (str): HTTP method
+            url (str): URL to request
+            **kwargs: Passed on to requests.Session.request
+
+        Returns:
+            requests.Response: Response object
+        """
+        host = urlparse(url).netloc
+        kwargs.setdefault('timeout', self.timeout)
+        self.rate_limiter.wait(host)
+        response = self.session.request(method, url, **kwargs)
+        self.rate_limiter.update(host, response)
+        return response
+
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+
+    def head(self, url, **kwargs):
+        return self.request('HEAD', url, **kwargs)
+
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
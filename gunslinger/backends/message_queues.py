@@ -0,0 +1,30 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def create_queue(queue_type, queue_data=None):
+    """Creates a message queue backend. Backends are imported when they are
+    used, so only the client library of the configured queue is needed.
+
+    Arguments:
+        queue_type (str): slack_mq, aws_sqs or sqlite_mq
+        queue_data (dict, optional): Arguments of the backend
+
+    Returns:
+        object: Message queue backend, None if the type is unknown
+    """
+    queue_data = queue_data or {}
+
+    if queue_type == 'slack_mq':
+        from backends.slack_backend import Slack_MQ
+        return Slack_MQ(**queue_data)
+    elif queue_type == 'aws_sqs':
+        from backends.sqs_backend import AWS_SQS
+        return AWS_SQS(**queue_data)
+    elif queue_type == 'sqlite_mq':
+        from backends.sqlite_backend import SQLite_MQ
+        return SQLite_MQ(**queue_data)
+    if queue_type:
+        logger.error(f'Unknown message queue {queue_type}')
+    return None
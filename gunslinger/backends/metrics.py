@@ -0,0 +1,444 @@
+import os
+import sys
+import json
+import time
+import signal
+import pstats
+import cProfile
+import logging
+import threading
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+logger = logging.getLogger(__name__)
+_metrics = None
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+HELP = {
+    'gunslinger_rule_seconds': 'Wall time of a rule on one script',
+    'gunslinger_rule_cpu_seconds_total': 'CPU time spent in a rule',
+    'gunslinger_rule_runs_total': 'Scripts a rule was run on',
+    'gunslinger_rule_fired_total': 'Scripts a rule fired on',
+    'gunslinger_rule_errors_total': 'Exceptions raised by a rule',
+    'gunslinger_rule_timeouts_total': 'Scripts a rule was stopped on',
+    'gunslinger_rule_quarantines_total': 'Times a rule was quarantined',
+    'gunslinger_stage_seconds': 'Wall time of a pipeline stage',
+    'gunslinger_stage_wait_seconds': 'Time spent waiting for a free worker '
+                                     'of an async pipeline stage',
+    'gunslinger_messages_total': 'Queue messages processed',
+    'gunslinger_responses_skipped_total': 'Responses not downloaded',
+}
+
+
+def get_metrics():
+    """Gets the process wide metrics registry, creating it on first use.
+
+    Returns:
+        Metrics: The registry
+    """
+    global _metrics
+
+    if _metrics is None:
+        _metrics = Metrics()
+    return _metrics
+
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    pairs = ','.join('{}="{}"'.format(key, str(value).replace('\\', '\\\\')
+                                      .replace('"', '\\"')
+                                      .replace('\n', '\\n'))
+                     for key, value in labels)
+    return '{' + pairs + '}'
+
+
+class Histogram():
+    """Distribution of observed values over fixed buckets.
+
+    Arguments:
+        buckets (tuple): Upper bounds of the buckets in ascending order
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+
+    def cumulative(self):
+        """Gets the bucket counts the way Prometheus expects them.
+
+        Returns:
+            list: (upper bound, observations less or equal to it) tuples
+        """
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class Metrics():
+    """Registry of counters and histograms, keyed by name and labels.
+
+    Every method is thread safe, so processors can record from their worker
+    threads. `prometheus` renders the registry in the Prometheus text format
+    and `snapshot` as a dict that can be dumped to JSON.
+    """
+
+    def __init__(self):
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+
+    def inc(self, name, amount=1, **labels):
+        """Adds to a counter.
+
+        Arguments:
+            name (str): Name of the counter
+            amount (float, optional): Amount to add
+            **labels: Labels of the counter
+        """
+        key = (name, tuple(sorted(labels.items())))
+
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+
+    def observe(self, name, value, **labels):
+        """Records a value in a histogram.
+
+        Arguments:
+            name (str): Name of the histogram
+            value (float): Observed value
+            **labels: Labels of the histogram
+        """
+        key = (name, tuple(sorted(labels.items())))
+
+        with self._lock:
+            if key not in self._histograms:
+                self._histograms[key] = Histogram()
+            self._histograms[key].observe(value)
+
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Times the body of a `with` block into a histogram.
+
+        Arguments:
+            name (str): Name of the histogram
+            **labels: Labels of the histogram
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+
+    def stage(self, stage):
+        """Times a pipeline stage, e.g. `with metrics.stage('output'):`.
+
+        Arguments:
+            stage (str): Name of the stage
+
+        Returns:
+            contextmanager: Timer for the stage
+        """
+        return self.timer('gunslinger_stage_seconds', stage=stage)
+
+
+    def record_rule(self, rule, wall, cpu, fired=None, error=False):
+        """Records one run of a rule on a script.
+
+        Arguments:
+            rule (str): Name of the rule
+            wall (float): Wall time in seconds
+            cpu (float): CPU time in seconds
+            fired (bool, optional): Whether the rule fired
+            error (bool, optional): Whether the rule raised an exception
+        """
+        self.observe('gunslinger_rule_seconds', wall, rule=rule)
+        self.inc('gunslinger_rule_cpu_seconds_total', cpu, rule=rule)
+        self.inc('gunslinger_rule_runs_total', rule=rule)
+        if fired:
+            self.inc('gunslinger_rule_fired_total', rule=rule)
+        if error:
+            self.inc('gunslinger_rule_errors_total', rule=rule)
+
+
+    def snapshot(self):
+        """Gets the current value of every metric.
+
+        Returns:
+            dict: Counters and histograms with their labels
+        """
+        with self._lock:
+            counters = [{'name': name, 'labels': dict(labels), 'value': value}
+                        for (name, labels), value in self._counters.items()]
+            histograms = [{'name': name, 'labels': dict(labels),
+                           'count': histogram.count, 'sum': histogram.sum,
+                           'buckets': histogram.cumulative()}
+                          for (name, labels), histogram
+                          in self._histograms.items()]
+        return {'pid': os.getpid(),
+                'timestamp': time.time(),
+                'uptime': time.time() - self.started,
+                'counters': sorted(counters, key=lambda c: c['name']),
+                'histograms': sorted(histograms, key=lambda h: h['name'])}
+
+
+    def prometheus(self):
+        """Renders every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: Metrics text
+        """
+        lines = []
+        seen = set()
+
+        def header(name, metric_type):
+            if name in seen:
+                return
+            seen.add(name)
+            if name in HELP:
+                lines.append(f'# HELP {name} {HELP[name]}')
+            lines.append(f'# TYPE {name} {metric_type}')
+
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items(),
+                                key=lambda item: item[0])
+            histograms = [(key, histogram.cumulative(), histogram.count,
+                           histogram.sum) for key, histogram in histograms]
+        for (name, labels), value in counters:
+            header(name, 'counter')
+            lines.append(f'{name}{format_labels(labels)} {value}')
+        for (name, labels), buckets, count, total in histograms:
+            header(name, 'histogram')
+            for bound, bucket_count in buckets + [('+Inf', count)]:
+                bucket_labels = labels + (('le', bound),)
+                lines.append(f'{name}_bucket{format_labels(bucket_labels)} '
+                             f'{bucket_count}')
+            lines.append(f'{name}_sum{format_labels(labels)} {total}')
+            lines.append(f'{name}_count{format_labels(labels)} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+    def dump(self, path):
+        """Writes a JSON snapshot, replacing the previous one atomically.
+
+        Arguments:
+            path (str): Path of the JSON file
+        """
+        directory = os.path.dirname(path)
+
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(self.snapshot(), f)
+        os.replace(path + '.tmp', path)
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """Serves `/metrics` in the Prometheus text format and `/metrics.json`
+    as a JSON snapshot."""
+
+    def do_GET(self):
+        metrics = self.server.metrics
+        path = self.path.split('?')[0]
+
+        if path == '/metrics':
+            body = metrics.prometheus().encode()
+            content_type = 'text/plain; version=0.0.4'
+        elif path == '/metrics.json':
+            body = json.dumps(metrics.snapshot()).encode()
+            content_type = 'application/json'
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+    def log_message(self, *args):
+        pass
+
+
+class MetricsExporter():
+    """Exposes the metrics of this process over HTTP and/or periodic JSON
+    dumps, both running in daemon threads.
+
+    Arguments:
+        metrics (Metrics): Registry to export
+        port (int, optional): Port of the HTTP endpoint, not served if unset
+        host (str, optional): Address the HTTP endpoint binds to
+        dump_path (str, optional): JSON dump file, `{pid}` is replaced by
+            the process ID
+        dump_interval (int, optional): Seconds between JSON dumps
+    """
+
+    def __init__(self, metrics, **kwargs):
+        self.metrics = metrics
+        self.port = kwargs.get('port')
+        self.host = kwargs.get('host', '127.0.0.1')
+        dump_path = kwargs.get('dump_path')
+        self.dump_path = dump_path.format(pid=os.getpid()) if dump_path \
+            else None
+        self.dump_interval = kwargs.get('dump_interval', 60)
+        self._server = None
+        self._stop = threading.Event()
+
+
+    def start(self):
+        if self.port is not None:
+            self._server = ThreadingHTTPServer((self.host, self.port),
+                                               MetricsHandler)
+            self._server.daemon_threads = True
+            self._server.metrics = self.metrics
+            threading.Thread(target=self._server.serve_forever,
+                             daemon=True).start()
+            logger.info(f'Serving metrics on {self.host}:{self.port}')
+        if self.dump_path:
+            threading.Thread(target=self.dump_loop, daemon=True).start()
+
+
+    def dump_loop(self):
+        while not self._stop.wait(self.dump_interval):
+            try:
+                self.metrics.dump(self.dump_path)
+            except Exception as e:
+                logger.error(f'Cannot dump metrics to {self.dump_path}')
+                logger.error(e)
+
+
+    def stop(self):
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self.dump_path:
+            self.metrics.dump(self.dump_path)
+
+
+class MessageProfiler():
+    """Runs cProfile on single messages on request.
+
+    Profiling is opt-in: every `every`-th message is profiled, and sending
+    SIGUSR1 to the process profiles the next message. Each profile is
+    written to `path` as a pstats file and its top functions are logged.
+
+    Threads started while a message is profiled (e.g. the fetch and rule
+    pools of the processors) get a profiler of their own, which is merged
+    into the profile of the message. Threads that were already running,
+    like the output dispatcher's, are not profiled.
+
+    Arguments:
+        path (str, optional): Directory the profiles are written to
+        every (int, optional): Profile one message out of this many, 0 only
+            profiles on SIGUSR1
+        top (int, optional): Number of functions logged per profile
+    """
+
+    def __init__(self, **kwargs):
+        self.path = kwargs.get('path', 'logs/profiles')
+        self.every = kwargs.get('every', 0)
+        self.top = kwargs.get('top', 25)
+        self._messages = 0
+        self._requested = False
+        if hasattr(signal, 'SIGUSR1') and \
+           threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGUSR1, self.request)
+
+
+    def request(self, signum=None, frame=None):
+        """Profiles the next message."""
+        self._requested = True
+
+
+    def should_profile(self):
+        self._messages += 1
+        if self._requested:
+            self._requested = False
+            return True
+        return bool(self.every) and self._messages % self.every == 0
+
+
+    def run(self, func, *args, **kwargs):
+        """Calls a function, profiling it if this message was selected.
+
+        Arguments:
+            func (callable): Function processing the message
+
+        Returns:
+            object: Return value of the function
+        """
+        if not self.should_profile():
+            return func(*args, **kwargs)
+        profiler = cProfile.Profile()
+        profilers = [profiler]
+
+        if sys.version_info >= (3, 12):
+            # cProfile is built on sys.monitoring, which sees every thread
+            try:
+                return profiler.runcall(func, *args, **kwargs)
+            finally:
+                self.save(profilers)
+        lock = threading.Lock()
+
+        def start_thread_profiler(frame, event, arg):
+            # Called once in every new thread, then replaced by its profiler
+            sys.setprofile(None)
+            thread_profiler = cProfile.Profile()
+            with lock:
+                profilers.append(thread_profiler)
+            thread_profiler.enable()
+
+        threading.setprofile(start_thread_profiler)
+        try:
+            return profiler.runcall(func, *args, **kwargs)
+        finally:
+            threading.setprofile(None)
+            with lock:
+                self.save(list(profilers))
+
+
+    def save(self, profilers):
+        """Writes the merged profile of a message and logs its top
+        functions.
+
+        Arguments:
+            profilers (list): Profilers of the threads of the message
+        """
+        if not os.path.exists(self.path):
+            os.makedirs(self.path, exist_ok=True)
+        name = f'profile_{os.getpid()}_{int(time.time() * 1000)}.prof'
+        path = os.path.join(self.path, name)
+        stats = pstats.Stats(*profilers)
+        stats.dump_stats(path)
+        top = sorted(stats.stats.items(), key=lambda item: item[1][3],
+                     reverse=True)[:self.top]
+        logger.info(f'Profiled message, written to {path}')
+        for (filename, line, function), (_, calls, tottime, cumtime, _) in top:
+            logger.info(f'{cumtime:10.4f}s cum {tottime:10.4f}s own '
+                        f'{calls:8d} calls {function} '
+                        f'({os.path.basename(filename)}:{line})')
@@ -0,0 +1,248 @@
+import time
+import queue
+import logging
+import threading
+from backends.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+def merge_reports(reports):
+    """Coalesces several reports into one.
+
+    Arguments:
+        reports (list): Report dicts with a `results` list
+
+    Returns:
+        dict: Report holding the results of every report
+    """
+    merged = {'results': []}
+
+    for report in reports:
+        merged['results'] += report.get('results', [])
+    return merged
+
+
+class Delivery():
+    """Lets the thread that submitted a report wait until it was sent."""
+
+    def __init__(self):
+        self.sent = False
+        self._event = threading.Event()
+
+
+    def set(self, sent):
+        self.sent = sent
+        self._event.set()
+
+
+    def wait(self):
+        """Waits until the report was sent or dropped.
+
+        Returns:
+            bool: True if it was sent
+        """
+        self._event.wait()
+        return self.sent
+
+
+class OutputWorker():
+    """Sends the reports of one output from a background thread.
+
+    Reports are collected for up to `batch_window` seconds or until
+    `batch_size` results are waiting, then sent as a single report. A report
+    submitted with a Delivery is sent right away, with whatever was
+    collected before it. Failed
+    sends are retried with exponential backoff. If the output plugin has an
+    `init(config_info, session=None)` function, the object it returns is
+    created once and passed to `run` as `handler`, so clients and channel
+    lookups are reused between sends.
+
+    Arguments:
+        out_manager (PluginManager): Manager of the output plugins
+        config_info (dict): Config of the output, `name` is the plugin
+        batch_window (float, optional): Seconds reports are collected for
+        batch_size (int, optional): Results that trigger a send right away
+        max_retries (int, optional): Retries of a failed send
+        backoff (float, optional): Seconds before the first retry
+        max_backoff (float, optional): Longest wait between retries
+        max_pending (int, optional): Reports buffered before `submit` blocks
+    """
+
+    def __init__(self, out_manager, config_info, **kwargs):
+        self.out_manager = out_manager
+        self.config_info = config_info
+        self.name = config_info['name']
+        self.batch_window = kwargs.get('batch_window', 5)
+        self.batch_size = kwargs.get('batch_size', 50)
+        self.max_retries = kwargs.get('max_retries', 5)
+        self.backoff = kwargs.get('backoff', 2)
+        self.max_backoff = kwargs.get('max_backoff', 300)
+        self._queue = queue.Queue(kwargs.get('max_pending', 10000))
+        self._module = None
+        self._handler = None
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self.run, daemon=True,
+                                        name=f'output-{self.name}')
+        self._thread.start()
+
+
+    def submit(self, report_data, delivery=None):
+        """Queues a report.
+
+        Arguments:
+            report_data (dict): Report with a `results` list
+            delivery (Delivery, optional): Set once the report was sent
+        """
+        self._queue.put((report_data, delivery))
+
+
+    def get_handler(self, plugin):
+        """Gets the long-lived handler of the plugin, creating it again when
+        the plugin was reloaded.
+
+        Arguments:
+            plugin (module): Output plugin
+
+        Returns:
+            object: Handler returned by the plugin's `init`, None if it has
+                no `init`
+        """
+        if plugin is not self._module:
+            self._module = plugin
+            self._handler = None
+            if hasattr(plugin, 'init'):
+                self._handler = plugin.init(self.config_info,
+                                            session=self.out_manager.session)
+        return self._handler
+
+
+    def send(self, report_data):
+        """Sends a report, retrying with exponential backoff.
+
+        Arguments:
+            report_data (dict): Report to send
+
+        Returns:
+            bool: True if it was sent, False if it was dropped
+        """
+        delay = self.backoff
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                plugin = self.out_manager.get_plugin(self.name)
+                kwargs = {}
+                handler = self.get_handler(plugin)
+                if handler is not None:
+                    kwargs['handler'] = handler
+                with get_metrics().stage('output'):
+                    self.out_manager.run_output(self.name, report_data,
+                                                self.config_info,
+                                                raise_errors=True, **kwargs)
+                return True
+            except Exception as e:
+                logger.error(f'Cannot send to output {self.name} (attempt '
+                             f'{attempt + 1}): {e}')
+                # The handler may hold a broken connection
+                self._module = None
+            if attempt < self.max_retries:
+                # Retry right away when shutting down, so flushing is quick
+                self._stopping.wait(delay)
+                delay = min(delay * 2, self.max_backoff)
+        logger.error(f'Dropped {len(report_data["results"])} result(s) for '
+                     f'output {self.name}: {report_data}')
+        return False
+
+
+    def run(self):
+        while True:
+            item = self._queue.get()
+
+            if item is None:
+                return
+            report, delivery = item
+            batch = [report]
+            deliveries = [delivery]
+            count = len(report.get('results', []))
+            deadline = time.monotonic() + self.batch_window
+            stop = False
+
+            while count < self.batch_size and delivery is None:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                report, delivery = item
+                batch.append(report)
+                deliveries.append(delivery)
+                count += len(report.get('results', []))
+            sent = self.send(merge_reports(batch))
+            for delivery in deliveries:
+                if delivery is not None:
+                    delivery.set(sent)
+            if stop:
+                return
+
+
+    def close(self, timeout=None):
+        """Sends what is still buffered and stops the thread.
+
+        Arguments:
+            timeout (float, optional): Seconds to wait for the thread
+        """
+        self._stopping.set()
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+
+class OutputDispatcher():
+    """Hands reports to one background OutputWorker per configured output,
+    so slow outputs never hold up rule evaluation or each other.
+
+    Arguments:
+        out_manager (PluginManager): Manager of the output plugins
+        outputs (list): Output configs
+        **kwargs: Batching and retry settings for the OutputWorkers
+    """
+
+    def __init__(self, out_manager, outputs, **kwargs):
+        self.workers = [OutputWorker(out_manager, output, **kwargs)
+                        for output in outputs]
+
+
+    def submit(self, report_data, wait=False):
+        """Queues a report for every output. When waiting, a RuntimeError
+        is raised if an output dropped the report.
+
+        Arguments:
+            report_data (dict): Report with a `results` list
+            wait (bool, optional): Wait until every output sent the report
+        """
+        deliveries = []
+
+        for worker in self.workers:
+            delivery = Delivery() if wait else None
+            worker.submit(report_data, delivery)
+            deliveries.append((worker.name, delivery))
+        if not wait:
+            return
+        failed = [name for name, delivery in deliveries
+                  if not delivery.wait()]
+        if failed:
+            raise RuntimeError(f'Cannot send report to {", ".join(failed)}')
+
+
+    def close(self, timeout=30):
+        """Flushes every output.
+
+        Arguments:
+            timeout (float, optional): Seconds to wait for each output
+        """
+        for worker in self.workers:
+            worker.close(timeout)
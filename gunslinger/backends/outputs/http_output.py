@@ -1,6 +1,6 @@
-import requests
 import logging
 import json
+from backends.http_backend import get_session
 
 class HTTPOutputHandler():
 
@@ -12,6 +12,7 @@ class HTTPOutputHandler():
             self.fields = kwargs.get('fields', [])
             self.method = kwargs.get('method', 'POST')
             self.endpoint = kwargs['url']
+            self.session = kwargs.get('session') or get_session()
         except Exception as exc:
             logging.critical(f'HTTP Output configured incorrectly: {exc}')
 
@@ -48,18 +49,19 @@ class HTTPOutputHandler():
 
     def send_data(self, data):
         report_data = self.create_data(data)
-        response = requests.request(self.method, self.endpoint,
-                                    data=json.dumps(report_data),
-                                    headers=self.headers)
+        response = self.session.request(self.method, self.endpoint,
+                                        data=json.dumps(report_data),
+                                        headers=self.headers)
         if not response.ok:
             status = response.status_code
-            logging.error(f'ERROR sending data to {self.endpoint}: {status} :'\
-                          ' {response.text}')
+            raise Exception(f'ERROR sending data to {self.endpoint}: '\
+                            f'{status} : {response.text}')
 
 
-def run(output_data, config_info):
-    http_handler = HTTPOutputHandler(**config_info)
-    try:
-        http_handler.send_data(output_data)
-    except Exception as exc:
-        logging.error(exc)
+def init(config_info, session=None):
+    return HTTPOutputHandler(session=session, **config_info)
+
+
+def run(output_data, config_info, session=None, handler=None):
+    http_handler = handler or init(config_info, session)
+    http_handler.send_data(output_data)
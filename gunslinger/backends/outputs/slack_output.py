@@ -1,4 +1,5 @@
 import logging
+from backends.slack_channels import resolve_channel
 import slack
 import yaml
 
@@ -9,25 +10,25 @@ class SlackHandler():
         channel = kwargs.get('channel', 'mq')
         slack_token = kwargs.get('slack_token', '')
         self.client = slack.WebClient(token=slack_token)
+        self._token = slack_token
+        # Channel lookups are cached on disk, `channel_cache` configures it
+        self._channel_cache = kwargs.get('channel_cache')
         logging.info(f'Channel is {channel}')
-        self.channel = self.get_channel(channel)
+        self.channel = self.get_channel(kwargs.get('channel_id') or channel)
 
 
     def get_channel(self, channel):
         """Gets ID of Slack channel.
 
         Arguments:
-            channel (str): channel to get ID of
+            channel (str): channel name or ID
 
         Returns:
             str: Channel ID
         """
         logging.info(f'Getting channel {channel}')
-        channels = self.client.conversations_list()
-        for slack_channel in channels['channels']:
-            if slack_channel['name'] == channel:
-                return slack_channel['id']
-        raise Exception('Channel does not exist')
+        return resolve_channel(self.client, self._token, channel,
+                               self._channel_cache)
 
 
     def post_message(self, text, **kwargs):
@@ -48,10 +49,11 @@ class SlackHandler():
         return message_response
 
 
-def run(output_data, config_data):
-    slack_handler = SlackHandler(**config_data)
-    try:
-        output_str = 'Hit!:gun:\n'+yaml.dump(output_data)
-        slack_handler.post_message(output_str)
-    except Exception as e:
-        logging.error(e)
+def init(config_data, session=None):
+    return SlackHandler(**config_data)
+
+
+def run(output_data, config_data, handler=None):
+    slack_handler = handler or init(config_data)
+    output_str = 'Hit!:gun:\n'+yaml.dump(output_data)
+    slack_handler.post_message(output_str)
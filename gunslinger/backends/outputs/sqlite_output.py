@@ -0,0 +1,358 @@
+import os
+import sys
+import json
+import time
+import sqlite3
+import logging
+import argparse
+import threading
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+SCHEMA = [
+    'CREATE TABLE IF NOT EXISTS names ('
+    'id INTEGER PRIMARY KEY, '
+    'name TEXT NOT NULL UNIQUE)',
+    'CREATE TABLE IF NOT EXISTS domains ('
+    'id INTEGER PRIMARY KEY, '
+    'name TEXT NOT NULL UNIQUE, '
+    'rname TEXT NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS domains_rname ON domains (rname)',
+    'CREATE TABLE IF NOT EXISTS hits ('
+    'id INTEGER PRIMARY KEY, '
+    'hash BLOB NOT NULL, '
+    'rule_id INTEGER NOT NULL, '
+    'timed_out INTEGER NOT NULL DEFAULT 0, '
+    'domain_id INTEGER, '
+    'url_id INTEGER, '
+    'page_id INTEGER, '
+    'report_id INTEGER, '
+    'first_seen INTEGER NOT NULL, '
+    'last_seen INTEGER NOT NULL, '
+    'count INTEGER NOT NULL DEFAULT 1)',
+    # Also serves lookups by hash, its first column
+    'CREATE INDEX IF NOT EXISTS hits_repeat ON hits '
+    '(hash, rule_id, domain_id, url_id, last_seen)',
+    'CREATE INDEX IF NOT EXISTS hits_rule ON hits (rule_id, last_seen)',
+    'CREATE INDEX IF NOT EXISTS hits_domain ON hits (domain_id, last_seen)',
+    'CREATE INDEX IF NOT EXISTS hits_time ON hits (last_seen)']
+
+
+def pack_hash(h):
+    """Packs a hex sha256 into 32 bytes, other hashes are kept as text.
+
+    Arguments:
+        h (str): Hash of a script
+
+    Returns:
+        bytes: Packed hash
+    """
+    try:
+        if len(h) == 64:
+            return bytes.fromhex(h)
+    except ValueError:
+        pass
+    return h.encode('utf-8')
+
+
+def unpack_hash(packed):
+    if len(packed) == 32:
+        return packed.hex()
+    return packed.decode('utf-8', 'replace')
+
+
+def get_domain(script_data):
+    """Gets the domain a hit was found on, the host of the submitted page
+    or else of the script itself.
+
+    Arguments:
+        script_data (dict): A result of a report
+
+    Returns:
+        str: Lowercase host name, None if there is none
+    """
+    url = script_data.get('submitted_url') or script_data.get('url') or ''
+    return urlparse(url).hostname
+
+
+def reverse_domain(domain):
+    # Reversed names put subdomains in one range, next to their parent
+    return '.'.join(reversed(domain.split('.'))) + '.'
+
+
+class HitStore():
+    """SQLite store of every hit, indexed by hash, rule, domain and time.
+
+    Each fired (or timed out) rule of a result is a row. URLs, rule names
+    and domains are stored once and referenced by ID, and sha256 hashes are
+    packed into 32 bytes, so rows stay small at millions of hits. A hit that
+    repeats one stored less than `dedup_window` seconds ago (same hash,
+    rule, domain and URL) only updates the `last_seen` time and `count` of
+    the stored row.
+
+    Arguments:
+        path (str, optional): Path of the SQLite database
+        dedup_window (int, optional): Seconds repeats are folded into the
+            same row, 0 stores every hit as a new row
+        cache_size (int, optional): Name IDs kept in memory
+    """
+
+    def __init__(self, **kwargs):
+        logging.getLogger(__name__)
+        path = kwargs.get('path', 'results/hits.db')
+        self.dedup_window = kwargs.get('dedup_window', 24 * 3600)
+        self.cache_size = kwargs.get('cache_size', 100000)
+        directory = os.path.dirname(path)
+
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        for statement in SCHEMA:
+            self.conn.execute(statement)
+        self._ids = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def get_id(self, table, name):
+        """Gets the ID of a name, storing it if it is new.
+
+        Arguments:
+            table (str): `names` or `domains`
+            name (str): The name
+
+        Returns:
+            int: ID of the name, None for an empty name
+        """
+        if not name:
+            return None
+        key = (table, name)
+        if key in self._ids:
+            self._ids.move_to_end(key)
+            return self._ids[key]
+        row = self.conn.execute(f'SELECT id FROM {table} WHERE name=?',
+                                (name,)).fetchone()
+        if row:
+            name_id = row[0]
+        elif table == 'domains':
+            name_id = self.conn.execute('INSERT INTO domains (name, rname) '
+                                        'VALUES (?, ?)',
+                                        (name, reverse_domain(name))).lastrowid
+        else:
+            name_id = self.conn.execute('INSERT INTO names (name) VALUES (?)',
+                                        (name,)).lastrowid
+        self._ids[key] = name_id
+        if len(self._ids) > self.cache_size:
+            self._ids.popitem(last=False)
+        return name_id
+
+
+    def add_hit(self, script_data, now):
+        """Stores the rows of one result.
+
+        Arguments:
+            script_data (dict): A result of a report
+            now (int): Time of the hit
+
+        Returns:
+            int: Rows added, repeats are not counted
+        """
+        added = 0
+        packed = pack_hash(script_data.get('hash') or '')
+        domain_id = self.get_id('domains', get_domain(script_data))
+        url_id = self.get_id('names', script_data.get('url'))
+        page_id = self.get_id('names', script_data.get('submitted_url'))
+        report_id = self.get_id('names', script_data.get('urlscan_url'))
+        rules = [(rule, 0) for rule in script_data.get('fired_rules', [])]
+        rules += [(rule, 1) for rule in script_data.get('timed_out_rules',
+                                                        [])]
+
+        for rule, timed_out in rules:
+            rule_id = self.get_id('names', rule)
+            row = None
+            if self.dedup_window:
+                row = self.conn.execute(
+                    'SELECT id FROM hits WHERE hash=? AND rule_id=? AND '
+                    'domain_id IS ? AND url_id IS ? AND last_seen>=? '
+                    'ORDER BY last_seen DESC LIMIT 1',
+                    (packed, rule_id, domain_id, url_id,
+                     now - self.dedup_window)).fetchone()
+            if row:
+                self.conn.execute('UPDATE hits SET last_seen=?, '
+                                  'count=count+1, report_id=? WHERE id=?',
+                                  (now, report_id, row[0]))
+                continue
+            self.conn.execute('INSERT INTO hits (hash, rule_id, timed_out, '
+                              'domain_id, url_id, page_id, report_id, '
+                              'first_seen, last_seen) VALUES '
+                              '(?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                              (packed, rule_id, timed_out, domain_id, url_id,
+                               page_id, report_id, now, now))
+            added += 1
+        return added
+
+
+    def add_report(self, report_data):
+        """Stores the hits of a report in one transaction.
+
+        Arguments:
+            report_data (dict): Report with a `results` list
+
+        Returns:
+            int: Rows added
+        """
+        now = int(time.time())
+        added = 0
+
+        with self._lock:
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                for script_data in report_data.get('results', []):
+                    added += self.add_hit(script_data, now)
+                self.conn.execute('COMMIT')
+            except Exception:
+                self.conn.execute('ROLLBACK')
+                # IDs of rolled back names are gone from the database
+                self._ids.clear()
+                raise
+        return added
+
+
+    def find(self, h=None, rule=None, domain=None, since=None, limit=100):
+        """Looks up stored hits, newest first.
+
+        Arguments:
+            h (str, optional): Hash of the script
+            rule (str, optional): Name of a rule that fired
+            domain (str, optional): Domain the hit was found on, its
+                subdomains match too
+            since (int, optional): Only hits seen at or after this time
+            limit (int, optional): Most hits returned
+
+        Returns:
+            list: Hit dicts
+        """
+        where = []
+        args = []
+
+        if h:
+            where.append('hits.hash=?')
+            args.append(pack_hash(h))
+        if rule:
+            where.append('hits.rule_id=(SELECT id FROM names WHERE name=?)')
+            args.append(rule)
+        if domain:
+            rname = reverse_domain(domain.lower())
+            where.append('hits.domain_id IN (SELECT id FROM domains WHERE '
+                         'rname>=? AND rname<?)')
+            args += [rname, rname[:-1] + '/']
+        if since:
+            where.append('hits.last_seen>=?')
+            args.append(since)
+        query = ('SELECT hits.hash, rule.name, hits.timed_out, domain.name, '
+                 'url.name, page.name, report.name, hits.first_seen, '
+                 'hits.last_seen, hits.count FROM hits '
+                 'JOIN names AS rule ON rule.id=hits.rule_id '
+                 'LEFT JOIN domains AS domain ON domain.id=hits.domain_id '
+                 'LEFT JOIN names AS url ON url.id=hits.url_id '
+                 'LEFT JOIN names AS page ON page.id=hits.page_id '
+                 'LEFT JOIN names AS report ON report.id=hits.report_id')
+        if where:
+            query += ' WHERE ' + ' AND '.join(where)
+        query += ' ORDER BY hits.last_seen DESC LIMIT ?'
+        args.append(limit)
+        keys = ['hash', 'rule', 'timed_out', 'domain', 'url',
+                'submitted_url', 'urlscan_url', 'first_seen', 'last_seen',
+                'count']
+
+        with self._lock:
+            rows = self.conn.execute(query, args).fetchall()
+        hits = []
+        for row in rows:
+            hit = dict(zip(keys, row))
+            hit['hash'] = unpack_hash(hit['hash'])
+            hit['timed_out'] = bool(hit['timed_out'])
+            hits.append(hit)
+        return hits
+
+
+    def seen(self, h):
+        """Checks whether any rule fired on a hash before.
+
+        Arguments:
+            h (str): Hash of the script
+
+        Returns:
+            bool: True if the hash is stored
+        """
+        with self._lock:
+            return self.conn.execute('SELECT 1 FROM hits WHERE hash=? LIMIT 1',
+                                     (pack_hash(h),)).fetchone() is not None
+
+
+    def get_stats(self):
+        """Gets the number of rows, hits, hashes and domains stored.
+
+        Returns:
+            dict: Counts of the store
+        """
+        with self._lock:
+            rows, hits, hashes = self.conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(count), 0), '
+                'COUNT(DISTINCT hash) FROM hits').fetchone()
+            domains = self.conn.execute('SELECT COUNT(*) FROM '
+                                        'domains').fetchone()[0]
+        return {'rows': rows, 'hits': hits, 'hashes': hashes,
+                'domains': domains}
+
+
+    def close(self):
+        self.conn.close()
+
+
+def init(config_info, session=None):
+    return HitStore(**config_info)
+
+
+def run(output_data, config_info, handler=None):
+    hit_store = handler or init(config_info)
+    added = hit_store.add_report(output_data)
+    logging.info(f'Stored {added} new hit(s) in {config_info.get("path")}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Queries the hits stored '
+                                     'by sqlite_output')
+    parser.add_argument('-p', '--path', default='results/hits.db',
+                        help='Path of the hit store (default: '
+                        'results/hits.db)')
+    parser.add_argument('--hash', help='Hits on a script hash')
+    parser.add_argument('-r', '--rule', help='Hits of a rule')
+    parser.add_argument('-d', '--domain',
+                        help='Hits on a domain and its subdomains')
+    parser.add_argument('-s', '--since', type=float,
+                        help='Only hits seen in the last SINCE hours')
+    parser.add_argument('-n', '--limit', type=int, default=100,
+                        help='Most hits shown (default: 100)')
+    parser.add_argument('--stats', action='store_true',
+                        help='Show the size of the store instead')
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.path):
+        parser.error(f'{args.path} does not exist')
+    hit_store = HitStore(path=args.path)
+    if args.stats:
+        print(json.dumps(hit_store.get_stats(), indent=2))
+        return
+    since = None
+    if args.since is not None:
+        since = int(time.time() - args.since * 3600)
+    for hit in hit_store.find(args.hash, args.rule, args.domain, since,
+                              args.limit):
+        print(json.dumps(hit))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
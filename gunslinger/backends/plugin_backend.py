@@ -1,7 +1,39 @@
 from pluginbase import PluginBase
 import os
 import sys
+import time
+import hashlib
+import inspect
+import importlib
 import logging
+import threading
+from backends.rule_engine import DeclarativeRule, RuleIndex, RuleInput, \
+    RuleSet
+from backends.metrics import get_metrics
+from backends.rule_sandbox import RuleSandbox
+from backends.checkpoint import FlushError
+
+def accepts_kwarg(func, name):
+    """Checks whether a plugin function can be passed a keyword argument,
+    so older plugins keep working when new arguments are added.
+
+    Arguments:
+        func (callable): Function to check
+        name (str): Name of the keyword argument
+
+    Returns:
+        bool: True if the argument can be passed
+    """
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    for parameter in parameters:
+        if parameter.kind == parameter.VAR_KEYWORD or \
+           parameter.name == name:
+            return True
+    return False
+
 
 class PluginManager():
 
@@ -13,6 +45,32 @@ class PluginManager():
         plugin_path = self.get_path(self._plugin_dir)
         self._source = self._plugin_base.make_plugin_source(
             searchpath=[plugin_path])
+        self._reload_interval = kwargs.get('reload_interval', 30)
+        # With `plugins`, only the named plugins are imported by refresh,
+        # others are imported when first asked for
+        self._wanted = None
+        if kwargs.get('plugins') is not None:
+            self._wanted = set(kwargs['plugins'])
+        self.session = kwargs.get('session')
+        # Called with (rule name, wall time, CPU time) after every rule runs
+        self.rule_timer = kwargs.get('rule_timer')
+        # Called with the rule name before every rule runs
+        self.rule_started = kwargs.get('rule_started')
+        self.metrics = kwargs.get('metrics') or get_metrics()
+        self._plugins = {}
+        self._signatures = {}
+        self._last_refresh = None
+        self._lock = threading.RLock()
+        # Compiled declarative rules, keyed by whether they match bytes
+        self._rule_sets = {}
+        self._rule_index = (None, RuleIndex([]))
+        self.ruleset_version = ''
+        self.stats = {'loads': 0, 'reloads': 0, 'refreshes': 0,
+                      'load_time': 0.0, 'plugins': {}}
+        # Rules run in separate evaluator processes when `sandbox` is set
+        self.sandbox = None
+        if kwargs.get('sandbox'):
+            self.sandbox = RuleSandbox(self, **kwargs['sandbox'])
 
 
     def get_path(self, directory):
@@ -28,35 +86,431 @@ class PluginManager():
         return os.path.join(here, directory)
 
 
-    def run_rules(self, **kwargs):
-        """Runs rules via python plugins.
+    def get_file_signature(self, module):
+        """Gets the mtime and content hash of a plugin's source file.
+
+        Arguments:
+            module (module): Loaded plugin module
+
+        Returns:
+            tuple: mtime of the file and sha256 of its contents
+        """
+        path = getattr(module, '__file__', None)
+
+        if not path or not os.path.exists(path):
+            return (None, '')
+        mtime = os.path.getmtime(path)
+        previous = self._signatures.get(module.__name__)
+
+        if previous and previous[0] == mtime:
+            return previous
+        with open(path, 'rb') as f:
+            return (mtime, hashlib.sha256(f.read()).hexdigest())
+
+
+    def load(self, plugin_name, reload=False):
+        """Imports a plugin and keeps it in the registry.
+
+        Arguments:
+            plugin_name (str): Name of the plugin to load
+            reload (bool, optional): Force the module to be executed again
+
+        Returns:
+            module: The loaded plugin
+        """
+        start = time.perf_counter()
+        if reload:
+            old_module = self._plugins[plugin_name]
+            sys.modules.pop(old_module.__name__, None)
+            importlib.invalidate_caches()
+        module = self._source.load_plugin(plugin_name)
+        elapsed = time.perf_counter() - start
+        self._plugins[plugin_name] = module
+        if self._wanted is not None:
+            self._wanted.add(plugin_name)
+        self._signatures[module.__name__] = self.get_file_signature(module)
+
+        plugin_stats = self.stats['plugins'].setdefault(
+            plugin_name, {'loads': 0, 'last_load_time': 0.0})
+        plugin_stats['loads'] += 1
+        plugin_stats['last_load_time'] = elapsed
+        self.stats['load_time'] += elapsed
+        if reload:
+            self.stats['reloads'] += 1
+            logging.info(f'Reloaded plugin {plugin_name} ({elapsed:.4f}s)')
+        else:
+            self.stats['loads'] += 1
+            logging.info(f'Loaded plugin {plugin_name} ({elapsed:.4f}s)')
+        return module
+
+
+    def refresh(self, force=False):
+        """Syncs the registry with the plugin directory. New plugins are
+        loaded, removed ones dropped and changed ones reloaded. Without a
+        `plugins` list every plugin in the directory is loaded, otherwise
+        only the listed ones and those loaded before. The directory is only
+        polled once every `reload_interval` seconds.
+
+        Arguments:
+            force (bool, optional): Poll even if the interval has not passed
+        """
+        with self._lock:
+            now = time.monotonic()
+
+            if not force and self._last_refresh is not None and \
+               now - self._last_refresh < self._reload_interval:
+                return
+            self._last_refresh = now
+            self.stats['refreshes'] += 1
+            plugin_names = set(self._source.list_plugins())
+            if self._wanted is not None:
+                plugin_names &= self._wanted
+
+            for plugin_name in list(self._plugins):
+                if plugin_name not in plugin_names:
+                    logging.info(f'Plugin {plugin_name} removed')
+                    module = self._plugins.pop(plugin_name)
+                    self._signatures.pop(module.__name__, None)
+            for plugin_name in sorted(plugin_names):
+                try:
+                    if plugin_name not in self._plugins:
+                        self.load(plugin_name)
+                        continue
+                    module = self._plugins[plugin_name]
+                    signature = self.get_file_signature(module)
+                    if signature[1] != self._signatures[module.__name__][1]:
+                        self.load(plugin_name, reload=True)
+                    else:
+                        self._signatures[module.__name__] = signature
+                except Exception as e:
+                    logging.error(f'Cannot load plugin {plugin_name}')
+                    logging.error(e)
+            version = hashlib.sha256()
+            for plugin_name in sorted(self._plugins):
+                module = self._plugins[plugin_name]
+                version.update(plugin_name.encode())
+                version.update(self._signatures[module.__name__][1].encode())
+            self.ruleset_version = version.hexdigest()
+
+
+    def get_plugin(self, plugin_name):
+        """Gets a plugin from the registry, importing it if needed.
+
+        Arguments:
+            plugin_name (str): Name of the plugin
+
+        Returns:
+            module: The loaded plugin
+        """
+        with self._lock:
+            self.refresh()
+            if plugin_name in self._plugins:
+                return self._plugins[plugin_name]
+            return self.load(plugin_name)
+
+
+    def get_plugins(self):
+        """Gets every plugin in the plugin directory.
+
+        Returns:
+            list: List of (name, module) tuples sorted by name
+        """
+        with self._lock:
+            self.refresh()
+            return sorted(self._plugins.items(), key=lambda item: item[0])
+
+
+    def get_ruleset_version(self):
+        """Gets a hash identifying the currently loaded plugins, which changes
+        whenever a plugin file is added, removed or edited.
+
+        Returns:
+            str: sha256 hash of the plugin names and contents
+        """
+        self.refresh()
+        if self.sandbox:
+            return self.sandbox.get_version(self.ruleset_version)
+        return self.ruleset_version
+
+
+    def get_verdict_version(self, response_data=None):
+        """Gets the version a verdict on a response is cached under. Rules
+        scoped to hosts or content types may be skipped for one response
+        and run for another with the same hash, so the rules skipped
+        because of `response_data` are part of the version.
+
+        Arguments:
+            response_data (dict, optional): URLScan response object
+
+        Returns:
+            str: Ruleset version, with a hash of the skipped rule names
+                appended if any are skipped
+        """
+        ruleset_version = self.get_ruleset_version()
+        skipped = self.get_rule_index().get_skipped_by_response(response_data)
+
+        if not skipped:
+            return ruleset_version
+        names = '\n'.join(sorted(skipped)).encode('utf-8')
+        return f'{ruleset_version}:{hashlib.sha256(names).hexdigest()[:16]}'
+
+
+    def get_stats(self):
+        """Gets registry counters so reloads can be monitored.
+
+        Returns:
+            dict: Load/reload counts and timings
+        """
+        stats = dict(self.stats)
+        stats['loaded'] = len(self._plugins)
+        stats['ruleset_version'] = self.ruleset_version
+        return stats
+
+
+    def get_rule_set(self, rules, binary=False):
+        """Gets the compiled matcher for the declarative rules, rebuilding it
+        only when the loaded rule modules change.
+
+        Arguments:
+            rules (list): List of (name, module) tuples of declarative rules
+            binary (bool, optional): The rules match bytes instead of text
+
+        Returns:
+            RuleSet: Compiled matcher for the rules
+        """
+        with self._lock:
+            key = tuple((name, id(module)) for name, module in rules)
+            cached = self._rule_sets.get(binary)
+
+            if cached is None or cached[0] != key:
+                compiled = []
+                for name, module in rules:
+                    try:
+                        compiled.append(DeclarativeRule(name, module))
+                    except Exception as e:
+                        logging.error(f'Cannot compile rule {name} ' \
+                                      '(possibly formatted incorrectly)')
+                        logging.error(e)
+                cached = (key, RuleSet(compiled, binary=binary))
+                self._rule_sets[binary] = cached
+            return cached[1]
+
+
+    def get_rule_index(self):
+        """Gets the index of the preconditions declared by the rules,
+        rebuilding it only when the loaded rule modules change.
+
+        Returns:
+            RuleIndex: Index of the loaded rules
+        """
+        rules = self.get_plugins()
+
+        with self._lock:
+            key = tuple((name, id(module)) for name, module in rules)
+            if key != self._rule_index[0]:
+                try:
+                    self._rule_index = (key, RuleIndex(rules))
+                except Exception as e:
+                    logging.error('Cannot index rules (possibly formatted '
+                                  'incorrectly)')
+                    logging.error(e)
+                    self._rule_index = (key, RuleIndex([]))
+            return self._rule_index[1]
+
+
+    def split_rules(self):
+        """Splits the loaded rules into declarative and scripted rules.
+
+        Returns:
+            RuleSet: Compiled declarative rules matching text
+            RuleSet: Compiled declarative rules matching bytes
+            list: (name, module) tuples of rules with a `run` function
+        """
+        declarative = []
+        binary = []
+        scripted = []
+        for plugin_name, rule in self.get_plugins():
+            if not DeclarativeRule.is_declarative(rule):
+                scripted.append((plugin_name, rule))
+            elif getattr(rule, 'binary', False):
+                binary.append((plugin_name, rule))
+            else:
+                declarative.append((plugin_name, rule))
+        return (self.get_rule_set(declarative),
+                self.get_rule_set(binary, binary=True), scripted)
+
+
+    def get_content_types(self):
+        """Gets the content types the loaded rules can fire on, from the
+        `content_types` list rule modules may declare (e.g. `['javascript',
+        'html']`, matched as parts of a MIME type).
+
+        Returns:
+            set: Declared content types, None if any rule leaves them out
+                and so has to see every response
+        """
+        content_types = set()
+
+        for plugin_name, rule in self.get_plugins():
+            declared = getattr(rule, 'content_types', None)
+            if declared is None:
+                return None
+            content_types.update(t.lower() for t in declared)
+        return content_types
+
+
+    def record_rule(self, rule_name, wall, cpu, fired=None, error=False):
+        """Records the timing and outcome of one rule on one script.
+
+        Arguments:
+            rule_name (str): Name of the rule
+            wall (float): Wall time in seconds
+            cpu (float): CPU time in seconds
+            fired (bool, optional): Whether the rule fired
+            error (bool, optional): Whether the rule raised an exception
+        """
+        self.metrics.record_rule(rule_name, wall, cpu, fired, error)
+        if self.rule_timer:
+            self.rule_timer(rule_name, wall, cpu)
+
+
+    def run_scripted_rules(self, scripted, **kwargs):
+        """Calls the `run` function of every scripted rule. Rules with
+        `binary = True` get the script as a memoryview, the others as text.
+
+        Arguments:
+            scripted (list): (name, module) tuples of the rules to run
+            script (str, bytes-like or RuleInput, optional): The script
+            encoding (str, optional): Encoding of a script given as bytes
 
         Returns:
             list: List of all rules that returned True
         """
+        rule_input = kwargs.pop('script', '')
+        encoding = kwargs.pop('encoding', None)
         fired_rules = []
-        for plugin_name in self._source.list_plugins():
-            logging.info(f'Running rule {plugin_name}')
-            rule = self._source.load_plugin(plugin_name)
+
+        if not isinstance(rule_input, RuleInput):
+            rule_input = RuleInput(rule_input, encoding)
+        for plugin_name, rule in scripted:
+            logging.debug(f'Running rule {plugin_name}')
+            if self.rule_started:
+                self.rule_started(plugin_name)
+            start, start_cpu = time.perf_counter(), time.process_time()
+            rule_fired = error = False
             try:
-                rule_fired = rule.run(**kwargs)
+                if getattr(rule, 'binary', False):
+                    script = rule_input.buffer
+                else:
+                    script = rule_input.text
+                rule_fired = rule.run(script=script, **kwargs)
                 if rule_fired:
                     fired_rules.append(plugin_name)
             except Exception as e:
+                error = True
                 logging.error(f'Cannot run rule {plugin_name} ' \
                               '(possibly formatted incorrectly)')
                 logging.error(e)
+            self.record_rule(plugin_name, time.perf_counter() - start,
+                             time.process_time() - start_cpu,
+                             bool(rule_fired), error)
         return fired_rules
 
 
+    def run_rules(self, **kwargs):
+        """Runs rules via python plugins.
+
+        Declarative rules are compiled together and scan the script once,
+        rules with a `run` function are called one after another. Rules
+        whose declared preconditions (see RuleIndex) fail for the script or
+        its `response_data` are not run at all. The script
+        can be given as text or as a bytes buffer (e.g. a memoryview slice of
+        a response), it is only decoded or encoded if a rule needs the other
+        form.
+
+        With a sandbox the rules run in its evaluator processes, and the list
+        returned is a RuleResults whose `timed_out` names the rules that were
+        stopped.
+
+        Arguments:
+            script (str or bytes-like, optional): The script
+            encoding (str, optional): Encoding of the script, defaults to
+                ISO-8859-1
+            skip (list, optional): Names of rules not to run
+
+        Returns:
+            list: List of all rules that returned True
+        """
+        script = kwargs.pop('script', '')
+        encoding = kwargs.pop('encoding', None)
+        skip = kwargs.pop('skip', ())
+
+        if self.sandbox:
+            with self.metrics.stage('rule_eval'):
+                return self.sandbox.run(script, encoding, skip, **kwargs)
+        rule_set, binary_set, scripted = self.split_rules()
+        rule_index = self.get_rule_index()
+        rule_input = RuleInput(script, encoding)
+
+        with self.metrics.stage('rule_eval'):
+            skip = set(skip)
+            if len(rule_index):
+                skip |= rule_index.get_skipped(rule_input,
+                                               kwargs.get('response_data'))
+            scripted = [(plugin_name, rule) for plugin_name, rule in scripted
+                        if plugin_name not in skip]
+            fired_rules = self.run_scripted_rules(scripted, script=rule_input,
+                                                  **kwargs)
+            if len(rule_set) > len(skip & rule_set.names):
+                logging.debug(f'Running {len(rule_set)} declarative rule(s)')
+                fired_rules += rule_set.run(rule_input.text, self.record_rule,
+                                            self.rule_started, skip)
+            if len(binary_set) > len(skip & binary_set.names):
+                logging.debug(f'Running {len(binary_set)} binary rule(s)')
+                fired_rules += binary_set.run(rule_input.buffer,
+                                              self.record_rule,
+                                              self.rule_started, skip)
+        return fired_rules
+
+
+    def stream_rules(self, **kwargs):
+        """Starts running the rules on a script that is still downloading.
+
+        Arguments:
+            **kwargs: Arguments for the rules other than `script`
+
+        Returns:
+            RuleStream: Stream the script is fed to
+        """
+        if self.sandbox:
+            return SandboxedStream(self, **kwargs)
+        rule_set, binary_set, scripted = self.split_rules()
+        return RuleStream(self, rule_set, binary_set, scripted,
+                          self.get_rule_index(), **kwargs)
+
+
+    def close(self):
+        """Stops the rule evaluators of the sandbox."""
+        if self.sandbox:
+            self.sandbox.close()
+
+
     def run_processor(self, processor_name, processor_data, config_info,
-                      rule_manager):
-        plugin = self._source.load_plugin(processor_name)
+                      rule_manager, checkpoint=None):
+        plugin = self.get_plugin(processor_name)
+        kwargs = {}
+        # Processors that know about checkpoints report through the job
+        if checkpoint is not None and accepts_kwarg(plugin.run, 'checkpoint'):
+            kwargs['checkpoint'] = checkpoint
         try:
             returned_data = plugin.run(data=processor_data,
                                        config_info=config_info,
-                                       rule_manager=rule_manager)
+                                       rule_manager=rule_manager,
+                                       session=self.session, **kwargs)
             return returned_data
+        except FlushError:
+            # The job has to run again, its message must not be acked
+            raise
         except Exception as e:
             logging.error(f'Cannot run processor {processor_name} ' \
                           '(possible misconfigured)')
@@ -64,11 +518,183 @@ class PluginManager():
             return {}
 
 
-    def run_output(self, output_name, output_data, config_info):
-        plugin = self._source.load_plugin(output_name)
+    def run_output(self, output_name, output_data, config_info,
+                   raise_errors=False, **kwargs):
+        """Runs an output plugin.
+
+        Arguments:
+            output_name (str): Name of the output plugin
+            output_data (dict): Report to output
+            config_info (dict): Config of the output
+            raise_errors (bool, optional): Raise errors of the plugin instead
+                of logging them
+            **kwargs: Extra arguments, only passed if the plugin accepts them
+        """
+        plugin = self.get_plugin(output_name)
+        kwargs = {key: value for key, value in kwargs.items()
+                  if accepts_kwarg(plugin.run, key)}
+        if self.session is not None and accepts_kwarg(plugin.run, 'session'):
+            kwargs['session'] = self.session
         try:
-            plugin.run(output_data, config_info)
+            plugin.run(output_data, config_info, **kwargs)
         except Exception as e:
+            if raise_errors:
+                raise
             logging.error(f'Cannot run output {output_name} ' \
                           '(possibly misconfigured)')
             logging.error(e)
+
+
+class RuleStream():
+    """Feeds a script to the rules while it downloads.
+
+    Declarative rules are matched chunk by chunk, binary rules on the raw
+    bytes and the others on the decoded text. Rules with a `run` function
+    need the whole script, so they are called from `finish`. Host and
+    content type preconditions are checked up front, size and literal
+    preconditions in `finish` for every kind of rule, so a rule that
+    declares them and already fired keeps the script reading to the end.
+
+    Arguments:
+        manager (PluginManager): Manager the rules belong to
+        rule_set (RuleSet): Compiled declarative rules matching text
+        binary_set (RuleSet): Compiled declarative rules matching bytes
+        scripted (list): (name, module) tuples of rules with a `run` function
+        rule_index (RuleIndex): Index of the rule preconditions
+        **kwargs: Arguments for the rules other than `script`
+    """
+
+    def __init__(self, manager, rule_set, binary_set, scripted, rule_index,
+                 **kwargs):
+        self._manager = manager
+        self._encoding = kwargs.pop('encoding', None)
+        self._kwargs = kwargs
+        self._rule_index = rule_index
+        skip = rule_index.get_skipped_by_response(kwargs.get('response_data'))
+        self._scripted = [(plugin_name, rule) for plugin_name, rule in scripted
+                          if plugin_name not in skip]
+        self._gated = rule_index.script_rules - skip
+        scripted = self._scripted
+        keep_bytes = any(getattr(rule, 'binary', False)
+                         for _, rule in scripted)
+        # Preconditions are checked on the text, unless bytes are kept
+        keep_text = bool(self._gated) or \
+            any(not getattr(rule, 'binary', False) for _, rule in scripted)
+        self._keep_bytes = keep_bytes
+        self._matcher = rule_set.stream(keep_text=keep_text,
+                                        timer=manager.record_rule, skip=skip)
+        self._binary_matcher = binary_set.stream(keep_text=keep_bytes,
+                                                 timer=manager.record_rule,
+                                                 skip=skip)
+        # Chunks are only encoded when something matches the bytes
+        self._binary = keep_bytes or bool(self._binary_matcher.rules)
+        self._elapsed = 0.0
+
+
+    @property
+    def done(self):
+        """bool: Whether the remaining chunks can no longer change the
+        outcome of any rule."""
+        if self._scripted or not self._matcher.done or \
+           not self._binary_matcher.done:
+            return False
+        # A fired rule may still be ruled out by the rest of the script
+        return not any(self._matcher.decided.get(name) or
+                       self._binary_matcher.decided.get(name)
+                       for name in self._gated)
+
+
+    def feed(self, text, data=None):
+        """Adds the next chunk of the script.
+
+        Arguments:
+            text (str): Next chunk of the script
+            data (bytes, optional): The chunk as it was downloaded, encoded
+                from `text` if binary rules need it and it is not given
+
+        Returns:
+            bool: True once the remaining chunks cannot change the outcome
+        """
+        start = time.perf_counter()
+        self._matcher.feed(text)
+        if self._binary:
+            if data is None:
+                data = text.encode(self._encoding or 'ISO-8859-1', 'replace')
+            self._binary_matcher.feed(data)
+        self._elapsed += time.perf_counter() - start
+        return self.done
+
+
+    def finish(self):
+        """Runs the rules that still need the complete script.
+
+        Returns:
+            list: List of all rules that fired
+        """
+        start = time.perf_counter()
+        fired_rules = []
+        skip = set()
+        if self._scripted or self._gated:
+            buffer = self._binary_matcher.text if self._keep_bytes else None
+            rule_input = RuleInput(self._matcher.text, self._encoding,
+                                   buffer=buffer)
+            skip = self._rule_index.get_skipped_by_script(rule_input)
+        if self._scripted:
+            scripted = [(plugin_name, rule)
+                        for plugin_name, rule in self._scripted
+                        if plugin_name not in skip]
+            fired_rules = self._manager.run_scripted_rules(
+                scripted, script=rule_input, **self._kwargs)
+        for matcher in (self._matcher, self._binary_matcher):
+            fired_rules += [plugin_name for plugin_name in matcher.finish()
+                            if plugin_name not in skip]
+        # Matching is interleaved with the download, only the time spent
+        # in the rules counts towards the stage
+        self._elapsed += time.perf_counter() - start
+        self._manager.metrics.observe('gunslinger_stage_seconds',
+                                      self._elapsed, stage='rule_eval')
+        return fired_rules
+
+
+class SandboxedStream():
+    """Collects a downloading script for the sandbox. The rules only run in
+    the evaluators once the script is complete, so reading never stops
+    early.
+
+    Arguments:
+        manager (PluginManager): Manager the rules belong to
+        **kwargs: Arguments for the rules other than `script`
+    """
+
+    def __init__(self, manager, **kwargs):
+        self._manager = manager
+        self._kwargs = kwargs
+        self._chunks = []
+        self.done = False
+
+
+    def feed(self, text, data=None):
+        """Adds the next chunk of the script.
+
+        Arguments:
+            text (str): Next chunk of the script
+            data (bytes, optional): The chunk as it was downloaded
+
+        Returns:
+            bool: Always False
+        """
+        if data is None:
+            data = text.encode(self._kwargs.get('encoding') or 'ISO-8859-1',
+                               'replace')
+        self._chunks.append(data)
+        return False
+
+
+    def finish(self):
+        """Runs the rules on the complete script.
+
+        Returns:
+            list: List of all rules that fired
+        """
+        return self._manager.run_rules(script=b''.join(self._chunks),
+                                       **self._kwargs)
@@ -1,12 +1,31 @@
-import gc
+import codecs
 import logging
-from bs4 import BeautifulSoup
-import requests
 import hashlib
+from backends.verdict_cache import get_verdict_cache
+from backends.http_backend import get_session
+from backends.stream_scanner import scan_response
+from backends.html_scripts import ScriptExtractor, split_inline_scripts
+from backends.metrics import get_metrics
+from backends.results import get_script_data
 
 logger = logging.getLogger(__name__)
 
-def url_thread(url, timeout=10):
+def url_thread(url, timeout=10, session=None, max_size=5 * 1024 * 1024):
+    """Downloads a page with a single GET and extracts its scripts while it
+    downloads.
+
+    Arguments:
+        url (str): URL of the page, as posted to the queue
+        timeout (int, optional): Request timeout in seconds
+        session (HTTPSession, optional): Session to send the request with
+        max_size (int, optional): Maximum number of bytes read
+
+    Returns:
+        str: Cleaned up URL of the page
+        bytes: Content of the page, None if it is not HTML
+        list: Absolute URLs of the external scripts
+        str: Encoding of the page
+    """
     clean_url = url.replace('<', '').replace('>', '')
 
     if '|' in clean_url:
@@ -16,77 +35,192 @@ def url_thread(url, timeout=10):
             clean_url.startswith('https://')):
         clean_url = 'http://' + clean_url
     logger.info(f'Getting scripts at {clean_url}')
-    r = requests.head(clean_url, allow_redirects=True,
-                      timeout=timeout)
+    session = session or get_session()
 
-    if not 'text/html' in r.headers['Content-Type']:
-        return []
-    r = requests.get(clean_url, timeout=timeout)
-    soup = BeautifulSoup(r.content.decode('ISO-8859-1')
-                         , "lxml")
-    scripts = soup.find_all('script', {'src':True})
-    logger.info(f'Found {len(scripts)} at url')
-    soup.decompose()
-    data = [clean_url]
-
-    for script in scripts:
-        script_src = script['src']
-
-        if script_src[:2] == '//':
-            script_src = 'http:' + script_src
-        elif (not script_src.startswith('http://') and not
-              script_src.startswith('https://')):
-            script_src = 'http://' + script_src
-        data.append(script_src)
-    logger.info(f'Got {len(data)} script(s)')
-
-    return data
-
-
-def get_js_content(js_dat, rule_manager, timeout=10):
+    with get_metrics().stage('page_fetch'):
+        r = session.get(clean_url, timeout=timeout, stream=True)
+        try:
+            if not 'text/html' in r.headers.get('Content-Type', ''):
+                return clean_url, None, [], None
+            extractor = ScriptExtractor(r.url or clean_url)
+            decoder = codecs.getincrementaldecoder(
+                r.encoding or 'ISO-8859-1')(errors='replace')
+            chunks = []
+            size = 0
+
+            for chunk in r.iter_content(65536):
+                chunk = chunk[:max_size - size]
+                size += len(chunk)
+                chunks.append(chunk)
+                extractor.feed(decoder.decode(chunk))
+                if size >= max_size:
+                    logger.info(f'Stopped reading {clean_url} at {size} '
+                                'bytes')
+                    break
+            extractor.feed(decoder.decode(b'', final=True))
+            extractor.close()
+        finally:
+            r.close()
+    logger.info(f'Got {len(extractor.script_urls)} script(s)')
+
+    return clean_url, b''.join(chunks), extractor.script_urls, r.encoding
+
+
+def get_js_content(js_dat, rule_manager, timeout=10, verdict_cache=None,
+                   session=None, streaming=None):
     scripts_found = []
+    session = session or get_session()
 
     for url in js_dat:
         logger.info(f'Getting script at {url}')
         try:
-            r = requests.get(url, timeout=timeout)
-            logger.info('Running rules')
-            fired_rules = rule_manager.run_rules(
-                script=r.content.decode('ISO-8859-1'))
-
-            if fired_rules:
-                sha256_hash = hashlib.sha256(r.content).hexdigest()
-                scripts_found.append({'url':url,
-                                      'fired_rules':fired_rules,
-                                      'hash':sha256_hash})
+            script_data = check_script(url, rule_manager, timeout,
+                                       verdict_cache, session, streaming)
+
+            if script_data:
+                scripts_found.append(script_data)
         except Exception as e:
             logger.error(e)
 
             continue
-        gc.collect()
         logger.info(f'Got script at {url}')
 
     return scripts_found
 
 
+def check_script(url, rule_manager, timeout, verdict_cache, session,
+                 streaming):
+    if streaming is not None:
+        return stream_script(url, rule_manager, timeout, verdict_cache,
+                             session, streaming)
+    with get_metrics().stage('response_fetch'):
+        r = session.get(url, timeout=timeout)
+        content = r.content
+    return check_content(url, content, hashlib.sha256(content).hexdigest(),
+                         rule_manager, verdict_cache)
+
+
+def check_content(url, script, sha256_hash, rule_manager, verdict_cache,
+                  encoding=None):
+    """Runs the rules on a script that is already downloaded.
+
+    Arguments:
+        url (str): URL reported for the script
+        script (bytes-like): The script, only decoded if a rule needs text
+        sha256_hash (str): Hash of the script, used by the verdict cache
+        rule_manager (PluginManager): Manager of the rules
+        verdict_cache (VerdictCache): Verdict cache, may be None
+        encoding (str, optional): Encoding of the script
+
+    Returns:
+        dict: Script data if a rule fired or timed out, otherwise None
+    """
+    fired_rules = None
+
+    if verdict_cache:
+        ruleset_version = rule_manager.get_ruleset_version()
+        fired_rules = verdict_cache.get(sha256_hash, ruleset_version)
+    if fired_rules is None:
+        logger.debug('Running rules')
+        fired_rules = rule_manager.run_rules(script=script, encoding=encoding)
+        # Verdicts missing a rule that was stopped are not cached
+        if verdict_cache and not getattr(fired_rules, 'timed_out', None):
+            verdict_cache.set(sha256_hash, ruleset_version, fired_rules)
+    return get_script_data(url, sha256_hash, fired_rules)
+
+
+def stream_script(url, rule_manager, timeout, verdict_cache, session,
+                  streaming):
+    # The hash is only known once the download is done, so the verdict
+    # cache can be filled but not checked here
+    with get_metrics().stage('response_fetch'):
+        r = session.get(url, timeout=timeout, stream=True)
+        fired_rules, sha256_hash, complete = scan_response(r, rule_manager,
+                                                           **streaming)
+
+    if verdict_cache and complete and \
+       not getattr(fired_rules, 'timed_out', None):
+        verdict_cache.set(sha256_hash, rule_manager.get_ruleset_version(),
+                          fired_rules)
+    script_data = get_script_data(url, sha256_hash, fired_rules)
+    if script_data and not complete:
+        # The hash only covers the bytes read, it does not identify the
+        # script, so it is not reported as one
+        script_data['partial_hash'] = script_data.pop('hash')
+        script_data['truncated'] = True
+    return script_data
+
+
+def check_page(url, rule_manager, timeout=10, verdict_cache=None,
+               session=None, streaming=None, max_size=5 * 1024 * 1024):
+    """Runs the rules on a page, its inline scripts and its external
+    scripts.
+
+    Returns:
+        list: Script data of everything a rule fired on
+    """
+    page_url, content, script_urls, encoding = url_thread(
+        url, timeout, session, max_size)
+
+    if content is None:
+        return []
+    scripts_found = []
+    # The page itself was scanned as a script before, it is already
+    # downloaded so it does not have to be fetched again
+    page_data = check_content(page_url, content,
+                              hashlib.sha256(content).hexdigest(),
+                              rule_manager, verdict_cache, encoding)
+    if page_data:
+        scripts_found.append(page_data)
+    # Inline scripts are slices of the page, nothing is copied
+    for i, script in enumerate(split_inline_scripts(content)):
+        try:
+            script_data = check_content(
+                f'{page_url}#inline-{i}', script,
+                hashlib.sha256(script).hexdigest(), rule_manager,
+                verdict_cache, encoding)
+            if script_data:
+                scripts_found.append(script_data)
+        except Exception as e:
+            logger.error(e)
+    scripts_found += get_js_content(script_urls, rule_manager, timeout,
+                                    verdict_cache, session, streaming)
+    return scripts_found
+
+
 def run(**kwargs):
     urls = kwargs.get('data', [])
-    timeout = kwargs.get('config_info',
-                         {'timeout':10}).get('timeout', 10)
+    config_info = kwargs.get('config_info', {'timeout':10})
+    timeout = config_info.get('timeout', 10)
+    max_page_size = config_info.get('max_page_size', 5 * 1024 * 1024)
     rule_manager = kwargs.get('rule_manager')
+    verdict_cache = get_verdict_cache(config_info)
+    session = kwargs.get('session')
+    # Pages of a resumed job that are already checked are skipped
+    checkpoint = kwargs.get('checkpoint')
+    streaming = config_info.get('streaming')
+    if streaming is True:
+        streaming = {}
     report_data = {'results':[]}
 
     for url in urls:
-        js_urls = url_thread(url, timeout)
-        found_scripts = get_js_content(js_urls, rule_manager, timeout)
-
-        if found_scripts:
-            for script_data in found_scripts:
-                report = script_data
-                report['submitted_url'] = url
-                report_data['results'].append(report)
+        if checkpoint and checkpoint.is_done('page', url):
+            continue
+        try:
+            found_scripts = check_page(url, rule_manager, timeout,
+                                       verdict_cache, session, streaming,
+                                       max_page_size)
+        except Exception as e:
+            # Failed pages are not marked done, a resumed job retries them
+            logger.error(e)
+            continue
+
+        for script_data in found_scripts:
+            script_data['submitted_url'] = url
+        if checkpoint:
+            checkpoint.complete('page', url, found_scripts)
         else:
-            del found_scripts
+            report_data['results'] += found_scripts
     if report_data['results']:
         return report_data
     return None
@@ -1,15 +1,268 @@
-import requests
+import asyncio
+import hashlib
 import logging
+import threading
+from collections import Counter
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from backends.verdict_cache import get_verdict_cache
+from backends.http_backend import get_session
+from backends.stream_scanner import scan_response
+from backends.html_scripts import split_inline_scripts
+from backends.metrics import get_metrics
+from backends.results import get_script_data
+from backends.checkpoint import FlushError
 
 logger = logging.getLogger(__name__)
 
+class FetchLimiter():
+    """Bounds the number of HTTP requests in flight, overall and per host.
+
+    Arguments:
+        session (HTTPSession): Shared session the requests are sent through
+        max_in_flight (int, optional): Maximum requests in flight overall
+        per_host_limit (int, optional): Maximum requests in flight per host
+    """
+
+    def __init__(self, session, max_in_flight=16, per_host_limit=8):
+        self._session = session
+        self._total = threading.BoundedSemaphore(max_in_flight)
+        self._per_host_limit = per_host_limit
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+
+    def get_host_semaphore(self, url):
+        host = urlparse(url).netloc
+
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = threading.BoundedSemaphore(
+                    self._per_host_limit)
+            return self._hosts[host]
+
+
+    def get(self, url, **kwargs):
+        """Sends a GET request once both the host and overall limits allow.
+        With `stream=True` the body is still being downloaded when the
+        response is returned, so the request holds its place until the
+        response is closed.
+
+        Arguments:
+            url (str): URL to request
+            **kwargs: Passed on to the session
+
+        Returns:
+            requests.Response: Response object
+        """
+        host = self.get_host_semaphore(url)
+
+        if not kwargs.get('stream'):
+            with host, self._total:
+                return self._session.get(url, **kwargs)
+        host.acquire()
+        self._total.acquire()
+        slots = [host, self._total]
+        try:
+            response = self._session.get(url, **kwargs)
+        except BaseException:
+            self.release(slots)
+            raise
+        close = response.close
+
+        def close_and_release():
+            try:
+                close()
+            finally:
+                self.release(slots)
+        response.close = close_and_release
+        return response
+
+
+    def release(self, slots):
+        """Gives back the places a request held, only the first call for a
+        request releases them.
+
+        Arguments:
+            slots (list): Semaphores held by the request
+        """
+        with self._lock:
+            held = list(slots)
+            slots.clear()
+        for semaphore in held:
+            semaphore.release()
+
+
+def is_html(response):
+    """Checks whether a URLScan response is an HTML document.
+
+    Arguments:
+        response (dict): URLScan response object
+
+    Returns:
+        bool: True for documents and responses served as HTML
+    """
+    mime_type = response.get('response', {}).get('mimeType') or ''
+    return response.get('type') == 'Document' or 'html' in mime_type.lower()
+
+
+def get_hash(request):
+    return (request.get('response') or {}).get('hash')
+
+
+def get_scripts_found(response, fired_rules, inline):
+    """Builds the results for a response and its inline scripts.
+
+    Arguments:
+        response (dict): URLScan response object
+        fired_rules (list): Rules that fired on the response
+        inline (list): (index, hash, fired rules) of every inline script
+
+    Returns:
+        list: Script data for the response and every inline script a rule
+            fired on
+    """
+    scripts_found = []
+    h = response['hash']
+    url = response['response']['url']
+    script_data = get_script_data(url, h, fired_rules)
+
+    if script_data:
+        logger.info(f'Rule fired on {url}')
+        scripts_found.append(script_data)
+    for i, inline_hash, inline_rules in inline:
+        script_data = get_script_data(f'{url}#inline-{i}', inline_hash,
+                                      inline_rules)
+        if script_data:
+            logger.info(f'Rule fired on inline script {i} of {url}')
+            script_data['document_hash'] = h
+            scripts_found.append(script_data)
+    return scripts_found
+
+
+class ResponseFilter():
+    """Decides which responses of a URLScan result are downloaded, from the
+    resource type, MIME type and size URLScan reports for each request, and
+    in which order.
+
+    Arguments:
+        skip_types (list, optional): Resource types that are never fetched
+        skip_mime_types (list, optional): MIME type prefixes that are never
+            fetched. application/octet-stream is not skipped by default,
+            servers often send scripts with it
+        max_size (int, optional): Largest response fetched in bytes, 0 for
+            no limit
+        priority (list, optional): Resource types fetched first, in order
+    """
+
+    def __init__(self, **kwargs):
+        self.skip_types = set(kwargs.get('skip_types',
+                                         ['Image', 'Font', 'Media']))
+        self.skip_mime_types = tuple(kwargs.get('skip_mime_types', [
+            'image/', 'font/', 'audio/', 'video/', 'application/font',
+            'application/x-font', 'application/pdf', 'application/zip']))
+        self.max_size = kwargs.get('max_size', 5 * 1024 * 1024)
+        self.priority = kwargs.get('priority', ['Script', 'Document'])
+
+
+    def get_skip_reason(self, response, content_types=None):
+        """Checks whether a response should be downloaded.
+
+        Arguments:
+            response (dict): URLScan response object
+            content_types (set, optional): Content types the rules declare,
+                None if some rule looks at every response
+
+        Returns:
+            str: Why the response is skipped, None if it is fetched
+        """
+        if not response.get('hash'):
+            return 'no_body'
+        if response.get('type') in self.skip_types:
+            return 'type'
+        mime_type = (response.get('response', {}).get('mimeType') or
+                     '').lower()
+        if mime_type.startswith(self.skip_mime_types):
+            return 'mime_type'
+        size = response.get('dataLength') or response.get('size') or 0
+        if self.max_size and size > self.max_size:
+            return 'size'
+        if content_types is not None and mime_type and \
+           not any(content_type in mime_type
+                   for content_type in content_types):
+            return 'rules'
+        return None
+
+
+    def select(self, requests, content_types=None):
+        """Drops the requests whose responses are not worth downloading and
+        sorts the rest by priority.
+
+        Arguments:
+            requests (list): URLScan request objects
+            content_types (set, optional): Content types the rules declare
+
+        Returns:
+            list: Requests to fetch, highest priority first
+            Counter: Skipped responses per (resource type, reason)
+        """
+        selected = []
+        skipped = Counter()
+
+        for request in requests:
+            response = request.get('response') or {}
+            reason = self.get_skip_reason(response, content_types)
+            if reason:
+                skipped[(response.get('type') or 'Other', reason)] += 1
+            else:
+                selected.append(request)
+        rank = {resource_type: i
+                for i, resource_type in enumerate(self.priority)}
+        selected.sort(key=lambda request: rank.get(
+            request['response'].get('type'), len(rank)))
+        return selected, skipped
+
+
 class URLScanProcessor():
+    """Runs the rules on the responses of URLScan results.
 
-    def __init__(self, config_data, rule_manager):
+    With a `checkpoint` (a Job of the CheckpointStore), finished results and
+    responses are saved as they complete and their hits are reported
+    through the job, so a resumed job skips them.
+
+    Arguments:
+        config_data (dict): Config of the processor
+        rule_manager (PluginManager): Manager of the rules
+        session (HTTPSession, optional): Session to send requests with
+        checkpoint (Job, optional): Progress of the job
+    """
+
+    def __init__(self, config_data, rule_manager, session=None,
+                 checkpoint=None):
         api_key = config_data.get('api_key', '')
         self.header = {'Content-Type': 'application/json',
                        'Api-Key': api_key}
         self.rule_manager = rule_manager
+        self.checkpoint = checkpoint
+        self.verdict_cache = get_verdict_cache(config_data)
+        self.metrics = get_metrics()
+        max_in_flight = config_data.get('max_in_flight', 16)
+        self.limiter = FetchLimiter(session or get_session(), max_in_flight,
+                                    config_data.get('per_host_limit', 8))
+        self.result_workers = config_data.get('result_workers', 4)
+        self.response_workers = config_data.get('response_workers',
+                                                max_in_flight)
+        self._response_pool = None
+        self.response_url = config_data.get('response_url',
+                                            'https://urlscan.io/responses/{}/')
+        # Responses are scanned while they download when this is set
+        self.streaming = config_data.get('streaming')
+        if self.streaming is True:
+            self.streaming = {}
+        self.response_filter = ResponseFilter(
+            **config_data.get('response_filter', {}))
+        self.skipped = Counter()
+        self._skipped_lock = threading.Lock()
 
 
     def parse_search_results(self, results):
@@ -19,29 +272,174 @@ class URLScanProcessor():
             results (array): Array of object results from URLScan
         """
         report_data = {'results':[]}
+        # Results and responses get separate pools so result workers waiting
+        # on their responses can never starve the response workers
+        response_pool = ThreadPoolExecutor(self.response_workers)
+        self._response_pool = response_pool
 
-        for result in results:
-            try:
-                # Contains the URLScan info for URL
-                url = result.replace('<', '').replace('>', '')
-                web_requests, submitted_url, urlscan_url = self.get_requests(url)
-                scripts_found = self.parse_requests(web_requests)
-
-                if scripts_found:
-                    for script_data in scripts_found:
-                        report = script_data
-                        report['submitted_url'] = submitted_url
-                        report['urlscan_url'] = urlscan_url
-                        report_data['results'].append(report)
-            except Exception as e:
-                logger.error(e)
-
-                continue
+        try:
+            with ThreadPoolExecutor(self.result_workers) as result_pool:
+                futures = [result_pool.submit(self.parse_result, result)
+                           for result in results]
+                for future in futures:
+                    report_data['results'] += future.result()
+        finally:
+            self._response_pool = None
+            response_pool.shutdown()
+        return self.finish_search(report_data)
+
+
+    async def parse_search_results_async(self, results, pipeline):
+        """Parses the results of the search on an AsyncPipeline, which
+        fetches the responses and runs the rules in its stages.
+
+        Arguments:
+            results (array): Array of object results from URLScan
+            pipeline (AsyncPipeline): Pipeline the job runs on
+        """
+        report_data = {'results':[]}
+        # Bounds the results (and their response bodies) held at once
+        result_slots = asyncio.Semaphore(self.result_workers)
+
+        async def parse(result):
+            async with result_slots:
+                return await self.parse_result_async(result, pipeline)
+
+        for reports in await asyncio.gather(*[parse(result)
+                                              for result in results]):
+            report_data['results'] += reports
+        return self.finish_search(report_data)
+
+
+    def finish_search(self, report_data):
+        """Logs the statistics of a search.
+
+        Arguments:
+            report_data (dict): Report of the hits of the search
+
+        Returns:
+            dict: The report, None if nothing was found
+        """
+        if self.skipped:
+            counts = ', '.join(f'{count} {resource_type} ({reason})'
+                               for (resource_type, reason), count
+                               in sorted(self.skipped.items()))
+            logger.info(f'Skipped responses: {counts}')
+        if self.verdict_cache:
+            stats = self.verdict_cache.get_stats()
+            logger.info(f'Verdict cache: {stats["hits"]} hits, '
+                        f'{stats["misses"]} misses '
+                        f'({stats["ratio"]:.1%} hit ratio)')
         if report_data['results']:
             return report_data
         return None
 
 
+    def parse_result(self, result):
+        """Fetches one URLScan result and runs the rules on its responses.
+
+        Arguments:
+            result (str): URL of the URLScan result
+
+        Returns:
+            list: Report objects for every response a rule fired on, empty
+                with a checkpoint since those go through the job
+        """
+        reports = []
+        # Contains the URLScan info for URL
+        url = result.replace('<', '').replace('>', '')
+
+        if self.checkpoint and self.checkpoint.is_done('result', url):
+            return reports
+        try:
+            web_requests, add_reports = self.get_pending_requests(
+                url, *self.get_requests(url), reports)
+            self.parse_requests(web_requests, add_reports)
+            if self.checkpoint:
+                self.checkpoint.complete('result', url)
+        except FlushError:
+            raise
+        except Exception as e:
+            logger.error(e)
+        return reports
+
+
+    async def parse_result_async(self, result, pipeline):
+        """Same as `parse_result`, on an AsyncPipeline.
+
+        Arguments:
+            result (str): URL of the URLScan result
+            pipeline (AsyncPipeline): Pipeline the job runs on
+
+        Returns:
+            list: Report objects for every response a rule fired on
+        """
+        reports = []
+        url = result.replace('<', '').replace('>', '')
+
+        if self.checkpoint and await pipeline.record(self.checkpoint.is_done,
+                                                     'result', url):
+            return reports
+        try:
+            web_requests, add_reports = await pipeline.record(
+                self.get_pending_requests, url,
+                *await pipeline.fetch(self.get_requests, url), reports)
+
+            async def check(request):
+                scripts_found = await self.parse_request_async(request,
+                                                               pipeline)
+                await pipeline.record(add_reports, request, scripts_found)
+
+            web_requests = await pipeline.evaluate(self.select_requests,
+                                                   web_requests)
+            await asyncio.gather(*[check(request) for request
+                                   in web_requests])
+            if self.checkpoint:
+                await pipeline.record(self.checkpoint.complete, 'result', url)
+        except FlushError:
+            raise
+        except Exception as e:
+            logger.error(e)
+        return reports
+
+
+    def get_pending_requests(self, url, web_requests, submitted_url,
+                             urlscan_url, reports):
+        """Drops the requests a resumed job already checked.
+
+        Arguments:
+            url (str): URL of the URLScan result
+            web_requests (list): Request objects of the result
+            submitted_url (str): URL submitted to URLScan
+            urlscan_url (str): URL of the URLScan report
+            reports (list): Report objects are added to it when there is no
+                checkpoint
+
+        Returns:
+            list: Requests left to check
+            callable: Called with each request and its script data once it
+                is checked
+        """
+        done = set()
+        if self.checkpoint:
+            done = self.checkpoint.get_done('response')
+
+        def add_reports(request, scripts_found):
+            for script_data in scripts_found:
+                script_data['submitted_url'] = submitted_url
+                script_data['urlscan_url'] = urlscan_url
+            if self.checkpoint:
+                self.checkpoint.complete(
+                    'response', f'{url} {get_hash(request)}',
+                    scripts_found)
+            else:
+                reports.extend(scripts_found)
+
+        web_requests = [request for request in web_requests
+                        if f'{url} {get_hash(request)}' not in done]
+        return web_requests, add_reports
+
+
     def get_requests(self, url):
         """Gets the requests a URL makes when a webpage is loaded
 
@@ -53,7 +451,9 @@ class URLScanProcessor():
             dict: Dict containing the original URL submitted to URLScan
                   and the URLScan report
         """
-        result_dat = requests.get(url, headers=self.header, timeout=10).json()
+        with self.metrics.stage('result_fetch'):
+            result_dat = self.limiter.get(url, headers=self.header,
+                                          timeout=10).json()
 
         if not 'data' in result_dat.keys() or not 'task' in result_dat.keys():
             return ([], '', '')
@@ -72,55 +472,314 @@ class URLScanProcessor():
                 from URLScan
 
         Returns:
-            string: The data returned by the request (i.e. scripts, html, etc.)
+            bytes: The data returned by the request (i.e. scripts, html, etc.),
+                None if it could not be fetched
+            str: Encoding of the data
         """
-        logger.info(f'Getting hash {h}')
-        script = ''
-        response = response['response']
-        url = f'https://urlscan.io/responses/{h}/' #URLScan response URL
-        script_r = requests.get(url, timeout=10)
+        logger.debug(f'Getting hash {h}')
+        url = self.response_url.format(h) #URLScan response URL
+
+        with self.metrics.stage('response_fetch'):
+            script_r = self.limiter.get(url, timeout=10)
+            if script_r.status_code != 200:
+                return None, None
+            # Rules decode the bytes themselves if they need text
+            return script_r.content, script_r.encoding
 
-        if script_r.status_code == 200:
-            script = script_r.text
 
-        return script
+    def stream_response(self, response, h):
+        """Runs the rules on a response while it downloads. Since URLScan
+        already gave us the hash, reading stops as soon as the rules are
+        decided.
 
+        Arguments:
+            response (dict): URLScan response object
+            h (str): Hash of the response
+
+        Returns:
+            list: Rules that fired, None if the response could not be fetched
+        """
+        logger.debug(f'Streaming hash {h}')
+        url = self.response_url.format(h) #URLScan response URL
+
+        # Includes the rules matching chunks as they arrive
+        with self.metrics.stage('response_fetch'):
+            script_r = self.limiter.get(url, timeout=10, stream=True)
+
+            # Closing the response frees its place in the fetch limits
+            try:
+                if script_r.status_code != 200:
+                    return None
+                options = dict(self.streaming)
+                options.setdefault('stop_early', True)
+                fired_rules, _, _ = scan_response(
+                    script_r, self.rule_manager, encoding=script_r.encoding,
+                    rule_kwargs={'response_data': response}, **options)
+            finally:
+                script_r.close()
+        return fired_rules
+
+
+    def select_requests(self, requests):
+        """Drops the requests whose responses the rules cannot use (images,
+        fonts, oversized bodies, ...) and puts scripts first.
+
+        Arguments:
+            requests (list): Request objects of a result
 
-    def parse_requests(self, requests):
+        Returns:
+            list: Requests whose responses are checked, in order
+        """
+        requests, skipped = self.response_filter.select(
+            requests, self.rule_manager.get_content_types())
+
+        with self._skipped_lock:
+            self.skipped.update(skipped)
+        for (resource_type, reason), count in skipped.items():
+            self.metrics.inc('gunslinger_responses_skipped_total', count,
+                             type=resource_type, reason=reason)
+        return requests
+
+
+    def parse_requests(self, requests, on_response=None):
         """Parses the requests made by a webpage to look for Magecart.
 
+        Responses the rules cannot use (images, fonts, oversized bodies, ...)
+        are never downloaded, and scripts are fetched before the rest.
+
         Arguments:
             requests (array): Array of objects contianing data on the request
                 made
+            on_response (callable, optional): Called with each request and
+                its script data once it is checked
         """
-        scripts_found = []
+        requests = self.select_requests(requests)
 
-        for request in requests:
-            try:
-                response = request['response'] #Get the response for each request
-                h = response['hash']
-                script = self.get_response(response, h)
-                url = response['response']['url']
-                fired_rules = self.rule_manager.run_rules(script=script,
-                                                          response_data=response)
+        def check(request):
+            script_data = self.parse_request(request)
+            if on_response:
+                on_response(request, script_data)
+            return script_data
+
+        if self._response_pool is None:
+            scripts_found = [check(request) for request in requests]
+        else:
+            futures = [self._response_pool.submit(check, request)
+                       for request in requests]
+            scripts_found = [future.result() for future in futures]
+
+        return [script_data for found in scripts_found
+                for script_data in found]
+
+
+    def parse_request(self, request):
+        """Fetches the response of a single request and runs the rules on it
+        and, for HTML documents, on each of its inline scripts.
+
+        Arguments:
+            request (dict): URLScan request object
+
+        Returns:
+            list: Script data for the response and every inline script a
+                rule fired on
+        """
+        try:
+            response = request['response'] #Get the response for each request
+            fired_rules, inline = self.check_response(response,
+                                                      response['hash'])
+            return get_scripts_found(response, fired_rules, inline)
+        except Exception as e:
+            logger.error(e)
+        return []
+
+
+    async def parse_request_async(self, request, pipeline):
+        """Same as `parse_request`, on an AsyncPipeline.
+
+        Arguments:
+            request (dict): URLScan request object
+            pipeline (AsyncPipeline): Pipeline the job runs on
+
+        Returns:
+            list: Script data for the response and every inline script a
+                rule fired on
+        """
+        try:
+            response = request['response']
+            fired_rules, inline = await self.check_response_async(
+                response, response['hash'], pipeline)
+            return get_scripts_found(response, fired_rules, inline)
+        except Exception as e:
+            logger.error(e)
+        return []
+
+
+    def check_response(self, response, h):
+        """Runs the rules on a response, using the verdict cache to skip
+        both the download and the rules for scripts that were already seen.
+
+        HTML documents are downloaded whole, even when streaming, and their
+        inline scripts are run through the rules as memoryview slices of the
+        body. Their verdicts are cached under `<hash>:inline`.
+
+        Arguments:
+            response (dict): URLScan response object
+            h (str): sha256 hash of the response
+
+        Returns:
+            list: Rules that fired on the response
+            list: (index, hash, fired rules) of every inline script
+        """
+        ruleset_version = self.rule_manager.get_verdict_version(response)
+        html = is_html(response)
+        cached = self.get_cached(h, ruleset_version, html)
+
+        if cached is not None:
+            return cached
+        inline = []
+
+        if self.streaming is not None and not html:
+            fired_rules = self.stream_response(response, h)
+        else:
+            script, encoding = self.get_response(response, h)
+            fired_rules = None
+            if script is not None:
+                fired_rules = self.rule_manager.run_rules(
+                    script=script, encoding=encoding, response_data=response)
+                if html:
+                    inline = self.check_inline_scripts(script, encoding,
+                                                       response)
+
+        if fired_rules is None:
+            # The response could not be fetched, only response_data is known
+            return self.rule_manager.run_rules(script='',
+                                               response_data=response), []
+        self.cache_verdicts(h, ruleset_version, html, fired_rules, inline)
+        return fired_rules, inline
+
+
+    async def check_response_async(self, response, h, pipeline):
+        """Same as `check_response`, fetching in the pipeline's `fetch`
+        stage, running the rules in its `rules` stage and using the verdict
+        cache in its `process` stage.
+
+        Arguments:
+            response (dict): URLScan response object
+            h (str): sha256 hash of the response
+            pipeline (AsyncPipeline): Pipeline the job runs on
+
+        Returns:
+            list: Rules that fired on the response
+            list: (index, hash, fired rules) of every inline script
+        """
+        ruleset_version = await pipeline.evaluate(
+            self.rule_manager.get_verdict_version, response)
+        html = is_html(response)
+        cached = await pipeline.record(self.get_cached, h, ruleset_version,
+                                       html)
+
+        if cached is not None:
+            return cached
+        inline = []
 
-                if fired_rules:
-                    logger.info(f'Rule fired on {url}')
-                    script_data = {'url':url, 'hash':h,
-                                   'fired_rules':fired_rules}
-                    scripts_found.append(script_data)
-            except Exception as e:
-                logger.error(e)
+        if self.streaming is not None and not html:
+            fired_rules = await pipeline.fetch(self.stream_response,
+                                               response, h)
+        else:
+            script, encoding = await pipeline.fetch(self.get_response,
+                                                    response, h)
+            fired_rules = None
+            if script is not None:
+                fired_rules = await pipeline.run_rules(
+                    self.rule_manager, script=script, encoding=encoding,
+                    response_data=response)
+                if html:
+                    inline = await pipeline.evaluate(
+                        self.check_inline_scripts, script, encoding,
+                        response)
 
-                continue
+        if fired_rules is None:
+            return await pipeline.run_rules(self.rule_manager, script='',
+                                            response_data=response), []
+        await pipeline.record(self.cache_verdicts, h, ruleset_version, html,
+                              fired_rules, inline)
+        return fired_rules, inline
 
-        return scripts_found
+
+    def get_cached(self, h, ruleset_version, html):
+        """Gets the verdicts of a response from the verdict cache.
+
+        Arguments:
+            h (str): sha256 hash of the response
+            ruleset_version (str): Version of the rules for the response,
+                see PluginManager.get_verdict_version
+            html (bool): Whether the response is an HTML document
+
+        Returns:
+            tuple: Fired rules and inline verdicts, None if they are not
+                cached
+        """
+        if not self.verdict_cache:
+            return None
+        fired_rules = self.verdict_cache.get(h, ruleset_version)
+        inline = []
+
+        if html and fired_rules is not None:
+            inline = self.verdict_cache.get(f'{h}:inline', ruleset_version)
+        if fired_rules is None or inline is None:
+            return None
+        return fired_rules, inline
+
+
+    def cache_verdicts(self, h, ruleset_version, html, fired_rules, inline):
+        if not self.verdict_cache:
+            return
+        # Verdicts missing a rule that was stopped are not cached
+        if not getattr(fired_rules, 'timed_out', None):
+            self.verdict_cache.set(h, ruleset_version, fired_rules)
+        if html and not any(getattr(inline_rules, 'timed_out', None)
+                            for _, _, inline_rules in inline):
+            self.verdict_cache.set(f'{h}:inline', ruleset_version, inline)
+
+
+    def check_inline_scripts(self, content, encoding, response):
+        """Runs the rules on the inline scripts of an HTML document.
+
+        Arguments:
+            content (bytes): Body of the document
+            encoding (str): Encoding of the body
+            response (dict): URLScan response object of the document
+
+        Returns:
+            list: (index, hash, fired rules) of every inline script
+        """
+        inline = []
+
+        for i, segment in enumerate(split_inline_scripts(content)):
+            fired_rules = self.rule_manager.run_rules(
+                script=segment, encoding=encoding, response_data=response)
+            inline.append((i, hashlib.sha256(segment).hexdigest(),
+                           fired_rules))
+        return inline
 
 def run(**kwargs):
     config_data = kwargs.get('config_info')
     rule_manager = kwargs.get('rule_manager')
-    urlscan_processor = URLScanProcessor(config_data, rule_manager)
+    urlscan_processor = URLScanProcessor(config_data, rule_manager,
+                                         kwargs.get('session'),
+                                         kwargs.get('checkpoint'))
     rule_data = urlscan_processor.parse_search_results(kwargs.get('data',
                                                                   []))
 
     return rule_data
+
+
+async def run_async(**kwargs):
+    config_data = kwargs.get('config_info')
+    rule_manager = kwargs.get('rule_manager')
+    urlscan_processor = URLScanProcessor(config_data, rule_manager,
+                                         kwargs.get('session'),
+                                         kwargs.get('checkpoint'))
+
+    return await urlscan_processor.parse_search_results_async(
+        kwargs.get('data', []), kwargs['pipeline'])
@@ -0,0 +1,20 @@
+def get_script_data(url, h, fired_rules):
+    """Builds the result of a script for the reports.
+
+    Arguments:
+        url (str): URL of the script
+        h (str): sha256 hash of the script
+        fired_rules (list): Rules that fired, a RuleResults also names the
+            rules that were stopped
+
+    Returns:
+        dict: Script data if a rule fired or timed out, otherwise None
+    """
+    timed_out = getattr(fired_rules, 'timed_out', None)
+
+    if not fired_rules and not timed_out:
+        return None
+    script_data = {'url':url, 'hash':h, 'fired_rules':list(fired_rules)}
+    if timed_out:
+        script_data['timed_out_rules'] = timed_out
+    return script_data
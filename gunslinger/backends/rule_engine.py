@@ -0,0 +1,698 @@
+import ast
+import re
+import time
+import bisect
+import fnmatch
+import logging
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class RuleFormatError(Exception):
+    pass
+
+
+class RuleInput():
+    """Script handed to the rules, as text and/or as a bytes buffer.
+
+    Only the form that was given is held, the other one is created the
+    first time a rule asks for it, so bytes are only decoded when a text
+    rule runs and buffers handed in are never copied.
+
+    Arguments:
+        script (str or bytes-like): The script
+        encoding (str, optional): Encoding between the text and the bytes
+        buffer (bytes-like, optional): Bytes of a script given as text
+    """
+
+    def __init__(self, script='', encoding=None, buffer=None):
+        self.encoding = encoding or 'ISO-8859-1'
+        self._text = None
+        self._buffer = None
+
+        if isinstance(script, str):
+            self._text = script
+        else:
+            self._buffer = memoryview(script)
+        if buffer is not None:
+            self._buffer = memoryview(buffer)
+
+
+    @property
+    def text(self):
+        """str: The script decoded as text."""
+        if self._text is None:
+            self._text = str(self._buffer, self.encoding, 'replace')
+        return self._text
+
+
+    @property
+    def size(self):
+        """int: Length of the script, in bytes if it was given as bytes."""
+        if self._buffer is not None:
+            return self._buffer.nbytes
+        return len(self._text)
+
+
+    @property
+    def buffer(self):
+        """memoryview: The bytes of the script."""
+        if self._buffer is None:
+            self._buffer = memoryview(self._text.encode(self.encoding,
+                                                        'replace'))
+        return self._buffer
+
+
+def to_bytes(value):
+    return value if isinstance(value, bytes) else value.encode('utf-8')
+
+
+def has_wildcard(glob):
+    return any(char in glob for char in '*?[')
+
+
+class Condition():
+    """Boolean condition over the named literals and patterns of a rule.
+
+    Only `and`, `or`, `not`, parentheses and names are allowed, e.g.
+    `ant_cockroach and (cc_number or checkout)`.
+
+    Arguments:
+        expression (str): Condition to compile
+        names (iterable): Names the condition is allowed to reference
+    """
+
+    def __init__(self, expression, names):
+        try:
+            tree = ast.parse(expression, mode='eval')
+        except SyntaxError as exc:
+            raise RuleFormatError(f'Invalid condition "{expression}": {exc}')
+        self._names = set(names)
+        self._check(tree.body)
+        self._tree = tree.body
+
+
+    def _check(self, node):
+        if isinstance(node, ast.BoolOp):
+            for value in node.values:
+                self._check(value)
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            self._check(node.operand)
+        elif isinstance(node, ast.Name):
+            if node.id not in self._names:
+                raise RuleFormatError(f'Unknown name "{node.id}" in condition')
+        else:
+            raise RuleFormatError('Conditions may only use and/or/not and '
+                                  'literal or pattern names')
+
+
+    def evaluate(self, lookup):
+        """Evaluates the condition, short-circuiting like Python does.
+
+        Arguments:
+            lookup (callable): Called with a name, returns whether it matched
+
+        Returns:
+            bool: Result of the condition
+        """
+        return self._evaluate(self._tree, lookup)
+
+
+    def _evaluate(self, node, lookup):
+        if isinstance(node, ast.BoolOp):
+            if isinstance(node.op, ast.And):
+                return all(self._evaluate(v, lookup) for v in node.values)
+            return any(self._evaluate(v, lookup) for v in node.values)
+        if isinstance(node, ast.UnaryOp):
+            return not self._evaluate(node.operand, lookup)
+        return lookup(node.id)
+
+
+    def evaluate_partial(self, lookup):
+        """Evaluates the condition when some names are not known yet, using
+        three-valued logic.
+
+        Arguments:
+            lookup (callable): Called with a name, returns True, False or
+                None if it is not known yet
+
+        Returns:
+            bool: Result of the condition, None if it cannot be decided yet
+        """
+        return self._evaluate_partial(self._tree, lookup)
+
+
+    def _evaluate_partial(self, node, lookup):
+        if isinstance(node, ast.BoolOp):
+            decisive = isinstance(node.op, ast.Or)
+            result = not decisive
+            for value in node.values:
+                value = self._evaluate_partial(value, lookup)
+                if value is decisive:
+                    return decisive
+                if value is None:
+                    result = None
+            return result
+        if isinstance(node, ast.UnaryOp):
+            value = self._evaluate_partial(node.operand, lookup)
+            return None if value is None else not value
+        return lookup(node.id)
+
+
+class DeclarativeRule():
+    """Rule described by data instead of a `run` function.
+
+    A rule module is declarative when it defines `literals` and/or
+    `patterns` (dicts mapping a name to a string) and optionally a
+    `condition` over those names. Without a condition every name must
+    match. Regex patterns can be compiled with `flags`. Rules with
+    `binary = True` match the raw bytes of the script, their literals and
+    patterns are encoded as UTF-8 if given as strings.
+
+    Arguments:
+        name (str): Name of the rule plugin
+        module (module): Loaded rule module
+    """
+
+    def __init__(self, name, module):
+        self.name = name
+        self.binary = bool(getattr(module, 'binary', False))
+        self.literals = dict(getattr(module, 'literals', {}))
+        flags = getattr(module, 'flags', 0)
+        patterns = dict(getattr(module, 'patterns', {}))
+        self.patterns = {}
+
+        if self.binary:
+            self.literals = {key: to_bytes(literal)
+                             for key, literal in self.literals.items()}
+            patterns = {key: to_bytes(pattern)
+                        for key, pattern in patterns.items()}
+        for key, pattern in patterns.items():
+            try:
+                self.patterns[key] = re.compile(pattern, flags)
+            except re.error as exc:
+                raise RuleFormatError(f'Invalid pattern {key}: {exc}')
+        names = list(self.literals) + list(self.patterns)
+
+        if not names:
+            raise RuleFormatError('Rule has no literals or patterns')
+        if set(self.literals) & set(self.patterns):
+            raise RuleFormatError('Literal and pattern names must be unique')
+        for key, literal in self.literals.items():
+            if not literal:
+                raise RuleFormatError(f'Literal {key} is empty')
+        expression = getattr(module, 'condition', '') or ' and '.join(names)
+        self.condition = Condition(expression, names)
+
+
+    @staticmethod
+    def is_declarative(module):
+        return hasattr(module, 'literals') or hasattr(module, 'patterns')
+
+
+class LiteralScanner():
+    """Finds which of a set of literals occur in a script with a single
+    scan.
+
+    All literals go into one alternation wrapped in a zero-width lookahead,
+    so overlapping literals are all seen.
+
+    Arguments:
+        literals (set): Literals to look for
+        binary (bool, optional): The literals are bytes
+    """
+
+    def __init__(self, literals, binary=False):
+        self.literals = set(literals)
+        # A match of a literal also proves every literal contained in it
+        self._implied = {lit: {other for other in self.literals
+                               if other in lit}
+                         for lit in self.literals}
+        self._prefilter = None
+
+        if self.literals:
+            ordered = sorted(self.literals, key=len, reverse=True)
+            if binary:
+                alternation = b'|'.join(re.escape(lit) for lit in ordered)
+                self._prefilter = re.compile(b'(?=(' + alternation + b'))')
+            else:
+                alternation = '|'.join(re.escape(lit) for lit in ordered)
+                self._prefilter = re.compile(f'(?=({alternation}))')
+
+
+    def __len__(self):
+        return len(self.literals)
+
+
+    def find(self, script, found=None):
+        """Scans the script once for every literal.
+
+        Arguments:
+            script (str or bytes-like): Script to scan
+            found (set, optional): Literals already known to be present
+
+        Returns:
+            set: Literals present in the script
+        """
+        found = set(found or ())
+
+        if self._prefilter is None or len(found) == len(self.literals):
+            return found
+        for match in self._prefilter.finditer(script):
+            literal = match.group(1)
+
+            if literal in found:
+                continue
+            found |= self._implied[literal]
+            if len(found) == len(self.literals):
+                break
+        return found
+
+
+    @property
+    def max_length(self):
+        return max((len(lit) for lit in self.literals), default=0)
+
+
+class RuleSet():
+    """All declarative rules compiled into a single matcher.
+
+    Every literal of every rule goes into one alternation that is scanned
+    once over the script. Rules are then evaluated against the literals
+    that were found, and their regex patterns only run when the condition
+    still depends on them.
+
+    Arguments:
+        rules (list): List of DeclarativeRule objects
+        binary (bool, optional): The rules match bytes instead of text
+    """
+
+    def __init__(self, rules, binary=False):
+        self.rules = rules
+        self.names = {rule.name for rule in rules}
+        self.binary = binary
+        self._scanner = LiteralScanner(
+            {lit for rule in rules for lit in rule.literals.values()}, binary)
+
+
+    def __len__(self):
+        return len(self.rules)
+
+
+    def find_literals(self, script, found=None):
+        """Scans the script once for every literal of every rule.
+
+        Arguments:
+            script (str or bytes-like): Script to scan
+            found (set, optional): Literals already known to be present
+
+        Returns:
+            set: Literals present in the script
+        """
+        return self._scanner.find(script, found)
+
+
+    @property
+    def max_literal_length(self):
+        return self._scanner.max_length
+
+
+    def run(self, script, timer=None, started=None, skip=()):
+        """Runs all declarative rules against a script.
+
+        Arguments:
+            script (str or bytes-like): Script to check, bytes for binary
+                rules
+            timer (callable, optional): Called with the rule name, wall time,
+                CPU time, whether the rule fired and whether it raised an
+                exception for every rule, the literal scan is reported as
+                `<literals>`
+            started (callable, optional): Called with the rule name before
+                each rule runs
+            skip (set, optional): Names of rules not to run
+
+        Returns:
+            list: Names of the rules that fired
+        """
+        if started:
+            started('<literals>')
+        if timer:
+            start, start_cpu = time.perf_counter(), time.process_time()
+        found = self.find_literals(script)
+        if timer:
+            timer('<literals>', time.perf_counter() - start,
+                  time.process_time() - start_cpu, None, False)
+        fired_rules = []
+
+        for rule in self.rules:
+            if rule.name in skip:
+                continue
+            if started:
+                started(rule.name)
+            if timer:
+                start, start_cpu = time.perf_counter(), time.process_time()
+            fired = error = False
+            try:
+                fired = self.evaluate(rule, script, found)
+                if fired:
+                    fired_rules.append(rule.name)
+            except Exception as e:
+                error = True
+                logger.error(f'Cannot run rule {rule.name}')
+                logger.error(e)
+            if timer:
+                timer(rule.name, time.perf_counter() - start,
+                      time.process_time() - start_cpu, fired, error)
+        return fired_rules
+
+
+    def stream(self, **kwargs):
+        """Creates a matcher that is fed the script chunk by chunk.
+
+        Returns:
+            StreamMatcher: Matcher for these rules
+        """
+        return StreamMatcher(self, **kwargs)
+
+
+    def evaluate(self, rule, script, found):
+        def lookup(name):
+            if name in rule.literals:
+                return rule.literals[name] in found
+            return rule.patterns[name].search(script) is not None
+
+        return rule.condition.evaluate(lookup)
+
+
+class StreamMatcher():
+    """Runs the declarative rules on a script that arrives in chunks.
+
+    Literals are looked for in every chunk as it arrives (keeping enough of
+    the previous chunk to catch literals split across chunks), so the
+    literal scan still happens once. Whenever new literals turn up, and each
+    time the text received has doubled, the rules are evaluated on what has
+    arrived so far. A rule is decided once its condition can no longer change
+    whatever the rest of the script contains. Pattern matches that end
+    within `margin` characters of the end of the received text are not
+    trusted yet, since anchors and lookaheads could depend on what follows.
+
+    Arguments:
+        rule_set (RuleSet): Compiled rules to run
+        margin (int, optional): Characters a pattern match has to end before
+            the end of the received text to count early
+        keep_text (bool, optional): Keep collecting the text after every
+            rule is decided
+        timer (callable, optional): Called like the timer of `RuleSet.run`
+            from `finish`, with the time spent on each rule over all chunks
+        skip (set, optional): Names of rules not to run
+    """
+
+    def __init__(self, rule_set, margin=1024, keep_text=False, timer=None,
+                 skip=()):
+        self.rule_set = rule_set
+        self.rules = [rule for rule in rule_set.rules if rule.name not in skip]
+        self.margin = margin
+        self.keep_text = keep_text
+        self.timer = timer
+        self._times = {}
+        self.found = set()
+        self.decided = {}
+        self.size = 0
+        self._chunks = []
+        self._empty = b'' if rule_set.binary else ''
+        self._tail = self._empty
+        self._overlap = max(rule_set.max_literal_length - 1, 0)
+        self._next_check = 65536
+
+
+    @property
+    def done(self):
+        """bool: Whether the outcome of every rule is decided."""
+        return len(self.decided) == len(self.rules)
+
+
+    def feed(self, text):
+        """Adds the next chunk of the script.
+
+        Arguments:
+            text (str or bytes): Next chunk of the script, bytes for binary
+                rules
+
+        Returns:
+            bool: True once the outcome of every rule is decided
+        """
+        if self.done:
+            if self.keep_text:
+                self._chunks.append(text)
+            return True
+        self._chunks.append(text)
+        self.size += len(text)
+        window = self._tail + text
+        start, start_cpu = time.perf_counter(), time.process_time()
+        found = self.rule_set.find_literals(window, self.found)
+        self.add_time('<literals>', start, start_cpu)
+        self._tail = window[-self._overlap:] if self._overlap else self._empty
+
+        if len(found) > len(self.found) or self.size >= self._next_check:
+            self.found = found
+            self._next_check = self.size * 2
+            self.decide()
+        return self.done
+
+
+    def add_time(self, name, start, start_cpu):
+        if not self.timer:
+            return
+        wall, cpu = self._times.get(name, (0.0, 0.0))
+        self._times[name] = (wall + time.perf_counter() - start,
+                             cpu + time.process_time() - start_cpu)
+
+
+    def decide(self):
+        """Evaluates the undecided rules on the text received so far."""
+        script = self.text
+        limit = len(script) - self.margin
+
+        for rule in self.rules:
+            if rule.name in self.decided:
+                continue
+            start, start_cpu = time.perf_counter(), time.process_time()
+
+            def lookup(name):
+                if name in rule.literals:
+                    return True if rule.literals[name] in self.found else None
+                match = rule.patterns[name].search(script)
+                if match is None or match.end() > limit:
+                    return None
+                return True
+
+            try:
+                result = rule.condition.evaluate_partial(lookup)
+            except Exception:
+                result = None
+            if result is not None:
+                self.decided[rule.name] = result
+            self.add_time(rule.name, start, start_cpu)
+
+
+    @property
+    def text(self):
+        """str: Text (bytes for binary rules) of the script received so
+        far."""
+        if len(self._chunks) > 1:
+            self._chunks = [self._empty.join(self._chunks)]
+        return self._chunks[0] if self._chunks else self._empty
+
+
+    def finish(self):
+        """Decides the remaining rules on the complete script.
+
+        Returns:
+            list: Names of the rules that fired
+        """
+        script = self.text
+        fired_rules = []
+
+        if self.timer and '<literals>' in self._times:
+            self.timer('<literals>', *self._times['<literals>'], None, False)
+        for rule in self.rules:
+            start, start_cpu = time.perf_counter(), time.process_time()
+            fired = error = False
+            try:
+                if rule.name in self.decided:
+                    fired = self.decided[rule.name]
+                else:
+                    fired = self.rule_set.evaluate(rule, script, self.found)
+                if fired:
+                    fired_rules.append(rule.name)
+            except Exception as e:
+                error = True
+                logger.error(f'Cannot run rule {rule.name}')
+                logger.error(e)
+            if self.timer:
+                self.add_time(rule.name, start, start_cpu)
+                self.timer(rule.name, *self._times[rule.name], fired, error)
+        return fired_rules
+
+
+class RuleIndex():
+    """Index of the preconditions rule modules can declare in an optional
+    metadata header, so only the rules that can match a script are run:
+
+        requires = ['cc_number']        # literals that must all be present
+        hosts = ['*.example.com']       # globs for the host (or whole URL)
+        content_types = ['javascript']  # parts of the MIME type
+        min_size = 1024                 # bytes the script must at least have
+
+    Host and URL come from `response_data` (the URLScan response object),
+    preconditions that cannot be checked because it is missing pass.
+
+    Arguments:
+        rules (list): (name, module) tuples of every rule
+    """
+
+    def __init__(self, rules):
+        self.exact_hosts = {}
+        self.host_suffixes = {}
+        self.host_globs = []
+        self.host_rules = set()
+        self.content_types = {}
+        self.content_type_rules = set()
+        self.min_sizes = []
+        self.requires = {}
+        self.binary = set()
+
+        for name, module in rules:
+            for host in getattr(module, 'hosts', None) or ():
+                host = host.lower()
+                self.host_rules.add(name)
+                # Plain hosts and `*.domain` globs are looked up directly,
+                # only other globs are matched one by one
+                if host.startswith('*.') and not has_wildcard(host[2:]):
+                    self.host_suffixes.setdefault(host[2:], set()).add(name)
+                elif '/' in host or has_wildcard(host):
+                    self.host_globs.append((host, name))
+                else:
+                    self.exact_hosts.setdefault(host, set()).add(name)
+            for content_type in getattr(module, 'content_types', None) or ():
+                self.content_types.setdefault(content_type.lower(),
+                                              set()).add(name)
+                self.content_type_rules.add(name)
+            if getattr(module, 'min_size', 0):
+                self.min_sizes.append((module.min_size, name))
+            if getattr(module, 'requires', None):
+                self.requires[name] = set(module.requires)
+                if getattr(module, 'binary', False):
+                    self.binary.add(name)
+                    self.requires[name] = {to_bytes(lit)
+                                           for lit in module.requires}
+        self.min_sizes.sort()
+        self._sizes = [size for size, _ in self.min_sizes]
+        # Rules that can only be ruled out once the whole script is known
+        self.script_rules = set(self.requires) | {name for _, name
+                                                  in self.min_sizes}
+        self._scanners = {}
+
+        for binary in (False, True):
+            literals = {lit for name, required in self.requires.items()
+                        if (name in self.binary) == binary
+                        for lit in required}
+            if literals:
+                self._scanners[binary] = LiteralScanner(literals, binary)
+
+
+    def __len__(self):
+        return len(self.host_rules | self.content_type_rules |
+                   set(self.requires) | {name for _, name in self.min_sizes})
+
+
+    def match_hosts(self, url):
+        """Gets the rules whose host globs match a URL.
+
+        Arguments:
+            url (str): URL of the script
+
+        Returns:
+            set: Names of the matching rules
+        """
+        host = (urlparse(url).hostname or '').lower()
+        matched = set(self.exact_hosts.get(host, ()))
+        parts = host.split('.')
+
+        for i in range(1, len(parts)):
+            matched |= self.host_suffixes.get('.'.join(parts[i:]), set())
+        for glob, name in self.host_globs:
+            if fnmatch.fnmatchcase(url.lower() if '/' in glob else host,
+                                   glob):
+                matched.add(name)
+        return matched
+
+
+    def get_skipped(self, rule_input, response_data=None):
+        """Gets the rules whose preconditions fail for a script.
+
+        Arguments:
+            rule_input (RuleInput): The script
+            response_data (dict, optional): URLScan response object
+
+        Returns:
+            set: Names of the rules that cannot match
+        """
+        skipped = self.get_skipped_by_response(response_data)
+        return skipped | self.get_skipped_by_script(rule_input, skipped)
+
+
+    def get_skipped_by_response(self, response_data=None):
+        """Gets the rules whose host or content type preconditions fail.
+
+        Arguments:
+            response_data (dict, optional): URLScan response object
+
+        Returns:
+            set: Names of the rules that cannot match
+        """
+        skipped = set()
+        response = (response_data or {}).get('response') or {}
+        url = response.get('url')
+        mime_type = (response.get('mimeType') or '').lower()
+
+        if url and self.host_rules:
+            skipped |= self.host_rules - self.match_hosts(url)
+        if mime_type and self.content_type_rules:
+            matched = set()
+            for content_type, names in self.content_types.items():
+                if content_type in mime_type:
+                    matched |= names
+            skipped |= self.content_type_rules - matched
+        return skipped
+
+
+    def get_skipped_by_script(self, rule_input, skipped=()):
+        """Gets the rules whose size or literal preconditions fail.
+
+        Arguments:
+            rule_input (RuleInput): The script
+            skipped (set, optional): Rules already known not to match
+
+        Returns:
+            set: Names of the rules that cannot match
+        """
+        skipped = set(skipped)
+
+        if self.min_sizes:
+            size = rule_input.size
+            skipped.update(name for _, name in
+                           self.min_sizes[bisect.bisect_right(self._sizes,
+                                                              size):])
+        pending = [name for name in self.requires if name not in skipped]
+        found = {}
+
+        for name in pending:
+            binary = name in self.binary
+            if binary not in found:
+                script = rule_input.buffer if binary else rule_input.text
+                found[binary] = self._scanners[binary].find(script)
+            if not self.requires[name] <= found[binary]:
+                skipped.add(name)
+        return skipped
@@ -0,0 +1,378 @@
+import os
+import sys
+import json
+import time
+import queue
+import signal
+import logging
+import threading
+import subprocess
+import multiprocessing
+from multiprocessing.connection import Connection
+
+logger = logging.getLogger(__name__)
+
+
+class RuleResults(list):
+    """Names of the rules that fired on a script. Rules that were stopped
+    because they ran out of time or memory are listed in `timed_out`."""
+
+    def __init__(self, fired_rules=(), timed_out=()):
+        super().__init__(fired_rules)
+        self.timed_out = list(timed_out)
+
+
+class Evaluator():
+    """Handle of one evaluator process, which loads the rules itself and
+    runs them on the scripts it is sent.
+
+    Arguments:
+        options (dict): Arguments of `evaluator_main`
+    """
+
+    def __init__(self, options):
+        self.options = options
+        self.process = None
+        self.conn = None
+        self.start()
+
+
+    def start(self):
+        # Evaluators are started with subprocess rather than multiprocessing,
+        # since the Supervisor's worker processes are daemons and may not
+        # have children of their own
+        parent_conn, child_conn = multiprocessing.Pipe()
+        fd = child_conn.fileno()
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'backends.rule_sandbox', str(fd),
+             json.dumps(self.options)], pass_fds=[fd])
+        child_conn.close()
+        self.conn = parent_conn
+        logger.info(f'Started rule evaluator {self.process.pid}')
+
+
+    def restart(self):
+        self.stop()
+        self.start()
+
+
+    def stop(self):
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+        self.conn.close()
+
+
+class RuleSandbox():
+    """Runs the rules in a pool of evaluator processes, so a rule that hangs
+    or eats memory cannot take the worker down with it.
+
+    Evaluators are started ahead of time and report each rule as it starts
+    and finishes. A rule that runs longer than `timeout` seconds (or an
+    evaluator that spends `load_timeout` seconds outside the rules, e.g.
+    importing them) is stopped by killing its evaluator, which is restarted,
+    and the rules that did not run yet are run on the fresh one. Evaluators
+    are also limited to `memory_limit` bytes (RLIMIT_AS, a rule going over
+    gets a MemoryError) and `cpu_limit` CPU seconds per script (RLIMIT_CPU,
+    the evaluator is killed by SIGXCPU). A rule stopped `quarantine_after` times within
+    `quarantine_window` seconds is quarantined: it is skipped for
+    `quarantine_time` seconds or until its file changes. Quarantined rules
+    are kept in `quarantine_file`, which the workers of a host share.
+
+    Arguments:
+        manager (PluginManager): Manager of the rules
+        workers (int, optional): Number of evaluator processes
+        timeout (float, optional): Wall seconds one rule may run on a script
+        load_timeout (float, optional): Wall seconds an evaluator may spend
+            loading the rules
+        cpu_limit (int, optional): CPU seconds all rules may use on a script
+        memory_limit (int, optional): Bytes of memory of an evaluator
+        quarantine_after (int, optional): Timeouts before a rule is
+            quarantined, 0 never quarantines
+        quarantine_window (int, optional): Seconds timeouts are counted over
+        quarantine_time (int, optional): Seconds a rule stays quarantined
+        quarantine_file (str, optional): Path of the shared quarantine list
+    """
+
+    def __init__(self, manager, **kwargs):
+        self.manager = manager
+        self.workers = kwargs.get('workers', 2)
+        self.timeout = kwargs.get('timeout', 5)
+        self.load_timeout = kwargs.get('load_timeout', 60)
+        self.quarantine_after = kwargs.get('quarantine_after', 3)
+        self.quarantine_window = kwargs.get('quarantine_window', 3600)
+        self.quarantine_time = kwargs.get('quarantine_time', 24 * 3600)
+        self.quarantine_file = kwargs.get('quarantine_file',
+                                          'state/quarantine.json')
+        self.options = {
+            'package': 'backends.sandboxed_rules',
+            'plugin_dir': manager.get_path(manager._plugin_dir),
+            'reload_interval': manager._reload_interval,
+            'cpu_limit': kwargs.get('cpu_limit', 30),
+            'memory_limit': kwargs.get('memory_limit', 1024 * 1024 * 1024)}
+        self._evaluators = []
+        self._idle = queue.Queue()
+        self._offenses = {}
+        self._quarantine = {}
+        self._quarantine_mtime = None
+        self._lock = threading.Lock()
+
+
+    def get_evaluator(self):
+        with self._lock:
+            if len(self._evaluators) < self.workers and self._idle.empty():
+                evaluator = Evaluator(self.options)
+                self._evaluators.append(evaluator)
+                return evaluator
+        return self._idle.get()
+
+
+    def get_rule_hash(self, rule_name):
+        for plugin_name, rule in self.manager.get_plugins():
+            if plugin_name == rule_name:
+                return self.manager.get_file_signature(rule)[1]
+        return None
+
+
+    def read_quarantine(self):
+        """Gets the quarantine list, reading the file again only when another
+        process changed it.
+
+        Returns:
+            dict: Rule names mapped to their quarantine entry
+        """
+        try:
+            mtime = os.path.getmtime(self.quarantine_file)
+        except OSError:
+            return self._quarantine
+        if mtime != self._quarantine_mtime:
+            try:
+                with open(self.quarantine_file) as f:
+                    self._quarantine = json.load(f)
+                self._quarantine_mtime = mtime
+            except Exception as e:
+                logger.error(f'Cannot read quarantine {self.quarantine_file}: '
+                             f'{e}')
+        return self._quarantine
+
+
+    def get_quarantined(self):
+        """Gets the rules that are quarantined right now.
+
+        Returns:
+            list: Sorted names of the quarantined rules
+        """
+        now = time.time()
+        return sorted(name for name, entry in self.read_quarantine().items()
+                      if entry['until'] > now and
+                      entry['hash'] == self.get_rule_hash(name))
+
+
+    def quarantine(self, rule_name):
+        with self._lock:
+            quarantine = dict(self.read_quarantine())
+            quarantine[rule_name] = {
+                'until': time.time() + self.quarantine_time,
+                'hash': self.get_rule_hash(rule_name)}
+            directory = os.path.dirname(self.quarantine_file)
+            try:
+                if directory and not os.path.exists(directory):
+                    os.makedirs(directory, exist_ok=True)
+                tmp_path = f'{self.quarantine_file}.{os.getpid()}.tmp'
+                with open(tmp_path, 'w') as f:
+                    json.dump(quarantine, f)
+                os.replace(tmp_path, self.quarantine_file)
+            except Exception as e:
+                logger.error(f'Cannot save quarantine {self.quarantine_file}: '
+                             f'{e}')
+            self._quarantine = quarantine
+        logger.error(f'Quarantined rule {rule_name} for '
+                     f'{self.quarantine_time}s')
+        self.manager.metrics.inc('gunslinger_rule_quarantines_total',
+                                 rule=rule_name)
+
+
+    def add_offense(self, rule_name):
+        """Counts a timeout of a rule and quarantines the rule once it timed
+        out too often.
+
+        Arguments:
+            rule_name (str): Name of the rule
+        """
+        now = time.time()
+        self.manager.metrics.inc('gunslinger_rule_timeouts_total',
+                                 rule=rule_name)
+        if not self.quarantine_after or rule_name.startswith('<'):
+            return
+        with self._lock:
+            offenses = [t for t in self._offenses.get(rule_name, [])
+                        if t > now - self.quarantine_window] + [now]
+            self._offenses[rule_name] = offenses
+        if len(offenses) >= self.quarantine_after:
+            self._offenses.pop(rule_name, None)
+            self.quarantine(rule_name)
+
+
+    def get_version(self, ruleset_version):
+        """Gets a version for the verdict cache that also changes when rules
+        go in or out of quarantine.
+
+        Arguments:
+            ruleset_version (str): Hash of the loaded rules
+
+        Returns:
+            str: Version of the rules that actually run
+        """
+        quarantined = self.get_quarantined()
+
+        if not quarantined:
+            return ruleset_version
+        return f'{ruleset_version}-{",".join(quarantined)}'
+
+
+    def evaluate(self, evaluator, request, results, skip):
+        """Sends a script to an evaluator and collects the outcome of each
+        rule.
+
+        Arguments:
+            evaluator (Evaluator): Evaluator to run the rules in
+            request (tuple): Script, encoding and arguments of the rules
+            results (RuleResults): Results the fired rules are added to
+            skip (set): Rules not to run, finished rules are added to it
+
+        Returns:
+            str: Rule that was stopped, None if every rule finished
+        """
+        current = None
+        deadline = time.monotonic() + self.load_timeout
+        try:
+            evaluator.conn.send((sorted(skip),) + request)
+            while True:
+                if not evaluator.conn.poll(max(deadline - time.monotonic(),
+                                               0)):
+                    logger.error(f'Rule {current} timed out on evaluator '
+                                 f'{evaluator.process.pid}')
+                    break
+                message = evaluator.conn.recv()
+                if message[0] == 'done':
+                    return None
+                if message[0] == 'start':
+                    current = message[1]
+                    deadline = time.monotonic() + self.timeout
+                    continue
+                _, rule_name, wall, cpu, fired, error = message
+                self.manager.record_rule(rule_name, wall, cpu, fired, error)
+                skip.add(rule_name)
+                current = None
+                deadline = time.monotonic() + self.load_timeout
+                if fired:
+                    results.append(rule_name)
+        except (EOFError, OSError):
+            logger.error(f'Rule evaluator {evaluator.process.pid} died '
+                         f'running {current}')
+        evaluator.restart()
+        return current or '<evaluator>'
+
+
+    def run(self, script, encoding=None, skip=(), **kwargs):
+        """Runs the rules on a script.
+
+        Arguments:
+            script (str or bytes-like): The script
+            encoding (str, optional): Encoding of a script given as bytes
+            skip (list, optional): Names of rules not to run
+            **kwargs: Other arguments for the rules
+
+        Returns:
+            RuleResults: Rules that fired and rules that were stopped
+        """
+        if not isinstance(script, (str, bytes)):
+            # Buffers are copied once to cross into the evaluator
+            script = bytes(script)
+        request = (script, encoding, kwargs)
+        results = RuleResults()
+        skip = set(self.get_quarantined()) | set(skip)
+
+        while True:
+            evaluator = self.get_evaluator()
+            try:
+                stopped = self.evaluate(evaluator, request, results, skip)
+            finally:
+                self._idle.put(evaluator)
+            if stopped is None or stopped in results.timed_out:
+                break
+            results.timed_out.append(stopped)
+            self.add_offense(stopped)
+            skip.add(stopped)
+        return results
+
+
+    def close(self):
+        """Stops the evaluator processes."""
+        with self._lock:
+            evaluators, self._evaluators = self._evaluators, []
+        for evaluator in evaluators:
+            evaluator.stop()
+
+
+def set_cpu_limit(cpu_limit):
+    """Lets the evaluator use `cpu_limit` more CPU seconds, after which the
+    kernel kills it with SIGXCPU.
+
+    Arguments:
+        cpu_limit (int): CPU seconds, 0 for no limit
+    """
+    import resource
+
+    if not cpu_limit:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used = int(usage.ru_utime + usage.ru_stime) + 1
+    hard = resource.getrlimit(resource.RLIMIT_CPU)[1]
+    soft = used + cpu_limit
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def evaluator_main(fd, options):
+    """Entry point of an evaluator process.
+
+    Arguments:
+        fd (int): File descriptor of the connection to the sandbox
+        options (dict): Rule directory, package and limits
+    """
+    import resource
+    from backends.plugin_backend import PluginManager
+
+    # The worker decides when evaluators stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    conn = Connection(fd)
+    memory_limit = options.get('memory_limit')
+
+    if memory_limit:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    manager = PluginManager(package=options['package'],
+                            plugin_dir=options['plugin_dir'],
+                            reload_interval=options['reload_interval'],
+                            rule_started=lambda name: conn.send(('start',
+                                                                 name)))
+
+    def record_rule(rule_name, wall, cpu, fired=None, error=False):
+        conn.send(('rule', rule_name, wall, cpu, fired, error))
+
+    manager.record_rule = record_rule
+    while True:
+        try:
+            skip, script, encoding, kwargs = conn.recv()
+        except EOFError:
+            return
+        set_cpu_limit(options.get('cpu_limit'))
+        manager.run_rules(script=script, encoding=encoding, skip=skip,
+                          **kwargs)
+        conn.send(('done',))
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.WARNING)
+    evaluator_main(int(sys.argv[1]), json.loads(sys.argv[2]))
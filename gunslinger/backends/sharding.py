@@ -0,0 +1,121 @@
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def get_cost(result):
+    """Estimates the work a search result takes from the number of requests
+    the scanned page made.
+
+    Arguments:
+        result (dict): URLScan search result
+
+    Returns:
+        int: Estimated cost of the result
+    """
+    stats = result.get('stats') or {}
+    try:
+        return 1 + int(stats.get('requests', 0) or 0)
+    except (TypeError, ValueError):
+        return 1
+
+
+class CostSharder():
+    """Splits search results into jobs of roughly equal estimated cost.
+
+    Jobs are sized so a worker finishes one in about `target_seconds`, based
+    on the throughput (cost per second) workers report back after each job.
+    Heavy results are packed first, so they are picked up early instead of
+    ending up in the last job of a cycle. Idle workers simply take the next
+    job from the queue.
+
+    Arguments:
+        target_seconds (float, optional): Time a worker should spend on a job
+        initial_rate (float, optional): Cost per second assumed until workers
+            report their throughput
+        min_cost (int, optional): Smallest job budget
+        max_cost (int, optional): Largest job budget
+        max_results (int, optional): Most results in a single job
+        smoothing (float, optional): Weight of a new throughput report
+    """
+
+    def __init__(self, **kwargs):
+        self.target_seconds = kwargs.get('target_seconds', 30)
+        self.rate = float(kwargs.get('initial_rate', 20))
+        self.min_cost = kwargs.get('min_cost', 20)
+        self.max_cost = kwargs.get('max_cost', 20000)
+        self.max_results = kwargs.get('max_results', 100)
+        self.smoothing = kwargs.get('smoothing', 0.2)
+
+
+    @property
+    def budget(self):
+        """int: Estimated cost a worker gets through in `target_seconds`."""
+        budget = int(self.rate * self.target_seconds)
+        return max(self.min_cost, min(self.max_cost, budget))
+
+
+    def update(self, cost, seconds):
+        """Adjusts the throughput estimate with a finished job.
+
+        Arguments:
+            cost (int): Estimated cost of the job
+            seconds (float): Seconds the worker spent on it
+        """
+        if cost <= 0 or seconds <= 0:
+            return
+        rate = cost / seconds
+        self.rate += self.smoothing * (rate - self.rate)
+
+
+    def read_feedback(self, feedback_queue, limit=1000):
+        """Reads the throughput reports workers posted since the last call.
+
+        Arguments:
+            feedback_queue (object): Message queue the reports are posted to
+            limit (int, optional): Most reports read per call
+        """
+        for _ in range(limit):
+            data, _ = feedback_queue.get_next_message()
+
+            if not data:
+                break
+            try:
+                report = json.loads(data)
+                self.update(report.get('cost', 0), report.get('seconds', 0))
+            except Exception as e:
+                logger.error(e)
+            feedback_queue.ack_message()
+        logger.info(f'Worker throughput {self.rate:.1f}/s, job budget '
+                    f'{self.budget}')
+
+
+    def shard(self, results):
+        """Packs results into jobs.
+
+        Arguments:
+            results (list): URLScan search results
+
+        Returns:
+            list: (result URLs, estimated cost) tuples, one per job
+        """
+        budget = self.budget
+        costed = sorted(((get_cost(result), result.get('result'))
+                         for result in results if result.get('result')),
+                        key=lambda item: item[0], reverse=True)
+        jobs = []
+        urls = []
+        total = 0
+
+        for cost, url in costed:
+            if urls and (total + cost > budget or
+                         len(urls) >= self.max_results):
+                jobs.append((urls, total))
+                urls = []
+                total = 0
+            urls.append(url)
+            total += cost
+        if urls:
+            jobs.append((urls, total))
+        return jobs
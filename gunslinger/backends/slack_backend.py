@@ -1,33 +1,120 @@
+import os
+import json
 import time
 import slack
 import logging
+from collections import deque
+from backends.slack_channels import call_slack, resolve_channel
 
 class Slack_MQ():
+    """Message queue backed by a Slack channel.
+
+    Jobs are JSON messages in the channel and are claimed by adding a `+1`
+    reaction. The consumer keeps a read cursor (the timestamp up to which
+    every job is known to be claimed) in `cursor_file`, so each poll only
+    reads the history after it, oldest first. Slack returns history newest
+    first, so when more than `max_pages` pages follow the cursor, each poll
+    reads the window below the oldest message seen so far until it reaches
+    the cursor. Up to `batch_size` jobs are claimed per history read and
+    buffered locally. A claim that Slack
+    rejects with `already_reacted` was taken by another consumer sharing the
+    token and is skipped. Rate limited calls wait for the `Retry-After` the
+    API returns.
+
+    Arguments:
+        slack_token (str): Slack token
+        channel (str): Channel name or ID of the queue
+        channel_id (str, optional): Channel ID, skips the name lookup
+        channel_cache (dict, optional): Settings of the channel name cache
+        batch_size (int, optional): Jobs claimed per history read
+        page_size (int, optional): Messages per history page
+        max_pages (int, optional): History pages read per poll
+        poll_interval (float, optional): Minimum seconds between history reads
+        lookback (int, optional): Seconds of history read on the first start
+        cursor_file (str, optional): File the read cursor is kept in
+    """
 
     def __init__(self, **kwargs):
         logging.getLogger(__name__)
         queue_channel = kwargs.get('channel', 'mq')
         slack_token = kwargs.get('slack_token', '')
         self.client = slack.WebClient(token=slack_token)
+        self._token = slack_token
+        # Channel lookups are cached on disk, `channel_cache` configures it
+        self._channel_cache = kwargs.get('channel_cache')
         logging.info(f'Channel is {queue_channel}')
-        self.channel = self.get_channel(queue_channel)
+        self.channel = self.get_channel(kwargs.get('channel_id') or
+                                        queue_channel)
+        self.batch_size = kwargs.get('batch_size', 10)
+        self.page_size = kwargs.get('page_size', 200)
+        self.max_pages = kwargs.get('max_pages', 10)
+        self.poll_interval = kwargs.get('poll_interval', 1.5)
+        self.cursor_file = kwargs.get('cursor_file',
+                                      f'state/slack_mq_{self.channel}.json')
+        self.oldest = self.read_cursor(kwargs.get('lookback', 24 * 3600))
+        self.last_receipt = None
+        self._buffer = deque()
+        self._last_poll = 0
+        # Upper ends of the history windows still to read, the last one is
+        # the window right after the cursor
+        self._windows = []
 
 
     def get_channel(self, channel):
         """Gets ID of Slack channel.
 
         Arguments:
-            channel (str): channel to get ID of
+            channel (str): channel name or ID
 
         Returns:
             str: Channel ID
         """
         logging.info(f'Getting channel {channel}')
-        channels = self.client.conversations_list()
-        for slack_channel in channels['channels']:
-            if slack_channel['name'] == channel:
-                return slack_channel['id']
-        raise Exception('Channel does not exist')
+        return resolve_channel(self.client, self._token, channel,
+                               self._channel_cache)
+
+
+    def read_cursor(self, lookback):
+        """Reads the persisted read cursor.
+
+        Arguments:
+            lookback (int): Seconds of history to read without a cursor
+
+        Returns:
+            str: Timestamp every older job is claimed up to
+        """
+        try:
+            with open(self.cursor_file) as f:
+                return json.load(f)['oldest']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.error(f'Cannot read cursor {self.cursor_file}: {e}')
+        return f'{time.time() - lookback:.6f}'
+
+
+    def save_cursor(self):
+        directory = os.path.dirname(self.cursor_file)
+        try:
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory, exist_ok=True)
+            with open(self.cursor_file + '.tmp', 'w') as f:
+                json.dump({'oldest': self.oldest}, f)
+            os.replace(self.cursor_file + '.tmp', self.cursor_file)
+        except Exception as e:
+            logging.error(f'Cannot save cursor {self.cursor_file}: {e}')
+
+
+    def call(self, method, **kwargs):
+        """Calls the Slack API, waiting out rate limits.
+
+        Arguments:
+            method (str): Name of the WebClient method
+
+        Returns:
+            SlackResponse: Response of the call
+        """
+        return call_slack(self.client, method, **kwargs)
 
 
     def post_message(self, text, **kwargs):
@@ -43,8 +130,8 @@ class Slack_MQ():
         """
         channel = kwargs.get('channel', self.channel)
         reaction = kwargs.get('reaction', '')
-        message_response = self.client.chat_postMessage(channel=channel,
-                                                        text=text)
+        message_response = self.call('chat_postMessage', channel=channel,
+                                     text=text)
         if reaction:
             self.react_message(message_response['ts'],
                                reaction,
@@ -52,6 +139,18 @@ class Slack_MQ():
         return message_response
 
 
+    def post_messages(self, texts, **kwargs):
+        """Posts several messages to Slack, one after another.
+
+        Arguments:
+            texts (list): messages to send
+
+        Returns:
+            (list): Message response objects from Slack API
+        """
+        return [self.post_message(text, **kwargs) for text in texts]
+
+
     def react_message(self, ts, reaction, channel=''):
         """Reacts to a Slack message
 
@@ -65,75 +164,152 @@ class Slack_MQ():
         """
         if channel == '':
             channel = self.channel
-        reaction_response = self.client.reactions_add(channel=channel,
-                                                      name=reaction,
-                                                      timestamp=ts)
+        reaction_response = self.call('reactions_add', channel=channel,
+                                      name=reaction, timestamp=ts)
         return reaction_response
 
 
-    def get_next_message(self, **kwargs):
-        """Gets next message in queue and reacts to it to mark it as taken
+    def read_history(self, latest=None):
+        """Reads the channel history after the cursor.
+
+        Arguments:
+            latest (str, optional): Only read messages before this timestamp
+
+        Returns:
+            list: Messages sorted oldest first
+            bool: True if there was more history than `max_pages`
+        """
+        messages = []
+        cursor = None
+        kwargs = {}
+
+        if latest is not None:
+            kwargs['latest'] = latest
+        for _ in range(self.max_pages):
+            r = self.call('conversations_history', channel=self.channel,
+                          limit=self.page_size, oldest=self.oldest,
+                          inclusive=0, cursor=cursor, **kwargs)
+            messages += r.data.get('messages', [])
+            cursor = r.data.get('response_metadata', {}).get('next_cursor')
+            if not cursor:
+                break
+        return sorted(messages, key=lambda m: float(m['ts'])), bool(cursor)
+
+
+    def claim(self, message):
+        """Claims a job by reacting to it.
 
         Arguments:
-            oldest (str, optional): timestamp of oldest message to check
-            latest (str, optional): timestamp of latest message to check
-            cursor (str, optional): cursor code used for pagination
+            message (dict): Slack message of the job
+
+        Returns:
+            bool: True if this consumer got the job
+        """
+        try:
+            self.call('reactions_add', channel=self.channel, name='+1',
+                      timestamp=message['ts'])
+            return True
+        except Exception as e:
+            response = getattr(e, 'response', None)
+            if response is not None and \
+               response.get('error') == 'already_reacted':
+                logging.info(f'Job {message["ts"]} was claimed by another '
+                             'consumer')
+                return False
+            raise
+
+
+    def claim_messages(self):
+        """Claims the next batch of jobs after the cursor and moves the
+        cursor past every job that is claimed."""
+        wait = self._last_poll + self.poll_interval - time.monotonic()
+
+        if wait > 0:
+            time.sleep(wait)
+        self._last_poll = time.monotonic()
+
+        while True:
+            latest = self._windows[-1] if self._windows else None
+            messages, truncated = self.read_history(latest)
+            if not truncated:
+                break
+            # History is returned newest first, so when it was cut off the
+            # jobs right after the cursor are below the oldest message read
+            self._windows.append(messages[0]['ts'])
+        oldest = self.oldest
+        finished = True
+
+        for message in messages:
+            text = message.get('text', '')
+            is_job = text.startswith('{')
+            claimed = any(reaction.get('name') == '+1'
+                          for reaction in message.get('reactions', []))
+
+            if is_job and not claimed:
+                if len(self._buffer) >= self.batch_size:
+                    finished = False
+                    break
+                if self.claim(message):
+                    self._buffer.append((message['ts'], text.strip()))
+            oldest = message['ts']
+        if finished and self._windows:
+            # The window is read up to its end, the next poll reads the one
+            # above it
+            self._windows.pop()
+        if oldest != self.oldest:
+            self.oldest = oldest
+            self.save_cursor()
+
+
+    def get_next_message(self, **kwargs):
+        """Gets the next claimed job, claiming a batch when none are left.
 
         Returns:
-            (str, str): message text and timestamp of message
+            str: text of the message
+            int: numeric 0 to comply with Gunslinger logic
         """
-        oldest = kwargs.get('oldest', 0)
-        latest = kwargs.get('latest', '')
-        cursor = kwargs.get('cursor', '')
         try:
-            r = self.client.conversations_history(channel=self.channel,
-                                                  limit=999,
-                                                  oldest=str(oldest),
-                                                  latest=str(latest),
-                                                  inclusive=1,
-                                                  cursor=cursor)
-            data = r.data
-            messages = data['messages']
-            i = 0
-            for i in range(len(messages)-1):
-                m = messages[i]
-                if 'reactions' in messages[i+1] and m['text'][0] == '{' \
-                   and not 'reactions' in m.keys():
-                    ts = m['ts']
-                    self.client.reactions_add(channel=self.channel,
-                                              name='+1',
-                                              timestamp=ts)
-                    oldest = ts
-                    dat = m['text'].strip()
-                    return dat, oldest
-                if 'reactions' in m.keys():
-                    return [], 0
-            if 'reactions' in messages[i] and \
-               messages[i]['text'][0] == '{':
-                ts = messages[i]['ts']
-                self.client.reactions_add(channel=self.channel,
-                                          name='+1',
-                                          timestamp=ts)
-                oldest = ts
-                dat = m['text'].strip()
-                return dat, oldest
-            if 'response_metadata' in data.keys() and \
-               'next_cursor' in data['response_metadata'].keys():
-                logging.info('Getting next cursor')
-                cursor = data['response_metadata']['next_cursor']
-                return self.get_next_message(oldest=oldest,
-                                             latest=latest,
-                                             cursor=cursor)
-            return [], latest
+            if not self._buffer:
+                self.claim_messages()
         except Exception as e:
             logging.error(e)
-            if 'response' in dir(e):
-                r = e.response
-                logging.error(r)
-                time.sleep(60)
-                if r['error'] == 'ratelimited':
-                    return self.get_next_message(oldest=oldest,
-                                                 latest=latest,
-                                                 cursor=cursor)
-                return [], 0
-            return [], oldest
+        if not self._buffer:
+            return [], 0
+        ts, text = self._buffer.popleft()
+        self.last_receipt = ts
+        return text, 0
+
+
+    def ack_message(self, receipt=None):
+        """Messages are claimed with a reaction when they are read, so there
+        is nothing left to do once they are processed."""
+
+
+    def release_message(self, receipt=None):
+        """Hands a claimed job back by removing the claim reaction and
+        moving the cursor back before it.
+
+        Arguments:
+            receipt (str, optional): Timestamp of the message, defaults to
+                the last message returned by `get_next_message`
+        """
+        receipt = receipt or self.last_receipt
+
+        if not receipt:
+            return
+        try:
+            self.call('reactions_remove', channel=self.channel, name='+1',
+                      timestamp=receipt)
+        except Exception as e:
+            logging.error(f'Cannot release job {receipt}: {e}')
+            return
+        if float(receipt) <= float(self.oldest):
+            self.oldest = f'{float(receipt) - 0.000001:.6f}'
+            self.save_cursor()
+
+
+    def close(self):
+        """Releases jobs that were claimed but not handed out yet."""
+        while self._buffer:
+            ts, _ = self._buffer.popleft()
+            self.release_message(ts)
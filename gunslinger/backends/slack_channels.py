@@ -0,0 +1,183 @@
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_ID = re.compile(r'^[CGD][A-Z0-9]{8,}$')
+
+
+def call_slack(client, method, **kwargs):
+    """Calls the Slack API, waiting out rate limits for the `Retry-After`
+    the API returns.
+
+    Arguments:
+        client (slack.WebClient): Client of the workspace
+        method (str): Name of the WebClient method
+        **kwargs: Arguments of the method
+
+    Returns:
+        SlackResponse: Response of the call
+    """
+    while True:
+        try:
+            return getattr(client, method)(**kwargs)
+        except Exception as e:
+            response = getattr(e, 'response', None)
+            if response is None or response.get('error') != 'ratelimited':
+                raise
+            delay = int(response.headers.get('Retry-After', 30))
+            logger.info(f'Rate limited on {method}, waiting {delay}s')
+            time.sleep(delay)
+
+
+def is_channel_id(channel):
+    """Checks whether a channel is given by ID (e.g. C0123456789) rather
+    than by name.
+
+    Arguments:
+        channel (str): Channel name or ID
+
+    Returns:
+        bool: True if it is an ID
+    """
+    return bool(CHANNEL_ID.match(channel))
+
+
+class ChannelResolver():
+    """Resolves Slack channel names to IDs.
+
+    Channel IDs are returned as they are. Names are looked up in a JSON
+    cache on disk first, entries expire after `ttl` seconds. On a miss the
+    workspace is listed page by page with `conversations_list`, every channel
+    seen is cached, and listing stops as soon as the channel is found. The
+    cache is kept per workspace token, so several tokens can share one file.
+
+    Arguments:
+        client (slack.WebClient): Client of the workspace
+        token (str): Slack token the client uses, only its hash is stored
+        path (str, optional): Path of the JSON cache
+        ttl (int, optional): Seconds a cached ID stays valid
+        page_size (int, optional): Channels requested per page
+    """
+
+    def __init__(self, client, token, **kwargs):
+        self.client = client
+        self.workspace = hashlib.sha256(token.encode()).hexdigest()[:16]
+        self.path = kwargs.get('path', 'cache/slack_channels.json')
+        self.ttl = kwargs.get('ttl', 24 * 3600)
+        self.page_size = kwargs.get('page_size', 1000)
+
+
+    def read_cache(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f'Cannot read channel cache {self.path}: {e}')
+            return {}
+
+
+    def write_cache(self, channels):
+        """Adds channels to the cache, keeping entries other processes wrote
+        in the meantime.
+
+        Arguments:
+            channels (dict): Channel names mapped to IDs
+        """
+        now = time.time()
+        cache = self.read_cache()
+        workspace = cache.setdefault(self.workspace, {})
+
+        for name, channel_id in channels.items():
+            workspace[name] = [channel_id, now]
+        directory = os.path.dirname(self.path)
+        try:
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f'{self.path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f'Cannot write channel cache {self.path}: {e}')
+
+
+    def resolve(self, channel):
+        """Gets the ID of a channel.
+
+        Arguments:
+            channel (str): Channel name (with or without #) or ID
+
+        Returns:
+            str: Channel ID
+        """
+        channel = channel.lstrip('#')
+
+        if is_channel_id(channel):
+            return channel
+        entry = self.read_cache().get(self.workspace, {}).get(channel)
+
+        if entry and time.time() - entry[1] < self.ttl:
+            return entry[0]
+        logger.info(f'Looking up channel {channel}')
+        channel_id = self.list_channels(channel)
+
+        if channel_id is None:
+            raise Exception('Channel does not exist')
+        return channel_id
+
+
+    def list_channels(self, wanted):
+        """Lists the channels of the workspace until one is found.
+
+        Arguments:
+            wanted (str): Name of the channel to find
+
+        Returns:
+            str: ID of the channel, None if it does not exist
+        """
+        cursor = None
+        found = {}
+        channel_id = None
+
+        while True:
+            response = self.request_page(cursor)
+            for slack_channel in response['channels']:
+                found[slack_channel['name']] = slack_channel['id']
+            if wanted in found:
+                channel_id = found[wanted]
+                break
+            cursor = response.get('response_metadata',
+                                  {}).get('next_cursor')
+            if not cursor:
+                break
+        self.write_cache(found)
+        return channel_id
+
+
+    def request_page(self, cursor):
+        return call_slack(self.client, 'conversations_list', cursor=cursor,
+                          limit=self.page_size, exclude_archived=True,
+                          types='public_channel,private_channel')
+
+
+def resolve_channel(client, token, channel, cache_config=None):
+    """Gets the ID of a channel through the shared channel cache.
+
+    Arguments:
+        client (slack.WebClient): Client of the workspace
+        token (str): Slack token the client uses
+        channel (str): Channel name or ID
+        cache_config (dict, optional): Arguments of the ChannelResolver
+
+    Returns:
+        str: Channel ID
+    """
+    resolver = ChannelResolver(client, token, **(cache_config or {}))
+    return resolver.resolve(channel)
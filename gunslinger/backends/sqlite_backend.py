@@ -0,0 +1,264 @@
+import os
+import time
+import uuid
+import sqlite3
+import logging
+import threading
+from collections import deque
+
+class SQLite_MQ():
+    """Message queue backed by a local SQLite database in WAL mode.
+
+    Every process on the machine can share the queue by pointing at the same
+    database file, no network access is needed. Messages are claimed
+    atomically and stay hidden from other consumers for `visibility_timeout`
+    seconds; a message that is not acknowledged in time becomes visible
+    again, and after `max_attempts` claims it is moved to the dead letter
+    state instead. The claims of messages handed out by `get_next_message`
+    are extended in the background until they are acknowledged or released,
+    so long jobs are not handed to another consumer.
+
+    Arguments:
+        path (str, optional): Path of the SQLite database
+        batch_size (int, optional): Messages claimed per dequeue
+        visibility_timeout (int, optional): Seconds a claimed message stays
+            hidden from other consumers
+        max_attempts (int, optional): Claims before a message is dead lettered
+        poll_interval (float, optional): Seconds to wait between polls of an
+            empty queue
+        wait_time (float, optional): Seconds get_next_message waits for a
+            message before returning empty
+        heartbeat_interval (float, optional): Seconds between claim
+            extensions
+    """
+
+    def __init__(self, **kwargs):
+        logging.getLogger(__name__)
+        path = kwargs.get('path', 'queue/gunslinger.db')
+        self.batch_size = kwargs.get('batch_size', 10)
+        self.visibility_timeout = kwargs.get('visibility_timeout', 300)
+        self.max_attempts = kwargs.get('max_attempts', 5)
+        self.poll_interval = kwargs.get('poll_interval', 0.5)
+        self.wait_time = kwargs.get('wait_time', 20)
+        self.heartbeat_interval = kwargs.get('heartbeat_interval',
+                                             self.visibility_timeout / 2)
+        self.path = path
+        self.consumer_id = f'{os.getpid()}-{uuid.uuid4().hex[:8]}'
+        self.last_receipt = None
+        self._buffer = deque()
+        self._in_flight = set()
+        self._lock = threading.Lock()
+        self._heartbeat = None
+        self._stop = threading.Event()
+        directory = os.path.dirname(path)
+
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        # The async pipeline uses the queue from one thread of its own
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS messages ('
+                          'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                          'body TEXT NOT NULL, '
+                          "state TEXT NOT NULL DEFAULT 'ready', "
+                          'visible_at REAL NOT NULL, '
+                          'attempts INTEGER NOT NULL DEFAULT 0, '
+                          'receipt TEXT, '
+                          'created REAL NOT NULL)')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS messages_ready ON '
+                          'messages (state, visible_at, id)')
+
+
+    def post_message(self, text, **kwargs):
+        """Posts message to the queue.
+
+        Arguments:
+            text (str): Text of the message
+
+        Returns:
+            int: ID of the message
+        """
+        return self.post_messages([text])[0]
+
+
+    def post_messages(self, texts, **kwargs):
+        """Posts several messages to the queue in one transaction.
+
+        Arguments:
+            texts (list): Texts of the messages
+
+        Returns:
+            list: IDs of the messages
+        """
+        now = time.time()
+        ids = []
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            for text in texts:
+                cursor = self.conn.execute('INSERT INTO messages (body, '
+                                           'visible_at, created) VALUES '
+                                           '(?, ?, ?)', (text, now, now))
+                ids.append(cursor.lastrowid)
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        return ids
+
+
+    def get_messages(self, count=None):
+        """Atomically claims a batch of messages.
+
+        Arguments:
+            count (int, optional): Maximum number of messages to claim
+
+        Returns:
+            list: (receipt, text, claim expiry) tuples of the claimed
+                messages
+        """
+        count = count or self.batch_size
+        now = time.time()
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            # Claims that ran out of attempts are not handed out again
+            self.conn.execute("UPDATE messages SET state='dead' WHERE "
+                              "state IN ('ready', 'claimed') AND "
+                              'visible_at <= ? AND attempts >= ?',
+                              (now, self.max_attempts))
+            rows = self.conn.execute("SELECT id, body FROM messages WHERE "
+                                     "state IN ('ready', 'claimed') AND "
+                                     'visible_at <= ? ORDER BY id LIMIT ?',
+                                     (now, count)).fetchall()
+            claimed = []
+            for message_id, body in rows:
+                receipt = f'{message_id}:{self.consumer_id}:{uuid.uuid4().hex}'
+                self.conn.execute("UPDATE messages SET state='claimed', "
+                                  'visible_at=?, attempts=attempts+1, '
+                                  'receipt=? WHERE id=?',
+                                  (now + self.visibility_timeout, receipt,
+                                   message_id))
+                claimed.append((receipt, body,
+                                now + self.visibility_timeout))
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        return claimed
+
+
+    def get_next_message(self, **kwargs):
+        """Gets next message in the queue, claiming a batch when the local
+        buffer is empty. Waits up to `wait_time` seconds for a message.
+
+        Returns:
+            str: text of the message
+            int: numeric 0 to comply with Gunslinger logic
+        """
+        deadline = time.monotonic() + self.wait_time
+
+        # Buffered claims that expired may already belong to someone else
+        while self._buffer and self._buffer[0][2] <= time.time():
+            self._buffer.popleft()
+        while not self._buffer:
+            self._buffer.extend(self.get_messages())
+            if self._buffer or time.monotonic() >= deadline:
+                break
+            time.sleep(self.poll_interval)
+        if not self._buffer:
+            return [], 0
+        receipt, body, _ = self._buffer.popleft()
+        self.last_receipt = receipt
+        if 'gunslinger' in body and not body.startswith('{'):
+            self.ack_message(receipt)
+            return [], 0
+        with self._lock:
+            self._in_flight.add(receipt)
+        self.start_heartbeat()
+        return body.strip(), 0
+
+
+    def ack_message(self, receipt=None):
+        """Deletes a processed message. Receipts from an expired claim that
+        was taken over by another consumer are ignored.
+
+        Arguments:
+            receipt (str, optional): Receipt of the message, defaults to the
+                last message returned by `get_next_message`
+        """
+        receipt = receipt or self.last_receipt
+        with self._lock:
+            self._in_flight.discard(receipt)
+        self.conn.execute('DELETE FROM messages WHERE receipt=?', (receipt,))
+
+
+    def release_message(self, receipt=None):
+        """Makes a claimed message visible again right away.
+
+        Arguments:
+            receipt (str, optional): Receipt of the message, defaults to the
+                last message returned by `get_next_message`
+        """
+        receipt = receipt or self.last_receipt
+        with self._lock:
+            self._in_flight.discard(receipt)
+        self.conn.execute("UPDATE messages SET visible_at=? WHERE receipt=? "
+                          "AND state='claimed'", (time.time(), receipt))
+
+
+    def extend_message(self, receipt=None, timeout=None):
+        """Extends the visibility timeout of a claimed message.
+
+        Arguments:
+            receipt (str, optional): Receipt of the message, defaults to the
+                last message returned by `get_next_message`
+            timeout (int, optional): New timeout in seconds from now
+        """
+        receipt = receipt or self.last_receipt
+        timeout = timeout or self.visibility_timeout
+        self.conn.execute("UPDATE messages SET visible_at=? WHERE receipt=? "
+                          "AND state='claimed'", (time.time() + timeout,
+                                                  receipt))
+
+
+    def start_heartbeat(self):
+        if self._heartbeat is not None and self._heartbeat.is_alive():
+            return
+        self._heartbeat = threading.Thread(target=self.extend_claims,
+                                           daemon=True)
+        self._heartbeat.start()
+
+
+    def extend_claims(self):
+        """Keeps extending the claims of every message that was handed out
+        but not acknowledged or released yet."""
+        # A connection of its own keeps the updates out of the transactions
+        # of the consumer
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+        try:
+            while not self._stop.wait(self.heartbeat_interval):
+                with self._lock:
+                    receipts = list(self._in_flight)
+                visible_at = time.time() + self.visibility_timeout
+                try:
+                    conn.executemany("UPDATE messages SET visible_at=? WHERE "
+                                     "receipt=? AND state='claimed'",
+                                     [(visible_at, receipt)
+                                      for receipt in receipts])
+                except Exception as e:
+                    logging.error(f'Cannot extend claims: {e}')
+        finally:
+            conn.close()
+
+
+    def close(self):
+        """Hands buffered messages back to the queue and closes the database."""
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+        while self._buffer:
+            receipt, _, _ = self._buffer.popleft()
+            self.release_message(receipt)
+        self.conn.close()
@@ -1,12 +1,58 @@
 import boto3
+import hashlib
 import logging
+import threading
+from collections import deque
+
+
+def get_group_id(text):
+    """Gets the FIFO message group of a message. Every job is a group of
+    its own, since SQS hands out nothing from a group while one of its
+    messages is in flight.
+
+    Arguments:
+        text (str): Text of the message
+
+    Returns:
+        str: sha256 hash of the text
+    """
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
 
 class AWS_SQS():
+    """Message queue backed by AWS SQS.
+
+    Messages are received in batches with long polling and buffered locally.
+    A message is only deleted once it has been acknowledged after processing,
+    and the visibility timeout of messages still being worked on is extended
+    in the background so long jobs are not handed to another worker.
+
+    Arguments:
+        url (str): URL of the SQS queue
+        batch_size (int, optional): Messages received per call (max 10)
+        wait_time (int, optional): Long polling wait in seconds (max 20)
+        visibility_timeout (int, optional): Seconds a received message stays
+            hidden from other workers
+        heartbeat_interval (int, optional): Seconds between visibility
+            timeout extensions
+    """
 
     def __init__(self, **kwargs):
         logging.getLogger(__name__)
         self.sqs = boto3.client('sqs')
         self.url = kwargs.get('url', '')
+        self.batch_size = min(kwargs.get('batch_size', 10), 10)
+        self.wait_time = min(kwargs.get('wait_time', 20), 20)
+        self.visibility_timeout = kwargs.get('visibility_timeout', 300)
+        self.heartbeat_interval = kwargs.get('heartbeat_interval',
+                                             self.visibility_timeout / 2)
+        self.last_receipt = None
+        self._buffer = deque()
+        self._in_flight = set()
+        self._pending_deletes = []
+        self._lock = threading.Lock()
+        self._heartbeat = None
+        self._stop = threading.Event()
 
 
     def post_message(self, text, **kwargs):
@@ -20,9 +66,9 @@ class AWS_SQS():
         """
         while True:
             try:
-                response = self.sqs.send_message(QueueUrl=self.url,
-                                                 MessageBody=text,
-                                                 MessageGroupId='gunslinger_group')
+                response = self.sqs.send_message(
+                    QueueUrl=self.url, MessageBody=text,
+                    MessageGroupId=get_group_id(text))
                 break
             except Exception as e:
                 logging.error(e)
@@ -30,30 +76,180 @@ class AWS_SQS():
         return response
 
 
-    def get_next_message(self, **kwargs):
-        """Gets next message from the queue and deletes it.
+    def post_messages(self, texts, **kwargs):
+        """Posts messages to SQS in batches of 10.
+
+        Arguments:
+            texts (list): Texts to send to SQS
 
         Returns:
-            list: list of results from SQS
-            int: numeric 0 to comply with Gunslinger logic
+            list: Response objects from SQS
         """
+        responses = []
+
+        for i in range(0, len(texts), 10):
+            entries = [{'Id': str(j),
+                        'MessageBody': text,
+                        'MessageGroupId': get_group_id(text)}
+                       for j, text in enumerate(texts[i:i+10])]
+            while entries:
+                try:
+                    response = self.sqs.send_message_batch(QueueUrl=self.url,
+                                                           Entries=entries)
+                except Exception as e:
+                    logging.error(e)
+                    continue
+                responses.append(response)
+                failed = {f['Id'] for f in response.get('Failed', [])}
+                if failed:
+                    logging.error(f'Failed to send {len(failed)} message(s),'
+                                  ' retrying')
+                entries = [e for e in entries if e['Id'] in failed]
+        return responses
+
+
+    def receive_messages(self):
+        """Receives the next batch of messages into the local buffer."""
         while True:
             try:
-                response = self.sqs.receive_message(QueueUrl=self.url,
-                                                    MaxNumberOfMessages=1)
+                response = self.sqs.receive_message(
+                    QueueUrl=self.url,
+                    MaxNumberOfMessages=self.batch_size,
+                    WaitTimeSeconds=self.wait_time,
+                    VisibilityTimeout=self.visibility_timeout)
                 break
             except Exception as e:
                 logging.error(e)
                 continue
 
         messages = response.get('Messages', [])
-        if len(messages) == 0:
+        with self._lock:
+            for message in messages:
+                self._buffer.append(message)
+                self._in_flight.add(message['ReceiptHandle'])
+        self.start_heartbeat()
+
+
+    def get_next_message(self, **kwargs):
+        """Gets next message from the queue. The message stays hidden from
+        other workers until it is acknowledged with `ack_message`.
+
+        Returns:
+            str: text of the message
+            int: numeric 0 to comply with Gunslinger logic
+        """
+        if not self._buffer:
+            self.flush_deletes()
+            self.receive_messages()
+        if not self._buffer:
             return [], 0
-        message = messages[0]
-        self.sqs.delete_message(QueueUrl=self.url,
-                                ReceiptHandle=message['ReceiptHandle'])
+        message = self._buffer.popleft()
+        self.last_receipt = message['ReceiptHandle']
         message_body = message['Body']
         if 'gunslinger' in message_body:
+            self.ack_message(message['ReceiptHandle'])
             return [], 0
-        dat = message_body.strip().split('\n')[1:]
-        return dat, 0
+        return message_body.strip(), 0
+
+
+    def ack_message(self, receipt=None):
+        """Marks a message as processed so it gets deleted from the queue.
+        Deletes are sent in batches, at the latest by the next heartbeat, and
+        the message is kept hidden until its delete went through.
+
+        Arguments:
+            receipt (str, optional): Receipt handle of the message, defaults
+                to the last message returned by `get_next_message`
+        """
+        receipt = receipt or self.last_receipt
+
+        with self._lock:
+            self._pending_deletes.append(receipt)
+            flush = len(self._pending_deletes) >= 10 or not self._buffer
+        if flush:
+            self.flush_deletes()
+
+
+    def release_message(self, receipt=None):
+        """Makes a message that failed visible again right away, so SQS
+        hands it out again instead of after the visibility timeout.
+
+        Arguments:
+            receipt (str, optional): Receipt handle of the message, defaults
+                to the last message returned by `get_next_message`
+        """
+        receipt = receipt or self.last_receipt
+
+        with self._lock:
+            self._in_flight.discard(receipt)
+        try:
+            self.sqs.change_message_visibility(QueueUrl=self.url,
+                                               ReceiptHandle=receipt,
+                                               VisibilityTimeout=0)
+        except Exception as e:
+            logging.error(f'Cannot release message: {e}')
+
+
+    def flush_deletes(self):
+        """Deletes all acknowledged messages with `delete_message_batch`.
+        Messages whose delete failed are kept hidden and deleted on the next
+        flush."""
+        with self._lock:
+            receipts = self._pending_deletes
+            self._pending_deletes = []
+
+        for i in range(0, len(receipts), 10):
+            batch = receipts[i:i+10]
+            entries = [{'Id': str(j), 'ReceiptHandle': receipt}
+                       for j, receipt in enumerate(batch)]
+            try:
+                response = self.sqs.delete_message_batch(QueueUrl=self.url,
+                                                         Entries=entries)
+                failed = set()
+                for failure in response.get('Failed', []):
+                    logging.error('Failed to delete message: '
+                                  f'{failure.get("Message")}')
+                    failed.add(batch[int(failure['Id'])])
+            except Exception as e:
+                logging.error(e)
+                failed = set(batch)
+            with self._lock:
+                for receipt in batch:
+                    if receipt in failed:
+                        self._pending_deletes.append(receipt)
+                    else:
+                        self._in_flight.discard(receipt)
+
+
+    def start_heartbeat(self):
+        if self._heartbeat is not None and self._heartbeat.is_alive():
+            return
+        self._heartbeat = threading.Thread(target=self.extend_visibility,
+                                           daemon=True)
+        self._heartbeat.start()
+
+
+    def extend_visibility(self):
+        """Keeps extending the visibility timeout of every message that has
+        been received but not deleted yet, and sends the deletes still
+        waiting for a full batch."""
+        while not self._stop.wait(self.heartbeat_interval):
+            self.flush_deletes()
+            with self._lock:
+                receipts = list(self._in_flight)
+
+            for i in range(0, len(receipts), 10):
+                entries = [{'Id': str(j), 'ReceiptHandle': receipt,
+                            'VisibilityTimeout': self.visibility_timeout}
+                           for j, receipt in enumerate(receipts[i:i+10])]
+                try:
+                    self.sqs.change_message_visibility_batch(
+                        QueueUrl=self.url, Entries=entries)
+                except Exception as e:
+                    logging.error(e)
+
+
+    def close(self):
+        """Deletes outstanding acknowledged messages and stops the heartbeat."""
+        self._stop.set()
+        self.flush_deletes()
@@ -0,0 +1,61 @@
+import codecs
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def scan_response(response, rule_manager, **kwargs):
+    """Runs the rules on a streamed HTTP response while it downloads.
+
+    The body is read in chunks that are hashed and fed to the rules as they
+    arrive, so the raw body is never held in memory. Reading stops after
+    `max_size` bytes, or, with `stop_early`, as soon as the rest of the body
+    can no longer change the outcome of any rule.
+
+    Arguments:
+        response (requests.Response): Response requested with `stream=True`
+        rule_manager (PluginManager): Manager of the rules to run
+        max_size (int, optional): Maximum number of bytes to read
+        chunk_size (int, optional): Bytes read per chunk
+        stop_early (bool, optional): Stop reading once the rules are decided
+        encoding (str, optional): Encoding used to decode the body
+        rule_kwargs (dict, optional): Extra arguments for the rules
+
+    Returns:
+        list: Rules that fired
+        str: sha256 hash of the bytes read
+        bool: True if the whole body was read
+    """
+    max_size = kwargs.get('max_size', 5 * 1024 * 1024)
+    chunk_size = kwargs.get('chunk_size', 65536)
+    stop_early = kwargs.get('stop_early', False)
+    encoding = kwargs.get('encoding') or 'ISO-8859-1'
+    stream = rule_manager.stream_rules(encoding=encoding,
+                                       **kwargs.get('rule_kwargs', {}))
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    sha256_hash = hashlib.sha256()
+    size = 0
+    complete = True
+
+    try:
+        for chunk in response.iter_content(chunk_size):
+            if size + len(chunk) > max_size:
+                chunk = chunk[:max_size - size]
+                complete = False
+            size += len(chunk)
+            sha256_hash.update(chunk)
+            done = stream.feed(decoder.decode(chunk), chunk)
+
+            if not complete:
+                logger.info(f'Stopped reading {response.url} at {size} bytes')
+                break
+            if done and stop_early:
+                logger.info(f'Rules decided after {size} bytes of '
+                            f'{response.url}')
+                complete = False
+                break
+        stream.feed(decoder.decode(b'', final=True), b'')
+    finally:
+        response.close()
+    return stream.finish(), sha256_hash.hexdigest(), complete
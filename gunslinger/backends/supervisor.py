@@ -0,0 +1,210 @@
+import time
+import queue
+import signal
+import logging
+import multiprocessing
+
+logger = logging.getLogger(__name__)
+
+
+def worker_main(create_worker, jobs, results):
+    """Entry point of a worker process.
+
+    Arguments:
+        create_worker (callable): Creates the object that processes messages
+        jobs (multiprocessing.Queue): Queue of the worker's (job id,
+            message text) tuples, None tells the worker to exit
+        results (multiprocessing.Queue): Queue the job status is reported to
+    """
+    # The supervisor decides when workers stop, a Ctrl-C should not kill
+    # a worker halfway through a job
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    worker = create_worker()
+
+    # Jobs of a worker that crashed are picked up by its replacement
+    if hasattr(worker, 'resume_orphans'):
+        worker.resume_orphans()
+    while True:
+        job = jobs.get()
+
+        if job is None:
+            break
+        job_id, data = job
+        try:
+            worker.process(data)
+            results.put(('done', job_id, True))
+        except Exception as e:
+            logger.error(e)
+            results.put(('done', job_id, False))
+    if hasattr(worker, 'close'):
+        worker.close()
+
+
+class Supervisor():
+    """Runs a pool of worker processes fed from a single queue consumer.
+
+    The consumer reads messages from the message queue and hands each one to
+    the least busy worker, through a job queue of that worker. A message is
+    acknowledged once a worker finished it. Crashed workers are restarted
+    and the messages they had not finished, running or still queued, are
+    released back to the queue. SIGTERM and SIGINT stop the consumer and let
+    the workers finish their current jobs.
+
+    Arguments:
+        consumer (Gunslinger): Gunslinger instance owning the message queue
+        create_worker (callable): Creates a Gunslinger instance in a worker
+        num_workers (int): Number of worker processes
+        prefetch (int, optional): Messages queued per worker
+        shutdown_timeout (int, optional): Seconds to wait for workers to
+            finish when shutting down
+    """
+
+    def __init__(self, consumer, create_worker, num_workers, **kwargs):
+        self.consumer = consumer
+        self.message_queue = consumer.message_queue
+        self.create_worker = create_worker
+        self.num_workers = num_workers
+        self.max_pending = num_workers * (1 + kwargs.get('prefetch', 1))
+        self.shutdown_timeout = kwargs.get('shutdown_timeout', 300)
+        rate_limit = consumer.config_info.get('queue_data', {})
+        self.rate_limit = rate_limit.get('rate_limit', 0)
+        self.results = multiprocessing.Queue()
+        self.workers = [None] * num_workers
+        self.jobs = [None] * num_workers
+        self.pending = {}
+        self.assigned = {}
+        self.restarts = 0
+        self._next_job = 0
+        self._stopping = False
+
+
+    def start_worker(self, i):
+        """Starts worker `i` with a new job queue.
+
+        Arguments:
+            i (int): Index of the worker
+        """
+        # A worker killed while reading its queue can leave the queue's lock
+        # held, so a replacement never shares the queue of a dead worker
+        if self.jobs[i] is not None:
+            self.jobs[i].cancel_join_thread()
+            self.jobs[i].close()
+        self.jobs[i] = multiprocessing.Queue()
+        process = multiprocessing.Process(target=worker_main,
+                                          args=(self.create_worker,
+                                                self.jobs[i],
+                                                self.results),
+                                          daemon=True)
+        process.start()
+        logger.info(f'Started worker {process.pid}')
+        self.workers[i] = process
+
+
+    def stop(self, signum=None, frame=None):
+        logger.info('Shutting down workers')
+        self._stopping = True
+
+
+    def check_workers(self):
+        """Restarts crashed workers and releases the jobs handed to them."""
+        for i, process in enumerate(self.workers):
+            if process.is_alive():
+                continue
+            logger.error(f'Worker {process.pid} exited with code '
+                         f'{process.exitcode}, restarting')
+            # Let the job queue drain statuses the worker sent before dying
+            self.collect_results()
+            for job_id, worker in list(self.assigned.items()):
+                if worker == i:
+                    self.finish_job(job_id, False)
+            self.restarts += 1
+            self.start_worker(i)
+
+
+    def collect_results(self, timeout=0):
+        """Handles the job status messages sent by the workers.
+
+        Arguments:
+            timeout (float, optional): Seconds to wait for the first message
+        """
+        while True:
+            try:
+                status, job_id, value = self.results.get(timeout=timeout)
+            except queue.Empty:
+                return
+            timeout = 0
+            self.finish_job(job_id, value)
+
+
+    def finish_job(self, job_id, success):
+        # The job may already have been released with its crashed worker
+        if job_id not in self.pending:
+            return
+        receipt = self.pending.pop(job_id)
+        self.assigned.pop(job_id)
+
+        if success:
+            self.message_queue.ack_message(receipt)
+        else:
+            self.message_queue.release_message(receipt)
+
+
+    def dispatch(self):
+        """Reads the next message from the queue and hands it to the workers.
+
+        Returns:
+            bool: True if a message was dispatched
+        """
+        data = self.consumer.next_message()
+
+        if not data:
+            return False
+        job_id = self._next_job
+        self._next_job += 1
+        load = [0] * self.num_workers
+        for worker in self.assigned.values():
+            load[worker] += 1
+        worker = load.index(min(load))
+        self.pending[job_id] = getattr(self.message_queue, 'last_receipt',
+                                       None)
+        self.assigned[job_id] = worker
+        self.jobs[worker].put((job_id, data))
+        return True
+
+
+    def shutdown(self):
+        for jobs in self.jobs:
+            jobs.put(None)
+        deadline = time.monotonic() + self.shutdown_timeout
+
+        while self.pending and time.monotonic() < deadline:
+            self.collect_results(timeout=1)
+            if not any(process.is_alive() for process in self.workers):
+                self.collect_results()
+                break
+        for process in self.workers:
+            process.join(max(deadline - time.monotonic(), 0))
+            if process.is_alive():
+                logger.error(f'Worker {process.pid} did not stop, killing it')
+                process.terminate()
+        for job_id in list(self.pending):
+            self.finish_job(job_id, False)
+        self.message_queue.close()
+
+
+    def run(self):
+        """Starts the workers and feeds them until asked to stop."""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        for i in range(self.num_workers):
+            self.start_worker(i)
+
+        while not self._stopping:
+            self.check_workers()
+            if len(self.pending) >= self.max_pending:
+                self.collect_results(timeout=1)
+                continue
+            self.collect_results()
+            if not self.dispatch():
+                time.sleep(self.rate_limit)
+        self.shutdown()
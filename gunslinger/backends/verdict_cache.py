@@ -0,0 +1,142 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+_verdict_cache = None
+
+
+def get_verdict_cache(config_data):
+    """Gets the process wide verdict cache, creating it on first use.
+
+    Arguments:
+        config_data (dict): Processor config, caching is enabled by a
+            `verdict_cache` section
+
+    Returns:
+        VerdictCache: The cache, None if caching is not configured
+    """
+    global _verdict_cache
+    cache_config = config_data.get('verdict_cache')
+
+    if cache_config is None:
+        return None
+    if _verdict_cache is None:
+        _verdict_cache = VerdictCache(**(cache_config or {}))
+    return _verdict_cache
+
+
+class VerdictCache():
+    """Persistent cache of rule verdicts keyed by content hash and ruleset.
+
+    A verdict is the list of rules that fired on a script. Since scripts
+    are identified by their sha256 hash, a script that was already checked
+    against the current ruleset never has to be downloaded or scanned again.
+    Entries expire after `ttl` seconds and the least recently used entries
+    are evicted once the cache holds more than `max_entries`.
+
+    Arguments:
+        path (str, optional): Path of the SQLite database
+        ttl (int, optional): Seconds an entry stays valid
+        max_entries (int, optional): Maximum number of cached verdicts
+    """
+
+    def __init__(self, **kwargs):
+        path = kwargs.get('path', 'cache/verdicts.db')
+        self.ttl = kwargs.get('ttl', 7 * 24 * 3600)
+        self.max_entries = kwargs.get('max_entries', 1000000)
+        self.evict_every = kwargs.get('evict_every', 1000)
+        directory = os.path.dirname(path)
+
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30,
+                                     check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS verdicts ('
+                           'hash TEXT NOT NULL, '
+                           'ruleset TEXT NOT NULL, '
+                           'fired_rules TEXT NOT NULL, '
+                           'created REAL NOT NULL, '
+                           'last_used REAL NOT NULL, '
+                           'PRIMARY KEY (hash, ruleset))')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS verdicts_last_used '
+                           'ON verdicts (last_used)')
+        self._conn.commit()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+    def get(self, h, ruleset_version):
+        """Gets the cached verdict for a script.
+
+        Arguments:
+            h (str): sha256 hash of the script
+            ruleset_version (str): Version of the loaded ruleset
+
+        Returns:
+            list: Rules that fired on the script, None if not cached
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute('SELECT fired_rules, created FROM '
+                                     'verdicts WHERE hash=? AND ruleset=?',
+                                     (h, ruleset_version)).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                self.misses += 1
+                return None
+            self._conn.execute('UPDATE verdicts SET last_used=? WHERE '
+                               'hash=? AND ruleset=?',
+                               (now, h, ruleset_version))
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+
+    def set(self, h, ruleset_version, fired_rules):
+        """Stores the verdict for a script.
+
+        Arguments:
+            h (str): sha256 hash of the script
+            ruleset_version (str): Version of the loaded ruleset
+            fired_rules (list): Rules that fired on the script
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO verdicts VALUES '
+                               '(?, ?, ?, ?, ?)',
+                               (h, ruleset_version, json.dumps(fired_rules),
+                                now, now))
+            self._conn.commit()
+            self._writes += 1
+            if self._writes % self.evict_every == 0:
+                self._evict(now)
+
+
+    def _evict(self, now):
+        self._conn.execute('DELETE FROM verdicts WHERE created < ?',
+                           (now - self.ttl,))
+        count = self._conn.execute('SELECT COUNT(*) FROM verdicts').fetchone()[0]
+
+        if count > self.max_entries:
+            self._conn.execute('DELETE FROM verdicts WHERE rowid IN (SELECT '
+                               'rowid FROM verdicts ORDER BY last_used '
+                               'LIMIT ?)', (count - self.max_entries,))
+        self._conn.commit()
+
+
+    def get_stats(self):
+        """Gets the hit/miss counters of the cache.
+
+        Returns:
+            dict: Number of hits and misses and the hit ratio
+        """
+        total = self.hits + self.misses
+        ratio = self.hits / total if total else 0.0
+        return {'hits': self.hits, 'misses': self.misses, 'ratio': ratio}
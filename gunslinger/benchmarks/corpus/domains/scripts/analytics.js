@@ -0,0 +1,301 @@
+/* track - synthetic benchmark library */
+function track_0(a,b){var c=a+b*0;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_0={"id":0,"label":"track-0","enabled":true};
+function track_1(a,b){var c=a+b*1;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_1={"id":1,"label":"track-1","enabled":false};
+function track_2(a,b){var c=a+b*2;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_2={"id":2,"label":"track-2","enabled":true};
+function track_3(a,b){var c=a+b*3;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_3={"id":3,"label":"track-3","enabled":false};
+function track_4(a,b){var c=a+b*4;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_4={"id":4,"label":"track-4","enabled":true};
+function track_5(a,b){var c=a+b*5;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_5={"id":5,"label":"track-5","enabled":false};
+function track_6(a,b){var c=a+b*6;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_6={"id":6,"label":"track-6","enabled":true};
+function track_7(a,b){var c=a+b*7;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_7={"id":7,"label":"track-7","enabled":false};
+function track_8(a,b){var c=a+b*8;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_8={"id":8,"label":"track-8","enabled":true};
+function track_9(a,b){var c=a+b*9;if(c>9)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_9={"id":9,"label":"track-9","enabled":false};
+function track_10(a,b){var c=a+b*10;if(c>10)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_10={"id":10,"label":"track-10","enabled":true};
+function track_11(a,b){var c=a+b*11;if(c>11)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_11={"id":11,"label":"track-11","enabled":false};
+function track_12(a,b){var c=a+b*12;if(c>12)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_12={"id":12,"label":"track-12","enabled":true};
+function track_13(a,b){var c=a+b*13;if(c>13)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_13={"id":13,"label":"track-13","enabled":false};
+function track_14(a,b){var c=a+b*14;if(c>14)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_14={"id":14,"label":"track-14","enabled":true};
+function track_15(a,b){var c=a+b*15;if(c>15)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_15={"id":15,"label":"track-15","enabled":false};
+function track_16(a,b){var c=a+b*16;if(c>16)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_16={"id":16,"label":"track-16","enabled":true};
+function track_17(a,b){var c=a+b*17;if(c>17)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_17={"id":17,"label":"track-17","enabled":false};
+function track_18(a,b){var c=a+b*18;if(c>18)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_18={"id":18,"label":"track-18","enabled":true};
+function track_19(a,b){var c=a+b*19;if(c>19)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_19={"id":19,"label":"track-19","enabled":false};
+function track_20(a,b){var c=a+b*20;if(c>20)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_20={"id":20,"label":"track-20","enabled":true};
+function track_21(a,b){var c=a+b*21;if(c>21)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_21={"id":21,"label":"track-21","enabled":false};
+function track_22(a,b){var c=a+b*22;if(c>22)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_22={"id":22,"label":"track-22","enabled":true};
+function track_23(a,b){var c=a+b*23;if(c>23)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_23={"id":23,"label":"track-23","enabled":false};
+function track_24(a,b){var c=a+b*24;if(c>24)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_24={"id":24,"label":"track-24","enabled":true};
+function track_25(a,b){var c=a+b*25;if(c>25)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_25={"id":25,"label":"track-25","enabled":false};
+function track_26(a,b){var c=a+b*26;if(c>26)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_26={"id":26,"label":"track-26","enabled":true};
+function track_27(a,b){var c=a+b*27;if(c>27)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_27={"id":27,"label":"track-27","enabled":false};
+function track_28(a,b){var c=a+b*28;if(c>28)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_28={"id":28,"label":"track-28","enabled":true};
+function track_29(a,b){var c=a+b*29;if(c>29)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_29={"id":29,"label":"track-29","enabled":false};
+function track_30(a,b){var c=a+b*30;if(c>30)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_30={"id":30,"label":"track-30","enabled":true};
+function track_31(a,b){var c=a+b*31;if(c>31)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_31={"id":31,"label":"track-31","enabled":false};
+function track_32(a,b){var c=a+b*32;if(c>32)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_32={"id":32,"label":"track-32","enabled":true};
+function track_33(a,b){var c=a+b*33;if(c>33)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_33={"id":33,"label":"track-33","enabled":false};
+function track_34(a,b){var c=a+b*34;if(c>34)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_34={"id":34,"label":"track-34","enabled":true};
+function track_35(a,b){var c=a+b*35;if(c>35)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_35={"id":35,"label":"track-35","enabled":false};
+function track_36(a,b){var c=a+b*36;if(c>36)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_36={"id":36,"label":"track-36","enabled":true};
+function track_37(a,b){var c=a+b*37;if(c>37)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_37={"id":37,"label":"track-37","enabled":false};
+function track_38(a,b){var c=a+b*38;if(c>38)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_38={"id":38,"label":"track-38","enabled":true};
+function track_39(a,b){var c=a+b*39;if(c>39)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_39={"id":39,"label":"track-39","enabled":false};
+function track_40(a,b){var c=a+b*40;if(c>40)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_40={"id":40,"label":"track-40","enabled":true};
+function track_41(a,b){var c=a+b*41;if(c>41)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_41={"id":41,"label":"track-41","enabled":false};
+function track_42(a,b){var c=a+b*42;if(c>42)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_42={"id":42,"label":"track-42","enabled":true};
+function track_43(a,b){var c=a+b*43;if(c>43)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_43={"id":43,"label":"track-43","enabled":false};
+function track_44(a,b){var c=a+b*44;if(c>44)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_44={"id":44,"label":"track-44","enabled":true};
+function track_45(a,b){var c=a+b*45;if(c>45)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_45={"id":45,"label":"track-45","enabled":false};
+function track_46(a,b){var c=a+b*46;if(c>46)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_46={"id":46,"label":"track-46","enabled":true};
+function track_47(a,b){var c=a+b*47;if(c>47)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_47={"id":47,"label":"track-47","enabled":false};
+function track_48(a,b){var c=a+b*48;if(c>48)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_48={"id":48,"label":"track-48","enabled":true};
+function track_49(a,b){var c=a+b*49;if(c>49)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_49={"id":49,"label":"track-49","enabled":false};
+function track_50(a,b){var c=a+b*50;if(c>50)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_50={"id":50,"label":"track-50","enabled":true};
+function track_51(a,b){var c=a+b*51;if(c>51)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_51={"id":51,"label":"track-51","enabled":false};
+function track_52(a,b){var c=a+b*52;if(c>52)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_52={"id":52,"label":"track-52","enabled":true};
+function track_53(a,b){var c=a+b*53;if(c>53)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_53={"id":53,"label":"track-53","enabled":false};
+function track_54(a,b){var c=a+b*54;if(c>54)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_54={"id":54,"label":"track-54","enabled":true};
+function track_55(a,b){var c=a+b*55;if(c>55)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_55={"id":55,"label":"track-55","enabled":false};
+function track_56(a,b){var c=a+b*56;if(c>56)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_56={"id":56,"label":"track-56","enabled":true};
+function track_57(a,b){var c=a+b*57;if(c>57)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_57={"id":57,"label":"track-57","enabled":false};
+function track_58(a,b){var c=a+b*58;if(c>58)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_58={"id":58,"label":"track-58","enabled":true};
+function track_59(a,b){var c=a+b*59;if(c>59)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_59={"id":59,"label":"track-59","enabled":false};
+function track_60(a,b){var c=a+b*60;if(c>60)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_60={"id":60,"label":"track-60","enabled":true};
+function track_61(a,b){var c=a+b*61;if(c>61)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_61={"id":61,"label":"track-61","enabled":false};
+function track_62(a,b){var c=a+b*62;if(c>62)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_62={"id":62,"label":"track-62","enabled":true};
+function track_63(a,b){var c=a+b*63;if(c>63)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_63={"id":63,"label":"track-63","enabled":false};
+function track_64(a,b){var c=a+b*64;if(c>64)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_64={"id":64,"label":"track-64","enabled":true};
+function track_65(a,b){var c=a+b*65;if(c>65)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_65={"id":65,"label":"track-65","enabled":false};
+function track_66(a,b){var c=a+b*66;if(c>66)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_66={"id":66,"label":"track-66","enabled":true};
+function track_67(a,b){var c=a+b*67;if(c>67)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_67={"id":67,"label":"track-67","enabled":false};
+function track_68(a,b){var c=a+b*68;if(c>68)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_68={"id":68,"label":"track-68","enabled":true};
+function track_69(a,b){var c=a+b*69;if(c>69)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_69={"id":69,"label":"track-69","enabled":false};
+function track_70(a,b){var c=a+b*70;if(c>70)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_70={"id":70,"label":"track-70","enabled":true};
+function track_71(a,b){var c=a+b*71;if(c>71)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_71={"id":71,"label":"track-71","enabled":false};
+function track_72(a,b){var c=a+b*72;if(c>72)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_72={"id":72,"label":"track-72","enabled":true};
+function track_73(a,b){var c=a+b*73;if(c>73)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_73={"id":73,"label":"track-73","enabled":false};
+function track_74(a,b){var c=a+b*74;if(c>74)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_74={"id":74,"label":"track-74","enabled":true};
+function track_75(a,b){var c=a+b*75;if(c>75)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_75={"id":75,"label":"track-75","enabled":false};
+function track_76(a,b){var c=a+b*76;if(c>76)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_76={"id":76,"label":"track-76","enabled":true};
+function track_77(a,b){var c=a+b*77;if(c>77)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_77={"id":77,"label":"track-77","enabled":false};
+function track_78(a,b){var c=a+b*78;if(c>78)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_78={"id":78,"label":"track-78","enabled":true};
+function track_79(a,b){var c=a+b*79;if(c>79)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_79={"id":79,"label":"track-79","enabled":false};
+function track_80(a,b){var c=a+b*80;if(c>80)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_80={"id":80,"label":"track-80","enabled":true};
+function track_81(a,b){var c=a+b*81;if(c>81)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_81={"id":81,"label":"track-81","enabled":false};
+function track_82(a,b){var c=a+b*82;if(c>82)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_82={"id":82,"label":"track-82","enabled":true};
+function track_83(a,b){var c=a+b*83;if(c>83)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_83={"id":83,"label":"track-83","enabled":false};
+function track_84(a,b){var c=a+b*84;if(c>84)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_84={"id":84,"label":"track-84","enabled":true};
+function track_85(a,b){var c=a+b*85;if(c>85)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_85={"id":85,"label":"track-85","enabled":false};
+function track_86(a,b){var c=a+b*86;if(c>86)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_86={"id":86,"label":"track-86","enabled":true};
+function track_87(a,b){var c=a+b*87;if(c>87)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_87={"id":87,"label":"track-87","enabled":false};
+function track_88(a,b){var c=a+b*88;if(c>88)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_88={"id":88,"label":"track-88","enabled":true};
+function track_89(a,b){var c=a+b*89;if(c>89)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_89={"id":89,"label":"track-89","enabled":false};
+function track_90(a,b){var c=a+b*90;if(c>90)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_90={"id":90,"label":"track-90","enabled":true};
+function track_91(a,b){var c=a+b*91;if(c>91)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_91={"id":91,"label":"track-91","enabled":false};
+function track_92(a,b){var c=a+b*92;if(c>92)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_92={"id":92,"label":"track-92","enabled":true};
+function track_93(a,b){var c=a+b*93;if(c>93)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_93={"id":93,"label":"track-93","enabled":false};
+function track_94(a,b){var c=a+b*94;if(c>94)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_94={"id":94,"label":"track-94","enabled":true};
+function track_95(a,b){var c=a+b*95;if(c>95)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_95={"id":95,"label":"track-95","enabled":false};
+function track_96(a,b){var c=a+b*96;if(c>96)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_96={"id":96,"label":"track-96","enabled":true};
+function track_97(a,b){var c=a+b*97;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_97={"id":97,"label":"track-97","enabled":false};
+function track_98(a,b){var c=a+b*98;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_98={"id":98,"label":"track-98","enabled":true};
+function track_99(a,b){var c=a+b*99;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_99={"id":99,"label":"track-99","enabled":false};
+function track_100(a,b){var c=a+b*100;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_100={"id":100,"label":"track-100","enabled":true};
+function track_101(a,b){var c=a+b*101;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_101={"id":101,"label":"track-101","enabled":false};
+function track_102(a,b){var c=a+b*102;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_102={"id":102,"label":"track-102","enabled":true};
+function track_103(a,b){var c=a+b*103;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_103={"id":103,"label":"track-103","enabled":false};
+function track_104(a,b){var c=a+b*104;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_104={"id":104,"label":"track-104","enabled":true};
+function track_105(a,b){var c=a+b*105;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_105={"id":105,"label":"track-105","enabled":false};
+function track_106(a,b){var c=a+b*106;if(c>9)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_106={"id":106,"label":"track-106","enabled":true};
+function track_107(a,b){var c=a+b*107;if(c>10)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_107={"id":107,"label":"track-107","enabled":false};
+function track_108(a,b){var c=a+b*108;if(c>11)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_108={"id":108,"label":"track-108","enabled":true};
+function track_109(a,b){var c=a+b*109;if(c>12)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_109={"id":109,"label":"track-109","enabled":false};
+function track_110(a,b){var c=a+b*110;if(c>13)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_110={"id":110,"label":"track-110","enabled":true};
+function track_111(a,b){var c=a+b*111;if(c>14)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_111={"id":111,"label":"track-111","enabled":false};
+function track_112(a,b){var c=a+b*112;if(c>15)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_112={"id":112,"label":"track-112","enabled":true};
+function track_113(a,b){var c=a+b*113;if(c>16)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_113={"id":113,"label":"track-113","enabled":false};
+function track_114(a,b){var c=a+b*114;if(c>17)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_114={"id":114,"label":"track-114","enabled":true};
+function track_115(a,b){var c=a+b*115;if(c>18)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_115={"id":115,"label":"track-115","enabled":false};
+function track_116(a,b){var c=a+b*116;if(c>19)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_116={"id":116,"label":"track-116","enabled":true};
+function track_117(a,b){var c=a+b*117;if(c>20)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_117={"id":117,"label":"track-117","enabled":false};
+function track_118(a,b){var c=a+b*118;if(c>21)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_118={"id":118,"label":"track-118","enabled":true};
+function track_119(a,b){var c=a+b*119;if(c>22)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_119={"id":119,"label":"track-119","enabled":false};
+function track_120(a,b){var c=a+b*120;if(c>23)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_120={"id":120,"label":"track-120","enabled":true};
+function track_121(a,b){var c=a+b*121;if(c>24)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_121={"id":121,"label":"track-121","enabled":false};
+function track_122(a,b){var c=a+b*122;if(c>25)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_122={"id":122,"label":"track-122","enabled":true};
+function track_123(a,b){var c=a+b*123;if(c>26)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_123={"id":123,"label":"track-123","enabled":false};
+function track_124(a,b){var c=a+b*124;if(c>27)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_124={"id":124,"label":"track-124","enabled":true};
+function track_125(a,b){var c=a+b*125;if(c>28)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_125={"id":125,"label":"track-125","enabled":false};
+function track_126(a,b){var c=a+b*126;if(c>29)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_126={"id":126,"label":"track-126","enabled":true};
+function track_127(a,b){var c=a+b*127;if(c>30)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_127={"id":127,"label":"track-127","enabled":false};
+function track_128(a,b){var c=a+b*128;if(c>31)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_128={"id":128,"label":"track-128","enabled":true};
+function track_129(a,b){var c=a+b*129;if(c>32)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_129={"id":129,"label":"track-129","enabled":false};
+function track_130(a,b){var c=a+b*130;if(c>33)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_130={"id":130,"label":"track-130","enabled":true};
+function track_131(a,b){var c=a+b*131;if(c>34)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_131={"id":131,"label":"track-131","enabled":false};
+function track_132(a,b){var c=a+b*132;if(c>35)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_132={"id":132,"label":"track-132","enabled":true};
+function track_133(a,b){var c=a+b*133;if(c>36)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_133={"id":133,"label":"track-133","enabled":false};
+function track_134(a,b){var c=a+b*134;if(c>37)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_134={"id":134,"label":"track-134","enabled":true};
+function track_135(a,b){var c=a+b*135;if(c>38)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_135={"id":135,"label":"track-135","enabled":false};
+function track_136(a,b){var c=a+b*136;if(c>39)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_136={"id":136,"label":"track-136","enabled":true};
+function track_137(a,b){var c=a+b*137;if(c>40)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_137={"id":137,"label":"track-137","enabled":false};
+function track_138(a,b){var c=a+b*138;if(c>41)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_138={"id":138,"label":"track-138","enabled":true};
+function track_139(a,b){var c=a+b*139;if(c>42)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_139={"id":139,"label":"track-139","enabled":false};
+function track_140(a,b){var c=a+b*140;if(c>43)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_140={"id":140,"label":"track-140","enabled":true};
+function track_141(a,b){var c=a+b*141;if(c>44)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_141={"id":141,"label":"track-141","enabled":false};
+function track_142(a,b){var c=a+b*142;if(c>45)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_142={"id":142,"label":"track-142","enabled":true};
+function track_143(a,b){var c=a+b*143;if(c>46)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_143={"id":143,"label":"track-143","enabled":false};
+function track_144(a,b){var c=a+b*144;if(c>47)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_144={"id":144,"label":"track-144","enabled":true};
+function track_145(a,b){var c=a+b*145;if(c>48)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_145={"id":145,"label":"track-145","enabled":false};
+function track_146(a,b){var c=a+b*146;if(c>49)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_146={"id":146,"label":"track-146","enabled":true};
+function track_147(a,b){var c=a+b*147;if(c>50)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_147={"id":147,"label":"track-147","enabled":false};
+function track_148(a,b){var c=a+b*148;if(c>51)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_148={"id":148,"label":"track-148","enabled":true};
+function track_149(a,b){var c=a+b*149;if(c>52)return c.toString(16);return [a,b,c].join("-")}
+window.track_cfg_149={"id":149,"label":"track-149","enabled":false};
\ No newline at end of file
@@ -0,0 +1,2001 @@
+/* liba - synthetic benchmark library */
+function liba_0(a,b){var c=a+b*0;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_0={"id":0,"label":"liba-0","enabled":true};
+function liba_1(a,b){var c=a+b*1;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_1={"id":1,"label":"liba-1","enabled":false};
+function liba_2(a,b){var c=a+b*2;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_2={"id":2,"label":"liba-2","enabled":true};
+function liba_3(a,b){var c=a+b*3;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_3={"id":3,"label":"liba-3","enabled":false};
+function liba_4(a,b){var c=a+b*4;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_4={"id":4,"label":"liba-4","enabled":true};
+function liba_5(a,b){var c=a+b*5;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_5={"id":5,"label":"liba-5","enabled":false};
+function liba_6(a,b){var c=a+b*6;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_6={"id":6,"label":"liba-6","enabled":true};
+function liba_7(a,b){var c=a+b*7;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_7={"id":7,"label":"liba-7","enabled":false};
+function liba_8(a,b){var c=a+b*8;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_8={"id":8,"label":"liba-8","enabled":true};
+function liba_9(a,b){var c=a+b*9;if(c>9)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_9={"id":9,"label":"liba-9","enabled":false};
+function liba_10(a,b){var c=a+b*10;if(c>10)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_10={"id":10,"label":"liba-10","enabled":true};
+function liba_11(a,b){var c=a+b*11;if(c>11)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_11={"id":11,"label":"liba-11","enabled":false};
+function liba_12(a,b){var c=a+b*12;if(c>12)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_12={"id":12,"label":"liba-12","enabled":true};
+function liba_13(a,b){var c=a+b*13;if(c>13)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_13={"id":13,"label":"liba-13","enabled":false};
+function liba_14(a,b){var c=a+b*14;if(c>14)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_14={"id":14,"label":"liba-14","enabled":true};
+function liba_15(a,b){var c=a+b*15;if(c>15)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_15={"id":15,"label":"liba-15","enabled":false};
+function liba_16(a,b){var c=a+b*16;if(c>16)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_16={"id":16,"label":"liba-16","enabled":true};
+function liba_17(a,b){var c=a+b*17;if(c>17)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_17={"id":17,"label":"liba-17","enabled":false};
+function liba_18(a,b){var c=a+b*18;if(c>18)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_18={"id":18,"label":"liba-18","enabled":true};
+function liba_19(a,b){var c=a+b*19;if(c>19)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_19={"id":19,"label":"liba-19","enabled":false};
+function liba_20(a,b){var c=a+b*20;if(c>20)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_20={"id":20,"label":"liba-20","enabled":true};
+function liba_21(a,b){var c=a+b*21;if(c>21)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_21={"id":21,"label":"liba-21","enabled":false};
+function liba_22(a,b){var c=a+b*22;if(c>22)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_22={"id":22,"label":"liba-22","enabled":true};
+function liba_23(a,b){var c=a+b*23;if(c>23)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_23={"id":23,"label":"liba-23","enabled":false};
+function liba_24(a,b){var c=a+b*24;if(c>24)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_24={"id":24,"label":"liba-24","enabled":true};
+function liba_25(a,b){var c=a+b*25;if(c>25)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_25={"id":25,"label":"liba-25","enabled":false};
+function liba_26(a,b){var c=a+b*26;if(c>26)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_26={"id":26,"label":"liba-26","enabled":true};
+function liba_27(a,b){var c=a+b*27;if(c>27)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_27={"id":27,"label":"liba-27","enabled":false};
+function liba_28(a,b){var c=a+b*28;if(c>28)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_28={"id":28,"label":"liba-28","enabled":true};
+function liba_29(a,b){var c=a+b*29;if(c>29)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_29={"id":29,"label":"liba-29","enabled":false};
+function liba_30(a,b){var c=a+b*30;if(c>30)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_30={"id":30,"label":"liba-30","enabled":true};
+function liba_31(a,b){var c=a+b*31;if(c>31)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_31={"id":31,"label":"liba-31","enabled":false};
+function liba_32(a,b){var c=a+b*32;if(c>32)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_32={"id":32,"label":"liba-32","enabled":true};
+function liba_33(a,b){var c=a+b*33;if(c>33)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_33={"id":33,"label":"liba-33","enabled":false};
+function liba_34(a,b){var c=a+b*34;if(c>34)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_34={"id":34,"label":"liba-34","enabled":true};
+function liba_35(a,b){var c=a+b*35;if(c>35)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_35={"id":35,"label":"liba-35","enabled":false};
+function liba_36(a,b){var c=a+b*36;if(c>36)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_36={"id":36,"label":"liba-36","enabled":true};
+function liba_37(a,b){var c=a+b*37;if(c>37)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_37={"id":37,"label":"liba-37","enabled":false};
+function liba_38(a,b){var c=a+b*38;if(c>38)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_38={"id":38,"label":"liba-38","enabled":true};
+function liba_39(a,b){var c=a+b*39;if(c>39)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_39={"id":39,"label":"liba-39","enabled":false};
+function liba_40(a,b){var c=a+b*40;if(c>40)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_40={"id":40,"label":"liba-40","enabled":true};
+function liba_41(a,b){var c=a+b*41;if(c>41)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_41={"id":41,"label":"liba-41","enabled":false};
+function liba_42(a,b){var c=a+b*42;if(c>42)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_42={"id":42,"label":"liba-42","enabled":true};
+function liba_43(a,b){var c=a+b*43;if(c>43)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_43={"id":43,"label":"liba-43","enabled":false};
+function liba_44(a,b){var c=a+b*44;if(c>44)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_44={"id":44,"label":"liba-44","enabled":true};
+function liba_45(a,b){var c=a+b*45;if(c>45)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_45={"id":45,"label":"liba-45","enabled":false};
+function liba_46(a,b){var c=a+b*46;if(c>46)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_46={"id":46,"label":"liba-46","enabled":true};
+function liba_47(a,b){var c=a+b*47;if(c>47)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_47={"id":47,"label":"liba-47","enabled":false};
+function liba_48(a,b){var c=a+b*48;if(c>48)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_48={"id":48,"label":"liba-48","enabled":true};
+function liba_49(a,b){var c=a+b*49;if(c>49)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_49={"id":49,"label":"liba-49","enabled":false};
+function liba_50(a,b){var c=a+b*50;if(c>50)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_50={"id":50,"label":"liba-50","enabled":true};
+function liba_51(a,b){var c=a+b*51;if(c>51)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_51={"id":51,"label":"liba-51","enabled":false};
+function liba_52(a,b){var c=a+b*52;if(c>52)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_52={"id":52,"label":"liba-52","enabled":true};
+function liba_53(a,b){var c=a+b*53;if(c>53)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_53={"id":53,"label":"liba-53","enabled":false};
+function liba_54(a,b){var c=a+b*54;if(c>54)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_54={"id":54,"label":"liba-54","enabled":true};
+function liba_55(a,b){var c=a+b*55;if(c>55)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_55={"id":55,"label":"liba-55","enabled":false};
+function liba_56(a,b){var c=a+b*56;if(c>56)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_56={"id":56,"label":"liba-56","enabled":true};
+function liba_57(a,b){var c=a+b*57;if(c>57)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_57={"id":57,"label":"liba-57","enabled":false};
+function liba_58(a,b){var c=a+b*58;if(c>58)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_58={"id":58,"label":"liba-58","enabled":true};
+function liba_59(a,b){var c=a+b*59;if(c>59)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_59={"id":59,"label":"liba-59","enabled":false};
+function liba_60(a,b){var c=a+b*60;if(c>60)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_60={"id":60,"label":"liba-60","enabled":true};
+function liba_61(a,b){var c=a+b*61;if(c>61)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_61={"id":61,"label":"liba-61","enabled":false};
+function liba_62(a,b){var c=a+b*62;if(c>62)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_62={"id":62,"label":"liba-62","enabled":true};
+function liba_63(a,b){var c=a+b*63;if(c>63)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_63={"id":63,"label":"liba-63","enabled":false};
+function liba_64(a,b){var c=a+b*64;if(c>64)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_64={"id":64,"label":"liba-64","enabled":true};
+function liba_65(a,b){var c=a+b*65;if(c>65)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_65={"id":65,"label":"liba-65","enabled":false};
+function liba_66(a,b){var c=a+b*66;if(c>66)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_66={"id":66,"label":"liba-66","enabled":true};
+function liba_67(a,b){var c=a+b*67;if(c>67)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_67={"id":67,"label":"liba-67","enabled":false};
+function liba_68(a,b){var c=a+b*68;if(c>68)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_68={"id":68,"label":"liba-68","enabled":true};
+function liba_69(a,b){var c=a+b*69;if(c>69)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_69={"id":69,"label":"liba-69","enabled":false};
+function liba_70(a,b){var c=a+b*70;if(c>70)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_70={"id":70,"label":"liba-70","enabled":true};
+function liba_71(a,b){var c=a+b*71;if(c>71)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_71={"id":71,"label":"liba-71","enabled":false};
+function liba_72(a,b){var c=a+b*72;if(c>72)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_72={"id":72,"label":"liba-72","enabled":true};
+function liba_73(a,b){var c=a+b*73;if(c>73)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_73={"id":73,"label":"liba-73","enabled":false};
+function liba_74(a,b){var c=a+b*74;if(c>74)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_74={"id":74,"label":"liba-74","enabled":true};
+function liba_75(a,b){var c=a+b*75;if(c>75)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_75={"id":75,"label":"liba-75","enabled":false};
+function liba_76(a,b){var c=a+b*76;if(c>76)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_76={"id":76,"label":"liba-76","enabled":true};
+function liba_77(a,b){var c=a+b*77;if(c>77)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_77={"id":77,"label":"liba-77","enabled":false};
+function liba_78(a,b){var c=a+b*78;if(c>78)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_78={"id":78,"label":"liba-78","enabled":true};
+function liba_79(a,b){var c=a+b*79;if(c>79)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_79={"id":79,"label":"liba-79","enabled":false};
+function liba_80(a,b){var c=a+b*80;if(c>80)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_80={"id":80,"label":"liba-80","enabled":true};
+function liba_81(a,b){var c=a+b*81;if(c>81)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_81={"id":81,"label":"liba-81","enabled":false};
+function liba_82(a,b){var c=a+b*82;if(c>82)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_82={"id":82,"label":"liba-82","enabled":true};
+function liba_83(a,b){var c=a+b*83;if(c>83)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_83={"id":83,"label":"liba-83","enabled":false};
+function liba_84(a,b){var c=a+b*84;if(c>84)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_84={"id":84,"label":"liba-84","enabled":true};
+function liba_85(a,b){var c=a+b*85;if(c>85)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_85={"id":85,"label":"liba-85","enabled":false};
+function liba_86(a,b){var c=a+b*86;if(c>86)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_86={"id":86,"label":"liba-86","enabled":true};
+function liba_87(a,b){var c=a+b*87;if(c>87)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_87={"id":87,"label":"liba-87","enabled":false};
+function liba_88(a,b){var c=a+b*88;if(c>88)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_88={"id":88,"label":"liba-88","enabled":true};
+function liba_89(a,b){var c=a+b*89;if(c>89)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_89={"id":89,"label":"liba-89","enabled":false};
+function liba_90(a,b){var c=a+b*90;if(c>90)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_90={"id":90,"label":"liba-90","enabled":true};
+function liba_91(a,b){var c=a+b*91;if(c>91)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_91={"id":91,"label":"liba-91","enabled":false};
+function liba_92(a,b){var c=a+b*92;if(c>92)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_92={"id":92,"label":"liba-92","enabled":true};
+function liba_93(a,b){var c=a+b*93;if(c>93)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_93={"id":93,"label":"liba-93","enabled":false};
+function liba_94(a,b){var c=a+b*94;if(c>94)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_94={"id":94,"label":"liba-94","enabled":true};
+function liba_95(a,b){var c=a+b*95;if(c>95)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_95={"id":95,"label":"liba-95","enabled":false};
+function liba_96(a,b){var c=a+b*96;if(c>96)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_96={"id":96,"label":"liba-96","enabled":true};
+function liba_97(a,b){var c=a+b*97;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_97={"id":97,"label":"liba-97","enabled":false};
+function liba_98(a,b){var c=a+b*98;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_98={"id":98,"label":"liba-98","enabled":true};
+function liba_99(a,b){var c=a+b*99;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_99={"id":99,"label":"liba-99","enabled":false};
+function liba_100(a,b){var c=a+b*100;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_100={"id":100,"label":"liba-100","enabled":true};
+function liba_101(a,b){var c=a+b*101;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_101={"id":101,"label":"liba-101","enabled":false};
+function liba_102(a,b){var c=a+b*102;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_102={"id":102,"label":"liba-102","enabled":true};
+function liba_103(a,b){var c=a+b*103;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_103={"id":103,"label":"liba-103","enabled":false};
+function liba_104(a,b){var c=a+b*104;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_104={"id":104,"label":"liba-104","enabled":true};
+function liba_105(a,b){var c=a+b*105;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_105={"id":105,"label":"liba-105","enabled":false};
+function liba_106(a,b){var c=a+b*106;if(c>9)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_106={"id":106,"label":"liba-106","enabled":true};
+function liba_107(a,b){var c=a+b*107;if(c>10)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_107={"id":107,"label":"liba-107","enabled":false};
+function liba_108(a,b){var c=a+b*108;if(c>11)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_108={"id":108,"label":"liba-108","enabled":true};
+function liba_109(a,b){var c=a+b*109;if(c>12)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_109={"id":109,"label":"liba-109","enabled":false};
+function liba_110(a,b){var c=a+b*110;if(c>13)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_110={"id":110,"label":"liba-110","enabled":true};
+function liba_111(a,b){var c=a+b*111;if(c>14)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_111={"id":111,"label":"liba-111","enabled":false};
+function liba_112(a,b){var c=a+b*112;if(c>15)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_112={"id":112,"label":"liba-112","enabled":true};
+function liba_113(a,b){var c=a+b*113;if(c>16)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_113={"id":113,"label":"liba-113","enabled":false};
+function liba_114(a,b){var c=a+b*114;if(c>17)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_114={"id":114,"label":"liba-114","enabled":true};
+function liba_115(a,b){var c=a+b*115;if(c>18)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_115={"id":115,"label":"liba-115","enabled":false};
+function liba_116(a,b){var c=a+b*116;if(c>19)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_116={"id":116,"label":"liba-116","enabled":true};
+function liba_117(a,b){var c=a+b*117;if(c>20)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_117={"id":117,"label":"liba-117","enabled":false};
+function liba_118(a,b){var c=a+b*118;if(c>21)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_118={"id":118,"label":"liba-118","enabled":true};
+function liba_119(a,b){var c=a+b*119;if(c>22)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_119={"id":119,"label":"liba-119","enabled":false};
+function liba_120(a,b){var c=a+b*120;if(c>23)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_120={"id":120,"label":"liba-120","enabled":true};
+function liba_121(a,b){var c=a+b*121;if(c>24)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_121={"id":121,"label":"liba-121","enabled":false};
+function liba_122(a,b){var c=a+b*122;if(c>25)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_122={"id":122,"label":"liba-122","enabled":true};
+function liba_123(a,b){var c=a+b*123;if(c>26)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_123={"id":123,"label":"liba-123","enabled":false};
+function liba_124(a,b){var c=a+b*124;if(c>27)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_124={"id":124,"label":"liba-124","enabled":true};
+function liba_125(a,b){var c=a+b*125;if(c>28)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_125={"id":125,"label":"liba-125","enabled":false};
+function liba_126(a,b){var c=a+b*126;if(c>29)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_126={"id":126,"label":"liba-126","enabled":true};
+function liba_127(a,b){var c=a+b*127;if(c>30)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_127={"id":127,"label":"liba-127","enabled":false};
+function liba_128(a,b){var c=a+b*128;if(c>31)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_128={"id":128,"label":"liba-128","enabled":true};
+function liba_129(a,b){var c=a+b*129;if(c>32)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_129={"id":129,"label":"liba-129","enabled":false};
+function liba_130(a,b){var c=a+b*130;if(c>33)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_130={"id":130,"label":"liba-130","enabled":true};
+function liba_131(a,b){var c=a+b*131;if(c>34)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_131={"id":131,"label":"liba-131","enabled":false};
+function liba_132(a,b){var c=a+b*132;if(c>35)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_132={"id":132,"label":"liba-132","enabled":true};
+function liba_133(a,b){var c=a+b*133;if(c>36)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_133={"id":133,"label":"liba-133","enabled":false};
+function liba_134(a,b){var c=a+b*134;if(c>37)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_134={"id":134,"label":"liba-134","enabled":true};
+function liba_135(a,b){var c=a+b*135;if(c>38)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_135={"id":135,"label":"liba-135","enabled":false};
+function liba_136(a,b){var c=a+b*136;if(c>39)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_136={"id":136,"label":"liba-136","enabled":true};
+function liba_137(a,b){var c=a+b*137;if(c>40)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_137={"id":137,"label":"liba-137","enabled":false};
+function liba_138(a,b){var c=a+b*138;if(c>41)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_138={"id":138,"label":"liba-138","enabled":true};
+function liba_139(a,b){var c=a+b*139;if(c>42)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_139={"id":139,"label":"liba-139","enabled":false};
+function liba_140(a,b){var c=a+b*140;if(c>43)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_140={"id":140,"label":"liba-140","enabled":true};
+function liba_141(a,b){var c=a+b*141;if(c>44)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_141={"id":141,"label":"liba-141","enabled":false};
+function liba_142(a,b){var c=a+b*142;if(c>45)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_142={"id":142,"label":"liba-142","enabled":true};
+function liba_143(a,b){var c=a+b*143;if(c>46)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_143={"id":143,"label":"liba-143","enabled":false};
+function liba_144(a,b){var c=a+b*144;if(c>47)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_144={"id":144,"label":"liba-144","enabled":true};
+function liba_145(a,b){var c=a+b*145;if(c>48)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_145={"id":145,"label":"liba-145","enabled":false};
+function liba_146(a,b){var c=a+b*146;if(c>49)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_146={"id":146,"label":"liba-146","enabled":true};
+function liba_147(a,b){var c=a+b*147;if(c>50)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_147={"id":147,"label":"liba-147","enabled":false};
+function liba_148(a,b){var c=a+b*148;if(c>51)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_148={"id":148,"label":"liba-148","enabled":true};
+function liba_149(a,b){var c=a+b*149;if(c>52)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_149={"id":149,"label":"liba-149","enabled":false};
+function liba_150(a,b){var c=a+b*150;if(c>53)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_150={"id":150,"label":"liba-150","enabled":true};
+function liba_151(a,b){var c=a+b*151;if(c>54)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_151={"id":151,"label":"liba-151","enabled":false};
+function liba_152(a,b){var c=a+b*152;if(c>55)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_152={"id":152,"label":"liba-152","enabled":true};
+function liba_153(a,b){var c=a+b*153;if(c>56)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_153={"id":153,"label":"liba-153","enabled":false};
+function liba_154(a,b){var c=a+b*154;if(c>57)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_154={"id":154,"label":"liba-154","enabled":true};
+function liba_155(a,b){var c=a+b*155;if(c>58)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_155={"id":155,"label":"liba-155","enabled":false};
+function liba_156(a,b){var c=a+b*156;if(c>59)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_156={"id":156,"label":"liba-156","enabled":true};
+function liba_157(a,b){var c=a+b*157;if(c>60)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_157={"id":157,"label":"liba-157","enabled":false};
+function liba_158(a,b){var c=a+b*158;if(c>61)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_158={"id":158,"label":"liba-158","enabled":true};
+function liba_159(a,b){var c=a+b*159;if(c>62)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_159={"id":159,"label":"liba-159","enabled":false};
+function liba_160(a,b){var c=a+b*160;if(c>63)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_160={"id":160,"label":"liba-160","enabled":true};
+function liba_161(a,b){var c=a+b*161;if(c>64)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_161={"id":161,"label":"liba-161","enabled":false};
+function liba_162(a,b){var c=a+b*162;if(c>65)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_162={"id":162,"label":"liba-162","enabled":true};
+function liba_163(a,b){var c=a+b*163;if(c>66)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_163={"id":163,"label":"liba-163","enabled":false};
+function liba_164(a,b){var c=a+b*164;if(c>67)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_164={"id":164,"label":"liba-164","enabled":true};
+function liba_165(a,b){var c=a+b*165;if(c>68)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_165={"id":165,"label":"liba-165","enabled":false};
+function liba_166(a,b){var c=a+b*166;if(c>69)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_166={"id":166,"label":"liba-166","enabled":true};
+function liba_167(a,b){var c=a+b*167;if(c>70)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_167={"id":167,"label":"liba-167","enabled":false};
+function liba_168(a,b){var c=a+b*168;if(c>71)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_168={"id":168,"label":"liba-168","enabled":true};
+function liba_169(a,b){var c=a+b*169;if(c>72)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_169={"id":169,"label":"liba-169","enabled":false};
+function liba_170(a,b){var c=a+b*170;if(c>73)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_170={"id":170,"label":"liba-170","enabled":true};
+function liba_171(a,b){var c=a+b*171;if(c>74)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_171={"id":171,"label":"liba-171","enabled":false};
+function liba_172(a,b){var c=a+b*172;if(c>75)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_172={"id":172,"label":"liba-172","enabled":true};
+function liba_173(a,b){var c=a+b*173;if(c>76)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_173={"id":173,"label":"liba-173","enabled":false};
+function liba_174(a,b){var c=a+b*174;if(c>77)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_174={"id":174,"label":"liba-174","enabled":true};
+function liba_175(a,b){var c=a+b*175;if(c>78)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_175={"id":175,"label":"liba-175","enabled":false};
+function liba_176(a,b){var c=a+b*176;if(c>79)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_176={"id":176,"label":"liba-176","enabled":true};
+function liba_177(a,b){var c=a+b*177;if(c>80)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_177={"id":177,"label":"liba-177","enabled":false};
+function liba_178(a,b){var c=a+b*178;if(c>81)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_178={"id":178,"label":"liba-178","enabled":true};
+function liba_179(a,b){var c=a+b*179;if(c>82)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_179={"id":179,"label":"liba-179","enabled":false};
+function liba_180(a,b){var c=a+b*180;if(c>83)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_180={"id":180,"label":"liba-180","enabled":true};
+function liba_181(a,b){var c=a+b*181;if(c>84)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_181={"id":181,"label":"liba-181","enabled":false};
+function liba_182(a,b){var c=a+b*182;if(c>85)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_182={"id":182,"label":"liba-182","enabled":true};
+function liba_183(a,b){var c=a+b*183;if(c>86)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_183={"id":183,"label":"liba-183","enabled":false};
+function liba_184(a,b){var c=a+b*184;if(c>87)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_184={"id":184,"label":"liba-184","enabled":true};
+function liba_185(a,b){var c=a+b*185;if(c>88)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_185={"id":185,"label":"liba-185","enabled":false};
+function liba_186(a,b){var c=a+b*186;if(c>89)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_186={"id":186,"label":"liba-186","enabled":true};
+function liba_187(a,b){var c=a+b*187;if(c>90)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_187={"id":187,"label":"liba-187","enabled":false};
+function liba_188(a,b){var c=a+b*188;if(c>91)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_188={"id":188,"label":"liba-188","enabled":true};
+function liba_189(a,b){var c=a+b*189;if(c>92)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_189={"id":189,"label":"liba-189","enabled":false};
+function liba_190(a,b){var c=a+b*190;if(c>93)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_190={"id":190,"label":"liba-190","enabled":true};
+function liba_191(a,b){var c=a+b*191;if(c>94)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_191={"id":191,"label":"liba-191","enabled":false};
+function liba_192(a,b){var c=a+b*192;if(c>95)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_192={"id":192,"label":"liba-192","enabled":true};
+function liba_193(a,b){var c=a+b*193;if(c>96)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_193={"id":193,"label":"liba-193","enabled":false};
+function liba_194(a,b){var c=a+b*194;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_194={"id":194,"label":"liba-194","enabled":true};
+function liba_195(a,b){var c=a+b*195;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_195={"id":195,"label":"liba-195","enabled":false};
+function liba_196(a,b){var c=a+b*196;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_196={"id":196,"label":"liba-196","enabled":true};
+function liba_197(a,b){var c=a+b*197;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_197={"id":197,"label":"liba-197","enabled":false};
+function liba_198(a,b){var c=a+b*198;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_198={"id":198,"label":"liba-198","enabled":true};
+function liba_199(a,b){var c=a+b*199;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_199={"id":199,"label":"liba-199","enabled":false};
+function liba_200(a,b){var c=a+b*200;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_200={"id":200,"label":"liba-200","enabled":true};
+function liba_201(a,b){var c=a+b*201;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_201={"id":201,"label":"liba-201","enabled":false};
+function liba_202(a,b){var c=a+b*202;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_202={"id":202,"label":"liba-202","enabled":true};
+function liba_203(a,b){var c=a+b*203;if(c>9)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_203={"id":203,"label":"liba-203","enabled":false};
+function liba_204(a,b){var c=a+b*204;if(c>10)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_204={"id":204,"label":"liba-204","enabled":true};
+function liba_205(a,b){var c=a+b*205;if(c>11)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_205={"id":205,"label":"liba-205","enabled":false};
+function liba_206(a,b){var c=a+b*206;if(c>12)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_206={"id":206,"label":"liba-206","enabled":true};
+function liba_207(a,b){var c=a+b*207;if(c>13)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_207={"id":207,"label":"liba-207","enabled":false};
+function liba_208(a,b){var c=a+b*208;if(c>14)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_208={"id":208,"label":"liba-208","enabled":true};
+function liba_209(a,b){var c=a+b*209;if(c>15)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_209={"id":209,"label":"liba-209","enabled":false};
+function liba_210(a,b){var c=a+b*210;if(c>16)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_210={"id":210,"label":"liba-210","enabled":true};
+function liba_211(a,b){var c=a+b*211;if(c>17)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_211={"id":211,"label":"liba-211","enabled":false};
+function liba_212(a,b){var c=a+b*212;if(c>18)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_212={"id":212,"label":"liba-212","enabled":true};
+function liba_213(a,b){var c=a+b*213;if(c>19)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_213={"id":213,"label":"liba-213","enabled":false};
+function liba_214(a,b){var c=a+b*214;if(c>20)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_214={"id":214,"label":"liba-214","enabled":true};
+function liba_215(a,b){var c=a+b*215;if(c>21)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_215={"id":215,"label":"liba-215","enabled":false};
+function liba_216(a,b){var c=a+b*216;if(c>22)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_216={"id":216,"label":"liba-216","enabled":true};
+function liba_217(a,b){var c=a+b*217;if(c>23)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_217={"id":217,"label":"liba-217","enabled":false};
+function liba_218(a,b){var c=a+b*218;if(c>24)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_218={"id":218,"label":"liba-218","enabled":true};
+function liba_219(a,b){var c=a+b*219;if(c>25)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_219={"id":219,"label":"liba-219","enabled":false};
+function liba_220(a,b){var c=a+b*220;if(c>26)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_220={"id":220,"label":"liba-220","enabled":true};
+function liba_221(a,b){var c=a+b*221;if(c>27)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_221={"id":221,"label":"liba-221","enabled":false};
+function liba_222(a,b){var c=a+b*222;if(c>28)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_222={"id":222,"label":"liba-222","enabled":true};
+function liba_223(a,b){var c=a+b*223;if(c>29)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_223={"id":223,"label":"liba-223","enabled":false};
+function liba_224(a,b){var c=a+b*224;if(c>30)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_224={"id":224,"label":"liba-224","enabled":true};
+function liba_225(a,b){var c=a+b*225;if(c>31)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_225={"id":225,"label":"liba-225","enabled":false};
+function liba_226(a,b){var c=a+b*226;if(c>32)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_226={"id":226,"label":"liba-226","enabled":true};
+function liba_227(a,b){var c=a+b*227;if(c>33)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_227={"id":227,"label":"liba-227","enabled":false};
+function liba_228(a,b){var c=a+b*228;if(c>34)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_228={"id":228,"label":"liba-228","enabled":true};
+function liba_229(a,b){var c=a+b*229;if(c>35)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_229={"id":229,"label":"liba-229","enabled":false};
+function liba_230(a,b){var c=a+b*230;if(c>36)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_230={"id":230,"label":"liba-230","enabled":true};
+function liba_231(a,b){var c=a+b*231;if(c>37)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_231={"id":231,"label":"liba-231","enabled":false};
+function liba_232(a,b){var c=a+b*232;if(c>38)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_232={"id":232,"label":"liba-232","enabled":true};
+function liba_233(a,b){var c=a+b*233;if(c>39)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_233={"id":233,"label":"liba-233","enabled":false};
+function liba_234(a,b){var c=a+b*234;if(c>40)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_234={"id":234,"label":"liba-234","enabled":true};
+function liba_235(a,b){var c=a+b*235;if(c>41)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_235={"id":235,"label":"liba-235","enabled":false};
+function liba_236(a,b){var c=a+b*236;if(c>42)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_236={"id":236,"label":"liba-236","enabled":true};
+function liba_237(a,b){var c=a+b*237;if(c>43)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_237={"id":237,"label":"liba-237","enabled":false};
+function liba_238(a,b){var c=a+b*238;if(c>44)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_238={"id":238,"label":"liba-238","enabled":true};
+function liba_239(a,b){var c=a+b*239;if(c>45)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_239={"id":239,"label":"liba-239","enabled":false};
+function liba_240(a,b){var c=a+b*240;if(c>46)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_240={"id":240,"label":"liba-240","enabled":true};
+function liba_241(a,b){var c=a+b*241;if(c>47)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_241={"id":241,"label":"liba-241","enabled":false};
+function liba_242(a,b){var c=a+b*242;if(c>48)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_242={"id":242,"label":"liba-242","enabled":true};
+function liba_243(a,b){var c=a+b*243;if(c>49)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_243={"id":243,"label":"liba-243","enabled":false};
+function liba_244(a,b){var c=a+b*244;if(c>50)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_244={"id":244,"label":"liba-244","enabled":true};
+function liba_245(a,b){var c=a+b*245;if(c>51)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_245={"id":245,"label":"liba-245","enabled":false};
+function liba_246(a,b){var c=a+b*246;if(c>52)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_246={"id":246,"label":"liba-246","enabled":true};
+function liba_247(a,b){var c=a+b*247;if(c>53)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_247={"id":247,"label":"liba-247","enabled":false};
+function liba_248(a,b){var c=a+b*248;if(c>54)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_248={"id":248,"label":"liba-248","enabled":true};
+function liba_249(a,b){var c=a+b*249;if(c>55)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_249={"id":249,"label":"liba-249","enabled":false};
+function liba_250(a,b){var c=a+b*250;if(c>56)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_250={"id":250,"label":"liba-250","enabled":true};
+function liba_251(a,b){var c=a+b*251;if(c>57)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_251={"id":251,"label":"liba-251","enabled":false};
+function liba_252(a,b){var c=a+b*252;if(c>58)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_252={"id":252,"label":"liba-252","enabled":true};
+function liba_253(a,b){var c=a+b*253;if(c>59)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_253={"id":253,"label":"liba-253","enabled":false};
+function liba_254(a,b){var c=a+b*254;if(c>60)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_254={"id":254,"label":"liba-254","enabled":true};
+function liba_255(a,b){var c=a+b*255;if(c>61)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_255={"id":255,"label":"liba-255","enabled":false};
+function liba_256(a,b){var c=a+b*256;if(c>62)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_256={"id":256,"label":"liba-256","enabled":true};
+function liba_257(a,b){var c=a+b*257;if(c>63)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_257={"id":257,"label":"liba-257","enabled":false};
+function liba_258(a,b){var c=a+b*258;if(c>64)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_258={"id":258,"label":"liba-258","enabled":true};
+function liba_259(a,b){var c=a+b*259;if(c>65)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_259={"id":259,"label":"liba-259","enabled":false};
+function liba_260(a,b){var c=a+b*260;if(c>66)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_260={"id":260,"label":"liba-260","enabled":true};
+function liba_261(a,b){var c=a+b*261;if(c>67)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_261={"id":261,"label":"liba-261","enabled":false};
+function liba_262(a,b){var c=a+b*262;if(c>68)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_262={"id":262,"label":"liba-262","enabled":true};
+function liba_263(a,b){var c=a+b*263;if(c>69)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_263={"id":263,"label":"liba-263","enabled":false};
+function liba_264(a,b){var c=a+b*264;if(c>70)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_264={"id":264,"label":"liba-264","enabled":true};
+function liba_265(a,b){var c=a+b*265;if(c>71)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_265={"id":265,"label":"liba-265","enabled":false};
+function liba_266(a,b){var c=a+b*266;if(c>72)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_266={"id":266,"label":"liba-266","enabled":true};
+function liba_267(a,b){var c=a+b*267;if(c>73)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_267={"id":267,"label":"liba-267","enabled":false};
+function liba_268(a,b){var c=a+b*268;if(c>74)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_268={"id":268,"label":"liba-268","enabled":true};
+function liba_269(a,b){var c=a+b*269;if(c>75)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_269={"id":269,"label":"liba-269","enabled":false};
+function liba_270(a,b){var c=a+b*270;if(c>76)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_270={"id":270,"label":"liba-270","enabled":true};
+function liba_271(a,b){var c=a+b*271;if(c>77)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_271={"id":271,"label":"liba-271","enabled":false};
+function liba_272(a,b){var c=a+b*272;if(c>78)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_272={"id":272,"label":"liba-272","enabled":true};
+function liba_273(a,b){var c=a+b*273;if(c>79)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_273={"id":273,"label":"liba-273","enabled":false};
+function liba_274(a,b){var c=a+b*274;if(c>80)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_274={"id":274,"label":"liba-274","enabled":true};
+function liba_275(a,b){var c=a+b*275;if(c>81)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_275={"id":275,"label":"liba-275","enabled":false};
+function liba_276(a,b){var c=a+b*276;if(c>82)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_276={"id":276,"label":"liba-276","enabled":true};
+function liba_277(a,b){var c=a+b*277;if(c>83)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_277={"id":277,"label":"liba-277","enabled":false};
+function liba_278(a,b){var c=a+b*278;if(c>84)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_278={"id":278,"label":"liba-278","enabled":true};
+function liba_279(a,b){var c=a+b*279;if(c>85)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_279={"id":279,"label":"liba-279","enabled":false};
+function liba_280(a,b){var c=a+b*280;if(c>86)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_280={"id":280,"label":"liba-280","enabled":true};
+function liba_281(a,b){var c=a+b*281;if(c>87)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_281={"id":281,"label":"liba-281","enabled":false};
+function liba_282(a,b){var c=a+b*282;if(c>88)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_282={"id":282,"label":"liba-282","enabled":true};
+function liba_283(a,b){var c=a+b*283;if(c>89)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_283={"id":283,"label":"liba-283","enabled":false};
+function liba_284(a,b){var c=a+b*284;if(c>90)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_284={"id":284,"label":"liba-284","enabled":true};
+function liba_285(a,b){var c=a+b*285;if(c>91)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_285={"id":285,"label":"liba-285","enabled":false};
+function liba_286(a,b){var c=a+b*286;if(c>92)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_286={"id":286,"label":"liba-286","enabled":true};
+function liba_287(a,b){var c=a+b*287;if(c>93)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_287={"id":287,"label":"liba-287","enabled":false};
+function liba_288(a,b){var c=a+b*288;if(c>94)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_288={"id":288,"label":"liba-288","enabled":true};
+function liba_289(a,b){var c=a+b*289;if(c>95)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_289={"id":289,"label":"liba-289","enabled":false};
+function liba_290(a,b){var c=a+b*290;if(c>96)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_290={"id":290,"label":"liba-290","enabled":true};
+function liba_291(a,b){var c=a+b*291;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_291={"id":291,"label":"liba-291","enabled":false};
+function liba_292(a,b){var c=a+b*292;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_292={"id":292,"label":"liba-292","enabled":true};
+function liba_293(a,b){var c=a+b*293;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_293={"id":293,"label":"liba-293","enabled":false};
+function liba_294(a,b){var c=a+b*294;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_294={"id":294,"label":"liba-294","enabled":true};
+function liba_295(a,b){var c=a+b*295;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_295={"id":295,"label":"liba-295","enabled":false};
+function liba_296(a,b){var c=a+b*296;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_296={"id":296,"label":"liba-296","enabled":true};
+function liba_297(a,b){var c=a+b*297;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_297={"id":297,"label":"liba-297","enabled":false};
+function liba_298(a,b){var c=a+b*298;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_298={"id":298,"label":"liba-298","enabled":true};
+function liba_299(a,b){var c=a+b*299;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_299={"id":299,"label":"liba-299","enabled":false};
+function liba_300(a,b){var c=a+b*300;if(c>9)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_300={"id":300,"label":"liba-300","enabled":true};
+function liba_301(a,b){var c=a+b*301;if(c>10)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_301={"id":301,"label":"liba-301","enabled":false};
+function liba_302(a,b){var c=a+b*302;if(c>11)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_302={"id":302,"label":"liba-302","enabled":true};
+function liba_303(a,b){var c=a+b*303;if(c>12)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_303={"id":303,"label":"liba-303","enabled":false};
+function liba_304(a,b){var c=a+b*304;if(c>13)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_304={"id":304,"label":"liba-304","enabled":true};
+function liba_305(a,b){var c=a+b*305;if(c>14)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_305={"id":305,"label":"liba-305","enabled":false};
+function liba_306(a,b){var c=a+b*306;if(c>15)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_306={"id":306,"label":"liba-306","enabled":true};
+function liba_307(a,b){var c=a+b*307;if(c>16)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_307={"id":307,"label":"liba-307","enabled":false};
+function liba_308(a,b){var c=a+b*308;if(c>17)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_308={"id":308,"label":"liba-308","enabled":true};
+function liba_309(a,b){var c=a+b*309;if(c>18)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_309={"id":309,"label":"liba-309","enabled":false};
+function liba_310(a,b){var c=a+b*310;if(c>19)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_310={"id":310,"label":"liba-310","enabled":true};
+function liba_311(a,b){var c=a+b*311;if(c>20)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_311={"id":311,"label":"liba-311","enabled":false};
+function liba_312(a,b){var c=a+b*312;if(c>21)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_312={"id":312,"label":"liba-312","enabled":true};
+function liba_313(a,b){var c=a+b*313;if(c>22)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_313={"id":313,"label":"liba-313","enabled":false};
+function liba_314(a,b){var c=a+b*314;if(c>23)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_314={"id":314,"label":"liba-314","enabled":true};
+function liba_315(a,b){var c=a+b*315;if(c>24)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_315={"id":315,"label":"liba-315","enabled":false};
+function liba_316(a,b){var c=a+b*316;if(c>25)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_316={"id":316,"label":"liba-316","enabled":true};
+function liba_317(a,b){var c=a+b*317;if(c>26)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_317={"id":317,"label":"liba-317","enabled":false};
+function liba_318(a,b){var c=a+b*318;if(c>27)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_318={"id":318,"label":"liba-318","enabled":true};
+function liba_319(a,b){var c=a+b*319;if(c>28)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_319={"id":319,"label":"liba-319","enabled":false};
+function liba_320(a,b){var c=a+b*320;if(c>29)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_320={"id":320,"label":"liba-320","enabled":true};
+function liba_321(a,b){var c=a+b*321;if(c>30)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_321={"id":321,"label":"liba-321","enabled":false};
+function liba_322(a,b){var c=a+b*322;if(c>31)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_322={"id":322,"label":"liba-322","enabled":true};
+function liba_323(a,b){var c=a+b*323;if(c>32)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_323={"id":323,"label":"liba-323","enabled":false};
+function liba_324(a,b){var c=a+b*324;if(c>33)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_324={"id":324,"label":"liba-324","enabled":true};
+function liba_325(a,b){var c=a+b*325;if(c>34)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_325={"id":325,"label":"liba-325","enabled":false};
+function liba_326(a,b){var c=a+b*326;if(c>35)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_326={"id":326,"label":"liba-326","enabled":true};
+function liba_327(a,b){var c=a+b*327;if(c>36)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_327={"id":327,"label":"liba-327","enabled":false};
+function liba_328(a,b){var c=a+b*328;if(c>37)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_328={"id":328,"label":"liba-328","enabled":true};
+function liba_329(a,b){var c=a+b*329;if(c>38)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_329={"id":329,"label":"liba-329","enabled":false};
+function liba_330(a,b){var c=a+b*330;if(c>39)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_330={"id":330,"label":"liba-330","enabled":true};
+function liba_331(a,b){var c=a+b*331;if(c>40)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_331={"id":331,"label":"liba-331","enabled":false};
+function liba_332(a,b){var c=a+b*332;if(c>41)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_332={"id":332,"label":"liba-332","enabled":true};
+function liba_333(a,b){var c=a+b*333;if(c>42)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_333={"id":333,"label":"liba-333","enabled":false};
+function liba_334(a,b){var c=a+b*334;if(c>43)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_334={"id":334,"label":"liba-334","enabled":true};
+function liba_335(a,b){var c=a+b*335;if(c>44)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_335={"id":335,"label":"liba-335","enabled":false};
+function liba_336(a,b){var c=a+b*336;if(c>45)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_336={"id":336,"label":"liba-336","enabled":true};
+function liba_337(a,b){var c=a+b*337;if(c>46)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_337={"id":337,"label":"liba-337","enabled":false};
+function liba_338(a,b){var c=a+b*338;if(c>47)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_338={"id":338,"label":"liba-338","enabled":true};
+function liba_339(a,b){var c=a+b*339;if(c>48)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_339={"id":339,"label":"liba-339","enabled":false};
+function liba_340(a,b){var c=a+b*340;if(c>49)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_340={"id":340,"label":"liba-340","enabled":true};
+function liba_341(a,b){var c=a+b*341;if(c>50)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_341={"id":341,"label":"liba-341","enabled":false};
+function liba_342(a,b){var c=a+b*342;if(c>51)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_342={"id":342,"label":"liba-342","enabled":true};
+function liba_343(a,b){var c=a+b*343;if(c>52)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_343={"id":343,"label":"liba-343","enabled":false};
+function liba_344(a,b){var c=a+b*344;if(c>53)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_344={"id":344,"label":"liba-344","enabled":true};
+function liba_345(a,b){var c=a+b*345;if(c>54)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_345={"id":345,"label":"liba-345","enabled":false};
+function liba_346(a,b){var c=a+b*346;if(c>55)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_346={"id":346,"label":"liba-346","enabled":true};
+function liba_347(a,b){var c=a+b*347;if(c>56)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_347={"id":347,"label":"liba-347","enabled":false};
+function liba_348(a,b){var c=a+b*348;if(c>57)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_348={"id":348,"label":"liba-348","enabled":true};
+function liba_349(a,b){var c=a+b*349;if(c>58)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_349={"id":349,"label":"liba-349","enabled":false};
+function liba_350(a,b){var c=a+b*350;if(c>59)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_350={"id":350,"label":"liba-350","enabled":true};
+function liba_351(a,b){var c=a+b*351;if(c>60)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_351={"id":351,"label":"liba-351","enabled":false};
+function liba_352(a,b){var c=a+b*352;if(c>61)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_352={"id":352,"label":"liba-352","enabled":true};
+function liba_353(a,b){var c=a+b*353;if(c>62)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_353={"id":353,"label":"liba-353","enabled":false};
+function liba_354(a,b){var c=a+b*354;if(c>63)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_354={"id":354,"label":"liba-354","enabled":true};
+function liba_355(a,b){var c=a+b*355;if(c>64)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_355={"id":355,"label":"liba-355","enabled":false};
+function liba_356(a,b){var c=a+b*356;if(c>65)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_356={"id":356,"label":"liba-356","enabled":true};
+function liba_357(a,b){var c=a+b*357;if(c>66)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_357={"id":357,"label":"liba-357","enabled":false};
+function liba_358(a,b){var c=a+b*358;if(c>67)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_358={"id":358,"label":"liba-358","enabled":true};
+function liba_359(a,b){var c=a+b*359;if(c>68)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_359={"id":359,"label":"liba-359","enabled":false};
+function liba_360(a,b){var c=a+b*360;if(c>69)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_360={"id":360,"label":"liba-360","enabled":true};
+function liba_361(a,b){var c=a+b*361;if(c>70)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_361={"id":361,"label":"liba-361","enabled":false};
+function liba_362(a,b){var c=a+b*362;if(c>71)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_362={"id":362,"label":"liba-362","enabled":true};
+function liba_363(a,b){var c=a+b*363;if(c>72)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_363={"id":363,"label":"liba-363","enabled":false};
+function liba_364(a,b){var c=a+b*364;if(c>73)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_364={"id":364,"label":"liba-364","enabled":true};
+function liba_365(a,b){var c=a+b*365;if(c>74)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_365={"id":365,"label":"liba-365","enabled":false};
+function liba_366(a,b){var c=a+b*366;if(c>75)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_366={"id":366,"label":"liba-366","enabled":true};
+function liba_367(a,b){var c=a+b*367;if(c>76)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_367={"id":367,"label":"liba-367","enabled":false};
+function liba_368(a,b){var c=a+b*368;if(c>77)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_368={"id":368,"label":"liba-368","enabled":true};
+function liba_369(a,b){var c=a+b*369;if(c>78)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_369={"id":369,"label":"liba-369","enabled":false};
+function liba_370(a,b){var c=a+b*370;if(c>79)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_370={"id":370,"label":"liba-370","enabled":true};
+function liba_371(a,b){var c=a+b*371;if(c>80)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_371={"id":371,"label":"liba-371","enabled":false};
+function liba_372(a,b){var c=a+b*372;if(c>81)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_372={"id":372,"label":"liba-372","enabled":true};
+function liba_373(a,b){var c=a+b*373;if(c>82)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_373={"id":373,"label":"liba-373","enabled":false};
+function liba_374(a,b){var c=a+b*374;if(c>83)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_374={"id":374,"label":"liba-374","enabled":true};
+function liba_375(a,b){var c=a+b*375;if(c>84)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_375={"id":375,"label":"liba-375","enabled":false};
+function liba_376(a,b){var c=a+b*376;if(c>85)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_376={"id":376,"label":"liba-376","enabled":true};
+function liba_377(a,b){var c=a+b*377;if(c>86)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_377={"id":377,"label":"liba-377","enabled":false};
+function liba_378(a,b){var c=a+b*378;if(c>87)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_378={"id":378,"label":"liba-378","enabled":true};
+function liba_379(a,b){var c=a+b*379;if(c>88)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_379={"id":379,"label":"liba-379","enabled":false};
+function liba_380(a,b){var c=a+b*380;if(c>89)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_380={"id":380,"label":"liba-380","enabled":true};
+function liba_381(a,b){var c=a+b*381;if(c>90)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_381={"id":381,"label":"liba-381","enabled":false};
+function liba_382(a,b){var c=a+b*382;if(c>91)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_382={"id":382,"label":"liba-382","enabled":true};
+function liba_383(a,b){var c=a+b*383;if(c>92)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_383={"id":383,"label":"liba-383","enabled":false};
+function liba_384(a,b){var c=a+b*384;if(c>93)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_384={"id":384,"label":"liba-384","enabled":true};
+function liba_385(a,b){var c=a+b*385;if(c>94)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_385={"id":385,"label":"liba-385","enabled":false};
+function liba_386(a,b){var c=a+b*386;if(c>95)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_386={"id":386,"label":"liba-386","enabled":true};
+function liba_387(a,b){var c=a+b*387;if(c>96)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_387={"id":387,"label":"liba-387","enabled":false};
+function liba_388(a,b){var c=a+b*388;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_388={"id":388,"label":"liba-388","enabled":true};
+function liba_389(a,b){var c=a+b*389;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_389={"id":389,"label":"liba-389","enabled":false};
+function liba_390(a,b){var c=a+b*390;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_390={"id":390,"label":"liba-390","enabled":true};
+function liba_391(a,b){var c=a+b*391;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_391={"id":391,"label":"liba-391","enabled":false};
+function liba_392(a,b){var c=a+b*392;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_392={"id":392,"label":"liba-392","enabled":true};
+function liba_393(a,b){var c=a+b*393;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_393={"id":393,"label":"liba-393","enabled":false};
+function liba_394(a,b){var c=a+b*394;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_394={"id":394,"label":"liba-394","enabled":true};
+function liba_395(a,b){var c=a+b*395;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_395={"id":395,"label":"liba-395","enabled":false};
+function liba_396(a,b){var c=a+b*396;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_396={"id":396,"label":"liba-396","enabled":true};
+function liba_397(a,b){var c=a+b*397;if(c>9)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_397={"id":397,"label":"liba-397","enabled":false};
+function liba_398(a,b){var c=a+b*398;if(c>10)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_398={"id":398,"label":"liba-398","enabled":true};
+function liba_399(a,b){var c=a+b*399;if(c>11)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_399={"id":399,"label":"liba-399","enabled":false};
+function liba_400(a,b){var c=a+b*400;if(c>12)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_400={"id":400,"label":"liba-400","enabled":true};
+function liba_401(a,b){var c=a+b*401;if(c>13)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_401={"id":401,"label":"liba-401","enabled":false};
+function liba_402(a,b){var c=a+b*402;if(c>14)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_402={"id":402,"label":"liba-402","enabled":true};
+function liba_403(a,b){var c=a+b*403;if(c>15)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_403={"id":403,"label":"liba-403","enabled":false};
+function liba_404(a,b){var c=a+b*404;if(c>16)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_404={"id":404,"label":"liba-404","enabled":true};
+function liba_405(a,b){var c=a+b*405;if(c>17)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_405={"id":405,"label":"liba-405","enabled":false};
+function liba_406(a,b){var c=a+b*406;if(c>18)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_406={"id":406,"label":"liba-406","enabled":true};
+function liba_407(a,b){var c=a+b*407;if(c>19)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_407={"id":407,"label":"liba-407","enabled":false};
+function liba_408(a,b){var c=a+b*408;if(c>20)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_408={"id":408,"label":"liba-408","enabled":true};
+function liba_409(a,b){var c=a+b*409;if(c>21)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_409={"id":409,"label":"liba-409","enabled":false};
+function liba_410(a,b){var c=a+b*410;if(c>22)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_410={"id":410,"label":"liba-410","enabled":true};
+function liba_411(a,b){var c=a+b*411;if(c>23)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_411={"id":411,"label":"liba-411","enabled":false};
+function liba_412(a,b){var c=a+b*412;if(c>24)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_412={"id":412,"label":"liba-412","enabled":true};
+function liba_413(a,b){var c=a+b*413;if(c>25)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_413={"id":413,"label":"liba-413","enabled":false};
+function liba_414(a,b){var c=a+b*414;if(c>26)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_414={"id":414,"label":"liba-414","enabled":true};
+function liba_415(a,b){var c=a+b*415;if(c>27)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_415={"id":415,"label":"liba-415","enabled":false};
+function liba_416(a,b){var c=a+b*416;if(c>28)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_416={"id":416,"label":"liba-416","enabled":true};
+function liba_417(a,b){var c=a+b*417;if(c>29)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_417={"id":417,"label":"liba-417","enabled":false};
+function liba_418(a,b){var c=a+b*418;if(c>30)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_418={"id":418,"label":"liba-418","enabled":true};
+function liba_419(a,b){var c=a+b*419;if(c>31)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_419={"id":419,"label":"liba-419","enabled":false};
+function liba_420(a,b){var c=a+b*420;if(c>32)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_420={"id":420,"label":"liba-420","enabled":true};
+function liba_421(a,b){var c=a+b*421;if(c>33)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_421={"id":421,"label":"liba-421","enabled":false};
+function liba_422(a,b){var c=a+b*422;if(c>34)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_422={"id":422,"label":"liba-422","enabled":true};
+function liba_423(a,b){var c=a+b*423;if(c>35)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_423={"id":423,"label":"liba-423","enabled":false};
+function liba_424(a,b){var c=a+b*424;if(c>36)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_424={"id":424,"label":"liba-424","enabled":true};
+function liba_425(a,b){var c=a+b*425;if(c>37)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_425={"id":425,"label":"liba-425","enabled":false};
+function liba_426(a,b){var c=a+b*426;if(c>38)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_426={"id":426,"label":"liba-426","enabled":true};
+function liba_427(a,b){var c=a+b*427;if(c>39)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_427={"id":427,"label":"liba-427","enabled":false};
+function liba_428(a,b){var c=a+b*428;if(c>40)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_428={"id":428,"label":"liba-428","enabled":true};
+function liba_429(a,b){var c=a+b*429;if(c>41)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_429={"id":429,"label":"liba-429","enabled":false};
+function liba_430(a,b){var c=a+b*430;if(c>42)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_430={"id":430,"label":"liba-430","enabled":true};
+function liba_431(a,b){var c=a+b*431;if(c>43)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_431={"id":431,"label":"liba-431","enabled":false};
+function liba_432(a,b){var c=a+b*432;if(c>44)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_432={"id":432,"label":"liba-432","enabled":true};
+function liba_433(a,b){var c=a+b*433;if(c>45)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_433={"id":433,"label":"liba-433","enabled":false};
+function liba_434(a,b){var c=a+b*434;if(c>46)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_434={"id":434,"label":"liba-434","enabled":true};
+function liba_435(a,b){var c=a+b*435;if(c>47)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_435={"id":435,"label":"liba-435","enabled":false};
+function liba_436(a,b){var c=a+b*436;if(c>48)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_436={"id":436,"label":"liba-436","enabled":true};
+function liba_437(a,b){var c=a+b*437;if(c>49)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_437={"id":437,"label":"liba-437","enabled":false};
+function liba_438(a,b){var c=a+b*438;if(c>50)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_438={"id":438,"label":"liba-438","enabled":true};
+function liba_439(a,b){var c=a+b*439;if(c>51)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_439={"id":439,"label":"liba-439","enabled":false};
+function liba_440(a,b){var c=a+b*440;if(c>52)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_440={"id":440,"label":"liba-440","enabled":true};
+function liba_441(a,b){var c=a+b*441;if(c>53)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_441={"id":441,"label":"liba-441","enabled":false};
+function liba_442(a,b){var c=a+b*442;if(c>54)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_442={"id":442,"label":"liba-442","enabled":true};
+function liba_443(a,b){var c=a+b*443;if(c>55)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_443={"id":443,"label":"liba-443","enabled":false};
+function liba_444(a,b){var c=a+b*444;if(c>56)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_444={"id":444,"label":"liba-444","enabled":true};
+function liba_445(a,b){var c=a+b*445;if(c>57)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_445={"id":445,"label":"liba-445","enabled":false};
+function liba_446(a,b){var c=a+b*446;if(c>58)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_446={"id":446,"label":"liba-446","enabled":true};
+function liba_447(a,b){var c=a+b*447;if(c>59)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_447={"id":447,"label":"liba-447","enabled":false};
+function liba_448(a,b){var c=a+b*448;if(c>60)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_448={"id":448,"label":"liba-448","enabled":true};
+function liba_449(a,b){var c=a+b*449;if(c>61)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_449={"id":449,"label":"liba-449","enabled":false};
+function liba_450(a,b){var c=a+b*450;if(c>62)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_450={"id":450,"label":"liba-450","enabled":true};
+function liba_451(a,b){var c=a+b*451;if(c>63)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_451={"id":451,"label":"liba-451","enabled":false};
+function liba_452(a,b){var c=a+b*452;if(c>64)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_452={"id":452,"label":"liba-452","enabled":true};
+function liba_453(a,b){var c=a+b*453;if(c>65)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_453={"id":453,"label":"liba-453","enabled":false};
+function liba_454(a,b){var c=a+b*454;if(c>66)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_454={"id":454,"label":"liba-454","enabled":true};
+function liba_455(a,b){var c=a+b*455;if(c>67)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_455={"id":455,"label":"liba-455","enabled":false};
+function liba_456(a,b){var c=a+b*456;if(c>68)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_456={"id":456,"label":"liba-456","enabled":true};
+function liba_457(a,b){var c=a+b*457;if(c>69)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_457={"id":457,"label":"liba-457","enabled":false};
+function liba_458(a,b){var c=a+b*458;if(c>70)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_458={"id":458,"label":"liba-458","enabled":true};
+function liba_459(a,b){var c=a+b*459;if(c>71)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_459={"id":459,"label":"liba-459","enabled":false};
+function liba_460(a,b){var c=a+b*460;if(c>72)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_460={"id":460,"label":"liba-460","enabled":true};
+function liba_461(a,b){var c=a+b*461;if(c>73)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_461={"id":461,"label":"liba-461","enabled":false};
+function liba_462(a,b){var c=a+b*462;if(c>74)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_462={"id":462,"label":"liba-462","enabled":true};
+function liba_463(a,b){var c=a+b*463;if(c>75)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_463={"id":463,"label":"liba-463","enabled":false};
+function liba_464(a,b){var c=a+b*464;if(c>76)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_464={"id":464,"label":"liba-464","enabled":true};
+function liba_465(a,b){var c=a+b*465;if(c>77)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_465={"id":465,"label":"liba-465","enabled":false};
+function liba_466(a,b){var c=a+b*466;if(c>78)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_466={"id":466,"label":"liba-466","enabled":true};
+function liba_467(a,b){var c=a+b*467;if(c>79)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_467={"id":467,"label":"liba-467","enabled":false};
+function liba_468(a,b){var c=a+b*468;if(c>80)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_468={"id":468,"label":"liba-468","enabled":true};
+function liba_469(a,b){var c=a+b*469;if(c>81)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_469={"id":469,"label":"liba-469","enabled":false};
+function liba_470(a,b){var c=a+b*470;if(c>82)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_470={"id":470,"label":"liba-470","enabled":true};
+function liba_471(a,b){var c=a+b*471;if(c>83)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_471={"id":471,"label":"liba-471","enabled":false};
+function liba_472(a,b){var c=a+b*472;if(c>84)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_472={"id":472,"label":"liba-472","enabled":true};
+function liba_473(a,b){var c=a+b*473;if(c>85)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_473={"id":473,"label":"liba-473","enabled":false};
+function liba_474(a,b){var c=a+b*474;if(c>86)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_474={"id":474,"label":"liba-474","enabled":true};
+function liba_475(a,b){var c=a+b*475;if(c>87)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_475={"id":475,"label":"liba-475","enabled":false};
+function liba_476(a,b){var c=a+b*476;if(c>88)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_476={"id":476,"label":"liba-476","enabled":true};
+function liba_477(a,b){var c=a+b*477;if(c>89)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_477={"id":477,"label":"liba-477","enabled":false};
+function liba_478(a,b){var c=a+b*478;if(c>90)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_478={"id":478,"label":"liba-478","enabled":true};
+function liba_479(a,b){var c=a+b*479;if(c>91)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_479={"id":479,"label":"liba-479","enabled":false};
+function liba_480(a,b){var c=a+b*480;if(c>92)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_480={"id":480,"label":"liba-480","enabled":true};
+function liba_481(a,b){var c=a+b*481;if(c>93)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_481={"id":481,"label":"liba-481","enabled":false};
+function liba_482(a,b){var c=a+b*482;if(c>94)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_482={"id":482,"label":"liba-482","enabled":true};
+function liba_483(a,b){var c=a+b*483;if(c>95)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_483={"id":483,"label":"liba-483","enabled":false};
+function liba_484(a,b){var c=a+b*484;if(c>96)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_484={"id":484,"label":"liba-484","enabled":true};
+function liba_485(a,b){var c=a+b*485;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_485={"id":485,"label":"liba-485","enabled":false};
+function liba_486(a,b){var c=a+b*486;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_486={"id":486,"label":"liba-486","enabled":true};
+function liba_487(a,b){var c=a+b*487;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_487={"id":487,"label":"liba-487","enabled":false};
+function liba_488(a,b){var c=a+b*488;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_488={"id":488,"label":"liba-488","enabled":true};
+function liba_489(a,b){var c=a+b*489;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_489={"id":489,"label":"liba-489","enabled":false};
+function liba_490(a,b){var c=a+b*490;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_490={"id":490,"label":"liba-490","enabled":true};
+function liba_491(a,b){var c=a+b*491;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_491={"id":491,"label":"liba-491","enabled":false};
+function liba_492(a,b){var c=a+b*492;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_492={"id":492,"label":"liba-492","enabled":true};
+function liba_493(a,b){var c=a+b*493;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_493={"id":493,"label":"liba-493","enabled":false};
+function liba_494(a,b){var c=a+b*494;if(c>9)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_494={"id":494,"label":"liba-494","enabled":true};
+function liba_495(a,b){var c=a+b*495;if(c>10)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_495={"id":495,"label":"liba-495","enabled":false};
+function liba_496(a,b){var c=a+b*496;if(c>11)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_496={"id":496,"label":"liba-496","enabled":true};
+function liba_497(a,b){var c=a+b*497;if(c>12)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_497={"id":497,"label":"liba-497","enabled":false};
+function liba_498(a,b){var c=a+b*498;if(c>13)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_498={"id":498,"label":"liba-498","enabled":true};
+function liba_499(a,b){var c=a+b*499;if(c>14)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_499={"id":499,"label":"liba-499","enabled":false};
+function liba_500(a,b){var c=a+b*500;if(c>15)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_500={"id":500,"label":"liba-500","enabled":true};
+function liba_501(a,b){var c=a+b*501;if(c>16)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_501={"id":501,"label":"liba-501","enabled":false};
+function liba_502(a,b){var c=a+b*502;if(c>17)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_502={"id":502,"label":"liba-502","enabled":true};
+function liba_503(a,b){var c=a+b*503;if(c>18)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_503={"id":503,"label":"liba-503","enabled":false};
+function liba_504(a,b){var c=a+b*504;if(c>19)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_504={"id":504,"label":"liba-504","enabled":true};
+function liba_505(a,b){var c=a+b*505;if(c>20)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_505={"id":505,"label":"liba-505","enabled":false};
+function liba_506(a,b){var c=a+b*506;if(c>21)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_506={"id":506,"label":"liba-506","enabled":true};
+function liba_507(a,b){var c=a+b*507;if(c>22)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_507={"id":507,"label":"liba-507","enabled":false};
+function liba_508(a,b){var c=a+b*508;if(c>23)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_508={"id":508,"label":"liba-508","enabled":true};
+function liba_509(a,b){var c=a+b*509;if(c>24)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_509={"id":509,"label":"liba-509","enabled":false};
+function liba_510(a,b){var c=a+b*510;if(c>25)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_510={"id":510,"label":"liba-510","enabled":true};
+function liba_511(a,b){var c=a+b*511;if(c>26)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_511={"id":511,"label":"liba-511","enabled":false};
+function liba_512(a,b){var c=a+b*512;if(c>27)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_512={"id":512,"label":"liba-512","enabled":true};
+function liba_513(a,b){var c=a+b*513;if(c>28)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_513={"id":513,"label":"liba-513","enabled":false};
+function liba_514(a,b){var c=a+b*514;if(c>29)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_514={"id":514,"label":"liba-514","enabled":true};
+function liba_515(a,b){var c=a+b*515;if(c>30)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_515={"id":515,"label":"liba-515","enabled":false};
+function liba_516(a,b){var c=a+b*516;if(c>31)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_516={"id":516,"label":"liba-516","enabled":true};
+function liba_517(a,b){var c=a+b*517;if(c>32)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_517={"id":517,"label":"liba-517","enabled":false};
+function liba_518(a,b){var c=a+b*518;if(c>33)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_518={"id":518,"label":"liba-518","enabled":true};
+function liba_519(a,b){var c=a+b*519;if(c>34)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_519={"id":519,"label":"liba-519","enabled":false};
+function liba_520(a,b){var c=a+b*520;if(c>35)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_520={"id":520,"label":"liba-520","enabled":true};
+function liba_521(a,b){var c=a+b*521;if(c>36)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_521={"id":521,"label":"liba-521","enabled":false};
+function liba_522(a,b){var c=a+b*522;if(c>37)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_522={"id":522,"label":"liba-522","enabled":true};
+function liba_523(a,b){var c=a+b*523;if(c>38)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_523={"id":523,"label":"liba-523","enabled":false};
+function liba_524(a,b){var c=a+b*524;if(c>39)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_524={"id":524,"label":"liba-524","enabled":true};
+function liba_525(a,b){var c=a+b*525;if(c>40)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_525={"id":525,"label":"liba-525","enabled":false};
+function liba_526(a,b){var c=a+b*526;if(c>41)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_526={"id":526,"label":"liba-526","enabled":true};
+function liba_527(a,b){var c=a+b*527;if(c>42)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_527={"id":527,"label":"liba-527","enabled":false};
+function liba_528(a,b){var c=a+b*528;if(c>43)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_528={"id":528,"label":"liba-528","enabled":true};
+function liba_529(a,b){var c=a+b*529;if(c>44)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_529={"id":529,"label":"liba-529","enabled":false};
+function liba_530(a,b){var c=a+b*530;if(c>45)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_530={"id":530,"label":"liba-530","enabled":true};
+function liba_531(a,b){var c=a+b*531;if(c>46)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_531={"id":531,"label":"liba-531","enabled":false};
+function liba_532(a,b){var c=a+b*532;if(c>47)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_532={"id":532,"label":"liba-532","enabled":true};
+function liba_533(a,b){var c=a+b*533;if(c>48)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_533={"id":533,"label":"liba-533","enabled":false};
+function liba_534(a,b){var c=a+b*534;if(c>49)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_534={"id":534,"label":"liba-534","enabled":true};
+function liba_535(a,b){var c=a+b*535;if(c>50)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_535={"id":535,"label":"liba-535","enabled":false};
+function liba_536(a,b){var c=a+b*536;if(c>51)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_536={"id":536,"label":"liba-536","enabled":true};
+function liba_537(a,b){var c=a+b*537;if(c>52)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_537={"id":537,"label":"liba-537","enabled":false};
+function liba_538(a,b){var c=a+b*538;if(c>53)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_538={"id":538,"label":"liba-538","enabled":true};
+function liba_539(a,b){var c=a+b*539;if(c>54)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_539={"id":539,"label":"liba-539","enabled":false};
+function liba_540(a,b){var c=a+b*540;if(c>55)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_540={"id":540,"label":"liba-540","enabled":true};
+function liba_541(a,b){var c=a+b*541;if(c>56)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_541={"id":541,"label":"liba-541","enabled":false};
+function liba_542(a,b){var c=a+b*542;if(c>57)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_542={"id":542,"label":"liba-542","enabled":true};
+function liba_543(a,b){var c=a+b*543;if(c>58)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_543={"id":543,"label":"liba-543","enabled":false};
+function liba_544(a,b){var c=a+b*544;if(c>59)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_544={"id":544,"label":"liba-544","enabled":true};
+function liba_545(a,b){var c=a+b*545;if(c>60)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_545={"id":545,"label":"liba-545","enabled":false};
+function liba_546(a,b){var c=a+b*546;if(c>61)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_546={"id":546,"label":"liba-546","enabled":true};
+function liba_547(a,b){var c=a+b*547;if(c>62)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_547={"id":547,"label":"liba-547","enabled":false};
+function liba_548(a,b){var c=a+b*548;if(c>63)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_548={"id":548,"label":"liba-548","enabled":true};
+function liba_549(a,b){var c=a+b*549;if(c>64)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_549={"id":549,"label":"liba-549","enabled":false};
+function liba_550(a,b){var c=a+b*550;if(c>65)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_550={"id":550,"label":"liba-550","enabled":true};
+function liba_551(a,b){var c=a+b*551;if(c>66)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_551={"id":551,"label":"liba-551","enabled":false};
+function liba_552(a,b){var c=a+b*552;if(c>67)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_552={"id":552,"label":"liba-552","enabled":true};
+function liba_553(a,b){var c=a+b*553;if(c>68)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_553={"id":553,"label":"liba-553","enabled":false};
+function liba_554(a,b){var c=a+b*554;if(c>69)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_554={"id":554,"label":"liba-554","enabled":true};
+function liba_555(a,b){var c=a+b*555;if(c>70)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_555={"id":555,"label":"liba-555","enabled":false};
+function liba_556(a,b){var c=a+b*556;if(c>71)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_556={"id":556,"label":"liba-556","enabled":true};
+function liba_557(a,b){var c=a+b*557;if(c>72)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_557={"id":557,"label":"liba-557","enabled":false};
+function liba_558(a,b){var c=a+b*558;if(c>73)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_558={"id":558,"label":"liba-558","enabled":true};
+function liba_559(a,b){var c=a+b*559;if(c>74)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_559={"id":559,"label":"liba-559","enabled":false};
+function liba_560(a,b){var c=a+b*560;if(c>75)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_560={"id":560,"label":"liba-560","enabled":true};
+function liba_561(a,b){var c=a+b*561;if(c>76)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_561={"id":561,"label":"liba-561","enabled":false};
+function liba_562(a,b){var c=a+b*562;if(c>77)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_562={"id":562,"label":"liba-562","enabled":true};
+function liba_563(a,b){var c=a+b*563;if(c>78)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_563={"id":563,"label":"liba-563","enabled":false};
+function liba_564(a,b){var c=a+b*564;if(c>79)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_564={"id":564,"label":"liba-564","enabled":true};
+function liba_565(a,b){var c=a+b*565;if(c>80)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_565={"id":565,"label":"liba-565","enabled":false};
+function liba_566(a,b){var c=a+b*566;if(c>81)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_566={"id":566,"label":"liba-566","enabled":true};
+function liba_567(a,b){var c=a+b*567;if(c>82)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_567={"id":567,"label":"liba-567","enabled":false};
+function liba_568(a,b){var c=a+b*568;if(c>83)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_568={"id":568,"label":"liba-568","enabled":true};
+function liba_569(a,b){var c=a+b*569;if(c>84)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_569={"id":569,"label":"liba-569","enabled":false};
+function liba_570(a,b){var c=a+b*570;if(c>85)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_570={"id":570,"label":"liba-570","enabled":true};
+function liba_571(a,b){var c=a+b*571;if(c>86)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_571={"id":571,"label":"liba-571","enabled":false};
+function liba_572(a,b){var c=a+b*572;if(c>87)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_572={"id":572,"label":"liba-572","enabled":true};
+function liba_573(a,b){var c=a+b*573;if(c>88)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_573={"id":573,"label":"liba-573","enabled":false};
+function liba_574(a,b){var c=a+b*574;if(c>89)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_574={"id":574,"label":"liba-574","enabled":true};
+function liba_575(a,b){var c=a+b*575;if(c>90)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_575={"id":575,"label":"liba-575","enabled":false};
+function liba_576(a,b){var c=a+b*576;if(c>91)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_576={"id":576,"label":"liba-576","enabled":true};
+function liba_577(a,b){var c=a+b*577;if(c>92)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_577={"id":577,"label":"liba-577","enabled":false};
+function liba_578(a,b){var c=a+b*578;if(c>93)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_578={"id":578,"label":"liba-578","enabled":true};
+function liba_579(a,b){var c=a+b*579;if(c>94)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_579={"id":579,"label":"liba-579","enabled":false};
+function liba_580(a,b){var c=a+b*580;if(c>95)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_580={"id":580,"label":"liba-580","enabled":true};
+function liba_581(a,b){var c=a+b*581;if(c>96)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_581={"id":581,"label":"liba-581","enabled":false};
+function liba_582(a,b){var c=a+b*582;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_582={"id":582,"label":"liba-582","enabled":true};
+function liba_583(a,b){var c=a+b*583;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_583={"id":583,"label":"liba-583","enabled":false};
+function liba_584(a,b){var c=a+b*584;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_584={"id":584,"label":"liba-584","enabled":true};
+function liba_585(a,b){var c=a+b*585;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_585={"id":585,"label":"liba-585","enabled":false};
+function liba_586(a,b){var c=a+b*586;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_586={"id":586,"label":"liba-586","enabled":true};
+function liba_587(a,b){var c=a+b*587;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_587={"id":587,"label":"liba-587","enabled":false};
+function liba_588(a,b){var c=a+b*588;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_588={"id":588,"label":"liba-588","enabled":true};
+function liba_589(a,b){var c=a+b*589;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_589={"id":589,"label":"liba-589","enabled":false};
+function liba_590(a,b){var c=a+b*590;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_590={"id":590,"label":"liba-590","enabled":true};
+function liba_591(a,b){var c=a+b*591;if(c>9)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_591={"id":591,"label":"liba-591","enabled":false};
+function liba_592(a,b){var c=a+b*592;if(c>10)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_592={"id":592,"label":"liba-592","enabled":true};
+function liba_593(a,b){var c=a+b*593;if(c>11)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_593={"id":593,"label":"liba-593","enabled":false};
+function liba_594(a,b){var c=a+b*594;if(c>12)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_594={"id":594,"label":"liba-594","enabled":true};
+function liba_595(a,b){var c=a+b*595;if(c>13)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_595={"id":595,"label":"liba-595","enabled":false};
+function liba_596(a,b){var c=a+b*596;if(c>14)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_596={"id":596,"label":"liba-596","enabled":true};
+function liba_597(a,b){var c=a+b*597;if(c>15)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_597={"id":597,"label":"liba-597","enabled":false};
+function liba_598(a,b){var c=a+b*598;if(c>16)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_598={"id":598,"label":"liba-598","enabled":true};
+function liba_599(a,b){var c=a+b*599;if(c>17)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_599={"id":599,"label":"liba-599","enabled":false};
+function liba_600(a,b){var c=a+b*600;if(c>18)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_600={"id":600,"label":"liba-600","enabled":true};
+function liba_601(a,b){var c=a+b*601;if(c>19)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_601={"id":601,"label":"liba-601","enabled":false};
+function liba_602(a,b){var c=a+b*602;if(c>20)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_602={"id":602,"label":"liba-602","enabled":true};
+function liba_603(a,b){var c=a+b*603;if(c>21)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_603={"id":603,"label":"liba-603","enabled":false};
+function liba_604(a,b){var c=a+b*604;if(c>22)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_604={"id":604,"label":"liba-604","enabled":true};
+function liba_605(a,b){var c=a+b*605;if(c>23)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_605={"id":605,"label":"liba-605","enabled":false};
+function liba_606(a,b){var c=a+b*606;if(c>24)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_606={"id":606,"label":"liba-606","enabled":true};
+function liba_607(a,b){var c=a+b*607;if(c>25)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_607={"id":607,"label":"liba-607","enabled":false};
+function liba_608(a,b){var c=a+b*608;if(c>26)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_608={"id":608,"label":"liba-608","enabled":true};
+function liba_609(a,b){var c=a+b*609;if(c>27)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_609={"id":609,"label":"liba-609","enabled":false};
+function liba_610(a,b){var c=a+b*610;if(c>28)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_610={"id":610,"label":"liba-610","enabled":true};
+function liba_611(a,b){var c=a+b*611;if(c>29)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_611={"id":611,"label":"liba-611","enabled":false};
+function liba_612(a,b){var c=a+b*612;if(c>30)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_612={"id":612,"label":"liba-612","enabled":true};
+function liba_613(a,b){var c=a+b*613;if(c>31)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_613={"id":613,"label":"liba-613","enabled":false};
+function liba_614(a,b){var c=a+b*614;if(c>32)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_614={"id":614,"label":"liba-614","enabled":true};
+function liba_615(a,b){var c=a+b*615;if(c>33)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_615={"id":615,"label":"liba-615","enabled":false};
+function liba_616(a,b){var c=a+b*616;if(c>34)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_616={"id":616,"label":"liba-616","enabled":true};
+function liba_617(a,b){var c=a+b*617;if(c>35)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_617={"id":617,"label":"liba-617","enabled":false};
+function liba_618(a,b){var c=a+b*618;if(c>36)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_618={"id":618,"label":"liba-618","enabled":true};
+function liba_619(a,b){var c=a+b*619;if(c>37)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_619={"id":619,"label":"liba-619","enabled":false};
+function liba_620(a,b){var c=a+b*620;if(c>38)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_620={"id":620,"label":"liba-620","enabled":true};
+function liba_621(a,b){var c=a+b*621;if(c>39)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_621={"id":621,"label":"liba-621","enabled":false};
+function liba_622(a,b){var c=a+b*622;if(c>40)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_622={"id":622,"label":"liba-622","enabled":true};
+function liba_623(a,b){var c=a+b*623;if(c>41)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_623={"id":623,"label":"liba-623","enabled":false};
+function liba_624(a,b){var c=a+b*624;if(c>42)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_624={"id":624,"label":"liba-624","enabled":true};
+function liba_625(a,b){var c=a+b*625;if(c>43)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_625={"id":625,"label":"liba-625","enabled":false};
+function liba_626(a,b){var c=a+b*626;if(c>44)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_626={"id":626,"label":"liba-626","enabled":true};
+function liba_627(a,b){var c=a+b*627;if(c>45)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_627={"id":627,"label":"liba-627","enabled":false};
+function liba_628(a,b){var c=a+b*628;if(c>46)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_628={"id":628,"label":"liba-628","enabled":true};
+function liba_629(a,b){var c=a+b*629;if(c>47)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_629={"id":629,"label":"liba-629","enabled":false};
+function liba_630(a,b){var c=a+b*630;if(c>48)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_630={"id":630,"label":"liba-630","enabled":true};
+function liba_631(a,b){var c=a+b*631;if(c>49)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_631={"id":631,"label":"liba-631","enabled":false};
+function liba_632(a,b){var c=a+b*632;if(c>50)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_632={"id":632,"label":"liba-632","enabled":true};
+function liba_633(a,b){var c=a+b*633;if(c>51)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_633={"id":633,"label":"liba-633","enabled":false};
+function liba_634(a,b){var c=a+b*634;if(c>52)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_634={"id":634,"label":"liba-634","enabled":true};
+function liba_635(a,b){var c=a+b*635;if(c>53)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_635={"id":635,"label":"liba-635","enabled":false};
+function liba_636(a,b){var c=a+b*636;if(c>54)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_636={"id":636,"label":"liba-636","enabled":true};
+function liba_637(a,b){var c=a+b*637;if(c>55)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_637={"id":637,"label":"liba-637","enabled":false};
+function liba_638(a,b){var c=a+b*638;if(c>56)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_638={"id":638,"label":"liba-638","enabled":true};
+function liba_639(a,b){var c=a+b*639;if(c>57)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_639={"id":639,"label":"liba-639","enabled":false};
+function liba_640(a,b){var c=a+b*640;if(c>58)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_640={"id":640,"label":"liba-640","enabled":true};
+function liba_641(a,b){var c=a+b*641;if(c>59)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_641={"id":641,"label":"liba-641","enabled":false};
+function liba_642(a,b){var c=a+b*642;if(c>60)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_642={"id":642,"label":"liba-642","enabled":true};
+function liba_643(a,b){var c=a+b*643;if(c>61)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_643={"id":643,"label":"liba-643","enabled":false};
+function liba_644(a,b){var c=a+b*644;if(c>62)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_644={"id":644,"label":"liba-644","enabled":true};
+function liba_645(a,b){var c=a+b*645;if(c>63)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_645={"id":645,"label":"liba-645","enabled":false};
+function liba_646(a,b){var c=a+b*646;if(c>64)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_646={"id":646,"label":"liba-646","enabled":true};
+function liba_647(a,b){var c=a+b*647;if(c>65)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_647={"id":647,"label":"liba-647","enabled":false};
+function liba_648(a,b){var c=a+b*648;if(c>66)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_648={"id":648,"label":"liba-648","enabled":true};
+function liba_649(a,b){var c=a+b*649;if(c>67)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_649={"id":649,"label":"liba-649","enabled":false};
+function liba_650(a,b){var c=a+b*650;if(c>68)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_650={"id":650,"label":"liba-650","enabled":true};
+function liba_651(a,b){var c=a+b*651;if(c>69)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_651={"id":651,"label":"liba-651","enabled":false};
+function liba_652(a,b){var c=a+b*652;if(c>70)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_652={"id":652,"label":"liba-652","enabled":true};
+function liba_653(a,b){var c=a+b*653;if(c>71)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_653={"id":653,"label":"liba-653","enabled":false};
+function liba_654(a,b){var c=a+b*654;if(c>72)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_654={"id":654,"label":"liba-654","enabled":true};
+function liba_655(a,b){var c=a+b*655;if(c>73)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_655={"id":655,"label":"liba-655","enabled":false};
+function liba_656(a,b){var c=a+b*656;if(c>74)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_656={"id":656,"label":"liba-656","enabled":true};
+function liba_657(a,b){var c=a+b*657;if(c>75)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_657={"id":657,"label":"liba-657","enabled":false};
+function liba_658(a,b){var c=a+b*658;if(c>76)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_658={"id":658,"label":"liba-658","enabled":true};
+function liba_659(a,b){var c=a+b*659;if(c>77)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_659={"id":659,"label":"liba-659","enabled":false};
+function liba_660(a,b){var c=a+b*660;if(c>78)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_660={"id":660,"label":"liba-660","enabled":true};
+function liba_661(a,b){var c=a+b*661;if(c>79)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_661={"id":661,"label":"liba-661","enabled":false};
+function liba_662(a,b){var c=a+b*662;if(c>80)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_662={"id":662,"label":"liba-662","enabled":true};
+function liba_663(a,b){var c=a+b*663;if(c>81)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_663={"id":663,"label":"liba-663","enabled":false};
+function liba_664(a,b){var c=a+b*664;if(c>82)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_664={"id":664,"label":"liba-664","enabled":true};
+function liba_665(a,b){var c=a+b*665;if(c>83)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_665={"id":665,"label":"liba-665","enabled":false};
+function liba_666(a,b){var c=a+b*666;if(c>84)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_666={"id":666,"label":"liba-666","enabled":true};
+function liba_667(a,b){var c=a+b*667;if(c>85)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_667={"id":667,"label":"liba-667","enabled":false};
+function liba_668(a,b){var c=a+b*668;if(c>86)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_668={"id":668,"label":"liba-668","enabled":true};
+function liba_669(a,b){var c=a+b*669;if(c>87)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_669={"id":669,"label":"liba-669","enabled":false};
+function liba_670(a,b){var c=a+b*670;if(c>88)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_670={"id":670,"label":"liba-670","enabled":true};
+function liba_671(a,b){var c=a+b*671;if(c>89)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_671={"id":671,"label":"liba-671","enabled":false};
+function liba_672(a,b){var c=a+b*672;if(c>90)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_672={"id":672,"label":"liba-672","enabled":true};
+function liba_673(a,b){var c=a+b*673;if(c>91)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_673={"id":673,"label":"liba-673","enabled":false};
+function liba_674(a,b){var c=a+b*674;if(c>92)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_674={"id":674,"label":"liba-674","enabled":true};
+function liba_675(a,b){var c=a+b*675;if(c>93)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_675={"id":675,"label":"liba-675","enabled":false};
+function liba_676(a,b){var c=a+b*676;if(c>94)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_676={"id":676,"label":"liba-676","enabled":true};
+function liba_677(a,b){var c=a+b*677;if(c>95)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_677={"id":677,"label":"liba-677","enabled":false};
+function liba_678(a,b){var c=a+b*678;if(c>96)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_678={"id":678,"label":"liba-678","enabled":true};
+function liba_679(a,b){var c=a+b*679;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_679={"id":679,"label":"liba-679","enabled":false};
+function liba_680(a,b){var c=a+b*680;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_680={"id":680,"label":"liba-680","enabled":true};
+function liba_681(a,b){var c=a+b*681;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_681={"id":681,"label":"liba-681","enabled":false};
+function liba_682(a,b){var c=a+b*682;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_682={"id":682,"label":"liba-682","enabled":true};
+function liba_683(a,b){var c=a+b*683;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_683={"id":683,"label":"liba-683","enabled":false};
+function liba_684(a,b){var c=a+b*684;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_684={"id":684,"label":"liba-684","enabled":true};
+function liba_685(a,b){var c=a+b*685;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_685={"id":685,"label":"liba-685","enabled":false};
+function liba_686(a,b){var c=a+b*686;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_686={"id":686,"label":"liba-686","enabled":true};
+function liba_687(a,b){var c=a+b*687;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_687={"id":687,"label":"liba-687","enabled":false};
+function liba_688(a,b){var c=a+b*688;if(c>9)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_688={"id":688,"label":"liba-688","enabled":true};
+function liba_689(a,b){var c=a+b*689;if(c>10)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_689={"id":689,"label":"liba-689","enabled":false};
+function liba_690(a,b){var c=a+b*690;if(c>11)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_690={"id":690,"label":"liba-690","enabled":true};
+function liba_691(a,b){var c=a+b*691;if(c>12)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_691={"id":691,"label":"liba-691","enabled":false};
+function liba_692(a,b){var c=a+b*692;if(c>13)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_692={"id":692,"label":"liba-692","enabled":true};
+function liba_693(a,b){var c=a+b*693;if(c>14)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_693={"id":693,"label":"liba-693","enabled":false};
+function liba_694(a,b){var c=a+b*694;if(c>15)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_694={"id":694,"label":"liba-694","enabled":true};
+function liba_695(a,b){var c=a+b*695;if(c>16)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_695={"id":695,"label":"liba-695","enabled":false};
+function liba_696(a,b){var c=a+b*696;if(c>17)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_696={"id":696,"label":"liba-696","enabled":true};
+function liba_697(a,b){var c=a+b*697;if(c>18)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_697={"id":697,"label":"liba-697","enabled":false};
+function liba_698(a,b){var c=a+b*698;if(c>19)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_698={"id":698,"label":"liba-698","enabled":true};
+function liba_699(a,b){var c=a+b*699;if(c>20)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_699={"id":699,"label":"liba-699","enabled":false};
+function liba_700(a,b){var c=a+b*700;if(c>21)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_700={"id":700,"label":"liba-700","enabled":true};
+function liba_701(a,b){var c=a+b*701;if(c>22)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_701={"id":701,"label":"liba-701","enabled":false};
+function liba_702(a,b){var c=a+b*702;if(c>23)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_702={"id":702,"label":"liba-702","enabled":true};
+function liba_703(a,b){var c=a+b*703;if(c>24)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_703={"id":703,"label":"liba-703","enabled":false};
+function liba_704(a,b){var c=a+b*704;if(c>25)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_704={"id":704,"label":"liba-704","enabled":true};
+function liba_705(a,b){var c=a+b*705;if(c>26)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_705={"id":705,"label":"liba-705","enabled":false};
+function liba_706(a,b){var c=a+b*706;if(c>27)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_706={"id":706,"label":"liba-706","enabled":true};
+function liba_707(a,b){var c=a+b*707;if(c>28)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_707={"id":707,"label":"liba-707","enabled":false};
+function liba_708(a,b){var c=a+b*708;if(c>29)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_708={"id":708,"label":"liba-708","enabled":true};
+function liba_709(a,b){var c=a+b*709;if(c>30)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_709={"id":709,"label":"liba-709","enabled":false};
+function liba_710(a,b){var c=a+b*710;if(c>31)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_710={"id":710,"label":"liba-710","enabled":true};
+function liba_711(a,b){var c=a+b*711;if(c>32)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_711={"id":711,"label":"liba-711","enabled":false};
+function liba_712(a,b){var c=a+b*712;if(c>33)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_712={"id":712,"label":"liba-712","enabled":true};
+function liba_713(a,b){var c=a+b*713;if(c>34)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_713={"id":713,"label":"liba-713","enabled":false};
+function liba_714(a,b){var c=a+b*714;if(c>35)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_714={"id":714,"label":"liba-714","enabled":true};
+function liba_715(a,b){var c=a+b*715;if(c>36)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_715={"id":715,"label":"liba-715","enabled":false};
+function liba_716(a,b){var c=a+b*716;if(c>37)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_716={"id":716,"label":"liba-716","enabled":true};
+function liba_717(a,b){var c=a+b*717;if(c>38)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_717={"id":717,"label":"liba-717","enabled":false};
+function liba_718(a,b){var c=a+b*718;if(c>39)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_718={"id":718,"label":"liba-718","enabled":true};
+function liba_719(a,b){var c=a+b*719;if(c>40)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_719={"id":719,"label":"liba-719","enabled":false};
+function liba_720(a,b){var c=a+b*720;if(c>41)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_720={"id":720,"label":"liba-720","enabled":true};
+function liba_721(a,b){var c=a+b*721;if(c>42)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_721={"id":721,"label":"liba-721","enabled":false};
+function liba_722(a,b){var c=a+b*722;if(c>43)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_722={"id":722,"label":"liba-722","enabled":true};
+function liba_723(a,b){var c=a+b*723;if(c>44)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_723={"id":723,"label":"liba-723","enabled":false};
+function liba_724(a,b){var c=a+b*724;if(c>45)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_724={"id":724,"label":"liba-724","enabled":true};
+function liba_725(a,b){var c=a+b*725;if(c>46)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_725={"id":725,"label":"liba-725","enabled":false};
+function liba_726(a,b){var c=a+b*726;if(c>47)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_726={"id":726,"label":"liba-726","enabled":true};
+function liba_727(a,b){var c=a+b*727;if(c>48)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_727={"id":727,"label":"liba-727","enabled":false};
+function liba_728(a,b){var c=a+b*728;if(c>49)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_728={"id":728,"label":"liba-728","enabled":true};
+function liba_729(a,b){var c=a+b*729;if(c>50)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_729={"id":729,"label":"liba-729","enabled":false};
+function liba_730(a,b){var c=a+b*730;if(c>51)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_730={"id":730,"label":"liba-730","enabled":true};
+function liba_731(a,b){var c=a+b*731;if(c>52)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_731={"id":731,"label":"liba-731","enabled":false};
+function liba_732(a,b){var c=a+b*732;if(c>53)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_732={"id":732,"label":"liba-732","enabled":true};
+function liba_733(a,b){var c=a+b*733;if(c>54)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_733={"id":733,"label":"liba-733","enabled":false};
+function liba_734(a,b){var c=a+b*734;if(c>55)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_734={"id":734,"label":"liba-734","enabled":true};
+function liba_735(a,b){var c=a+b*735;if(c>56)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_735={"id":735,"label":"liba-735","enabled":false};
+function liba_736(a,b){var c=a+b*736;if(c>57)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_736={"id":736,"label":"liba-736","enabled":true};
+function liba_737(a,b){var c=a+b*737;if(c>58)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_737={"id":737,"label":"liba-737","enabled":false};
+function liba_738(a,b){var c=a+b*738;if(c>59)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_738={"id":738,"label":"liba-738","enabled":true};
+function liba_739(a,b){var c=a+b*739;if(c>60)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_739={"id":739,"label":"liba-739","enabled":false};
+function liba_740(a,b){var c=a+b*740;if(c>61)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_740={"id":740,"label":"liba-740","enabled":true};
+function liba_741(a,b){var c=a+b*741;if(c>62)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_741={"id":741,"label":"liba-741","enabled":false};
+function liba_742(a,b){var c=a+b*742;if(c>63)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_742={"id":742,"label":"liba-742","enabled":true};
+function liba_743(a,b){var c=a+b*743;if(c>64)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_743={"id":743,"label":"liba-743","enabled":false};
+function liba_744(a,b){var c=a+b*744;if(c>65)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_744={"id":744,"label":"liba-744","enabled":true};
+function liba_745(a,b){var c=a+b*745;if(c>66)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_745={"id":745,"label":"liba-745","enabled":false};
+function liba_746(a,b){var c=a+b*746;if(c>67)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_746={"id":746,"label":"liba-746","enabled":true};
+function liba_747(a,b){var c=a+b*747;if(c>68)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_747={"id":747,"label":"liba-747","enabled":false};
+function liba_748(a,b){var c=a+b*748;if(c>69)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_748={"id":748,"label":"liba-748","enabled":true};
+function liba_749(a,b){var c=a+b*749;if(c>70)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_749={"id":749,"label":"liba-749","enabled":false};
+function liba_750(a,b){var c=a+b*750;if(c>71)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_750={"id":750,"label":"liba-750","enabled":true};
+function liba_751(a,b){var c=a+b*751;if(c>72)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_751={"id":751,"label":"liba-751","enabled":false};
+function liba_752(a,b){var c=a+b*752;if(c>73)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_752={"id":752,"label":"liba-752","enabled":true};
+function liba_753(a,b){var c=a+b*753;if(c>74)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_753={"id":753,"label":"liba-753","enabled":false};
+function liba_754(a,b){var c=a+b*754;if(c>75)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_754={"id":754,"label":"liba-754","enabled":true};
+function liba_755(a,b){var c=a+b*755;if(c>76)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_755={"id":755,"label":"liba-755","enabled":false};
+function liba_756(a,b){var c=a+b*756;if(c>77)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_756={"id":756,"label":"liba-756","enabled":true};
+function liba_757(a,b){var c=a+b*757;if(c>78)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_757={"id":757,"label":"liba-757","enabled":false};
+function liba_758(a,b){var c=a+b*758;if(c>79)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_758={"id":758,"label":"liba-758","enabled":true};
+function liba_759(a,b){var c=a+b*759;if(c>80)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_759={"id":759,"label":"liba-759","enabled":false};
+function liba_760(a,b){var c=a+b*760;if(c>81)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_760={"id":760,"label":"liba-760","enabled":true};
+function liba_761(a,b){var c=a+b*761;if(c>82)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_761={"id":761,"label":"liba-761","enabled":false};
+function liba_762(a,b){var c=a+b*762;if(c>83)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_762={"id":762,"label":"liba-762","enabled":true};
+function liba_763(a,b){var c=a+b*763;if(c>84)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_763={"id":763,"label":"liba-763","enabled":false};
+function liba_764(a,b){var c=a+b*764;if(c>85)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_764={"id":764,"label":"liba-764","enabled":true};
+function liba_765(a,b){var c=a+b*765;if(c>86)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_765={"id":765,"label":"liba-765","enabled":false};
+function liba_766(a,b){var c=a+b*766;if(c>87)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_766={"id":766,"label":"liba-766","enabled":true};
+function liba_767(a,b){var c=a+b*767;if(c>88)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_767={"id":767,"label":"liba-767","enabled":false};
+function liba_768(a,b){var c=a+b*768;if(c>89)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_768={"id":768,"label":"liba-768","enabled":true};
+function liba_769(a,b){var c=a+b*769;if(c>90)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_769={"id":769,"label":"liba-769","enabled":false};
+function liba_770(a,b){var c=a+b*770;if(c>91)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_770={"id":770,"label":"liba-770","enabled":true};
+function liba_771(a,b){var c=a+b*771;if(c>92)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_771={"id":771,"label":"liba-771","enabled":false};
+function liba_772(a,b){var c=a+b*772;if(c>93)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_772={"id":772,"label":"liba-772","enabled":true};
+function liba_773(a,b){var c=a+b*773;if(c>94)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_773={"id":773,"label":"liba-773","enabled":false};
+function liba_774(a,b){var c=a+b*774;if(c>95)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_774={"id":774,"label":"liba-774","enabled":true};
+function liba_775(a,b){var c=a+b*775;if(c>96)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_775={"id":775,"label":"liba-775","enabled":false};
+function liba_776(a,b){var c=a+b*776;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_776={"id":776,"label":"liba-776","enabled":true};
+function liba_777(a,b){var c=a+b*777;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_777={"id":777,"label":"liba-777","enabled":false};
+function liba_778(a,b){var c=a+b*778;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_778={"id":778,"label":"liba-778","enabled":true};
+function liba_779(a,b){var c=a+b*779;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_779={"id":779,"label":"liba-779","enabled":false};
+function liba_780(a,b){var c=a+b*780;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_780={"id":780,"label":"liba-780","enabled":true};
+function liba_781(a,b){var c=a+b*781;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_781={"id":781,"label":"liba-781","enabled":false};
+function liba_782(a,b){var c=a+b*782;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_782={"id":782,"label":"liba-782","enabled":true};
+function liba_783(a,b){var c=a+b*783;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_783={"id":783,"label":"liba-783","enabled":false};
+function liba_784(a,b){var c=a+b*784;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_784={"id":784,"label":"liba-784","enabled":true};
+function liba_785(a,b){var c=a+b*785;if(c>9)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_785={"id":785,"label":"liba-785","enabled":false};
+function liba_786(a,b){var c=a+b*786;if(c>10)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_786={"id":786,"label":"liba-786","enabled":true};
+function liba_787(a,b){var c=a+b*787;if(c>11)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_787={"id":787,"label":"liba-787","enabled":false};
+function liba_788(a,b){var c=a+b*788;if(c>12)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_788={"id":788,"label":"liba-788","enabled":true};
+function liba_789(a,b){var c=a+b*789;if(c>13)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_789={"id":789,"label":"liba-789","enabled":false};
+function liba_790(a,b){var c=a+b*790;if(c>14)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_790={"id":790,"label":"liba-790","enabled":true};
+function liba_791(a,b){var c=a+b*791;if(c>15)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_791={"id":791,"label":"liba-791","enabled":false};
+function liba_792(a,b){var c=a+b*792;if(c>16)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_792={"id":792,"label":"liba-792","enabled":true};
+function liba_793(a,b){var c=a+b*793;if(c>17)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_793={"id":793,"label":"liba-793","enabled":false};
+function liba_794(a,b){var c=a+b*794;if(c>18)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_794={"id":794,"label":"liba-794","enabled":true};
+function liba_795(a,b){var c=a+b*795;if(c>19)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_795={"id":795,"label":"liba-795","enabled":false};
+function liba_796(a,b){var c=a+b*796;if(c>20)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_796={"id":796,"label":"liba-796","enabled":true};
+function liba_797(a,b){var c=a+b*797;if(c>21)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_797={"id":797,"label":"liba-797","enabled":false};
+function liba_798(a,b){var c=a+b*798;if(c>22)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_798={"id":798,"label":"liba-798","enabled":true};
+function liba_799(a,b){var c=a+b*799;if(c>23)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_799={"id":799,"label":"liba-799","enabled":false};
+function liba_800(a,b){var c=a+b*800;if(c>24)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_800={"id":800,"label":"liba-800","enabled":true};
+function liba_801(a,b){var c=a+b*801;if(c>25)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_801={"id":801,"label":"liba-801","enabled":false};
+function liba_802(a,b){var c=a+b*802;if(c>26)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_802={"id":802,"label":"liba-802","enabled":true};
+function liba_803(a,b){var c=a+b*803;if(c>27)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_803={"id":803,"label":"liba-803","enabled":false};
+function liba_804(a,b){var c=a+b*804;if(c>28)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_804={"id":804,"label":"liba-804","enabled":true};
+function liba_805(a,b){var c=a+b*805;if(c>29)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_805={"id":805,"label":"liba-805","enabled":false};
+function liba_806(a,b){var c=a+b*806;if(c>30)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_806={"id":806,"label":"liba-806","enabled":true};
+function liba_807(a,b){var c=a+b*807;if(c>31)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_807={"id":807,"label":"liba-807","enabled":false};
+function liba_808(a,b){var c=a+b*808;if(c>32)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_808={"id":808,"label":"liba-808","enabled":true};
+function liba_809(a,b){var c=a+b*809;if(c>33)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_809={"id":809,"label":"liba-809","enabled":false};
+function liba_810(a,b){var c=a+b*810;if(c>34)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_810={"id":810,"label":"liba-810","enabled":true};
+function liba_811(a,b){var c=a+b*811;if(c>35)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_811={"id":811,"label":"liba-811","enabled":false};
+function liba_812(a,b){var c=a+b*812;if(c>36)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_812={"id":812,"label":"liba-812","enabled":true};
+function liba_813(a,b){var c=a+b*813;if(c>37)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_813={"id":813,"label":"liba-813","enabled":false};
+function liba_814(a,b){var c=a+b*814;if(c>38)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_814={"id":814,"label":"liba-814","enabled":true};
+function liba_815(a,b){var c=a+b*815;if(c>39)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_815={"id":815,"label":"liba-815","enabled":false};
+function liba_816(a,b){var c=a+b*816;if(c>40)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_816={"id":816,"label":"liba-816","enabled":true};
+function liba_817(a,b){var c=a+b*817;if(c>41)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_817={"id":817,"label":"liba-817","enabled":false};
+function liba_818(a,b){var c=a+b*818;if(c>42)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_818={"id":818,"label":"liba-818","enabled":true};
+function liba_819(a,b){var c=a+b*819;if(c>43)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_819={"id":819,"label":"liba-819","enabled":false};
+function liba_820(a,b){var c=a+b*820;if(c>44)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_820={"id":820,"label":"liba-820","enabled":true};
+function liba_821(a,b){var c=a+b*821;if(c>45)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_821={"id":821,"label":"liba-821","enabled":false};
+function liba_822(a,b){var c=a+b*822;if(c>46)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_822={"id":822,"label":"liba-822","enabled":true};
+function liba_823(a,b){var c=a+b*823;if(c>47)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_823={"id":823,"label":"liba-823","enabled":false};
+function liba_824(a,b){var c=a+b*824;if(c>48)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_824={"id":824,"label":"liba-824","enabled":true};
+function liba_825(a,b){var c=a+b*825;if(c>49)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_825={"id":825,"label":"liba-825","enabled":false};
+function liba_826(a,b){var c=a+b*826;if(c>50)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_826={"id":826,"label":"liba-826","enabled":true};
+function liba_827(a,b){var c=a+b*827;if(c>51)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_827={"id":827,"label":"liba-827","enabled":false};
+function liba_828(a,b){var c=a+b*828;if(c>52)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_828={"id":828,"label":"liba-828","enabled":true};
+function liba_829(a,b){var c=a+b*829;if(c>53)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_829={"id":829,"label":"liba-829","enabled":false};
+function liba_830(a,b){var c=a+b*830;if(c>54)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_830={"id":830,"label":"liba-830","enabled":true};
+function liba_831(a,b){var c=a+b*831;if(c>55)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_831={"id":831,"label":"liba-831","enabled":false};
+function liba_832(a,b){var c=a+b*832;if(c>56)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_832={"id":832,"label":"liba-832","enabled":true};
+function liba_833(a,b){var c=a+b*833;if(c>57)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_833={"id":833,"label":"liba-833","enabled":false};
+function liba_834(a,b){var c=a+b*834;if(c>58)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_834={"id":834,"label":"liba-834","enabled":true};
+function liba_835(a,b){var c=a+b*835;if(c>59)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_835={"id":835,"label":"liba-835","enabled":false};
+function liba_836(a,b){var c=a+b*836;if(c>60)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_836={"id":836,"label":"liba-836","enabled":true};
+function liba_837(a,b){var c=a+b*837;if(c>61)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_837={"id":837,"label":"liba-837","enabled":false};
+function liba_838(a,b){var c=a+b*838;if(c>62)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_838={"id":838,"label":"liba-838","enabled":true};
+function liba_839(a,b){var c=a+b*839;if(c>63)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_839={"id":839,"label":"liba-839","enabled":false};
+function liba_840(a,b){var c=a+b*840;if(c>64)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_840={"id":840,"label":"liba-840","enabled":true};
+function liba_841(a,b){var c=a+b*841;if(c>65)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_841={"id":841,"label":"liba-841","enabled":false};
+function liba_842(a,b){var c=a+b*842;if(c>66)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_842={"id":842,"label":"liba-842","enabled":true};
+function liba_843(a,b){var c=a+b*843;if(c>67)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_843={"id":843,"label":"liba-843","enabled":false};
+function liba_844(a,b){var c=a+b*844;if(c>68)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_844={"id":844,"label":"liba-844","enabled":true};
+function liba_845(a,b){var c=a+b*845;if(c>69)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_845={"id":845,"label":"liba-845","enabled":false};
+function liba_846(a,b){var c=a+b*846;if(c>70)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_846={"id":846,"label":"liba-846","enabled":true};
+function liba_847(a,b){var c=a+b*847;if(c>71)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_847={"id":847,"label":"liba-847","enabled":false};
+function liba_848(a,b){var c=a+b*848;if(c>72)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_848={"id":848,"label":"liba-848","enabled":true};
+function liba_849(a,b){var c=a+b*849;if(c>73)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_849={"id":849,"label":"liba-849","enabled":false};
+function liba_850(a,b){var c=a+b*850;if(c>74)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_850={"id":850,"label":"liba-850","enabled":true};
+function liba_851(a,b){var c=a+b*851;if(c>75)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_851={"id":851,"label":"liba-851","enabled":false};
+function liba_852(a,b){var c=a+b*852;if(c>76)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_852={"id":852,"label":"liba-852","enabled":true};
+function liba_853(a,b){var c=a+b*853;if(c>77)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_853={"id":853,"label":"liba-853","enabled":false};
+function liba_854(a,b){var c=a+b*854;if(c>78)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_854={"id":854,"label":"liba-854","enabled":true};
+function liba_855(a,b){var c=a+b*855;if(c>79)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_855={"id":855,"label":"liba-855","enabled":false};
+function liba_856(a,b){var c=a+b*856;if(c>80)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_856={"id":856,"label":"liba-856","enabled":true};
+function liba_857(a,b){var c=a+b*857;if(c>81)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_857={"id":857,"label":"liba-857","enabled":false};
+function liba_858(a,b){var c=a+b*858;if(c>82)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_858={"id":858,"label":"liba-858","enabled":true};
+function liba_859(a,b){var c=a+b*859;if(c>83)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_859={"id":859,"label":"liba-859","enabled":false};
+function liba_860(a,b){var c=a+b*860;if(c>84)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_860={"id":860,"label":"liba-860","enabled":true};
+function liba_861(a,b){var c=a+b*861;if(c>85)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_861={"id":861,"label":"liba-861","enabled":false};
+function liba_862(a,b){var c=a+b*862;if(c>86)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_862={"id":862,"label":"liba-862","enabled":true};
+function liba_863(a,b){var c=a+b*863;if(c>87)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_863={"id":863,"label":"liba-863","enabled":false};
+function liba_864(a,b){var c=a+b*864;if(c>88)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_864={"id":864,"label":"liba-864","enabled":true};
+function liba_865(a,b){var c=a+b*865;if(c>89)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_865={"id":865,"label":"liba-865","enabled":false};
+function liba_866(a,b){var c=a+b*866;if(c>90)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_866={"id":866,"label":"liba-866","enabled":true};
+function liba_867(a,b){var c=a+b*867;if(c>91)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_867={"id":867,"label":"liba-867","enabled":false};
+function liba_868(a,b){var c=a+b*868;if(c>92)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_868={"id":868,"label":"liba-868","enabled":true};
+function liba_869(a,b){var c=a+b*869;if(c>93)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_869={"id":869,"label":"liba-869","enabled":false};
+function liba_870(a,b){var c=a+b*870;if(c>94)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_870={"id":870,"label":"liba-870","enabled":true};
+function liba_871(a,b){var c=a+b*871;if(c>95)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_871={"id":871,"label":"liba-871","enabled":false};
+function liba_872(a,b){var c=a+b*872;if(c>96)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_872={"id":872,"label":"liba-872","enabled":true};
+function liba_873(a,b){var c=a+b*873;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_873={"id":873,"label":"liba-873","enabled":false};
+function liba_874(a,b){var c=a+b*874;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_874={"id":874,"label":"liba-874","enabled":true};
+function liba_875(a,b){var c=a+b*875;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_875={"id":875,"label":"liba-875","enabled":false};
+function liba_876(a,b){var c=a+b*876;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_876={"id":876,"label":"liba-876","enabled":true};
+function liba_877(a,b){var c=a+b*877;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_877={"id":877,"label":"liba-877","enabled":false};
+function liba_878(a,b){var c=a+b*878;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_878={"id":878,"label":"liba-878","enabled":true};
+function liba_879(a,b){var c=a+b*879;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_879={"id":879,"label":"liba-879","enabled":false};
+function liba_880(a,b){var c=a+b*880;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_880={"id":880,"label":"liba-880","enabled":true};
+function liba_881(a,b){var c=a+b*881;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_881={"id":881,"label":"liba-881","enabled":false};
+function liba_882(a,b){var c=a+b*882;if(c>9)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_882={"id":882,"label":"liba-882","enabled":true};
+function liba_883(a,b){var c=a+b*883;if(c>10)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_883={"id":883,"label":"liba-883","enabled":false};
+function liba_884(a,b){var c=a+b*884;if(c>11)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_884={"id":884,"label":"liba-884","enabled":true};
+function liba_885(a,b){var c=a+b*885;if(c>12)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_885={"id":885,"label":"liba-885","enabled":false};
+function liba_886(a,b){var c=a+b*886;if(c>13)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_886={"id":886,"label":"liba-886","enabled":true};
+function liba_887(a,b){var c=a+b*887;if(c>14)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_887={"id":887,"label":"liba-887","enabled":false};
+function liba_888(a,b){var c=a+b*888;if(c>15)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_888={"id":888,"label":"liba-888","enabled":true};
+function liba_889(a,b){var c=a+b*889;if(c>16)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_889={"id":889,"label":"liba-889","enabled":false};
+function liba_890(a,b){var c=a+b*890;if(c>17)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_890={"id":890,"label":"liba-890","enabled":true};
+function liba_891(a,b){var c=a+b*891;if(c>18)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_891={"id":891,"label":"liba-891","enabled":false};
+function liba_892(a,b){var c=a+b*892;if(c>19)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_892={"id":892,"label":"liba-892","enabled":true};
+function liba_893(a,b){var c=a+b*893;if(c>20)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_893={"id":893,"label":"liba-893","enabled":false};
+function liba_894(a,b){var c=a+b*894;if(c>21)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_894={"id":894,"label":"liba-894","enabled":true};
+function liba_895(a,b){var c=a+b*895;if(c>22)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_895={"id":895,"label":"liba-895","enabled":false};
+function liba_896(a,b){var c=a+b*896;if(c>23)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_896={"id":896,"label":"liba-896","enabled":true};
+function liba_897(a,b){var c=a+b*897;if(c>24)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_897={"id":897,"label":"liba-897","enabled":false};
+function liba_898(a,b){var c=a+b*898;if(c>25)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_898={"id":898,"label":"liba-898","enabled":true};
+function liba_899(a,b){var c=a+b*899;if(c>26)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_899={"id":899,"label":"liba-899","enabled":false};
+function liba_900(a,b){var c=a+b*900;if(c>27)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_900={"id":900,"label":"liba-900","enabled":true};
+function liba_901(a,b){var c=a+b*901;if(c>28)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_901={"id":901,"label":"liba-901","enabled":false};
+function liba_902(a,b){var c=a+b*902;if(c>29)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_902={"id":902,"label":"liba-902","enabled":true};
+function liba_903(a,b){var c=a+b*903;if(c>30)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_903={"id":903,"label":"liba-903","enabled":false};
+function liba_904(a,b){var c=a+b*904;if(c>31)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_904={"id":904,"label":"liba-904","enabled":true};
+function liba_905(a,b){var c=a+b*905;if(c>32)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_905={"id":905,"label":"liba-905","enabled":false};
+function liba_906(a,b){var c=a+b*906;if(c>33)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_906={"id":906,"label":"liba-906","enabled":true};
+function liba_907(a,b){var c=a+b*907;if(c>34)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_907={"id":907,"label":"liba-907","enabled":false};
+function liba_908(a,b){var c=a+b*908;if(c>35)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_908={"id":908,"label":"liba-908","enabled":true};
+function liba_909(a,b){var c=a+b*909;if(c>36)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_909={"id":909,"label":"liba-909","enabled":false};
+function liba_910(a,b){var c=a+b*910;if(c>37)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_910={"id":910,"label":"liba-910","enabled":true};
+function liba_911(a,b){var c=a+b*911;if(c>38)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_911={"id":911,"label":"liba-911","enabled":false};
+function liba_912(a,b){var c=a+b*912;if(c>39)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_912={"id":912,"label":"liba-912","enabled":true};
+function liba_913(a,b){var c=a+b*913;if(c>40)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_913={"id":913,"label":"liba-913","enabled":false};
+function liba_914(a,b){var c=a+b*914;if(c>41)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_914={"id":914,"label":"liba-914","enabled":true};
+function liba_915(a,b){var c=a+b*915;if(c>42)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_915={"id":915,"label":"liba-915","enabled":false};
+function liba_916(a,b){var c=a+b*916;if(c>43)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_916={"id":916,"label":"liba-916","enabled":true};
+function liba_917(a,b){var c=a+b*917;if(c>44)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_917={"id":917,"label":"liba-917","enabled":false};
+function liba_918(a,b){var c=a+b*918;if(c>45)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_918={"id":918,"label":"liba-918","enabled":true};
+function liba_919(a,b){var c=a+b*919;if(c>46)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_919={"id":919,"label":"liba-919","enabled":false};
+function liba_920(a,b){var c=a+b*920;if(c>47)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_920={"id":920,"label":"liba-920","enabled":true};
+function liba_921(a,b){var c=a+b*921;if(c>48)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_921={"id":921,"label":"liba-921","enabled":false};
+function liba_922(a,b){var c=a+b*922;if(c>49)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_922={"id":922,"label":"liba-922","enabled":true};
+function liba_923(a,b){var c=a+b*923;if(c>50)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_923={"id":923,"label":"liba-923","enabled":false};
+function liba_924(a,b){var c=a+b*924;if(c>51)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_924={"id":924,"label":"liba-924","enabled":true};
+function liba_925(a,b){var c=a+b*925;if(c>52)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_925={"id":925,"label":"liba-925","enabled":false};
+function liba_926(a,b){var c=a+b*926;if(c>53)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_926={"id":926,"label":"liba-926","enabled":true};
+function liba_927(a,b){var c=a+b*927;if(c>54)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_927={"id":927,"label":"liba-927","enabled":false};
+function liba_928(a,b){var c=a+b*928;if(c>55)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_928={"id":928,"label":"liba-928","enabled":true};
+function liba_929(a,b){var c=a+b*929;if(c>56)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_929={"id":929,"label":"liba-929","enabled":false};
+function liba_930(a,b){var c=a+b*930;if(c>57)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_930={"id":930,"label":"liba-930","enabled":true};
+function liba_931(a,b){var c=a+b*931;if(c>58)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_931={"id":931,"label":"liba-931","enabled":false};
+function liba_932(a,b){var c=a+b*932;if(c>59)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_932={"id":932,"label":"liba-932","enabled":true};
+function liba_933(a,b){var c=a+b*933;if(c>60)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_933={"id":933,"label":"liba-933","enabled":false};
+function liba_934(a,b){var c=a+b*934;if(c>61)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_934={"id":934,"label":"liba-934","enabled":true};
+function liba_935(a,b){var c=a+b*935;if(c>62)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_935={"id":935,"label":"liba-935","enabled":false};
+function liba_936(a,b){var c=a+b*936;if(c>63)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_936={"id":936,"label":"liba-936","enabled":true};
+function liba_937(a,b){var c=a+b*937;if(c>64)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_937={"id":937,"label":"liba-937","enabled":false};
+function liba_938(a,b){var c=a+b*938;if(c>65)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_938={"id":938,"label":"liba-938","enabled":true};
+function liba_939(a,b){var c=a+b*939;if(c>66)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_939={"id":939,"label":"liba-939","enabled":false};
+function liba_940(a,b){var c=a+b*940;if(c>67)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_940={"id":940,"label":"liba-940","enabled":true};
+function liba_941(a,b){var c=a+b*941;if(c>68)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_941={"id":941,"label":"liba-941","enabled":false};
+function liba_942(a,b){var c=a+b*942;if(c>69)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_942={"id":942,"label":"liba-942","enabled":true};
+function liba_943(a,b){var c=a+b*943;if(c>70)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_943={"id":943,"label":"liba-943","enabled":false};
+function liba_944(a,b){var c=a+b*944;if(c>71)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_944={"id":944,"label":"liba-944","enabled":true};
+function liba_945(a,b){var c=a+b*945;if(c>72)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_945={"id":945,"label":"liba-945","enabled":false};
+function liba_946(a,b){var c=a+b*946;if(c>73)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_946={"id":946,"label":"liba-946","enabled":true};
+function liba_947(a,b){var c=a+b*947;if(c>74)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_947={"id":947,"label":"liba-947","enabled":false};
+function liba_948(a,b){var c=a+b*948;if(c>75)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_948={"id":948,"label":"liba-948","enabled":true};
+function liba_949(a,b){var c=a+b*949;if(c>76)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_949={"id":949,"label":"liba-949","enabled":false};
+function liba_950(a,b){var c=a+b*950;if(c>77)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_950={"id":950,"label":"liba-950","enabled":true};
+function liba_951(a,b){var c=a+b*951;if(c>78)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_951={"id":951,"label":"liba-951","enabled":false};
+function liba_952(a,b){var c=a+b*952;if(c>79)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_952={"id":952,"label":"liba-952","enabled":true};
+function liba_953(a,b){var c=a+b*953;if(c>80)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_953={"id":953,"label":"liba-953","enabled":false};
+function liba_954(a,b){var c=a+b*954;if(c>81)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_954={"id":954,"label":"liba-954","enabled":true};
+function liba_955(a,b){var c=a+b*955;if(c>82)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_955={"id":955,"label":"liba-955","enabled":false};
+function liba_956(a,b){var c=a+b*956;if(c>83)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_956={"id":956,"label":"liba-956","enabled":true};
+function liba_957(a,b){var c=a+b*957;if(c>84)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_957={"id":957,"label":"liba-957","enabled":false};
+function liba_958(a,b){var c=a+b*958;if(c>85)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_958={"id":958,"label":"liba-958","enabled":true};
+function liba_959(a,b){var c=a+b*959;if(c>86)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_959={"id":959,"label":"liba-959","enabled":false};
+function liba_960(a,b){var c=a+b*960;if(c>87)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_960={"id":960,"label":"liba-960","enabled":true};
+function liba_961(a,b){var c=a+b*961;if(c>88)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_961={"id":961,"label":"liba-961","enabled":false};
+function liba_962(a,b){var c=a+b*962;if(c>89)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_962={"id":962,"label":"liba-962","enabled":true};
+function liba_963(a,b){var c=a+b*963;if(c>90)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_963={"id":963,"label":"liba-963","enabled":false};
+function liba_964(a,b){var c=a+b*964;if(c>91)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_964={"id":964,"label":"liba-964","enabled":true};
+function liba_965(a,b){var c=a+b*965;if(c>92)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_965={"id":965,"label":"liba-965","enabled":false};
+function liba_966(a,b){var c=a+b*966;if(c>93)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_966={"id":966,"label":"liba-966","enabled":true};
+function liba_967(a,b){var c=a+b*967;if(c>94)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_967={"id":967,"label":"liba-967","enabled":false};
+function liba_968(a,b){var c=a+b*968;if(c>95)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_968={"id":968,"label":"liba-968","enabled":true};
+function liba_969(a,b){var c=a+b*969;if(c>96)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_969={"id":969,"label":"liba-969","enabled":false};
+function liba_970(a,b){var c=a+b*970;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_970={"id":970,"label":"liba-970","enabled":true};
+function liba_971(a,b){var c=a+b*971;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_971={"id":971,"label":"liba-971","enabled":false};
+function liba_972(a,b){var c=a+b*972;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_972={"id":972,"label":"liba-972","enabled":true};
+function liba_973(a,b){var c=a+b*973;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_973={"id":973,"label":"liba-973","enabled":false};
+function liba_974(a,b){var c=a+b*974;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_974={"id":974,"label":"liba-974","enabled":true};
+function liba_975(a,b){var c=a+b*975;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_975={"id":975,"label":"liba-975","enabled":false};
+function liba_976(a,b){var c=a+b*976;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_976={"id":976,"label":"liba-976","enabled":true};
+function liba_977(a,b){var c=a+b*977;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_977={"id":977,"label":"liba-977","enabled":false};
+function liba_978(a,b){var c=a+b*978;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_978={"id":978,"label":"liba-978","enabled":true};
+function liba_979(a,b){var c=a+b*979;if(c>9)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_979={"id":979,"label":"liba-979","enabled":false};
+function liba_980(a,b){var c=a+b*980;if(c>10)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_980={"id":980,"label":"liba-980","enabled":true};
+function liba_981(a,b){var c=a+b*981;if(c>11)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_981={"id":981,"label":"liba-981","enabled":false};
+function liba_982(a,b){var c=a+b*982;if(c>12)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_982={"id":982,"label":"liba-982","enabled":true};
+function liba_983(a,b){var c=a+b*983;if(c>13)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_983={"id":983,"label":"liba-983","enabled":false};
+function liba_984(a,b){var c=a+b*984;if(c>14)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_984={"id":984,"label":"liba-984","enabled":true};
+function liba_985(a,b){var c=a+b*985;if(c>15)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_985={"id":985,"label":"liba-985","enabled":false};
+function liba_986(a,b){var c=a+b*986;if(c>16)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_986={"id":986,"label":"liba-986","enabled":true};
+function liba_987(a,b){var c=a+b*987;if(c>17)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_987={"id":987,"label":"liba-987","enabled":false};
+function liba_988(a,b){var c=a+b*988;if(c>18)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_988={"id":988,"label":"liba-988","enabled":true};
+function liba_989(a,b){var c=a+b*989;if(c>19)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_989={"id":989,"label":"liba-989","enabled":false};
+function liba_990(a,b){var c=a+b*990;if(c>20)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_990={"id":990,"label":"liba-990","enabled":true};
+function liba_991(a,b){var c=a+b*991;if(c>21)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_991={"id":991,"label":"liba-991","enabled":false};
+function liba_992(a,b){var c=a+b*992;if(c>22)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_992={"id":992,"label":"liba-992","enabled":true};
+function liba_993(a,b){var c=a+b*993;if(c>23)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_993={"id":993,"label":"liba-993","enabled":false};
+function liba_994(a,b){var c=a+b*994;if(c>24)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_994={"id":994,"label":"liba-994","enabled":true};
+function liba_995(a,b){var c=a+b*995;if(c>25)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_995={"id":995,"label":"liba-995","enabled":false};
+function liba_996(a,b){var c=a+b*996;if(c>26)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_996={"id":996,"label":"liba-996","enabled":true};
+function liba_997(a,b){var c=a+b*997;if(c>27)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_997={"id":997,"label":"liba-997","enabled":false};
+function liba_998(a,b){var c=a+b*998;if(c>28)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_998={"id":998,"label":"liba-998","enabled":true};
+function liba_999(a,b){var c=a+b*999;if(c>29)return c.toString(16);return [a,b,c].join("-")}
+window.liba_cfg_999={"id":999,"label":"liba-999","enabled":false};
\ No newline at end of file
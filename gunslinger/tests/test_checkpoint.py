@@ -0,0 +1,134 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from functools import partial
+from types import SimpleNamespace
+from backends.checkpoint import CheckpointStore, FlushError
+from backends.output_dispatcher import OutputDispatcher
+from backends.processors import domain_processor
+
+
+class FakeOutputs():
+
+    def __init__(self, fail=False):
+        self.session = None
+        self.fail = fail
+        self.sent = []
+
+
+    def get_plugin(self, name):
+        return SimpleNamespace()
+
+
+    def run_output(self, name, report_data, config_info, raise_errors=False,
+                   **kwargs):
+        if self.fail:
+            raise ConnectionError('output is down')
+        self.sent += report_data['results']
+
+
+class CheckpointTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'checkpoints.db')
+
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+
+    def start_job(self, outputs):
+        # Reports would wait a minute for a batch if they were not flushed
+        dispatcher = OutputDispatcher(outputs, [{'name': 'fake'}],
+                                      batch_window=60, max_retries=1,
+                                      backoff=0)
+        store = CheckpointStore(path=self.path, flush_results=1)
+        job = store.begin('{"job": 1}',
+                          partial(dispatcher.submit, wait=True))
+        return job, store
+
+
+    def test_hits_are_sent_before_the_checkpoint(self):
+        outputs = FakeOutputs()
+        job, store = self.start_job(outputs)
+        job.complete('result', 'a', [{'hash': 'a'}])
+
+        # The worker dies here, before anything else is sent or closed
+        self.assertEqual(store.get_items(job.job_id), {'result': {'a'}})
+        self.assertEqual(outputs.sent, [{'hash': 'a'}])
+        store.conn.close()
+
+
+    def test_checkpoint_is_not_saved_when_output_fails(self):
+        outputs = FakeOutputs(fail=True)
+        job, store = self.start_job(outputs)
+
+        with self.assertRaises(FlushError):
+            job.complete('result', 'a', [{'hash': 'a'}])
+        # The processor went on, but the job cannot be marked done
+        with self.assertRaises(FlushError):
+            job.finish()
+        state = store.conn.execute('SELECT state FROM jobs WHERE '
+                                   'job_id=?', (job.job_id,)).fetchone()[0]
+        self.assertEqual(state, 'running')
+
+        # The message comes back and the part is done again
+        job = store.begin('{"job": 1}', job.report)
+        self.assertIsNotNone(job)
+        self.assertFalse(job.is_done('result', 'a'))
+        store.conn.close()
+
+
+    def test_failed_hits_are_sent_by_the_next_flush(self):
+        outputs = FakeOutputs(fail=True)
+        job, store = self.start_job(outputs)
+
+        with self.assertRaises(FlushError):
+            job.complete('result', 'a', [{'hash': 'a'}])
+        outputs.fail = False
+        job.flush()
+        self.assertEqual(outputs.sent, [{'hash': 'a'}])
+        self.assertEqual(store.get_items(job.job_id), {'result': {'a'}})
+        store.conn.close()
+
+
+    def test_parts_complete_while_hits_are_sent(self):
+        sending = threading.Event()
+        sent = threading.Event()
+
+        def report(report_data):
+            sending.set()
+            sent.wait(5)
+
+        store = CheckpointStore(path=self.path, flush_results=1)
+        job = store.begin('{"job": 1}', report)
+        flush = threading.Thread(target=job.complete,
+                                 args=('result', 'a', [{'hash': 'a'}]))
+        flush.start()
+        sending.wait(5)
+
+        # Other threads are not held up by the report being sent
+        other = threading.Thread(target=job.complete, args=('result', 'b'))
+        other.start()
+        other.join(1)
+        self.assertFalse(other.is_alive())
+        self.assertTrue(job.is_done('result', 'b'))
+        sent.set()
+        flush.join()
+        store.conn.close()
+
+
+    def test_failed_page_is_not_completed(self):
+        store = CheckpointStore(path=self.path)
+        job = store.begin('{"job": 1}', lambda report_data: None)
+
+        with mock.patch.object(domain_processor, 'check_page',
+                               side_effect=ConnectionError('timed out')):
+            domain_processor.run(data=['https://shop.example/'],
+                                 config_info={}, checkpoint=job)
+        self.assertFalse(job.is_done('page', 'https://shop.example/'))
+        store.conn.close()
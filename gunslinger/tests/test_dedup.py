@@ -0,0 +1,94 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from backends.dedup import DedupFilter
+
+
+def result(url, domain=None):
+    page = {'url': url}
+    if domain:
+        page['domain'] = domain
+    return {'page': page}
+
+
+class DedupFilterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'dedup.db')
+        self.now = 1000.0
+        patcher = mock.patch('backends.dedup.time.time',
+                             lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+
+    def test_cooldown_expires(self):
+        dedup = DedupFilter(path=self.path, cooldown=60)
+        page = result('https://shop.example.com/')
+
+        self.assertEqual(dedup.filter([page]), [page])
+        self.now += 59
+        self.assertEqual(dedup.filter([page]), [])
+        self.now += 2
+        self.assertEqual(dedup.filter([page]), [page])
+        self.assertEqual(dedup.duplicates, 1)
+
+
+    def test_duplicates_within_a_batch(self):
+        dedup = DedupFilter(path=self.path)
+        first = result('https://Shop.example.com/#top')
+        second = result('https://shop.example.com')
+        self.assertEqual(dedup.filter([first, second]), [first])
+
+
+    def test_domain_key(self):
+        dedup = DedupFilter(path=self.path, key='domain')
+        first = result('https://shop.example.com/a')
+        second = result('https://shop.example.com/b')
+        self.assertEqual(dedup.filter([first, second]), [first])
+
+
+    def test_domain_cooldowns(self):
+        dedup = DedupFilter(path=self.path, cooldown=60,
+                            domain_cooldowns={'example.com': 0,
+                                              'slow.example.net': 600})
+        # A cooldown of 0 applies to subdomains and disables dedup
+        page = result('https://shop.example.com/')
+        self.assertEqual(dedup.filter([page, page]), [page, page])
+
+        page = result('https://cdn.slow.example.net/')
+        dedup.filter([page])
+        self.now += 300
+        self.assertEqual(dedup.filter([page]), [])
+
+
+    def test_survives_restarts(self):
+        page = result('https://shop.example.com/')
+        DedupFilter(path=self.path).filter([page])
+        self.assertEqual(DedupFilter(path=self.path).filter([page]), [])
+
+
+    def test_results_without_url_are_kept(self):
+        dedup = DedupFilter(path=self.path)
+        self.assertEqual(dedup.filter([{}, {}]), [{}, {}])
+
+
+    def test_eviction(self):
+        dedup = DedupFilter(path=self.path, cooldown=60, max_entries=2,
+                            evict_every=1)
+        for i in range(4):
+            self.now += 1
+            dedup.filter([result(f'https://{i}.example.com/')])
+        count = dedup._conn.execute('SELECT COUNT(*) FROM '
+                                    'seen').fetchone()[0]
+        self.assertEqual(count, 2)
+        # The oldest keys went first
+        self.assertEqual(dedup.filter([result('https://0.example.com/')]),
+                         [result('https://0.example.com/')])
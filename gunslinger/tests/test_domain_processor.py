@@ -0,0 +1,62 @@
+import hashlib
+import unittest
+from types import SimpleNamespace
+from backends.processors.domain_processor import stream_script
+
+BODY = b'var card = document.forms[0].cc.value;' * 10
+
+
+class FakeStream():
+    """A rule stream that fires on the first chunk and is then decided."""
+
+    def feed(self, text, data):
+        return True
+
+
+    def finish(self):
+        return ['skimmer']
+
+
+class FakeResponse():
+
+    def __init__(self, body):
+        self.url = 'https://shop.example/app.js'
+        self.body = body
+
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i:i + chunk_size]
+
+
+    def close(self):
+        pass
+
+
+class StreamScriptTest(unittest.TestCase):
+
+    def stream(self, **streaming):
+        session = SimpleNamespace(
+            get=lambda url, **kwargs: FakeResponse(BODY))
+        rule_manager = SimpleNamespace(
+            stream_rules=lambda **kwargs: FakeStream(),
+            get_ruleset_version=lambda: '1')
+        return stream_script('https://shop.example/app.js', rule_manager, 10,
+                             None, session, streaming)
+
+
+    def test_complete_script_is_hashed(self):
+        script_data = self.stream()
+        self.assertEqual(script_data['hash'],
+                         hashlib.sha256(BODY).hexdigest())
+        self.assertNotIn('truncated', script_data)
+
+
+    def test_truncated_script_has_no_hash(self):
+        for streaming in ({'max_size': 100},
+                          {'chunk_size': 50, 'stop_early': True}):
+            script_data = self.stream(**streaming)
+            self.assertTrue(script_data['truncated'])
+            self.assertNotIn('hash', script_data)
+            self.assertNotEqual(script_data['partial_hash'],
+                                hashlib.sha256(BODY).hexdigest())
@@ -0,0 +1,52 @@
+import unittest
+from types import SimpleNamespace
+from backends.processors.urlscan_processor import FetchLimiter
+
+
+class FakeSession():
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.closed = 0
+
+
+    def get(self, url, **kwargs):
+        if self.fail:
+            raise ConnectionError('refused')
+        return SimpleNamespace(url=url, close=self.close)
+
+
+    def close(self):
+        self.closed += 1
+
+
+class FetchLimiterTest(unittest.TestCase):
+
+    def test_streamed_response_holds_its_place_until_closed(self):
+        session = FakeSession()
+        limiter = FetchLimiter(session, max_in_flight=1, per_host_limit=1)
+        response = limiter.get('https://a.example/1', stream=True)
+        self.assertFalse(limiter._total.acquire(blocking=False))
+
+        response.close()
+        self.assertEqual(session.closed, 1)
+        # Closing again does not give the place back twice
+        response.close()
+        self.assertTrue(limiter._total.acquire(blocking=False))
+        limiter._total.release()
+        host = limiter.get_host_semaphore('https://a.example/2')
+        self.assertTrue(host.acquire(blocking=False))
+        self.assertFalse(host.acquire(blocking=False))
+
+
+    def test_failed_request_gives_its_place_back(self):
+        limiter = FetchLimiter(FakeSession(fail=True), max_in_flight=1)
+        with self.assertRaises(ConnectionError):
+            limiter.get('https://a.example/', stream=True)
+        self.assertTrue(limiter._total.acquire(blocking=False))
+
+
+    def test_plain_request_is_released_right_away(self):
+        limiter = FetchLimiter(FakeSession(), max_in_flight=1)
+        limiter.get('https://a.example/')
+        self.assertTrue(limiter._total.acquire(blocking=False))
@@ -0,0 +1,137 @@
+import time
+import threading
+import unittest
+from types import SimpleNamespace
+from backends.output_dispatcher import Delivery, OutputDispatcher, \
+    OutputWorker, merge_reports
+
+
+class FakeOutputs():
+    """Output plugins that record what they were sent and fail on demand."""
+
+    def __init__(self, failures=0):
+        self.session = None
+        self.failures = failures
+        self.sent = []
+        self.handlers = 0
+        self.plugin = SimpleNamespace(init=self.init)
+
+
+    def init(self, config_info, session=None):
+        self.handlers += 1
+        return self.handlers
+
+
+    def get_plugin(self, name):
+        return self.plugin
+
+
+    def run_output(self, name, report_data, config_info, raise_errors=False,
+                   **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError('output is down')
+        self.sent.append((name, kwargs.get('handler'),
+                          [r['hash'] for r in report_data['results']]))
+
+
+def report(*hashes):
+    return {'results': [{'hash': h} for h in hashes]}
+
+
+class OutputWorkerTest(unittest.TestCase):
+
+    def test_merge_reports(self):
+        self.assertEqual(merge_reports([report('a'), {}, report('b', 'c')]),
+                         report('a', 'b', 'c'))
+
+
+    def test_reports_are_batched(self):
+        outputs = FakeOutputs()
+        worker = OutputWorker(outputs, {'name': 'out'}, batch_window=60)
+        worker.submit(report('a'))
+        worker.submit(report('b'))
+        self.assertEqual(outputs.sent, [])
+
+        # Closing sends what is buffered as one report
+        worker.close(5)
+        self.assertEqual(outputs.sent, [('out', 1, ['a', 'b'])])
+
+
+    def test_full_batch_is_sent_right_away(self):
+        outputs = FakeOutputs()
+        worker = OutputWorker(outputs, {'name': 'out'}, batch_window=60,
+                              batch_size=2)
+        worker.submit(report('a', 'b'))
+        deadline = time.monotonic() + 5
+        while not outputs.sent and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(outputs.sent, [('out', 1, ['a', 'b'])])
+        worker.close(5)
+
+
+    def test_retry_recreates_the_handler(self):
+        outputs = FakeOutputs(failures=2)
+        worker = OutputWorker(outputs, {'name': 'out'}, batch_window=0,
+                              backoff=0.01)
+        delivery = Delivery()
+        worker.submit(report('a'), delivery)
+        self.assertTrue(delivery.wait())
+        # A handler may hold a broken connection, so each retry gets a new one
+        self.assertEqual(outputs.sent, [('out', 3, ['a'])])
+        worker.submit(report('b'))
+        worker.close(5)
+        self.assertEqual(outputs.sent[-1], ('out', 3, ['b']))
+
+
+    def test_report_is_dropped_after_the_last_retry(self):
+        outputs = FakeOutputs(failures=3)
+        worker = OutputWorker(outputs, {'name': 'out'}, batch_window=0,
+                              max_retries=2, backoff=0.01)
+        delivery = Delivery()
+
+        with self.assertLogs('backends.output_dispatcher', 'ERROR') as logs:
+            worker.submit(report('a'), delivery)
+            self.assertFalse(delivery.wait())
+        self.assertIn('Dropped 1 result(s)', logs.output[-1])
+        # The next report goes through once the output is back
+        worker.submit(report('b'))
+        worker.close(5)
+        self.assertEqual(outputs.sent, [('out', 4, ['b'])])
+
+
+class OutputDispatcherTest(unittest.TestCase):
+
+    def test_slow_output_does_not_hold_up_others(self):
+        release = threading.Event()
+
+        class SlowOutputs(FakeOutputs):
+            def run_output(self, name, *args, **kwargs):
+                if name == 'slow':
+                    release.wait(5)
+                super().run_output(name, *args, **kwargs)
+
+        outputs = SlowOutputs()
+        dispatcher = OutputDispatcher(outputs, [{'name': 'slow'},
+                                                {'name': 'fast'}],
+                                      batch_window=0)
+        dispatcher.submit(report('a'))
+        deadline = time.monotonic() + 5
+        while not outputs.sent and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual([(name, hashes) for name, _, hashes in outputs.sent],
+                         [('fast', ['a'])])
+        release.set()
+        dispatcher.close(5)
+        self.assertEqual([(name, hashes) for name, _, hashes in outputs.sent],
+                         [('fast', ['a']), ('slow', ['a'])])
+
+
+    def test_wait_raises_when_an_output_drops_the_report(self):
+        outputs = FakeOutputs(failures=10)
+        dispatcher = OutputDispatcher(outputs, [{'name': 'out'}],
+                                      max_retries=1, backoff=0.01)
+        with self.assertLogs('backends.output_dispatcher', 'ERROR'):
+            with self.assertRaises(RuntimeError):
+                dispatcher.submit(report('a'), wait=True)
+        dispatcher.close(5)
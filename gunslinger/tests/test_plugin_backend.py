@@ -0,0 +1,44 @@
+import os
+import shutil
+import tempfile
+import unittest
+from backends.plugin_backend import PluginManager
+
+
+class PluginManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        plugins = {'used_output': 'def run(output_data, config_info):\n'
+                                  '    return True\n',
+                   'other_output': 'def run(output_data, config_info):\n'
+                                   '    return False\n',
+                   'broken_output': 'import not_installed_dependency\n'}
+        for name, source in plugins.items():
+            with open(os.path.join(self.directory, f'{name}.py'), 'w') as f:
+                f.write(source)
+
+
+    def test_every_plugin_is_loaded_by_default(self):
+        manager = PluginManager(package='tests.all_outputs',
+                                plugin_dir=self.directory)
+        with self.assertLogs(level='ERROR'):
+            names = [name for name, _ in manager.get_plugins()]
+        self.assertEqual(names, ['other_output', 'used_output'])
+
+
+    def test_only_listed_plugins_are_loaded(self):
+        manager = PluginManager(package='tests.listed_outputs',
+                                plugin_dir=self.directory,
+                                plugins=['used_output'])
+        # The plugin with a missing dependency is never imported
+        with self.assertNoLogs(level='ERROR'):
+            names = [name for name, _ in manager.get_plugins()]
+        self.assertEqual(names, ['used_output'])
+
+        # Others are imported when asked for and then kept
+        self.assertFalse(manager.get_plugin('other_output').run({}, {}))
+        manager.refresh(force=True)
+        self.assertEqual([name for name, _ in manager.get_plugins()],
+                         ['other_output', 'used_output'])
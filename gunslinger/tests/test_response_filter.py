@@ -0,0 +1,43 @@
+import unittest
+from collections import Counter
+from backends.processors.urlscan_processor import ResponseFilter
+
+
+def request(resource_type, mime_type, size=100, h='a' * 64):
+    return {'response': {'hash': h, 'type': resource_type, 'dataLength': size,
+                         'response': {'mimeType': mime_type}}}
+
+
+class ResponseFilterTest(unittest.TestCase):
+
+    def test_skip_reasons(self):
+        response_filter = ResponseFilter(max_size=1000)
+        cases = [(request('Script', 'application/javascript'), None),
+                 (request('Script', 'application/javascript', h=''),
+                  'no_body'),
+                 (request('Image', 'image/png'), 'type'),
+                 (request('Other', 'font/woff2'), 'mime_type'),
+                 (request('Script', 'text/javascript', size=5000), 'size')]
+        for data, reason in cases:
+            self.assertEqual(
+                response_filter.get_skip_reason(data['response']), reason)
+
+
+    def test_octet_stream_is_fetched_by_default(self):
+        # Scripts are often served without a proper content type
+        response = request('Script', 'application/octet-stream')['response']
+        self.assertIsNone(ResponseFilter().get_skip_reason(response))
+        response_filter = ResponseFilter(
+            skip_mime_types=['application/octet-stream'])
+        self.assertEqual(response_filter.get_skip_reason(response),
+                         'mime_type')
+
+
+    def test_select_orders_by_priority(self):
+        requests = [request('Document', 'text/html', h='d'),
+                    request('Image', 'image/gif', h='i'),
+                    request('Script', 'text/javascript', h='s')]
+        selected, skipped = ResponseFilter().select(requests)
+        self.assertEqual([r['response']['hash'] for r in selected],
+                         ['s', 'd'])
+        self.assertEqual(skipped, Counter({('Image', 'type'): 1}))
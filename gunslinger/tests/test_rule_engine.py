@@ -0,0 +1,260 @@
+import unittest
+from types import SimpleNamespace
+from backends.rule_engine import Condition, DeclarativeRule, LiteralScanner, \
+    RuleFormatError, RuleIndex, RuleInput, RuleSet
+
+
+def make_rule_set(rules, binary=False):
+    return RuleSet([DeclarativeRule(name, SimpleNamespace(**module))
+                    for name, module in rules.items()], binary=binary)
+
+
+TEXT_RULES = {
+    'both': {'literals': {'ant': 'function ant_cockroach',
+                          'cc': 'cc_number'}},
+    'either': {'literals': {'ant': 'function ant_cockroach',
+                            'pay': 'payment'},
+               'condition': 'ant or pay'},
+    'without': {'literals': {'ant': 'function ant_cockroach',
+                             'cc': 'cc_number'},
+                'condition': 'ant and not cc'},
+    'anchored': {'patterns': {'end': r'checkout\d+$'}},
+    'lookahead': {'patterns': {'skim': r'skim(?!mer)'}},
+    'mixed': {'literals': {'cc': 'cc_number'},
+              'patterns': {'exfil': r'new Image\(\)\.src\s*='},
+              'condition': 'cc and exfil'},
+}
+
+BINARY_RULES = {
+    'magic': {'binary': True, 'literals': {'magic': b'\x89PNG'},
+              'patterns': {'eval': rb'eval\(atob'}},
+}
+
+SCRIPTS = [
+    '',
+    'function ant_cockroach() { var cc_number; }',
+    'function ant_cockroach() {}' + ' ' * 3000 + 'payment',
+    'var cc_number = 1;' + ' ' * 2000 + 'new Image().src = x',
+    'checkout1',
+    'checkout1' + ' ' * 2000 + 'checkout22',
+    'checkout1' + ' ' * 2000 + 'done',
+    'skim' + 'mer' + ' ' * 2000,
+    'x' * 2000 + 'skim',
+    'payment' + 'x' * 140000 + 'function ant_cockroach cc_number',
+    'function ant_cockroach' + 'y' * 70000 + 'cc_number' + 'y' * 70000,
+]
+
+
+class ConditionTest(unittest.TestCase):
+
+    def test_invalid_conditions(self):
+        for expression in ('a and', 'a == b', 'f(a)', 'a + b', 'c'):
+            with self.assertRaises(RuleFormatError):
+                Condition(expression, ['a', 'b'])
+
+
+    def test_evaluate(self):
+        condition = Condition('a and (b or not c)', ['a', 'b', 'c'])
+        values = {'a': True, 'b': False, 'c': False}
+        self.assertTrue(condition.evaluate(values.get))
+        values['c'] = True
+        self.assertFalse(condition.evaluate(values.get))
+
+
+    def test_evaluate_short_circuits(self):
+        asked = []
+        condition = Condition('a and b', ['a', 'b'])
+
+        def lookup(name):
+            asked.append(name)
+            return False
+
+        self.assertFalse(condition.evaluate(lookup))
+        self.assertEqual(asked, ['a'])
+
+
+    def test_evaluate_partial(self):
+        condition = Condition('a and not b', ['a', 'b'])
+        self.assertIsNone(condition.evaluate_partial({'a': True}.get))
+        self.assertFalse(condition.evaluate_partial({'a': False}.get))
+        self.assertFalse(condition.evaluate_partial({'b': True}.get))
+        self.assertTrue(condition.evaluate_partial(
+            {'a': True, 'b': False}.get))
+        condition = Condition('a or b', ['a', 'b'])
+        self.assertTrue(condition.evaluate_partial({'b': True}.get))
+        self.assertIsNone(condition.evaluate_partial({'a': False}.get))
+
+
+class DeclarativeRuleTest(unittest.TestCase):
+
+    def test_invalid_rules(self):
+        for module in ({'literals': {}},
+                       {'literals': {'a': ''}},
+                       {'patterns': {'a': '('}},
+                       {'literals': {'a': 'x'}, 'patterns': {'a': 'y'}},
+                       {'literals': {'a': 'x'}, 'condition': 'b'}):
+            with self.assertRaises(RuleFormatError):
+                DeclarativeRule('rule', SimpleNamespace(**module))
+
+
+    def test_default_condition_needs_every_name(self):
+        rule_set = make_rule_set({'rule': {'literals': {'a': 'foo'},
+                                           'patterns': {'b': 'ba+r'}}})
+        self.assertEqual(rule_set.run('foo baaar'), ['rule'])
+        self.assertEqual(rule_set.run('foo'), [])
+
+
+class LiteralScannerTest(unittest.TestCase):
+
+    def test_overlapping_literals(self):
+        scanner = LiteralScanner({'abc', 'bc', 'cd', 'zz'})
+        self.assertEqual(scanner.find('xabcdx'), {'abc', 'bc', 'cd'})
+        self.assertEqual(scanner.find('xbcx'), {'bc'})
+        self.assertEqual(scanner.find(''), set())
+
+
+    def test_known_literals_are_kept(self):
+        scanner = LiteralScanner({'abc', 'zz'})
+        self.assertEqual(scanner.find('abc', {'zz'}), {'abc', 'zz'})
+
+
+    def test_binary(self):
+        scanner = LiteralScanner({b'\x89PNG', b'\x00\x01'}, binary=True)
+        self.assertEqual(scanner.find(memoryview(b'..\x89PNG..')),
+                         {b'\x89PNG'})
+
+
+class StreamMatcherTest(unittest.TestCase):
+    """The chunked matcher has to give the same verdict as `RuleSet.run`,
+    wherever the chunks are cut and whether or not reading stops once
+    every rule is decided."""
+
+    def stream(self, rule_set, script, chunk_size, stop_early, margin=1024):
+        matcher = rule_set.stream(margin=margin)
+        for i in range(0, len(script), chunk_size):
+            if matcher.feed(script[i:i + chunk_size]) and stop_early:
+                break
+        return sorted(matcher.finish())
+
+
+    def assert_equivalent(self, rule_set, scripts, margin=1024):
+        for script in scripts:
+            expected = sorted(rule_set.run(script))
+            for chunk_size in (1, 7, 100, 4096, 65536):
+                if chunk_size == 1 and len(script) > 5000:
+                    continue
+                for stop_early in (False, True):
+                    with self.subTest(script=script[:40],
+                                      chunk_size=chunk_size,
+                                      stop_early=stop_early):
+                        self.assertEqual(
+                            self.stream(rule_set, script, chunk_size,
+                                        stop_early, margin), expected)
+
+
+    def test_text_rules(self):
+        self.assert_equivalent(make_rule_set(TEXT_RULES), SCRIPTS)
+
+
+    def test_small_margin(self):
+        # Patterns without anchors or lookarounds are safe with no margin
+        rule_set = make_rule_set({'mixed': TEXT_RULES['mixed'],
+                                  'both': TEXT_RULES['both']})
+        self.assert_equivalent(rule_set, SCRIPTS, margin=0)
+
+
+    def test_binary_rules(self):
+        scripts = [script.encode() for script in SCRIPTS]
+        scripts += [b'\x89PNG' + b'\x00' * 3000 + b'eval(atob(x))',
+                    b'\x89P' + b'NG eval(at' + b'ob']
+        self.assert_equivalent(make_rule_set(BINARY_RULES, binary=True),
+                               scripts)
+
+
+    def test_decides_before_the_end(self):
+        matcher = make_rule_set({'both': TEXT_RULES['both']}).stream()
+        self.assertFalse(matcher.feed('function ant_cockroach'))
+        self.assertTrue(matcher.feed(' cc_number'))
+        self.assertEqual(matcher.finish(), ['both'])
+
+
+    def test_pattern_near_the_end_is_not_trusted(self):
+        matcher = make_rule_set({'anchored': TEXT_RULES['anchored']}).stream()
+        matcher.feed('checkout1')
+        matcher.decide()
+        self.assertFalse(matcher.done)
+        matcher.feed('more')
+        self.assertEqual(matcher.finish(), [])
+
+
+    def test_skip(self):
+        rule_set = make_rule_set(TEXT_RULES)
+        script = SCRIPTS[1]
+        self.assertEqual(rule_set.run(script, skip={'both'}), ['either'])
+        matcher = rule_set.stream(skip={'both'})
+        matcher.feed(script)
+        self.assertEqual(matcher.finish(), ['either'])
+
+
+class RuleIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        rules = {
+            'exact': {'hosts': ['shop.example.com']},
+            'suffix': {'hosts': ['*.example.net']},
+            'path': {'hosts': ['*/checkout/*']},
+            'scripts': {'content_types': ['javascript']},
+            'big': {'min_size': 100},
+            'literal': {'requires': ['cc_number']},
+            'binary': {'requires': [b'\x89PNG'], 'binary': True},
+            'plain': {},
+        }
+        self.index = RuleIndex([(name, SimpleNamespace(**module))
+                                for name, module in rules.items()])
+
+
+    def response(self, url, mime_type='application/javascript'):
+        return {'response': {'url': url, 'mimeType': mime_type}}
+
+
+    def test_hosts(self):
+        skipped = self.index.get_skipped_by_response(
+            self.response('https://shop.example.com/a.js'))
+        self.assertEqual(skipped, {'suffix', 'path'})
+        skipped = self.index.get_skipped_by_response(
+            self.response('https://cdn.eu.example.net/checkout/a.js'))
+        self.assertEqual(skipped, {'exact'})
+        skipped = self.index.get_skipped_by_response(
+            self.response('https://example.net/a.js'))
+        self.assertEqual(skipped, {'exact', 'suffix', 'path'})
+
+
+    def test_content_types(self):
+        skipped = self.index.get_skipped_by_response(
+            self.response('https://shop.example.com/', 'text/html'))
+        self.assertIn('scripts', skipped)
+
+
+    def test_missing_response_passes(self):
+        self.assertEqual(self.index.get_skipped_by_response(None), set())
+        self.assertEqual(self.index.get_skipped_by_response({}), set())
+
+
+    def test_script_preconditions(self):
+        skipped = self.index.get_skipped_by_script(RuleInput('short'))
+        self.assertEqual(skipped, {'big', 'literal', 'binary'})
+        script = 'var cc_number;' + ' ' * 100
+        skipped = self.index.get_skipped_by_script(RuleInput(script))
+        self.assertEqual(skipped, {'binary'})
+        skipped = self.index.get_skipped_by_script(
+            RuleInput(b'\x89PNG' + b' ' * 100))
+        self.assertEqual(skipped, {'literal'})
+
+
+    def test_get_skipped_combines_both(self):
+        skipped = self.index.get_skipped(
+            RuleInput('short'), self.response('https://shop.example.com/'))
+        self.assertEqual(skipped, {'suffix', 'path', 'big', 'literal',
+                                   'binary'})
+        self.assertEqual(self.index.script_rules, {'big', 'literal',
+                                                   'binary'})
@@ -0,0 +1,56 @@
+import os
+import shutil
+import tempfile
+import unittest
+from backends.plugin_backend import PluginManager
+
+RULES = {
+    'plain': "literals = {'skim': 'skimmer('}\n",
+    'never_required': "literals = {'skim': 'skimmer('}\n"
+                      "requires = ['zzz_never']\n",
+    'late_required': "literals = {'skim': 'skimmer('}\n"
+                     "requires = ['checkout_done']\n",
+    'binary_min_size': "binary = True\n"
+                       "literals = {'skim': 'skimmer('}\n"
+                       "min_size = 1000000\n",
+}
+
+
+class RuleStreamTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        for name, source in RULES.items():
+            with open(os.path.join(self.directory, f'{name}.py'), 'w') as f:
+                f.write(source)
+        self.rule_manager = PluginManager(package='tests.stream_rules',
+                                          plugin_dir=self.directory)
+
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+
+    def stream(self, script, chunk_size=4096):
+        rule_stream = self.rule_manager.stream_rules()
+        for i in range(0, len(script), chunk_size):
+            # Reading stops as soon as the stream is decided
+            if rule_stream.feed(script[i:i + chunk_size]):
+                break
+        return sorted(rule_stream.finish())
+
+
+    def assert_same_verdict(self, script, expected):
+        self.assertEqual(sorted(self.rule_manager.run_rules(script=script)),
+                         expected)
+        self.assertEqual(self.stream(script), expected)
+
+
+    def test_preconditions_apply_to_streamed_rules(self):
+        script = 'skimmer();' + 'x' * 200000
+        self.assert_same_verdict(script, ['plain'])
+
+
+    def test_required_literal_after_the_match(self):
+        script = 'skimmer();' + 'x' * 200000 + 'checkout_done'
+        self.assert_same_verdict(script, ['late_required', 'plain'])
@@ -0,0 +1,85 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from backends.sharding import CostSharder, get_cost
+from backends.sqlite_backend import SQLite_MQ
+
+
+def result(i, requests):
+    return {'result': f'https://urlscan.io/api/v1/result/{i}/',
+            'stats': {'requests': requests}}
+
+
+class CostSharderTest(unittest.TestCase):
+
+    def test_get_cost(self):
+        self.assertEqual(get_cost(result(0, 9)), 10)
+        self.assertEqual(get_cost({}), 1)
+        self.assertEqual(get_cost({'stats': {'requests': 'many'}}), 1)
+
+
+    def test_budget_is_clamped(self):
+        sharder = CostSharder(target_seconds=10, initial_rate=1, min_cost=20,
+                              max_cost=100)
+        self.assertEqual(sharder.budget, 20)
+        sharder.rate = 50
+        self.assertEqual(sharder.budget, 100)
+
+
+    def test_every_result_in_one_job(self):
+        sharder = CostSharder(target_seconds=1, initial_rate=50, min_cost=1)
+        results = [result(i, i % 17) for i in range(100)]
+        results.append({'stats': {'requests': 3}})
+        jobs = sharder.shard(results)
+
+        urls = [url for job_urls, _ in jobs for url in job_urls]
+        self.assertEqual(sorted(urls), sorted(r['result'] for r in results
+                                              if 'result' in r))
+        for job_urls, cost in jobs:
+            self.assertTrue(cost <= 50 or len(job_urls) == 1)
+
+
+    def test_heavy_results_first(self):
+        sharder = CostSharder(target_seconds=1, initial_rate=10, min_cost=1)
+        jobs = sharder.shard([result(0, 1), result(1, 99), result(2, 4)])
+        # The result over budget gets a job of its own, at the front
+        self.assertEqual(jobs[0], (['https://urlscan.io/api/v1/result/1/'],
+                                   100))
+        self.assertEqual(len(jobs), 2)
+
+
+    def test_max_results(self):
+        sharder = CostSharder(max_results=3)
+        jobs = sharder.shard([result(i, 0) for i in range(7)])
+        self.assertEqual([len(urls) for urls, _ in jobs], [3, 3, 1])
+
+
+    def test_update_smooths_throughput(self):
+        sharder = CostSharder(initial_rate=20, smoothing=0.5)
+        sharder.update(400, 10)
+        self.assertEqual(sharder.rate, 30)
+        sharder.update(0, 10)
+        sharder.update(10, 0)
+        self.assertEqual(sharder.rate, 30)
+
+
+    def test_budget_does_not_depend_on_fleet_size(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        feedback = SQLite_MQ(path=os.path.join(directory, 'feedback.db'),
+                             wait_time=0)
+        self.addCleanup(feedback.close)
+        sharder = CostSharder(target_seconds=30, initial_rate=40)
+
+        for workers in (1, 4, 16):
+            for pid in range(workers):
+                feedback.post_message(json.dumps({'cost': 1200,
+                                                  'seconds': 30,
+                                                  'pid': pid}))
+            sharder.read_feedback(feedback)
+            # Each worker gets through 40 per second, however many there are
+            self.assertEqual(sharder.budget, 1200)
+        data, _ = feedback.get_next_message()
+        self.assertFalse(data)
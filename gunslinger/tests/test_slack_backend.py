@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import pytest
+
+slack = pytest.importorskip('slack')
+from backends.slack_backend import Slack_MQ
+
+
+class Response():
+
+    def __init__(self, data):
+        self.data = data
+
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+
+class FakeClient():
+    """Channel history served newest first in pages, like
+    conversations_history."""
+
+    def __init__(self, messages):
+        self.messages = messages
+        self.reactions = []
+
+
+    def conversations_history(self, channel, limit, oldest, inclusive=0,
+                              cursor=None, latest=None):
+        messages = [m for m in self.messages if float(m['ts']) > float(oldest)
+                    and (latest is None or float(m['ts']) < float(latest))]
+        messages.sort(key=lambda m: float(m['ts']), reverse=True)
+        start = int(cursor or 0)
+        page = messages[start:start + limit]
+        next_cursor = ''
+        if start + limit < len(messages):
+            next_cursor = str(start + limit)
+        return Response({'messages': page,
+                         'response_metadata': {'next_cursor': next_cursor}})
+
+
+    def reactions_add(self, channel, name, timestamp):
+        for message in self.messages:
+            if message['ts'] == timestamp:
+                message.setdefault('reactions', []).append({'name': name})
+        self.reactions.append(timestamp)
+        return Response({})
+
+
+class SlackMQTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+
+    def test_history_larger_than_one_read(self):
+        # 50 jobs, one history read covers 2 pages of 5 messages
+        messages = [{'ts': f'{1000 + i}.000000', 'text': f'{{"job": {i}}}'}
+                    for i in range(50)]
+        client = FakeClient(messages)
+        with mock.patch.object(slack, 'WebClient', return_value=client):
+            queue = Slack_MQ(channel_id='C0123456789', page_size=5,
+                             max_pages=2, batch_size=10, poll_interval=0,
+                             lookback=0,
+                             cursor_file=os.path.join(self.directory,
+                                                      'cursor.json'))
+        queue.oldest = '999.000000'
+
+        jobs = []
+        for _ in range(60):
+            data, _ = queue.get_next_message()
+            if data:
+                jobs.append(data)
+        self.assertEqual(jobs, [f'{{"job": {i}}}' for i in range(50)])
+        self.assertEqual(queue.oldest, '1049.000000')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import time
+import shutil
+import tempfile
+import unittest
+from backends.sqlite_backend import SQLite_MQ
+
+
+class SQLiteMQTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'queue.db')
+
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+
+    def test_long_job_is_not_claimed_twice(self):
+        options = {'path': self.path, 'visibility_timeout': 1,
+                   'heartbeat_interval': 0.2, 'wait_time': 0}
+        first = SQLite_MQ(**options)
+        second = SQLite_MQ(**options)
+        first.post_message('{"job": 1}')
+
+        data, _ = first.get_next_message()
+        self.assertEqual(data, '{"job": 1}')
+        # The job runs well past the visibility timeout
+        time.sleep(2.5)
+        data, _ = second.get_next_message()
+        self.assertEqual(data, [])
+
+        first.ack_message()
+        count = first.conn.execute('SELECT COUNT(*) FROM '
+                                   'messages').fetchone()[0]
+        self.assertEqual(count, 0)
+        first.close()
+        second.close()
+
+
+    def test_released_job_is_claimed_again(self):
+        options = {'path': self.path, 'visibility_timeout': 1,
+                   'heartbeat_interval': 0.2, 'wait_time': 0}
+        first = SQLite_MQ(**options)
+        second = SQLite_MQ(**options)
+        first.post_message('{"job": 1}')
+
+        first.get_next_message()
+        first.release_message()
+        time.sleep(0.5)
+        data, _ = second.get_next_message()
+        self.assertEqual(data, '{"job": 1}')
+        first.close()
+        second.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import io
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from contextlib import redirect_stdout
+from backends.outputs import sqlite_output
+from backends.outputs.sqlite_output import HitStore
+
+H1 = 'a' * 64
+H2 = 'b' * 64
+
+
+def hit(h, rules, url='https://shop.example.com/app.js',
+        page='https://shop.example.com/', timed_out=()):
+    return {'hash': h, 'fired_rules': list(rules),
+            'timed_out_rules': list(timed_out), 'url': url,
+            'submitted_url': page,
+            'urlscan_url': 'https://urlscan.io/result/1/'}
+
+
+class HitStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'hits.db')
+        self.store = HitStore(path=self.path, dedup_window=60)
+
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.directory)
+
+
+    def test_rows_per_rule(self):
+        added = self.store.add_report({'results': [
+            hit(H1, ['skimmer', 'exfil'], timed_out=['slow'])]})
+        self.assertEqual(added, 3)
+        hits = self.store.find(h=H1)
+        self.assertEqual(sorted((h['rule'], h['timed_out']) for h in hits),
+                         [('exfil', False), ('skimmer', False),
+                          ('slow', True)])
+        self.assertEqual(hits[0]['hash'], H1)
+        self.assertEqual(hits[0]['domain'], 'shop.example.com')
+
+
+    def test_repeats_are_folded(self):
+        with mock.patch('backends.outputs.sqlite_output.time.time',
+                        return_value=1000):
+            self.store.add_report({'results': [hit(H1, ['skimmer'])]})
+        with mock.patch('backends.outputs.sqlite_output.time.time',
+                        return_value=1030):
+            added = self.store.add_report({'results': [hit(H1, ['skimmer'])]})
+        self.assertEqual(added, 0)
+        [row] = self.store.find(h=H1)
+        self.assertEqual((row['first_seen'], row['last_seen'], row['count']),
+                         (1000, 1030, 2))
+        # After the window, and on another domain, a new row is stored
+        with mock.patch('backends.outputs.sqlite_output.time.time',
+                        return_value=1100):
+            added = self.store.add_report({'results': [
+                hit(H1, ['skimmer']),
+                hit(H1, ['skimmer'], page='https://other.example.org/')]})
+        self.assertEqual(added, 2)
+        self.assertEqual(self.store.get_stats(),
+                         {'rows': 3, 'hits': 4, 'hashes': 1, 'domains': 2})
+
+
+    def test_find_filters(self):
+        self.store.add_report({'results': [
+            hit(H1, ['skimmer']),
+            hit(H2, ['exfil'], page='https://cdn.shop.example.com/'),
+            hit(H2, ['exfil'], page='https://notshop.example.com/')]})
+        self.assertEqual({h['submitted_url'] for h in
+                          self.store.find(domain='shop.example.com')},
+                         {'https://shop.example.com/',
+                          'https://cdn.shop.example.com/'})
+        self.assertEqual(len(self.store.find(rule='exfil')), 2)
+        self.assertEqual(self.store.find(rule='unknown'), [])
+        self.assertEqual(len(self.store.find(limit=1)), 1)
+        self.assertEqual(self.store.find(since=2 ** 40), [])
+        self.assertTrue(self.store.seen(H2))
+        self.assertFalse(self.store.seen('c' * 64))
+
+
+    def test_other_hashes_are_kept_as_text(self):
+        self.store.add_report({'results': [hit('inline-3', ['skimmer'])]})
+        self.assertEqual(self.store.find()[0]['hash'], 'inline-3')
+
+
+    def test_failed_report_is_rolled_back(self):
+        self.store.add_report({'results': [hit(H1, ['skimmer'])]})
+        with self.assertRaises(AttributeError):
+            self.store.add_report({'results': [hit(H2, ['new_rule']), None]})
+        self.assertEqual(self.store.get_stats()['rows'], 1)
+        # Names of the rolled back report are stored again
+        self.store.add_report({'results': [hit(H2, ['new_rule'])]})
+        self.assertEqual(self.store.find(h=H2)[0]['rule'], 'new_rule')
+
+
+    def test_plugin_and_cli(self):
+        config_info = {'name': 'sqlite_output', 'path': self.path}
+        handler = sqlite_output.init(config_info)
+        sqlite_output.run({'results': [hit(H1, ['skimmer'])]}, config_info,
+                          handler=handler)
+        handler.close()
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            sqlite_output.main(['--path', self.path, '--rule', 'skimmer'])
+        [line] = output.getvalue().splitlines()
+        self.assertEqual(json.loads(line)['hash'], H1)
@@ -0,0 +1,55 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+from backends.sqlite_backend import SQLite_MQ
+from backends.supervisor import Supervisor
+
+
+class CrashingWorker():
+    """A worker whose process dies on the job named `crash`."""
+
+    def process(self, data):
+        if json.loads(data)['job'] == 'crash':
+            os._exit(1)
+
+
+class SupervisorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'queue.db')
+
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+
+    def test_jobs_of_a_crashed_worker_are_released(self):
+        message_queue = SQLite_MQ(path=self.path, wait_time=0, batch_size=1)
+        message_queue.post_messages([json.dumps({'job': job})
+                                     for job in ('crash', 'queued')])
+        consumer = SimpleNamespace(
+            message_queue=message_queue, config_info={},
+            next_message=lambda: message_queue.get_next_message()[0])
+        supervisor = Supervisor(consumer, CrashingWorker, 1, prefetch=1)
+        supervisor.start_worker(0)
+        self.assertTrue(supervisor.dispatch())
+        self.assertTrue(supervisor.dispatch())
+        crashed = supervisor.workers[0]
+        crashed.join(10)
+        self.assertFalse(crashed.is_alive())
+
+        # The job the worker never got to is released with the one it died on
+        supervisor.check_workers()
+        self.assertEqual(supervisor.pending, {})
+        self.assertEqual(supervisor.restarts, 1)
+        self.assertNotEqual(supervisor.workers[0].pid, crashed.pid)
+        claimable = SQLite_MQ(path=self.path, wait_time=0, batch_size=2)
+        self.assertEqual(len(claimable.get_messages(2)), 2)
+        claimable.close()
+
+        supervisor.shutdown()
+        self.assertFalse(supervisor.workers[0].is_alive())
@@ -0,0 +1,52 @@
+import os
+import shutil
+import tempfile
+import unittest
+from backends.plugin_backend import PluginManager
+from backends.processors.urlscan_processor import URLScanProcessor
+from backends.verdict_cache import VerdictCache
+
+HOST_RULE = '''hosts = ['shop.example.com']
+
+def run(**kwargs):
+    return 'skim' in kwargs.get('script', '')
+'''
+
+
+class VerdictCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        rules = os.path.join(self.directory, 'rules')
+        os.makedirs(rules)
+        with open(os.path.join(rules, 'shop_skimmer.py'), 'w') as f:
+            f.write(HOST_RULE)
+        self.rule_manager = PluginManager(package='tests.verdict_rules',
+                                          plugin_dir=rules)
+        self.processor = URLScanProcessor({}, self.rule_manager)
+        self.processor.verdict_cache = VerdictCache(
+            path=os.path.join(self.directory, 'verdicts.db'))
+        self.processor.get_response = lambda response, h: (b'skim()', 'utf-8')
+
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+
+    def check(self, url):
+        response = {'hash': 'a' * 64,
+                    'response': {'url': url,
+                                 'mimeType': 'application/javascript'}}
+        fired_rules, _ = self.processor.check_response(response, 'a' * 64)
+        return list(fired_rules)
+
+
+    def test_same_hash_from_two_hosts(self):
+        self.assertEqual(self.check('https://cdn.example.net/app.js'), [])
+        self.assertEqual(self.check('https://shop.example.com/app.js'),
+                         ['shop_skimmer'])
+        # Both verdicts are cached, each under its own version
+        self.assertEqual(self.check('https://shop.example.com/app.js'),
+                         ['shop_skimmer'])
+        self.assertEqual(self.check('https://cdn.example.net/app.js'), [])
+        self.assertEqual(self.processor.verdict_cache.hits, 2)
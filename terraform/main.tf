@@ -22,6 +22,7 @@ resource "aws_iam_user_policy" "sqs_user_policy" {
             "Sid": "VisualEditor0",
             "Effect": "Allow",
             "Action": [
+                "sqs:ChangeMessageVisibility",
                 "sqs:DeleteMessage",
                 "sqs:ReceiveMessage",
                 "sqs:SendMessage"